@@ -0,0 +1,57 @@
+# File: api/dependencies.py
+"""
+Shared FastAPI dependencies.
+
+The job store and job runner are created in the application lifespan
+(api.main) and kept on ``app.state``; endpoints get them through these
+dependencies so tests can swap in other backends.
+"""
+
+from fastapi import Request
+
+from api.utils.config import Config
+from api.utils.http_cache import ResponseCache
+from api.utils.job_cache import JobCache
+from api.utils.job_runner import JobRunner
+from api.utils.job_store import AsyncJobStore, create_job_store
+
+
+def build_job_pipeline() -> JobRunner:
+    """
+    Create the job store and runner from Config.
+
+    Returns:
+        Unstarted JobRunner wrapping an AsyncJobStore
+    """
+    store = AsyncJobStore(
+        create_job_store(Config.JOB_STORE, sqlite_path=Config.JOB_SQLITE_PATH),
+        threads=Config.DB_THREADS,
+        timeout=Config.DB_TIMEOUT_SECONDS,
+        cache=JobCache(Config.JOB_CACHE_SIZE, ttl=Config.JOB_CACHE_TTL_SECONDS)
+        if Config.JOB_CACHE_SIZE > 0 else None,
+    )
+    return JobRunner(
+        store,
+        workers=Config.JOB_WORKERS,
+        queue_depth=Config.JOB_QUEUE_DEPTH,
+        job_timeout=Config.JOB_TIMEOUT_SECONDS,
+        executor=Config.JOB_EXECUTOR,
+    )
+
+
+def get_job_runner(request: Request) -> JobRunner:
+    """Job runner of the running application."""
+    return request.app.state.job_runner
+
+
+def get_job_store(request: Request) -> AsyncJobStore:
+    """Non-blocking job store of the running application."""
+    return request.app.state.job_runner.store
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    """Serialized job response cache of the running application."""
+    state = request.app.state
+    if getattr(state, "response_cache", None) is None:
+        state.response_cache = ResponseCache(Config.RESPONSE_CACHE_SIZE)
+    return state.response_cache
@@ -1,12 +1,20 @@
 import os
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Header, status
-from fastapi.responses import JSONResponse
-from api.models.wall_models import WallDataInput, WallAnalysisJob
-from api.utils.db import create_job, update_job, get_job, list_jobs
-from api.utils.errors import ResourceNotFoundError, handle_exception
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from api.models.wall_models import WallDataInput, WallAnalysisJob, WallBatchInput
+from api.dependencies import get_job_runner, get_job_store, get_response_cache
+from api.utils.config import Config
+from api.utils.errors import ResourceNotFoundError, ServiceUnavailableError, handle_exception
+from api.utils.http_cache import (
+    REVALIDATE_CACHE_CONTROL, TERMINAL_CACHE_CONTROL, EncodedBody, ResponseCache, negotiate
+)
+from api.utils.job_runner import JobRunner, QueueFullError
+from api.utils.job_store import AsyncJobStore, JobStoreTimeout
+from api.utils.streaming import (
+    encode_event, iter_batch_events, iter_job_progress, stream_media_type
+)
 from typing import Dict, List, Any, Optional
 import uuid
-from api.utils.compat import timeout
 from datetime import datetime
 import traceback
 
@@ -16,7 +24,7 @@ logger = logging.getLogger("timber_framing.api")
 
 # Create a dependency specifically for auth
 async def verify_api_key(x_api_key: str = Header(...)):
-    if x_api_key != API_KEY:
+    if x_api_key != Config.API_KEY:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API Key"
@@ -29,58 +37,47 @@ router = APIRouter(dependencies=[Depends(verify_api_key)])
 @router.post("/analyze", response_model=WallAnalysisJob)
 async def analyze_wall(
     wall_data: WallDataInput,
-    background_tasks: BackgroundTasks
+    runner: JobRunner = Depends(get_job_runner)
 ):
     """
     Submit a wall for analysis.
     
-    This endpoint accepts wall data and initiates the analysis process.
-    The analysis runs asynchronously, and the results can be retrieved
-    using the returned job_id.
+    This endpoint accepts wall data and queues the analysis on the job
+    worker pool. The analysis runs asynchronously, and the results can be
+    retrieved using the returned job_id. Returns 503 when the job queue
+    is full.
     """
     logger.info("*** WALL ANALYSIS ENDPOINT CALLED ***")
     try:
         logger.info(f"Received wall analysis request with {len(wall_data.openings)} openings")
         
-        # Create job ID
-        job_id = str(uuid.uuid4())
-        
         # Create job record using Pydantic model
         job = WallAnalysisJob(
-            job_id=job_id,
+            job_id=str(uuid.uuid4()),
             status="pending",
             created_at=datetime.now(),
             updated_at=datetime.now(),
             wall_data=wall_data
         )
         
-        # Convert to dict for Supabase and store job
-        logger.info(f"Creating job {job_id} in database")
-        job_dict = job.model_dump()
-        
-        # Add explicit debugging for the conversion
-        logger.debug(f"Job dict structure: {type(job_dict)}")
-        for key, value in job_dict.items():
-            logger.debug(f"Key: {key}, Type: {type(value)}")
-        
-        db_result = create_job(job_dict)
-        
-        # Check if database operation succeeded
-        if not db_result:
-            logger.error(f"Failed to create job record in database for job_id: {job_id}")
-            raise HTTPException(
-                status_code=500, 
-                detail="Failed to create analysis job in database"
-            )
-            
-        logger.info(f"Successfully created job in database: {job_id}")
-        
-        # Start background task with job_id and wall_data
-        background_tasks.add_task(process_wall_analysis, job_id, wall_data)
-        logger.info(f"Started background analysis task for job_id: {job_id}")
+        # Store the job and queue it; store I/O runs off the event loop
+        await runner.submit(job.model_dump())
+        logger.info(f"Queued analysis job {job.job_id}")
         
         return job
         
+    except QueueFullError as e:
+        logger.warning(str(e))
+        raise ServiceUnavailableError(
+            "Analysis queue is full, retry later", internal_code="queue_full"
+        ).to_http_exception()
+    except JobStoreTimeout as e:
+        logger.error(str(e))
+        raise ServiceUnavailableError(
+            "Database timed out creating the job",
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            internal_code="database_timeout"
+        ).to_http_exception()
     except Exception as e:
         error_detail = traceback.format_exc()
         logger.error(f"Error in analyze_wall: {str(e)}\n{error_detail}")
@@ -89,6 +86,99 @@ async def analyze_wall(
             detail=f"Error creating analysis job: {str(e)}"
         )
 
+@router.post("/analyze/batch")
+async def analyze_walls_batch(
+    batch: WallBatchInput,
+    request: Request,
+    format: Optional[str] = None,
+    runner: JobRunner = Depends(get_job_runner)
+):
+    """
+    Submit many walls and stream each wall's result as it finishes.
+    
+    Every wall becomes a regular job (also readable at /job/{job_id}),
+    fanned out across the worker pool. The response is a stream of
+    events: one "batch" event with the job IDs in input order, one "job"
+    event per wall in completion order, and a final "done" event.
+    
+    Args:
+        batch: Walls to analyze
+        format: "ndjson" or "sse"; defaults from the Accept header
+        
+    Returns:
+        NDJSON or server-sent event stream
+        
+    Raises:
+        400: Too many walls or unknown format
+        503: The job queue has no room for the whole batch
+    """
+    try:
+        media_type = stream_media_type(format, request.headers.get("accept"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(batch.walls) > Config.BATCH_MAX_WALLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch has {len(batch.walls)} walls; the limit is {Config.BATCH_MAX_WALLS}"
+        )
+    
+    logger.info(f"Received batch analysis request with {len(batch.walls)} walls")
+    now = datetime.now()
+    jobs = [
+        WallAnalysisJob(
+            job_id=str(uuid.uuid4()),
+            status="pending",
+            created_at=now,
+            updated_at=now,
+            wall_data=wall
+        ).model_dump()
+        for wall in batch.walls
+    ]
+    job_ids = [job["job_id"] for job in jobs]
+    
+    # Subscribe before submitting so no completion is missed
+    subscription = runner.subscribe(job_ids)
+    try:
+        await runner.submit_many(jobs)
+    except QueueFullError as e:
+        runner.unsubscribe(subscription)
+        logger.warning(str(e))
+        raise ServiceUnavailableError(
+            "Analysis queue has no room for this batch, retry later",
+            internal_code="queue_full",
+            extra={"walls": len(jobs), "queue_capacity": runner.queue_depth}
+        ).to_http_exception()
+    except JobStoreTimeout as e:
+        runner.unsubscribe(subscription)
+        logger.error(str(e))
+        raise ServiceUnavailableError(
+            "Database timed out creating the batch",
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            internal_code="database_timeout"
+        ).to_http_exception()
+    except Exception as e:
+        runner.unsubscribe(subscription)
+        logger.error(f"Error in analyze_walls_batch: {str(e)}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error creating batch analysis jobs: {str(e)}"
+        )
+    
+    batch_id = str(uuid.uuid4())
+    logger.info(f"Queued batch {batch_id} with {len(jobs)} jobs")
+    
+    async def body():
+        async for event in iter_batch_events(
+            runner, subscription, batch_id, job_ids, Config.STREAM_HEARTBEAT_SECONDS
+        ):
+            yield encode_event(event, media_type)
+    
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # Test database connection
 @router.get("/test-database", response_model=Dict[str, str])
 async def test_database():
@@ -107,15 +197,47 @@ async def open_test():
     logger.info("Open test endpoint called")
     return {"status": "success", "message": "This endpoint doesn't require authentication"}
 
+def _job_version(record: Dict[str, Any]) -> tuple:
+    """Cache key that changes whenever the job's response would."""
+    return (record["job_id"], record["status"], str(record["updated_at"]))
+
+def _job_body(cache: ResponseCache, record: Dict[str, Any]) -> EncodedBody:
+    """Serialized job response, built once per job version."""
+    key = _job_version(record)
+    encoded = cache.get(key)
+    if encoded is None:
+        body = WallAnalysisJob.model_validate(record).model_dump_json()
+        encoded = cache.put(key, EncodedBody(body.encode("utf-8")))
+    return encoded
+
+def _conditional_response(request: Request, encoded: EncodedBody, cache_control: str) -> Response:
+    """304 if the client's ETag is current, else the body, compressed if accepted."""
+    status_code, headers, body = negotiate(
+        encoded,
+        request.headers.get("if-none-match"),
+        request.headers.get("accept-encoding"),
+        cache_control=cache_control,
+        min_bytes=Config.GZIP_MIN_BYTES
+    )
+    media_type = encoded.media_type if status_code == 200 else None
+    return Response(content=body, status_code=status_code, headers=headers, media_type=media_type)
+
 @router.get("/", response_model=List[WallAnalysisJob])
 async def list_wall_analyses(
+    request: Request,
     limit: int = 10, 
     offset: int = 0,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    store: AsyncJobStore = Depends(get_job_store),
+    cache: ResponseCache = Depends(get_response_cache)
 ):
     """
     List wall analysis jobs with pagination and optional status filtering.
     
+    The response carries an ETag; a request whose If-None-Match matches
+    gets 304 Not Modified. Large responses are gzip (or brotli) encoded
+    when the client accepts it.
+    
     Args:
         limit: Maximum number of jobs to return
         offset: Number of jobs to skip
@@ -127,24 +249,25 @@ async def list_wall_analyses(
     try:
         logger.info(f"Listing jobs: limit={limit}, offset={offset}, status={status}")
         
-        # Add timeouts to the database call
-        jobs = []
-        try:
-            # Wrap DB call in timeout context
-            from contextlib import timeout
-            with timeout(5):  # 5 second timeout
-                jobs = list_jobs(limit, offset, status)
-        except TimeoutError:
-            logger.error(f"Database query timed out when listing jobs")
-            raise HTTPException(
-                status_code=504,  # Gateway Timeout
-                detail="Database query timed out"
-            )
+        # The job store bounds the call with DB_TIMEOUT_SECONDS
+        jobs = await store.list_jobs(limit, offset, status)
         
+        jobs = jobs or []
         logger.info(f"Retrieved {len(jobs)} jobs")
         
-        # Return empty list instead of None
-        return jobs or []
+        # Assemble the page from the per-job serialized bodies
+        key = ("list", limit, offset, status, tuple(_job_version(job) for job in jobs))
+        encoded = cache.get(key)
+        if encoded is None:
+            body = b"[" + b",".join(_job_body(cache, job).body for job in jobs) + b"]"
+            encoded = cache.put(key, EncodedBody(body))
+        return _conditional_response(request, encoded, REVALIDATE_CACHE_CONTROL)
+    except JobStoreTimeout:
+        logger.error(f"Database query timed out when listing jobs")
+        raise HTTPException(
+            status_code=504,  # Gateway Timeout
+            detail="Database query timed out"
+        )
     except Exception as e:
         error_detail = traceback.format_exc()
         logger.error(f"Error listing jobs: {str(e)}\n{error_detail}")
@@ -153,47 +276,35 @@ async def list_wall_analyses(
             detail=f"Error listing jobs: {str(e)}"
         )
 
-async def process_wall_analysis(job_id: str, wall_data: WallDataInput):
-    """Process wall analysis in the background."""
+def _validate_job_id(job_id: str) -> None:
+    """Raise 400 unless job_id is a canonical UUID string."""
     try:
-        logger.info(f"Processing wall analysis for job {job_id}")
-        
-        # Update job status
-        update_result = update_job(job_id, {"status": "processing"})
-        if not update_result:
-            logger.error(f"Failed to update job status to 'processing' for job {job_id}")
-        
-        # Update job with results
-        logger.info(f"Updating job {job_id} with analysis results")
-        update_result = update_job(job_id, {
-            "status": "completed",
-            "result": result
-        })
-        
-        if update_result:
-            logger.info(f"Job {job_id} completed successfully")
-        else:
-            logger.error(f"Failed to update job status to 'completed' for job {job_id}")
-        
-    except Exception as e:
-        error_detail = traceback.format_exc()
-        logger.error(f"Error processing job {job_id}: {str(e)}\n{error_detail}")
-        
-        try:
-            # Handle errors - attempt to update job status
-            update_job(job_id, {
-                "status": "failed",
-                "error": str(e)
-            })
-        except Exception as update_error:
-            logger.error(f"Failed to update error status for job {job_id}: {str(update_error)}")
+        uuid_obj = uuid.UUID(job_id)
+        if str(uuid_obj) != job_id:
+            raise ValueError("Invalid UUID format")
+    except ValueError:
+        logger.warning(f"Invalid job ID format: {job_id}")
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid job ID format. Job IDs must be valid UUIDs."
+        )
 
 # Explicitly add type constraint for job_id route
 @router.get("/job/{job_id}", response_model=WallAnalysisJob)
-async def get_wall_analysis(job_id: str):
+async def get_wall_analysis(
+    job_id: str,
+    request: Request,
+    store: AsyncJobStore = Depends(get_job_store),
+    cache: ResponseCache = Depends(get_response_cache)
+):
     """
     Get the status and results of a wall analysis job.
     
+    The response carries an ETag; polling with If-None-Match returns 304
+    Not Modified until the job changes. Finished jobs never change and
+    may be cached by the client for an hour. Large results are gzip (or
+    brotli) encoded when the client accepts it.
+    
     Args:
         job_id: The unique identifier for the job
         
@@ -205,20 +316,10 @@ async def get_wall_analysis(job_id: str):
         500: If there's a server error retrieving the job
     """
     try:
-        # Validate job_id format (should be UUID)
-        try:
-            uuid_obj = uuid.UUID(job_id)
-            if str(uuid_obj) != job_id:
-                raise ValueError("Invalid UUID format")
-        except ValueError:
-            logger.warning(f"Invalid job ID format: {job_id}")
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid job ID format. Job IDs must be valid UUIDs."
-            )
+        _validate_job_id(job_id)
         
         logger.info(f"Retrieving job: {job_id}")
-        job_data = get_job(job_id)
+        job_data = await store.get_job(job_id)
         
         if not job_data:
             logger.warning(f"Job not found: {job_id}")
@@ -226,7 +327,51 @@ async def get_wall_analysis(job_id: str):
                 raise ResourceNotFoundError("job", job_id)
         
         logger.info(f"Successfully retrieved job: {job_id}")
-        return job_data
+        finished = job_data["status"] in ("completed", "failed")
+        return _conditional_response(
+            request,
+            _job_body(cache, job_data),
+            TERMINAL_CACHE_CONTROL if finished else REVALIDATE_CACHE_CONTROL
+        )
         
     except Exception as e:
-        raise handle_exception(e, "job", job_id)
\ No newline at end of file
+        raise handle_exception(e, "job", job_id)
+
+@router.get("/job/{job_id}/events")
+async def stream_wall_analysis_progress(
+    job_id: str,
+    request: Request,
+    format: Optional[str] = None,
+    runner: JobRunner = Depends(get_job_runner)
+):
+    """
+    Stream a job's status changes until it finishes, instead of polling.
+    
+    Events: "status" for the current and each new status, "heartbeat"
+    while nothing changes, then "job" with the result or error and
+    "done". A missing job produces a single "error" event.
+    
+    Args:
+        job_id: The unique identifier for the job
+        format: "ndjson" or "sse"; defaults from the Accept header
+        
+    Returns:
+        NDJSON or server-sent event stream
+    """
+    _validate_job_id(job_id)
+    try:
+        media_type = stream_media_type(format, request.headers.get("accept"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def body():
+        async for event in iter_job_progress(
+            runner, runner.store, job_id, Config.STREAM_HEARTBEAT_SECONDS
+        ):
+            yield encode_event(event, media_type)
+    
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
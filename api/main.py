@@ -7,7 +7,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 from api.utils.auth import get_api_key
-from api.utils.db import check_supabase_connection
+from api.utils.config import Config
+from api.dependencies import build_job_pipeline
+from api.utils.http_cache import ResponseCache
 from api.endpoints.debug import debug_router
 from api.endpoints.walls import router as walls_router
 from api.endpoints.speckle import router as speckle_router
@@ -25,15 +27,30 @@ logger.addHandler(handler)
 async def lifespan(app: FastAPI):
     # Startup code (runs before application starts)
     logger.info("Run on application startup.")
+    Config.validate()
     
-    # Test database connection
-    if not check_supabase_connection():
-        logger.error("Failed to connect to Supabase database. API may not function correctly.")
+    # Job store and worker pool
+    job_runner = build_job_pipeline()
+    app.state.job_runner = job_runner
+    app.state.response_cache = ResponseCache(Config.RESPONSE_CACHE_SIZE)
+    
+    # Test database connection (off the event loop)
+    try:
+        connected = await job_runner.store.check_connection()
+    except Exception as e:
+        logger.error(f"Job store connection check failed: {str(e)}")
+        connected = False
+    if not connected:
+        logger.error(f"Failed to connect to {Config.JOB_STORE} job store. API may not function correctly.")
+    
+    await job_runner.start()
     
     yield  # This is where the application runs
     
     # Shutdown code (runs when application is shutting down)
     logger.info("Application shutting down.")
+    await job_runner.stop()
+    job_runner.store.close()
 
 # Log startup information
 logger.info("==== API INITIALIZATION STARTING ====")
@@ -154,6 +171,14 @@ async def health_check():
     logger.info("Health check requested")
     return {"status": "healthy", "message": "Timber Framing API is running"}
 
+# Job pipeline metrics
+@app.get("/metrics", tags=["Status"], dependencies=[Depends(get_api_key)])
+async def job_metrics():
+    """Job queue, worker pool, job store and response cache statistics."""
+    metrics = app.state.job_runner.metrics()
+    metrics["response_cache"] = app.state.response_cache.stats()
+    return metrics
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -3,19 +3,16 @@ from typing import List, Dict, Any, Optional, Union, Literal
 from datetime import datetime
 import uuid
 
+# Arbitrary large value check on coordinates. Declared as field bounds so
+# pydantic-core enforces it natively instead of calling back into Python
+# for every coordinate of a large payload.
+MAX_COORDINATE = 1000
+
 class Point3D(BaseModel):
     """3D point coordinates."""
-    x: float = Field(description="X coordinate")
-    y: float = Field(description="Y coordinate")
-    z: float = Field(description="Z coordinate")
-    
-    @field_validator('x', 'y', 'z')
-    @classmethod
-    def validate_coordinate(cls, v: float) -> float:
-        """Validate that coordinate values are reasonable."""
-        if abs(v) > 1000:  # Arbitrary large value check
-            raise ValueError("Coordinate value exceeds reasonable range")
-        return v
+    x: float = Field(description="X coordinate", ge=-MAX_COORDINATE, le=MAX_COORDINATE)
+    y: float = Field(description="Y coordinate", ge=-MAX_COORDINATE, le=MAX_COORDINATE)
+    z: float = Field(description="Z coordinate", ge=-MAX_COORDINATE, le=MAX_COORDINATE)
 
 class Plane(BaseModel):
     """3D plane representation."""
@@ -148,6 +145,13 @@ class WallDataInput(BaseModel):
                         
         return self
 
+class WallBatchInput(BaseModel):
+    """Input data model for batch wall analysis."""
+    walls: List[WallDataInput] = Field(
+        description="Walls to analyze; results stream back as each finishes",
+        min_length=1
+    )
+
 class WallAnalysisJob(BaseModel):
     """Model for wall analysis job data."""
     job_id: str = Field(description="Unique job identifier")
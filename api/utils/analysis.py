@@ -0,0 +1,89 @@
+# File: api/utils/analysis.py
+"""
+Headless wall analysis kernel for API jobs.
+
+Runs the parts of the framing pipeline that need no Rhino runtime - panel
+decomposition and sheathing layout - on an API wall payload and returns
+JSON-serializable results. The kernel is a plain module-level function
+of a dictionary, so the job runner can ship it to worker processes.
+"""
+
+import os
+import re
+import sys
+from typing import Any, Dict, List
+
+# Make the src package importable in worker processes
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+# Actual stud depth (inches) by nominal size, for wall thickness
+_NOMINAL_DEPTH = {"4": 3.5, "6": 5.5, "8": 7.25}
+_NOMINAL_RE = re.compile(r"2x(\d+)", re.IGNORECASE)
+
+
+def to_internal_wall_data(wall_data: Dict[str, Any], wall_id: str = "wall") -> Dict[str, Any]:
+    """
+    Convert a WallDataInput payload to the internal WallData dictionary.
+
+    Args:
+        wall_data: WallDataInput.model_dump() output
+        wall_id: ID to give the wall
+
+    Returns:
+        WallData dictionary with u/v opening bounds
+    """
+    match = _NOMINAL_RE.search(wall_data.get("wall_type", ""))
+    depth_inches = _NOMINAL_DEPTH.get(match.group(1), 3.5) if match else 3.5
+
+    openings: List[Dict[str, Any]] = []
+    for i, opening in enumerate(wall_data.get("openings", [])):
+        u_start = opening["start_u_coordinate"]
+        v_start = opening["base_elevation_relative_to_wall_base"]
+        width = opening["rough_width"]
+        height = opening["rough_height"]
+        openings.append({
+            "id": f"{wall_id}_opening_{i}",
+            "opening_type": opening["opening_type"],
+            "u_start": u_start,
+            "u_end": u_start + width,
+            "v_start": v_start,
+            "v_end": v_start + height,
+            "width": width,
+            "height": height,
+        })
+
+    return {
+        "wall_id": wall_id,
+        "wall_type": wall_data.get("wall_type"),
+        "wall_length": wall_data["wall_length"],
+        "wall_height": wall_data["wall_height"],
+        "wall_thickness": depth_inches / 12.0,
+        "base_elevation": wall_data.get("wall_base_elevation", 0.0),
+        "is_exterior": wall_data.get("is_exterior_wall", True),
+        "openings": openings,
+    }
+
+
+def run_wall_analysis(wall_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze one wall: panel decomposition and sheathing layout.
+
+    Args:
+        wall_data: WallDataInput.model_dump() output
+
+    Returns:
+        Dictionary with the internal wall data, panels and sheathing
+    """
+    from src.timber_framing_generator.panels.panel_decomposer import decompose_wall_to_panels
+    from src.timber_framing_generator.sheathing.sheathing_generator import generate_wall_sheathing
+
+    wall = to_internal_wall_data(wall_data)
+    faces = ["exterior", "interior"] if wall["is_exterior"] else ["interior"]
+
+    return {
+        "wall": wall,
+        "panels": decompose_wall_to_panels(wall),
+        "sheathing": generate_wall_sheathing(wall, {"panel_size": "4x8"}, faces=faces),
+    }
@@ -16,6 +16,30 @@ class Config:
     
     # Application settings
     DEBUG = os.environ.get("DEBUG", "false").lower() == "true"
+
+    # Job pipeline
+    # Job store backend: "supabase", "sqlite" or "memory"
+    JOB_STORE = os.environ.get("JOB_STORE", "supabase").lower()
+    JOB_SQLITE_PATH = os.environ.get("JOB_SQLITE_PATH", "jobs.sqlite3")
+    # Worker executor: "process" (default) or "thread"
+    JOB_EXECUTOR = os.environ.get("JOB_EXECUTOR", "process").lower()
+    JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+    # Jobs waiting for a worker before submissions are rejected with 503
+    JOB_QUEUE_DEPTH = int(os.environ.get("JOB_QUEUE_DEPTH", "100"))
+    JOB_TIMEOUT_SECONDS = float(os.environ.get("JOB_TIMEOUT_SECONDS", "120"))
+    # Job store calls run on a thread pool so they never block the event loop
+    DB_THREADS = int(os.environ.get("DB_THREADS", "8"))
+    DB_TIMEOUT_SECONDS = float(os.environ.get("DB_TIMEOUT_SECONDS", "5"))
+    # Largest /walls/analyze/batch request
+    BATCH_MAX_WALLS = int(os.environ.get("BATCH_MAX_WALLS", "1000"))
+    # Idle seconds before a result stream sends a heartbeat event
+    STREAM_HEARTBEAT_SECONDS = float(os.environ.get("STREAM_HEARTBEAT_SECONDS", "15"))
+    # Job records cached in-process; unfinished jobs and lists for the TTL
+    JOB_CACHE_SIZE = int(os.environ.get("JOB_CACHE_SIZE", "1024"))
+    JOB_CACHE_TTL_SECONDS = float(os.environ.get("JOB_CACHE_TTL_SECONDS", "2"))
+    # Serialized job responses kept for ETag checks and compression
+    RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", "1024"))
+    GZIP_MIN_BYTES = int(os.environ.get("GZIP_MIN_BYTES", "1024"))
     
     @classmethod
     def validate(cls):
@@ -23,8 +47,14 @@ class Config:
         if not cls.API_KEY or cls.API_KEY == "dev_key":
             logger.warning("Using development API key - not secure for production!")
             
-        if not cls.SUPABASE_URL:
-            logger.error("SUPABASE_URL environment variable not set")
-            
-        if not cls.SUPABASE_SERVICE_ROLE_KEY:
-            logger.error("SUPABASE_SERVICE_ROLE_KEY environment variable not set")
\ No newline at end of file
+        if cls.JOB_STORE == "supabase":
+            if not cls.SUPABASE_URL:
+                logger.error("SUPABASE_URL environment variable not set")
+
+            if not cls.SUPABASE_SERVICE_ROLE_KEY:
+                logger.error("SUPABASE_SERVICE_ROLE_KEY environment variable not set")
+        elif cls.JOB_STORE not in ("sqlite", "memory"):
+            logger.error(f"Unknown JOB_STORE '{cls.JOB_STORE}'")
+
+        if cls.JOB_EXECUTOR not in ("process", "thread"):
+            logger.error(f"Unknown JOB_EXECUTOR '{cls.JOB_EXECUTOR}'")
\ No newline at end of file
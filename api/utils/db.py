@@ -99,6 +99,38 @@ def create_job(job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         logger.error(f"Error creating job in database: {str(e)}\n{traceback.format_exc()}")
         return None
 
+def create_jobs(jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Create several jobs with one insert request.
+    
+    Args:
+        jobs: Job dictionaries
+        
+    Returns:
+        Created job rows, or None if the insert failed
+    """
+    if not supabase:
+        logger.error("Cannot create jobs: Supabase client is not initialized")
+        return None
+    
+    try:
+        serialized = [_serialize_for_supabase(job) for job in jobs]
+        
+        logger.info(f"Creating {len(serialized)} jobs in database")
+        
+        # A single insert is one statement, so the batch is all or nothing
+        response = supabase.table("wall_jobs").insert(serialized).execute()
+        
+        if not response.data or len(response.data) != len(serialized):
+            logger.error(f"Insert returned {len(response.data or [])} of {len(serialized)} jobs")
+            return None
+            
+        return response.data
+    except Exception as e:
+        import traceback
+        logger.error(f"Error creating jobs in database: {str(e)}\n{traceback.format_exc()}")
+        return None
+
 def update_job(job_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Update a job by ID."""
     if not supabase:
@@ -133,6 +133,31 @@ class ValidationError(APIError):
             extra=extra
         )
 
+class ServiceUnavailableError(APIError):
+    """Error raised when the service is at capacity or a backend timed out."""
+    def __init__(
+        self,
+        detail: str,
+        status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE,
+        internal_code: str = "service_unavailable",
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize with capacity or timeout details.
+        
+        Args:
+            detail: Error details
+            status_code: 503 when at capacity, 504 for backend timeouts
+            internal_code: Internal error code for client reference
+            extra: Optional additional context
+        """
+        super().__init__(
+            status_code=status_code,
+            detail=detail,
+            internal_code=internal_code,
+            extra=extra
+        )
+
 def handle_exception(e: Exception, resource_type: str = "resource", resource_id: Optional[str] = None) -> HTTPException:
     """
     Handle exceptions and convert to appropriate HTTPExceptions.
@@ -175,4 +200,4 @@ def handle_exception(e: Exception, resource_type: str = "resource", resource_id:
     return HTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail=error_response
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,195 @@
+# File: api/utils/http_cache.py
+"""
+ETags, conditional requests and compression for job responses.
+
+A job response body is serialized once per job version and kept in a
+ResponseCache keyed by (job_id, status, updated_at), together with its
+strong ETag and lazily built compressed variants. ``negotiate`` turns a
+cached body plus the request's If-None-Match and Accept-Encoding headers
+into the status, headers and bytes to send: 304 with no body when the
+client's copy is current, otherwise the smallest acceptable encoding.
+
+Compressed variants get their own ETag (``"<hash>-gzip"``) as HTTP
+requires, but If-None-Match accepts any variant of the current body, so
+a client switching encodings still gets a 304. Brotli is used when the
+optional ``brotli`` package is installed; gzip otherwise.
+"""
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+TERMINAL_CACHE_CONTROL = "private, max-age=3600"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    # mtime=0 keeps the output, and so its length, deterministic
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+class EncodedBody:
+    """
+    A serialized response body with its ETag and compressed variants.
+
+    Args:
+        body: Uncompressed response bytes
+        media_type: Content-Type of the body
+    """
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self.tag = hashlib.sha256(body).hexdigest()[:32]
+        self._variants: Dict[str, bytes] = {}
+
+    def etag(self, encoding: str = "identity") -> str:
+        """Strong ETag of one encoding of the body."""
+        if encoding == "identity":
+            return f'"{self.tag}"'
+        return f'"{self.tag}-{encoding}"'
+
+    def encoded(self, encoding: str) -> bytes:
+        """The body in one encoding; compressed variants are built once."""
+        if encoding == "identity":
+            return self.body
+        variant = self._variants.get(encoding)
+        if variant is None:
+            variant = self._variants[encoding] = _compress(self.body, encoding)
+        return variant
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """
+        Whether an If-None-Match header names any variant of this body.
+
+        Comparison is weak (a W/ prefix is ignored), as RFC 9110 requires
+        for If-None-Match.
+        """
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*":
+                return True
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            tag = candidate.strip('"')
+            if tag == self.tag or tag.rsplit("-", 1)[0] == self.tag:
+                return True
+        return False
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> str:
+    """
+    Pick the response encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Request Accept-Encoding header
+
+    Returns:
+        "br", "gzip" or "identity"
+    """
+    if not accept_encoding:
+        return "identity"
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return "identity"
+
+
+def negotiate(
+    encoded: EncodedBody,
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str],
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+    min_bytes: int = 1024
+) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Build the response for a conditional, compressible GET.
+
+    Args:
+        encoded: Current response body
+        if_none_match: Request If-None-Match header
+        accept_encoding: Request Accept-Encoding header
+        cache_control: Cache-Control header to send
+        min_bytes: Bodies smaller than this are sent uncompressed
+
+    Returns:
+        Tuple of (status code, headers, body); 304 has an empty body
+    """
+    encoding = "identity"
+    if len(encoded.body) >= min_bytes:
+        encoding = choose_encoding(accept_encoding)
+    headers = {
+        "ETag": encoded.etag(encoding),
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if encoded.matches(if_none_match):
+        return 304, headers, b""
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return 200, headers, encoded.encoded(encoding)
+
+
+class ResponseCache:
+    """
+    LRU cache of serialized responses.
+
+    Keys must change whenever the response would, e.g. a job's ID,
+    status and updated_at; stale entries are then simply never hit and
+    age out.
+
+    Args:
+        max_entries: Responses kept (least recently used evicted first)
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, EncodedBody]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[EncodedBody]:
+        """Cached body, or None."""
+        encoded = self._entries.get(key)
+        if encoded is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return encoded
+
+    def put(self, key: Hashable, encoded: EncodedBody) -> EncodedBody:
+        """Cache a body and return it."""
+        self._entries[key] = encoded
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return encoded
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and size statistics."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,114 @@
+# File: api/utils/job_cache.py
+"""
+In-process cache of job records for AsyncJobStore.
+
+Polling clients read the same jobs over and over. Completed and failed
+jobs never change again, so they are cached until evicted (LRU, bounded
+by ``max_entries``); pending and processing jobs, and list pages, are
+cached for ``ttl`` seconds so a burst of polls costs one database read.
+
+Writes made through the same AsyncJobStore update the cache directly
+and drop cached list pages. Writes made by other processes become
+visible after at most ``ttl`` seconds (terminal jobs are never
+rewritten, so they cannot go stale).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+ListKey = Tuple[int, int, Optional[str]]
+
+
+class JobCache:
+    """
+    TTL/LRU cache of job records and list pages.
+
+    Args:
+        max_entries: Job records kept (least recently used evicted first)
+        ttl: Seconds non-terminal records and list pages stay valid
+        max_lists: List pages kept
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 2.0, max_lists: int = 64):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.max_lists = max(1, max_lists)
+        # job_id -> (record, expiry or None for terminal jobs)
+        self._jobs: "OrderedDict[str, Tuple[Dict[str, Any], Optional[float]]]" = OrderedDict()
+        self._lists: "OrderedDict[ListKey, Tuple[List[Dict[str, Any]], float]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cached record, or None on a miss or expiry."""
+        entry = self._jobs.get(job_id)
+        if entry is not None:
+            record, expires = entry
+            if expires is None or expires > time.monotonic():
+                self._jobs.move_to_end(job_id)
+                self.hits += 1
+                return record
+            del self._jobs[job_id]
+        self.misses += 1
+        return None
+
+    def put(self, record: Dict[str, Any]) -> None:
+        """Cache a record read from or written to the store."""
+        terminal = record.get("status") in TERMINAL_STATUSES
+        expires = None if terminal else time.monotonic() + self.ttl
+        job_id = record["job_id"]
+        self._jobs[job_id] = (record, expires)
+        self._jobs.move_to_end(job_id)
+        while len(self._jobs) > self.max_entries:
+            self._jobs.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, job_id: Optional[str] = None) -> None:
+        """Drop one job (or every job) and all list pages."""
+        if job_id is None:
+            self._jobs.clear()
+        else:
+            self._jobs.pop(job_id, None)
+        self._lists.clear()
+
+    def get_list(self, key: ListKey) -> Optional[List[Dict[str, Any]]]:
+        """Cached list page, or None on a miss or expiry."""
+        entry = self._lists.get(key)
+        if entry is not None:
+            records, expires = entry
+            if expires > time.monotonic():
+                self._lists.move_to_end(key)
+                self.hits += 1
+                return records
+            del self._lists[key]
+        self.misses += 1
+        return None
+
+    def put_list(self, key: ListKey, records: List[Dict[str, Any]]) -> None:
+        """Cache a list page; its records also fill the job cache."""
+        self._lists[key] = (records, time.monotonic() + self.ttl)
+        self._lists.move_to_end(key)
+        while len(self._lists) > self.max_lists:
+            self._lists.popitem(last=False)
+        for record in records:
+            if record.get("status") in TERMINAL_STATUSES:
+                self.put(record)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and size statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._jobs),
+            "list_pages": len(self._lists),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
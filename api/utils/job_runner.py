@@ -0,0 +1,298 @@
+# File: api/utils/job_runner.py
+"""
+Bounded worker pool for wall analysis jobs.
+
+Endpoints submit jobs and return immediately. Submitted jobs wait in a
+bounded asyncio queue; one dispatcher task per worker takes a job, marks
+it processing, runs the analysis kernel on a process pool (so CPU-bound
+framing never holds the event loop or the GIL) and writes the result or
+error back through the AsyncJobStore.
+
+Queue depth, worker count and per-job timeout come from Config. When the
+queue is full, submit raises QueueFullError and the endpoint answers 503
+instead of piling up work. A job that exceeds its timeout is marked
+failed; a process worker cannot be interrupted, so the pool slot stays
+busy until the kernel returns, which the ``timed_out`` metric exposes.
+
+Status changes are published to subscribers (see subscribe), which is
+what the batch and job progress streams are built on.
+
+Usage:
+    runner = JobRunner(store, workers=2, queue_depth=100, job_timeout=120)
+    await runner.start()
+    job = await runner.submit(job_dict)
+    ...
+    await runner.stop()
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from api.utils.analysis import run_wall_analysis
+from api.utils.job_store import AsyncJobStore
+from api.utils.metrics import LatencyStats
+
+logger = logging.getLogger("timber_framing.jobs")
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue has no room for another job."""
+
+
+class JobRunner:
+    """
+    Asynchronous job queue with a bounded process (or thread) pool.
+
+    Args:
+        store: Job store used for status updates
+        kernel: Picklable function of the job's wall_data returning a
+            JSON-serializable result
+        workers: Number of concurrent jobs
+        queue_depth: Jobs that may wait for a worker
+        job_timeout: Seconds a job may run before it is marked failed
+        executor: "process" or "thread"
+    """
+
+    def __init__(
+        self,
+        store: AsyncJobStore,
+        kernel: Callable[[Dict[str, Any]], Dict[str, Any]] = run_wall_analysis,
+        workers: int = 2,
+        queue_depth: int = 100,
+        job_timeout: float = 120.0,
+        executor: str = "process"
+    ):
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown executor '{executor}'")
+        self.store = store
+        self.kernel = kernel
+        self.workers = max(1, workers)
+        self.queue_depth = max(1, queue_depth)
+        self.job_timeout = job_timeout
+        self.executor_kind = executor
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._pool: Optional[Executor] = None
+        self._tasks: List[asyncio.Task] = []
+        self._reserved = 0  # submissions waiting on create_job
+        self._running = 0
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.job_seconds = LatencyStats()
+        self.queue_wait_seconds = LatencyStats()
+
+    @property
+    def started(self) -> bool:
+        return self._pool is not None
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or being submitted, not yet picked up by a worker."""
+        return (self._queue.qsize() if self._queue else 0) + self._reserved
+
+    async def start(self) -> None:
+        """Create the worker pool and dispatcher tasks."""
+        if self.started:
+            return
+        if self.executor_kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-worker")
+        self._queue = asyncio.Queue(maxsize=self.queue_depth)
+        self._tasks = [
+            asyncio.create_task(self._dispatch(), name=f"job-dispatcher-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(
+            f"Job runner started: {self.workers} {self.executor_kind} workers, "
+            f"queue depth {self.queue_depth}, timeout {self.job_timeout}s"
+        )
+
+    async def stop(self, drain: bool = False) -> None:
+        """
+        Stop the dispatchers and shut down the worker pool.
+
+        Args:
+            drain: Wait for queued jobs to finish first
+        """
+        if not self.started:
+            return
+        if drain:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        logger.info("Job runner stopped")
+
+    async def submit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a new job record and queue it for analysis.
+
+        Args:
+            job: Job record (WallAnalysisJob.model_dump()) with status pending
+
+        Returns:
+            The stored job record
+
+        Raises:
+            QueueFullError: If queue_depth jobs are already waiting
+            RuntimeError: If the runner is not started or the store write failed
+        """
+        return (await self.submit_many([job]))[0]
+
+    async def submit_many(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store and queue several jobs; all are accepted or none.
+
+        Args:
+            jobs: Job records with status pending
+
+        Returns:
+            The stored job records, in input order
+
+        Raises:
+            QueueFullError: If the queue has no room for every job
+            RuntimeError: If the runner is not started or a store write failed
+        """
+        if not self.started:
+            raise RuntimeError("Job runner is not started")
+        if self.pending + len(jobs) > self.queue_depth:
+            self.rejected += len(jobs)
+            raise QueueFullError(
+                f"Job queue is full ({self.pending} of {self.queue_depth} slots taken, "
+                f"{len(jobs)} requested)"
+            )
+
+        # Hold the queue slots while the records are written
+        self._reserved += len(jobs)
+        try:
+            records = await self.store.create_jobs(jobs)
+        finally:
+            self._reserved -= len(jobs)
+        if not records:
+            raise RuntimeError(f"Failed to create {len(jobs)} jobs in job store")
+
+        now = time.perf_counter()
+        for job in jobs:
+            self._queue.put_nowait((job["job_id"], job["wall_data"], now))
+        self.submitted += len(jobs)
+        return records
+
+    def subscribe(self, job_ids: Iterable[str]) -> asyncio.Queue:
+        """
+        Receive status events for jobs run by this runner.
+
+        Subscribe before submitting to see every event. Events are dicts
+        with job_id and status, plus result or error once the job is done.
+
+        Args:
+            job_ids: Jobs to follow
+
+        Returns:
+            Queue the events are put on; pass it to unsubscribe when done
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.job_ids = set(job_ids)
+        for job_id in queue.job_ids:
+            self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering events to a subscription queue."""
+        for job_id in queue.job_ids:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(event["job_id"], ()):
+            queue.put_nowait(event)
+
+    async def _dispatch(self) -> None:
+        while True:
+            job_id, payload, enqueued = await self._queue.get()
+            try:
+                self.queue_wait_seconds.record(time.perf_counter() - enqueued)
+                await self._run(job_id, payload)
+            except Exception as e:
+                logger.error(f"Unexpected error running job {job_id}: {str(e)}")
+                self._publish({"job_id": job_id, "status": "failed", "error": str(e)})
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, payload: Dict[str, Any]) -> None:
+        await self._update(job_id, {"status": "processing"})
+        self._publish({"job_id": job_id, "status": "processing"})
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        self._running += 1
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(self._pool, self.kernel, payload), self.job_timeout
+            )
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self.failed += 1
+            logger.error(f"Job {job_id} timed out after {self.job_timeout}s")
+            await self._finish(job_id, {
+                "status": "failed",
+                "error": f"Analysis timed out after {self.job_timeout} seconds",
+            })
+            return
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Job {job_id} failed: {str(e)}")
+            await self._finish(job_id, {"status": "failed", "error": str(e)})
+            return
+        finally:
+            self._running -= 1
+            self.job_seconds.record(time.perf_counter() - start)
+
+        self.completed += 1
+        await self._finish(job_id, {"status": "completed", "result": result})
+
+    async def _finish(self, job_id: str, changes: Dict[str, Any]) -> None:
+        # Store first so readers notified by the event see the final record
+        await self._update(job_id, changes)
+        self._publish({"job_id": job_id, **changes})
+
+    async def _update(self, job_id: str, changes: Dict[str, Any]) -> None:
+        try:
+            if not await self.store.update_job(job_id, changes):
+                logger.error(f"Failed to set job {job_id} to '{changes['status']}'")
+        except Exception as e:
+            logger.error(f"Error setting job {job_id} to '{changes['status']}': {str(e)}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue, worker, job and job store statistics."""
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "running": self._running,
+            "queue_depth": self.pending,
+            "queue_capacity": self.queue_depth,
+            "job_timeout_seconds": self.job_timeout,
+            "subscribed_jobs": len(self._subscribers),
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "job_duration": self.job_seconds.to_dict(),
+            "queue_wait": self.queue_wait_seconds.to_dict(),
+            "job_store": self.store.metrics(),
+        }
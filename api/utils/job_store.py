@@ -0,0 +1,542 @@
+# File: api/utils/job_store.py
+"""
+Pluggable job storage for wall analysis jobs.
+
+Job records are plain dictionaries shaped like WallAnalysisJob, with
+datetimes stored as ISO strings (what Supabase returns). Three backends
+share the JobStore interface:
+
+- SupabaseJobStore: the hosted ``wall_jobs`` table (api.utils.db)
+- SQLiteJobStore: a local file or ``:memory:`` database, for development,
+  tests and single-node deployments without Supabase
+- InMemoryJobStore: a dictionary, for tests
+
+All backends are synchronous. Endpoints and the job runner go through
+AsyncJobStore, which runs every call on a bounded thread pool with a
+timeout so a slow database never blocks the event loop, and optionally
+serves reads from a JobCache.
+
+Usage:
+    store = AsyncJobStore(create_job_store("sqlite", sqlite_path="jobs.db"))
+    job = await store.create_job(job_dict)
+    jobs = await store.list_jobs(limit=10)
+"""
+
+import asyncio
+import copy
+import datetime
+import functools
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from api.utils.job_cache import JobCache
+from api.utils.metrics import OperationStats
+
+logger = logging.getLogger("timber_framing.db")
+
+# Columns of the wall_jobs table; JSON columns are stored as text in SQLite
+JOB_COLUMNS = ("job_id", "status", "created_at", "updated_at", "wall_data", "result", "error")
+_JSON_COLUMNS = ("wall_data", "result")
+
+
+class JobStoreTimeout(TimeoutError):
+    """Raised when a job store call exceeds its timeout."""
+
+
+def serialize_job_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert datetimes to ISO strings, recursively.
+
+    Args:
+        data: Job fields
+
+    Returns:
+        JSON-compatible copy of the fields
+    """
+    def convert(value):
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        if isinstance(value, dict):
+            return {k: convert(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [convert(v) for v in value]
+        return value
+
+    return convert(data)
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat()
+
+
+class JobStore(ABC):
+    """
+    Synchronous job storage interface.
+
+    create_job and update_job return the stored record, or None when the
+    write failed; list_jobs raises RuntimeError on backend errors.
+    """
+
+    @abstractmethod
+    def create_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Insert a new job record."""
+
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Insert several job records; all are written or none.
+
+        Args:
+            jobs: Job records
+
+        Returns:
+            Stored records in input order, or None when the write failed
+        """
+        records = []
+        for job in jobs:
+            record = self.create_job(job)
+            if record is None:
+                for written in records:
+                    self.delete_job(written["job_id"])
+                return None
+            records.append(record)
+        return records
+
+    @abstractmethod
+    def update_job(self, job_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update fields of a job; updated_at defaults to now."""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID, or None if it does not exist."""
+
+    @abstractmethod
+    def list_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List jobs, newest first, optionally filtered by status."""
+
+    @abstractmethod
+    def delete_job(self, job_id: str) -> bool:
+        """Delete a job; True if it existed."""
+
+    def check_connection(self) -> bool:
+        """Check that the backend is reachable."""
+        return True
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemoryJobStore(JobStore):
+    """Job store backed by a dictionary (records are copied in and out)."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        record = {column: None for column in JOB_COLUMNS}
+        record.update(serialize_job_data(job_data))
+        with self._lock:
+            if record["job_id"] in self._jobs:
+                logger.error(f"Job {record['job_id']} already exists")
+                return None
+            self._jobs[record["job_id"]] = record
+            return copy.deepcopy(record)
+
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        records = []
+        for job in jobs:
+            record = {column: None for column in JOB_COLUMNS}
+            record.update(serialize_job_data(job))
+            records.append(record)
+        with self._lock:
+            ids = [r["job_id"] for r in records]
+            if len(set(ids)) < len(ids) or any(i in self._jobs for i in ids):
+                logger.error("Duplicate job IDs in batch")
+                return None
+            for record in records:
+                self._jobs[record["job_id"]] = record
+            return copy.deepcopy(records)
+
+    def update_job(self, job_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        changes = serialize_job_data(update_data)
+        changes.setdefault("updated_at", _now())
+        with self._lock:
+            record = self._jobs.get(job_id)
+            if record is None:
+                logger.error(f"Cannot update job {job_id}: not found")
+                return None
+            record.update(changes)
+            return copy.deepcopy(record)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return copy.deepcopy(record) if record is not None else None
+
+    def list_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = [j for j in self._jobs.values() if status is None or j["status"] == status]
+            jobs.sort(key=lambda j: j["created_at"] or "", reverse=True)
+            return copy.deepcopy(jobs[offset:offset + limit])
+
+    def delete_job(self, job_id: str) -> bool:
+        with self._lock:
+            return self._jobs.pop(job_id, None) is not None
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store backed by SQLite.
+
+    One connection is shared by the DB thread pool and serialized with a
+    lock; file databases use WAL so readers in other processes are not
+    blocked by writes.
+
+    Args:
+        path: Database file path, or ":memory:"
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS wall_jobs ("
+            "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+            "created_at TEXT, updated_at TEXT, "
+            "wall_data TEXT, result TEXT, error TEXT)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS wall_jobs_status_created "
+            "ON wall_jobs (status, created_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS wall_jobs_created ON wall_jobs (created_at)"
+        )
+
+    @staticmethod
+    def _encode(column: str, value: Any) -> Any:
+        if column in _JSON_COLUMNS and value is not None:
+            return json.dumps(value)
+        return value
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        for column in _JSON_COLUMNS:
+            if record.get(column) is not None:
+                record[column] = json.loads(record[column])
+        return record
+
+    def _fetch(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT * FROM wall_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._decode(row) if row is not None else None
+
+    def create_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        record = serialize_job_data(job_data)
+        columns = [c for c in JOB_COLUMNS if c in record]
+        try:
+            with self._lock:
+                self._conn.execute(
+                    f"INSERT INTO wall_jobs ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    [self._encode(c, record[c]) for c in columns],
+                )
+                return self._fetch(record["job_id"])
+        except sqlite3.Error as e:
+            logger.error(f"Error creating job in SQLite: {str(e)}")
+            return None
+
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        records = [serialize_job_data(job) for job in jobs]
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for record in records:
+                        columns = [c for c in JOB_COLUMNS if c in record]
+                        self._conn.execute(
+                            f"INSERT INTO wall_jobs ({', '.join(columns)}) "
+                            f"VALUES ({', '.join('?' for _ in columns)})",
+                            [self._encode(c, record[c]) for c in columns],
+                        )
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"Error creating {len(records)} jobs in SQLite: {str(e)}")
+            return None
+        return [{c: record.get(c) for c in JOB_COLUMNS} for record in records]
+
+    def update_job(self, job_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        changes = serialize_job_data(update_data)
+        changes.setdefault("updated_at", _now())
+        columns = [c for c in JOB_COLUMNS if c in changes and c != "job_id"]
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    f"UPDATE wall_jobs SET {', '.join(f'{c} = ?' for c in columns)} "
+                    f"WHERE job_id = ?",
+                    [self._encode(c, changes[c]) for c in columns] + [job_id],
+                )
+                if cursor.rowcount == 0:
+                    logger.error(f"Cannot update job {job_id}: not found")
+                    return None
+                return self._fetch(job_id)
+        except sqlite3.Error as e:
+            logger.error(f"Error updating job {job_id} in SQLite: {str(e)}")
+            return None
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._fetch(job_id)
+
+    def list_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        query = "SELECT * FROM wall_jobs"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        try:
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Database error while listing jobs: {str(e)}")
+        return [self._decode(row) for row in rows]
+
+    def delete_job(self, job_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM wall_jobs WHERE job_id = ?", (job_id,))
+            return cursor.rowcount > 0
+
+    def check_connection(self) -> bool:
+        try:
+            with self._lock:
+                self._conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"SQLite connection check failed: {str(e)}")
+            return False
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SupabaseJobStore(JobStore):
+    """Job store backed by the Supabase ``wall_jobs`` table (api.utils.db)."""
+
+    def __init__(self):
+        # Imported here so the other backends work without the supabase package
+        from api.utils import db
+        self._db = db
+
+    def create_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self._db.create_job(job_data)
+
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        return self._db.create_jobs(jobs)
+
+    def update_job(self, job_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self._db.update_job(job_id, serialize_job_data(update_data))
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._db.get_job(job_id)
+
+    def list_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return self._db.list_jobs(limit, offset, status)
+
+    def delete_job(self, job_id: str) -> bool:
+        return self._db.delete_job(job_id)
+
+    def check_connection(self) -> bool:
+        return self._db.check_supabase_connection()
+
+
+def create_job_store(backend: str = "supabase", sqlite_path: str = ":memory:") -> JobStore:
+    """
+    Create a job store backend by name.
+
+    Args:
+        backend: "supabase", "sqlite" or "memory"
+        sqlite_path: Database path for the sqlite backend
+
+    Returns:
+        JobStore instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = backend.lower()
+    if backend == "supabase":
+        return SupabaseJobStore()
+    if backend == "sqlite":
+        return SQLiteJobStore(sqlite_path)
+    if backend == "memory":
+        return InMemoryJobStore()
+    raise ValueError(f"Unknown job store backend '{backend}'")
+
+
+class AsyncJobStore:
+    """
+    Non-blocking facade over a JobStore.
+
+    Every call runs on a dedicated thread pool and is bounded by a
+    timeout. A call that times out raises JobStoreTimeout; its thread
+    finishes in the background and the pool stays bounded.
+
+    With a cache, get_job and list_jobs are answered from it when
+    possible and writes update it. Cached records are shared; treat
+    returned records as read-only.
+
+    Args:
+        store: Synchronous backend
+        threads: Thread pool size
+        timeout: Per-call timeout in seconds
+        cache: Optional record cache
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        threads: int = 8,
+        timeout: float = 5.0,
+        cache: Optional[JobCache] = None
+    ):
+        self.store = store
+        self.timeout = timeout
+        self.cache = cache
+        self.threads = max(1, threads)
+        self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="job-store")
+        self._stats: Dict[str, OperationStats] = {}
+
+    async def _call(self, operation: str, *args, **kwargs):
+        stats = self._stats.setdefault(operation, OperationStats())
+        stats.calls += 1
+        loop = asyncio.get_running_loop()
+        fn = functools.partial(getattr(self.store, operation), *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, fn), self.timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise JobStoreTimeout(f"Job store {operation} timed out after {self.timeout}s")
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.latency.record(time.perf_counter() - start)
+
+    async def create_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        record = await self._call("create_job", job_data)
+        if self.cache is not None:
+            self.cache.invalidate(job_data["job_id"])
+            if record:
+                self.cache.put(record)
+        return record
+
+    async def create_jobs(self, jobs: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        records = await self._call("create_jobs", jobs)
+        if self.cache is not None:
+            # Only the new ids (and list pages); cached terminal jobs stay
+            for job in jobs:
+                self.cache.invalidate(job["job_id"])
+            for record in records or ():
+                self.cache.put(record)
+        return records
+
+    async def update_job(self, job_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            record = await self._call("update_job", job_id, update_data)
+        finally:
+            # The write may have landed even if the call failed
+            if self.cache is not None:
+                self.cache.invalidate(job_id)
+        if self.cache is not None and record:
+            self.cache.put(record)
+        return record
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self.cache is not None:
+            record = self.cache.get(job_id)
+            if record is not None:
+                return record
+        record = await self._call("get_job", job_id)
+        if self.cache is not None and record:
+            self.cache.put(record)
+        return record
+
+    async def list_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        key = (limit, offset, status)
+        if self.cache is not None:
+            records = self.cache.get_list(key)
+            if records is not None:
+                return records
+        records = await self._call("list_jobs", limit, offset, status)
+        if self.cache is not None:
+            self.cache.put_list(key, records)
+        return records
+
+    async def delete_job(self, job_id: str) -> bool:
+        try:
+            return await self._call("delete_job", job_id)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(job_id)
+
+    async def check_connection(self) -> bool:
+        return await self._call("check_connection")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-operation call, error, timeout and latency statistics."""
+        return {
+            "backend": type(self.store).__name__,
+            "threads": self.threads,
+            "timeout_seconds": self.timeout,
+            "operations": {name: s.to_dict() for name, s in sorted(self._stats.items())},
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    def close(self) -> None:
+        """Shut down the thread pool and close the backend."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.store.close()
@@ -0,0 +1,60 @@
+# File: api/utils/metrics.py
+"""
+In-process metrics for the job pipeline.
+
+Counters and latency statistics are updated from the event loop (and, for
+job store calls, from the coroutine awaiting the thread pool), so plain
+attributes are enough; no locking is needed.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class LatencyStats:
+    """Running count, mean and max of a duration in seconds."""
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "count": self.count,
+            "mean_seconds": round(self.mean, 6),
+            "max_seconds": round(self.max, 6),
+        }
+
+
+@dataclass
+class OperationStats:
+    """Call counts and latency for one job store operation."""
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    latency: LatencyStats = None
+
+    def __post_init__(self):
+        if self.latency is None:
+            self.latency = LatencyStats()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            **self.latency.to_dict(),
+        }
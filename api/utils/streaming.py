@@ -0,0 +1,188 @@
+# File: api/utils/streaming.py
+"""
+Streaming job results as NDJSON or server-sent events.
+
+Both the batch endpoint and the job progress endpoint produce a sequence
+of event dictionaries, each with an ``event`` name:
+
+- ``batch``: the accepted batch (batch_id and job IDs in input order)
+- ``status``: a job's status changed (progress streams only)
+- ``job``: a job finished, with its result or error
+- ``heartbeat``: nothing happened for a while; keeps proxies from
+  closing the connection
+- ``done``: every job finished (completed and failed counts)
+
+The events are encoded one per line as NDJSON, or as SSE messages whose
+``event:`` field is the event name and ``data:`` field the JSON body.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from api.utils.job_runner import JobRunner
+from api.utils.job_store import AsyncJobStore, JobStoreTimeout
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def stream_media_type(format: Optional[str], accept: Optional[str]) -> str:
+    """
+    Choose the stream encoding.
+
+    Args:
+        format: Explicit "ndjson" or "sse" query parameter, if any
+        accept: Request Accept header
+
+    Returns:
+        NDJSON_MEDIA_TYPE or SSE_MEDIA_TYPE
+
+    Raises:
+        ValueError: If format is not "ndjson" or "sse"
+    """
+    if format:
+        if format not in ("ndjson", "sse"):
+            raise ValueError(f"Unknown stream format '{format}'")
+        return SSE_MEDIA_TYPE if format == "sse" else NDJSON_MEDIA_TYPE
+    if accept and SSE_MEDIA_TYPE in accept:
+        return SSE_MEDIA_TYPE
+    return NDJSON_MEDIA_TYPE
+
+
+def encode_event(event: Dict[str, Any], media_type: str) -> str:
+    """
+    Encode one event for the wire.
+
+    Args:
+        event: Event dictionary with an "event" name
+        media_type: NDJSON_MEDIA_TYPE or SSE_MEDIA_TYPE
+
+    Returns:
+        NDJSON line or SSE message
+    """
+    data = json.dumps(event, separators=(",", ":"), default=str)
+    if media_type == SSE_MEDIA_TYPE:
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+def _job_event(record: Dict[str, Any]) -> Dict[str, Any]:
+    event = {"event": "job", "job_id": record["job_id"], "status": record["status"]}
+    if record["status"] == "completed":
+        event["result"] = record.get("result")
+    else:
+        event["error"] = record.get("error")
+    return event
+
+
+async def iter_batch_events(
+    runner: JobRunner,
+    subscription: asyncio.Queue,
+    batch_id: str,
+    job_ids: List[str],
+    heartbeat: float = 15.0
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield batch events until every job in the batch has finished.
+
+    Job events arrive in completion order and carry the job's index in
+    the submitted batch.
+
+    Args:
+        runner: Runner the jobs were submitted to
+        subscription: runner.subscribe(job_ids), taken before submitting
+        batch_id: Batch identifier
+        job_ids: Job IDs in input order
+        heartbeat: Seconds without events before a heartbeat is sent
+
+    Yields:
+        Event dictionaries
+    """
+    index = {job_id: i for i, job_id in enumerate(job_ids)}
+    counts = {"completed": 0, "failed": 0}
+    try:
+        yield {"event": "batch", "batch_id": batch_id, "job_ids": job_ids, "total": len(job_ids)}
+        remaining = len(job_ids)
+        while remaining:
+            try:
+                update = await asyncio.wait_for(subscription.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield {"event": "heartbeat", "batch_id": batch_id, "remaining": remaining}
+                continue
+            if update["status"] not in TERMINAL_STATUSES:
+                continue
+            remaining -= 1
+            counts[update["status"]] += 1
+            event = _job_event(update)
+            event["index"] = index[update["job_id"]]
+            event["finished"] = len(job_ids) - remaining
+            event["total"] = len(job_ids)
+            yield event
+        yield {"event": "done", "batch_id": batch_id, "total": len(job_ids), **counts}
+    finally:
+        runner.unsubscribe(subscription)
+
+
+async def iter_job_progress(
+    runner: JobRunner,
+    store: AsyncJobStore,
+    job_id: str,
+    heartbeat: float = 15.0,
+    refresh: float = 5.0
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield a job's status changes until it finishes.
+
+    Starts with the stored status. Events come from the runner; the job
+    store is re-read every ``refresh`` seconds without events, so jobs
+    run by another API process still finish the stream.
+
+    Args:
+        runner: This process's job runner
+        store: Job store
+        job_id: Job to follow
+        heartbeat: Seconds without changes before a heartbeat is sent
+        refresh: Seconds without events before the store is re-read
+
+    Yields:
+        Event dictionaries
+    """
+    subscription = runner.subscribe([job_id])
+    try:
+        record = await store.get_job(job_id)
+        if record is None:
+            yield {"event": "error", "job_id": job_id, "error": "Job not found"}
+            return
+        status = record["status"]
+        yield {"event": "status", "job_id": job_id, "status": status}
+
+        loop = asyncio.get_running_loop()
+        last_change = loop.time()
+        while status not in TERMINAL_STATUSES:
+            try:
+                update = await asyncio.wait_for(subscription.get(), min(heartbeat, refresh))
+            except asyncio.TimeoutError:
+                try:
+                    update = await store.get_job(job_id)
+                except JobStoreTimeout:
+                    continue
+                if update is None:
+                    yield {"event": "error", "job_id": job_id, "error": "Job not found"}
+                    return
+            if update["status"] != status:
+                status = update["status"]
+                last_change = loop.time()
+                record = update
+                if status not in TERMINAL_STATUSES:
+                    yield {"event": "status", "job_id": job_id, "status": status}
+            elif loop.time() - last_change >= heartbeat:
+                last_change = loop.time()
+                yield {"event": "heartbeat", "job_id": job_id, "status": status}
+
+        yield _job_event(record)
+        yield {"event": "done", "job_id": job_id, "status": status}
+    finally:
+        runner.unsubscribe(subscription)
@@ -0,0 +1,27 @@
+# File: benchmarks/__init__.py
+"""
+Headless end-to-end benchmarks for the framing pipeline.
+
+Seeded synthetic buildings (generators) are pushed through the pipeline
+stages (stages) - serializers, panels, joints, sheathing, framing cut
+list and MEP routing - measuring time and peak memory per stage and
+comparing against a stored baseline (runner). Nothing needs Rhino or
+Revit.
+
+Run from the repository root:
+    python scripts/benchmark_pipeline.py
+    python -m pytest benchmarks --benchmark-only   # with pytest-benchmark
+"""
+
+from benchmarks.generators import SyntheticBuilding, generate_building
+from benchmarks.runner import compare_to_baseline, run_suite
+from benchmarks.stages import PIPELINE_STAGES, Stage
+
+__all__ = [
+    "SyntheticBuilding",
+    "generate_building",
+    "run_suite",
+    "compare_to_baseline",
+    "PIPELINE_STAGES",
+    "Stage",
+]
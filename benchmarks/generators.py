@@ -0,0 +1,427 @@
+# File: benchmarks/generators.py
+"""
+Seeded synthetic buildings for the pipeline benchmarks.
+
+Each floor is a row of rectangular rooms: exterior walls along the front
+and back, partitions between rooms, all meeting at shared endpoints so
+corner detection has real work to do. Walls carry windows and doors at a
+configurable density, and each floor gets plumbing and electrical
+fixtures mounted on its walls plus wet-wall and panel targets for them.
+
+Walls are WallData dictionaries (core.json_schemas) with the base plane
+convention used by the panel and sheathing code: X along the wall, Y up,
+Z the wall normal. ``routing_walls`` adds the keys the MEP routing code
+reads.
+
+The same seed and parameters always produce the same building.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+STUD_SPACING = 16.0 / 12.0
+PLATE_THICKNESS = 1.5 / 12.0
+MAX_PLATE_LENGTH = 16.0
+
+# Nominal lumber profile -> (width, depth) in feet
+PROFILE_SIZES = {
+    "2x4": (1.5 / 12.0, 3.5 / 12.0),
+    "2x6": (1.5 / 12.0, 5.5 / 12.0),
+    "2x10": (1.5 / 12.0, 9.25 / 12.0),
+}
+
+# fixture type -> (connectors as (system type, diameter ft), mounting height ft)
+FIXTURE_TYPES = {
+    "sink": ([("sanitary_drain", 0.125), ("domestic_cold_water", 0.0417),
+              ("domestic_hot_water", 0.0417)], 1.5),
+    "toilet": ([("sanitary_drain", 0.25), ("domestic_cold_water", 0.0417)], 0.5),
+    "shower": ([("sanitary_drain", 0.167), ("domestic_hot_water", 0.0417)], 0.25),
+    "outlet": ([("power", 0.0625)], 1.5),
+}
+
+PLUMBING_SYSTEMS = [
+    "sanitary_drain", "sanitary_vent", "domestic_hot_water", "domestic_cold_water"
+]
+
+
+@dataclass
+class SyntheticBuilding:
+    """
+    A generated building.
+
+    Attributes:
+        walls: WallData dictionaries, floor by floor
+        connectors: ConnectorInfo field dictionaries
+        targets: RoutingTarget field dictionaries (target_type as its value)
+        floor_bounds: (x_min, x_max, y_min, y_max) per floor
+        floor_height: Floor-to-floor height in feet
+        seed: Seed the building was generated from
+    """
+    walls: List[Dict[str, Any]]
+    connectors: List[Dict[str, Any]] = field(default_factory=list)
+    targets: List[Dict[str, Any]] = field(default_factory=list)
+    floor_bounds: List[Tuple[float, float, float, float]] = field(default_factory=list)
+    floor_height: float = 10.0
+    seed: str = ""
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts describing the building."""
+        return {
+            "walls": len(self.walls),
+            "floors": len(self.floor_bounds),
+            "openings": sum(len(w["openings"]) for w in self.walls),
+            "connectors": len(self.connectors),
+            "targets": len(self.targets),
+            "wall_length_ft": round(sum(w["wall_length"] for w in self.walls), 1),
+        }
+
+
+def _point(x: float, y: float, z: float) -> Dict[str, float]:
+    return {"x": x, "y": y, "z": z}
+
+
+def _make_wall(
+    wall_id: str,
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    elevation: float,
+    height: float,
+    is_exterior: bool,
+    opening_density: float,
+    rng: random.Random
+) -> Dict[str, Any]:
+    """WallData dictionary for a straight wall with generated openings."""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = math.hypot(dx, dy)
+    ux, uy = dx / length, dy / length
+    thickness = (5.5 if is_exterior else 3.5) / 12.0
+
+    openings = []
+    u = rng.uniform(1.5, 3.0)
+    while True:
+        is_door = not is_exterior or rng.random() < 0.15
+        width = 3.0 if is_door else rng.choice([2.0, 3.0, 4.0, 5.0])
+        if u + width + 1.5 > length:
+            break
+        if rng.random() >= opening_density:
+            u += rng.uniform(3.0, 6.0)
+            continue
+        if is_door:
+            v_start, opening_height = 0.0, 6.75
+        else:
+            v_start = rng.choice([2.5, 3.0, 3.5])
+            opening_height = min(rng.choice([3.0, 4.0, 5.0]), height - v_start - 1.0)
+        openings.append({
+            "id": f"{wall_id}_o{len(openings)}",
+            "opening_type": "door" if is_door else "window",
+            "u_start": u,
+            "u_end": u + width,
+            "v_start": v_start,
+            "v_end": v_start + opening_height,
+            "width": width,
+            "height": opening_height,
+            "sill_height": None if is_door else v_start,
+        })
+        u += width + rng.uniform(2.0, 4.0)
+
+    return {
+        "wall_id": wall_id,
+        "wall_length": length,
+        "wall_height": height,
+        "wall_thickness": thickness,
+        "base_elevation": elevation,
+        "top_elevation": elevation + height,
+        "base_plane": {
+            "origin": _point(start[0], start[1], elevation),
+            "x_axis": _point(ux, uy, 0.0),
+            "y_axis": _point(0.0, 0.0, 1.0),
+            "z_axis": _point(uy, -ux, 0.0),
+        },
+        "base_curve_start": _point(start[0], start[1], elevation),
+        "base_curve_end": _point(end[0], end[1], elevation),
+        "openings": openings,
+        "is_exterior": is_exterior,
+        "wall_type": "2x6 EXT" if is_exterior else "2x4 INT",
+        "base_level_id": None,
+        "top_level_id": None,
+        "metadata": {},
+    }
+
+
+def generate_building(
+    num_walls: int = 200,
+    opening_density: float = 0.5,
+    fixtures_per_floor: int = 12,
+    walls_per_floor: int = 40,
+    seed: str = "pipeline"
+) -> SyntheticBuilding:
+    """
+    Generate a multi-floor building.
+
+    Args:
+        num_walls: Total walls (the last floor may be partial)
+        opening_density: Chance (0-1) of an opening at each candidate slot
+        fixtures_per_floor: Plumbing and electrical fixtures per floor
+        walls_per_floor: Walls per full floor (rooms = (walls - 1) // 3)
+        seed: Random seed
+
+    Returns:
+        SyntheticBuilding
+    """
+    rng = random.Random(seed)
+    rooms = max(1, (walls_per_floor - 1) // 3)
+    wall_height = rng.choice([8.0, 9.0, 10.0])
+    floor_height = wall_height + 1.0
+    building = SyntheticBuilding(walls=[], floor_height=floor_height, seed=seed)
+
+    floor = 0
+    while len(building.walls) < num_walls:
+        z = floor * floor_height
+        depth = rng.uniform(12.0, 30.0)
+        xs = [0.0]
+        for _ in range(rooms):
+            xs.append(xs[-1] + rng.uniform(10.0, 20.0))
+
+        segments = []
+        for i in range(rooms):
+            segments.append(((xs[i], 0.0), (xs[i + 1], 0.0), True))
+            segments.append(((xs[i + 1], depth), (xs[i], depth), True))
+        for j, x in enumerate(xs):
+            segments.append(((x, 0.0), (x, depth), j in (0, rooms)))
+
+        floor_walls = []
+        for start, end, exterior in segments[:num_walls - len(building.walls)]:
+            wall_id = f"f{floor}_w{len(floor_walls)}"
+            floor_walls.append(_make_wall(
+                wall_id, start, end, z, wall_height, exterior, opening_density, rng
+            ))
+        building.walls.extend(floor_walls)
+        building.floor_bounds.append((0.0, xs[-1], 0.0, depth))
+        _add_fixtures(building, floor_walls, floor, fixtures_per_floor, rng)
+        floor += 1
+
+    return building
+
+
+def _wall_point(wall: Dict[str, Any], u: float, offset: float, z: float) -> Tuple[float, float, float]:
+    """World point at u along the wall, offset along its normal."""
+    plane = wall["base_plane"]
+    origin, x_axis, normal = plane["origin"], plane["x_axis"], plane["z_axis"]
+    return (
+        origin["x"] + x_axis["x"] * u + normal["x"] * offset,
+        origin["y"] + x_axis["y"] * u + normal["y"] * offset,
+        z,
+    )
+
+
+def _add_fixtures(
+    building: SyntheticBuilding,
+    walls: List[Dict[str, Any]],
+    floor: int,
+    count: int,
+    rng: random.Random
+) -> None:
+    """Add fixtures on the floor's walls and the targets serving them."""
+    if not walls:
+        return
+    names = sorted(FIXTURE_TYPES)
+    for n in range(count):
+        wall = rng.choice(walls)
+        fixture_type = rng.choice(names)
+        systems, mount = FIXTURE_TYPES[fixture_type]
+        u = rng.uniform(0.5, wall["wall_length"] - 0.5)
+        z = wall["base_elevation"] + mount
+        fixture_id = f"f{floor}_fx{n}"
+        for k, (system, diameter) in enumerate(systems):
+            building.connectors.append({
+                "id": f"{fixture_id}_c{k}",
+                "system_type": system,
+                "location": _wall_point(wall, u + 0.1 * k, 0.25, z),
+                "direction": "outward",
+                "diameter": diameter,
+                "fixture_id": fixture_id,
+                "fixture_type": fixture_type,
+                "wall_id": wall["wall_id"],
+                "elevation": z,
+            })
+
+    # One wet wall and one electrical panel per floor
+    for name, target_type, systems in (
+        ("wet", "wet_wall", PLUMBING_SYSTEMS),
+        ("panel", "equipment", ["power"]),
+    ):
+        wall = rng.choice(walls)
+        u = wall["wall_length"] / 2.0
+        building.targets.append({
+            "id": f"f{floor}_{name}",
+            "target_type": target_type,
+            "location": _wall_point(wall, u, 0.0, wall["base_elevation"]),
+            "domain_id": wall["wall_id"],
+            "plane_location": (u, 0.0),
+            "systems_served": list(systems),
+        })
+
+
+def routing_walls(walls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Wall dictionaries in the form the MEP routing code reads.
+
+    Args:
+        walls: WallData dictionaries
+
+    Returns:
+        Dictionaries with id, length, height, thickness, start/end and
+        start_point/end_point lists, base_elevation and openings
+    """
+    result = []
+    for wall in walls:
+        start = wall["base_curve_start"]
+        end = wall["base_curve_end"]
+        start_xyz = [start["x"], start["y"], start["z"]]
+        end_xyz = [end["x"], end["y"], end["z"]]
+        result.append({
+            "id": wall["wall_id"],
+            "length": wall["wall_length"],
+            "height": wall["wall_height"],
+            "thickness": wall["wall_thickness"],
+            "start": start_xyz,
+            "end": end_xyz,
+            "start_point": start_xyz,
+            "end_point": end_xyz,
+            "base_elevation": wall["base_elevation"],
+            "openings": wall["openings"],
+        })
+    return result
+
+
+def _member(wall: Dict[str, Any], member_id: str, element_type: str, profile: str,
+            u: float, v_start: float, length: float, horizontal: bool) -> Dict[str, Any]:
+    """Framing element dictionary in wall-local coordinates."""
+    start = {"x": u, "y": 0.0, "z": v_start}
+    end = {"x": u + length, "y": 0.0, "z": v_start} if horizontal else \
+        {"x": u, "y": 0.0, "z": v_start + length}
+    return {
+        "id": member_id,
+        "element_type": element_type,
+        "profile": {"name": profile, "material_system": "timber"},
+        "centerline_start": start,
+        "centerline_end": end,
+        "wall_id": wall["wall_id"],
+    }
+
+
+def layout_framing_members(walls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Lay out a conventional stud frame for each wall, without Rhino.
+
+    Studs at 16" on center (skipped inside openings), a bottom plate and
+    double top plate spliced at MAX_PLATE_LENGTH, and king studs, jack
+    studs, headers and sills around openings. This stands in for the
+    material strategies, which need Rhino geometry, as cut-list input.
+
+    Args:
+        walls: WallData dictionaries
+
+    Returns:
+        Framing element dictionaries as written by the framing step
+    """
+    members: List[Dict[str, Any]] = []
+    for wall in walls:
+        wall_id = wall["wall_id"]
+        length = wall["wall_length"]
+        height = wall["wall_height"]
+        stud = "2x6" if wall.get("is_exterior") else "2x4"
+        stud_length = height - 3 * PLATE_THICKNESS
+        openings = sorted(wall["openings"], key=lambda o: o["u_start"])
+        n = 0
+
+        for k, v in enumerate((0.0, height - 2 * PLATE_THICKNESS, height - PLATE_THICKNESS)):
+            u = 0.0
+            while u < length - 1e-9:
+                piece = min(MAX_PLATE_LENGTH, length - u)
+                plate_type = "bottom_plate" if k == 0 else "top_plate"
+                members.append(_member(wall, f"{wall_id}_m{n}", plate_type, stud,
+                                       u, v, piece, True))
+                n += 1
+                u += piece
+
+        # Common studs keep clear of king studs (0.25 ft outside openings)
+        clear = 0.25 + PROFILE_SIZES[stud][0]
+        u = 0.0
+        while u <= length:
+            if not any(o["u_start"] - clear < u < o["u_end"] + clear for o in openings):
+                members.append(_member(wall, f"{wall_id}_m{n}", "stud", stud,
+                                       u, PLATE_THICKNESS, stud_length, False))
+                n += 1
+            u += STUD_SPACING
+
+        for o in openings:
+            header_v = o["v_end"]
+            # Trimmers sit one stud thickness inside their king stud,
+            # toward the opening
+            stud_width = PROFILE_SIZES[stud][0]
+            for side, inward in ((o["u_start"] - 0.25, 1.0), (o["u_end"] + 0.25, -1.0)):
+                members.append(_member(wall, f"{wall_id}_m{n}", "king_stud", stud,
+                                       side, PLATE_THICKNESS, stud_length, False))
+                members.append(_member(wall, f"{wall_id}_m{n + 1}", "trimmer", stud,
+                                       side + inward * stud_width, PLATE_THICKNESS,
+                                       header_v - PLATE_THICKNESS, False))
+                n += 2
+            members.append(_member(wall, f"{wall_id}_m{n}", "header", "2x10",
+                                   o["u_start"] - 0.125, header_v, o["width"] + 0.25, True))
+            n += 1
+            if o["opening_type"] == "window":
+                members.append(_member(wall, f"{wall_id}_m{n}", "sill", stud,
+                                       o["u_start"], o["v_start"], o["width"], True))
+                n += 1
+    return members
+
+
+def place_members(walls: List[Dict[str, Any]], members: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    World-coordinate copies of wall-local framing members.
+
+    Centerlines are placed with each wall's base plane, profiles get
+    PROFILE_SIZES dimensions and metadata the wall axes, as the framing
+    step writes them. The layout gives horizontal members by their
+    bottom face; placed centerlines are raised to the member's middle.
+
+    Args:
+        walls: WallData dictionaries
+        members: Output of layout_framing_members for those walls
+
+    Returns:
+        Framing element dictionaries in world coordinates
+    """
+    planes = {wall["wall_id"]: wall["base_plane"] for wall in walls}
+    placed = []
+    for member in members:
+        plane = planes[member["wall_id"]]
+        origin, x_axis, y_axis = plane["origin"], plane["x_axis"], plane["y_axis"]
+
+        width, depth = PROFILE_SIZES[member["profile"]["name"]]
+        start, end = member["centerline_start"], member["centerline_end"]
+        lift = width / 2.0 if start["z"] == end["z"] else 0.0
+
+        def world(point: Dict[str, float]) -> Dict[str, float]:
+            u, v = point["x"], point["z"] + lift
+            return _point(
+                origin["x"] + x_axis["x"] * u + y_axis["x"] * v,
+                origin["y"] + x_axis["y"] * u + y_axis["y"] * v,
+                origin["z"] + x_axis["z"] * u + y_axis["z"] * v,
+            )
+
+        placed.append(dict(
+            member,
+            profile=dict(member["profile"], width=width, depth=depth),
+            centerline_start=world(start),
+            centerline_end=world(end),
+            metadata={
+                "wall_id": member["wall_id"],
+                "wall_x_axis": [x_axis["x"], x_axis["y"], x_axis["z"]],
+                "wall_z_axis": [plane["z_axis"][k] for k in ("x", "y", "z")],
+            },
+        ))
+    return placed
@@ -0,0 +1,224 @@
+# File: benchmarks/runner.py
+"""
+Run pipeline stages, measure them and compare against a baseline.
+
+Each stage is timed over ``repeat`` runs (best and median wall time) and
+run once more under tracemalloc for its peak Python memory. Results are
+keyed by scenario - the generator parameters - in the baseline file, so
+one file can hold several scales.
+
+A stage regresses when it is slower than its baseline by more than the
+time tolerance (and by more than ``min_seconds``, so tiny stages don't
+flap on noise) or its peak memory grows by more than the memory
+tolerance. Output summaries that differ from the baseline are reported
+separately: they mean the pipeline's results changed, not its speed.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.generators import generate_building
+from benchmarks.stages import Context, Stage, get_stages
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+@dataclass
+class StageResult:
+    """Measurements of one stage."""
+    name: str
+    status: str  # "ok", "skipped" or "error"
+    seconds: float = 0.0
+    median_seconds: float = 0.0
+    peak_kib: float = 0.0
+    summary: Dict[str, Any] = field(default_factory=dict)
+    reason: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+def scenario_key(
+    num_walls: int,
+    opening_density: float,
+    fixtures_per_floor: int,
+    seed: str
+) -> str:
+    """Baseline key of a generator configuration."""
+    return f"walls={num_walls} openings={opening_density:g} fixtures={fixtures_per_floor} seed={seed}"
+
+
+def _peak_kib(run, inputs) -> float:
+    """Peak traced allocation of one run, in KiB."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        run(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return max(0, peak - base) / 1024.0
+
+
+def run_stage(stage: Stage, context: Context, repeat: int = 3, memory: bool = True) -> StageResult:
+    """
+    Measure one stage and store its output in the context.
+
+    Args:
+        stage: Stage to run
+        context: Shared context (building and earlier outputs)
+        repeat: Timed runs
+        memory: Also measure peak memory (one extra run)
+
+    Returns:
+        StageResult; errors are captured, not raised
+    """
+    reason = stage.skip_reason(context)
+    if reason:
+        return StageResult(stage.name, "skipped", reason=reason)
+
+    try:
+        inputs = stage.prepare(context)
+        times = []
+        output = None
+        for _ in range(max(1, repeat)):
+            gc.collect()
+            t0 = time.perf_counter()
+            output = stage.run(inputs)
+            times.append(time.perf_counter() - t0)
+        gc.collect()
+        peak = _peak_kib(stage.run, inputs) if memory else 0.0
+        summary = stage.summarize(output)
+    except Exception as e:
+        return StageResult(stage.name, "error", reason=f"{type(e).__name__}: {e}")
+
+    context[stage.name] = output
+    return StageResult(
+        stage.name, "ok",
+        seconds=min(times),
+        median_seconds=statistics.median(times),
+        peak_kib=peak,
+        summary=summary,
+    )
+
+
+def run_suite(
+    num_walls: int = 200,
+    opening_density: float = 0.5,
+    fixtures_per_floor: int = 12,
+    seed: str = "pipeline",
+    stages: Optional[Sequence[str]] = None,
+    repeat: int = 3,
+    memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Generate a building and measure the pipeline stages on it.
+
+    Args:
+        num_walls: Walls in the building
+        opening_density: Opening density (0-1)
+        fixtures_per_floor: Fixtures per floor
+        seed: Random seed
+        stages: Stage names to run (default: all, in pipeline order)
+        repeat: Timed runs per stage
+        memory: Measure peak memory
+
+    Returns:
+        Dictionary with scenario key, building summary and per-stage results
+    """
+    building = generate_building(num_walls, opening_density, fixtures_per_floor, seed=seed)
+    context: Context = {"building": building}
+    results = [run_stage(stage, context, repeat, memory) for stage in get_stages(stages)]
+    return {
+        "scenario": scenario_key(num_walls, opening_density, fixtures_per_floor, seed),
+        "building": building.summary(),
+        "stages": results,
+    }
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    """Baseline file contents, or an empty baseline if it doesn't exist."""
+    if not os.path.exists(path):
+        return {"version": 1, "scenarios": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(run: Dict[str, Any], path: str = BASELINE_PATH) -> None:
+    """
+    Record a run's successful stages as the baseline for its scenario.
+
+    Other scenarios in the file are kept.
+    """
+    baseline = load_baseline(path)
+    baseline["scenarios"][run["scenario"]] = {
+        "recorded": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "stages": {
+            r.name: {
+                "seconds": round(r.seconds, 6),
+                "peak_kib": round(r.peak_kib, 1),
+                "summary": r.summary,
+            }
+            for r in run["stages"] if r.status == "ok"
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare_to_baseline(
+    results: List[StageResult],
+    baseline_stages: Dict[str, Dict[str, Any]],
+    time_tolerance: float = 0.5,
+    memory_tolerance: float = 0.25,
+    min_seconds: float = 0.005
+) -> Dict[str, List[str]]:
+    """
+    Compare stage results with a scenario's baseline.
+
+    Args:
+        results: Stage results of the current run
+        baseline_stages: Baseline "stages" mapping for the same scenario
+        time_tolerance: Allowed fractional slowdown (0.5 = 50%)
+        memory_tolerance: Allowed fractional peak memory growth
+        min_seconds: Slowdowns smaller than this never regress
+
+    Returns:
+        Dictionary with "regressions" and "changed_outputs" messages
+    """
+    regressions = []
+    changed = []
+    for result in results:
+        base = baseline_stages.get(result.name)
+        if base is None or result.status != "ok":
+            continue
+        slower = result.seconds - base["seconds"]
+        if result.seconds > base["seconds"] * (1 + time_tolerance) and slower > min_seconds:
+            regressions.append(
+                f"{result.name}: {result.seconds * 1000:.1f} ms vs baseline "
+                f"{base['seconds'] * 1000:.1f} ms"
+            )
+        base_peak = base.get("peak_kib", 0.0)
+        if result.peak_kib and base_peak and result.peak_kib > base_peak * (1 + memory_tolerance):
+            regressions.append(
+                f"{result.name}: peak {result.peak_kib:.0f} KiB vs baseline {base_peak:.0f} KiB"
+            )
+        if base.get("summary") and result.summary != base["summary"]:
+            changed.append(f"{result.name}: {result.summary} vs baseline {base['summary']}")
+    return {"regressions": regressions, "changed_outputs": changed}
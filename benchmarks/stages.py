@@ -0,0 +1,332 @@
+# File: benchmarks/stages.py
+"""
+Pipeline stages measured by the benchmark suite.
+
+A stage has an untimed ``prepare`` step that builds its input from the
+shared context (the generated building and earlier stage outputs) and a
+timed ``run`` step. Preparers hand each stage its own deep copy of the
+building walls, because some pipeline code (corner handling in panel
+decomposition) modifies nested wall data in place; a stage's input must
+not depend on which stages ran before it. Stages run in PIPELINE_STAGES order; each output is
+stored in the context under the stage name for the stages after it.
+
+Stages that need an optional package (networkx for MEP routing) are
+skipped when it is not installed. Cell decomposition runs headless on the
+batch decomposer. The material framing strategies need Rhino geometry,
+so framing is measured through its headless consumer: the cut list over
+a conventional stud layout.
+"""
+
+import copy
+import importlib.util
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.generators import layout_framing_members, place_members, routing_walls
+
+Context = Dict[str, Any]
+
+# Timber stock lengths (timber_profiles.TIMBER_STOCK_LENGTHS); passed
+# explicitly because the materials package imports Rhino
+STOCK_LENGTHS = [8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0]
+
+
+@dataclass
+class Stage:
+    """
+    One measured pipeline step.
+
+    Attributes:
+        name: Stage name (context key of its output)
+        description: One-line description
+        run: Timed step; takes the prepared input, returns the output
+        prepare: Untimed step building the input from the context
+        summarize: Output -> small dict of counts, recorded with timings
+        requires: Importable modules the stage needs
+        after: Earlier stages whose output the stage needs
+    """
+    name: str
+    description: str
+    run: Callable[[Any], Any]
+    prepare: Callable[[Context], Any]
+    summarize: Callable[[Any], Dict[str, Any]]
+    requires: Sequence[str] = ()
+    after: Sequence[str] = ()
+
+    def skip_reason(self, context: Context) -> Optional[str]:
+        """Why the stage cannot run, or None."""
+        for module in self.requires:
+            if importlib.util.find_spec(module) is None:
+                return f"{module} not installed"
+        for name in self.after:
+            if name not in context:
+                return f"needs output of {name}"
+        return None
+
+
+def _building_walls(context: Context) -> List[Dict[str, Any]]:
+    """A private copy of the building walls for one stage."""
+    return copy.deepcopy(context["building"].walls)
+
+
+# --- serializers --------------------------------------------------------------
+
+def _prepare_wall_json(context: Context) -> List[str]:
+    return [json.dumps(wall) for wall in context["building"].walls]
+
+
+def _round_trip_walls(wall_json: List[str]) -> List[str]:
+    from src.timber_framing_generator.core.json_schemas import (
+        deserialize_wall_data, serialize_wall_data, validate_wall_data_batch,
+    )
+    walls = [deserialize_wall_data(text) for text in wall_json]
+    valid, failures = validate_wall_data_batch(walls)
+    if not valid:
+        raise ValueError({walls[i].wall_id: errors for i, errors in failures.items()})
+    return [serialize_wall_data(wall) for wall in walls]
+
+
+def _serialize_panels(panel_results: List[Dict[str, Any]]) -> List[str]:
+    from src.timber_framing_generator.panels.panel_decomposer import (
+        deserialize_panel_results, serialize_panel_results,
+    )
+    out = []
+    for result in panel_results:
+        text = serialize_panel_results(result)
+        deserialize_panel_results(text)
+        out.append(text)
+    return out
+
+
+def _serialize_routes(orchestration: Any) -> str:
+    return orchestration.to_json()
+
+
+def _json_summary(texts: Any) -> Dict[str, Any]:
+    if isinstance(texts, str):
+        texts = [texts]
+    return {"documents": len(texts), "bytes": sum(len(t) for t in texts)}
+
+
+# --- cells --------------------------------------------------------------------
+
+def _prepare_cell_inputs(context: Context) -> Dict[str, Any]:
+    return {"walls": _building_walls(context), "panels": context["panels"]}
+
+
+def _decompose_cells(inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from src.timber_framing_generator.cell_decomposition.batch_decomposer import decompose_walls
+    return decompose_walls(inputs["walls"], inputs["panels"])
+
+
+def _cells_summary(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "entries": len(entries),
+        "cells": sum(len(entry["cells"]) for entry in entries),
+    }
+
+
+# --- panels -------------------------------------------------------------------
+
+def _decompose_panels(walls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    from src.timber_framing_generator.panels.panel_config import PanelConfig
+    from src.timber_framing_generator.panels.panel_decomposer import decompose_all_walls
+    return decompose_all_walls(walls, config=PanelConfig())
+
+
+def _panels_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "walls": len(results),
+        "panels": sum(r["total_panel_count"] for r in results),
+        "joints": sum(len(r["joints"]) for r in results),
+    }
+
+
+def _prepare_joint_inputs(context: Context) -> List[Any]:
+    from src.timber_framing_generator.panels.joint_optimizer import find_exclusion_zones
+    from src.timber_framing_generator.panels.panel_config import PanelConfig
+    config = PanelConfig()
+    return [
+        (wall["wall_length"], find_exclusion_zones(wall, config), config)
+        for wall in _building_walls(context)
+    ]
+
+
+def _optimize_joints(inputs: List[Any]) -> List[List[float]]:
+    from src.timber_framing_generator.panels.joint_optimizer import find_optimal_joints
+    return [find_optimal_joints(length, zones, config) for length, zones, config in inputs]
+
+
+def _joints_summary(joints: List[List[float]]) -> Dict[str, Any]:
+    return {"walls": len(joints), "joints": sum(len(j) for j in joints)}
+
+
+# --- sheathing and framing material -------------------------------------------
+
+def _sheathe_walls(walls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    from src.timber_framing_generator.sheathing.sheathing_generator import (
+        generate_wall_sheathing,
+    )
+    return [
+        generate_wall_sheathing(wall, faces=["exterior", "interior"]
+                                if wall.get("is_exterior") else ["interior"])
+        for wall in walls
+    ]
+
+
+def _sheathing_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "walls": len(results),
+        "panels": sum(len(r["sheathing_panels"]) for r in results),
+    }
+
+
+def _prepare_members(context: Context) -> List[Dict[str, Any]]:
+    return layout_framing_members(_building_walls(context))
+
+
+def _cut_list(members: List[Dict[str, Any]]) -> Dict[str, Any]:
+    from src.timber_framing_generator.cutting import get_purchase_report, optimize_cut_list
+    return get_purchase_report(optimize_cut_list(members, stock_lengths=STOCK_LENGTHS))
+
+
+def _cut_list_summary(report: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "sticks": report["total_sticks"],
+        "waste_percentage": report["waste_percentage"],
+        "oversize_members": report["oversize_members"],
+    }
+
+
+# --- clash detection ----------------------------------------------------------
+
+def _prepare_world_members(context: Context) -> List[Dict[str, Any]]:
+    walls = _building_walls(context)
+    return place_members(walls, layout_framing_members(walls))
+
+
+def _detect_clashes(members: List[Dict[str, Any]]) -> Any:
+    from src.timber_framing_generator.clash import detect_clashes
+    return detect_clashes(members)
+
+
+def _clash_summary(report: Any) -> Dict[str, Any]:
+    summary = {"members": report.member_count, "candidate_pairs": report.candidate_pairs}
+    summary.update({k: v for k, v in report.counts().items() if v})
+    return summary
+
+
+# --- MEP routing --------------------------------------------------------------
+
+def _prepare_graph_inputs(context: Context) -> List[Any]:
+    building = context["building"]
+    walls = routing_walls(_building_walls(context))
+    by_floor: Dict[float, List[Dict[str, Any]]] = {}
+    for wall in walls:
+        by_floor.setdefault(wall["base_elevation"], []).append(wall)
+    return list(zip(by_floor.values(), building.floor_bounds))
+
+
+def _build_graphs(floors: List[Any]) -> List[Any]:
+    from src.timber_framing_generator.mep.routing.graph_builder import UnifiedGraphBuilder
+    builder = UnifiedGraphBuilder(wall_grid_resolution=1.0, floor_grid_resolution=2.0)
+    return [builder.build_from_walls(walls, floor_bounds=bounds) for walls, bounds in floors]
+
+
+def _graphs_summary(graphs: List[Any]) -> Dict[str, Any]:
+    return {
+        "graphs": len(graphs),
+        "nodes": sum(g.unified_graph.number_of_nodes() for g in graphs),
+        "transitions": sum(len(g.transitions) for g in graphs),
+    }
+
+
+def _prepare_routing(context: Context) -> Dict[str, Any]:
+    from src.timber_framing_generator.mep.routing.graph_builder import UnifiedGraphBuilder
+    from src.timber_framing_generator.mep.routing.heuristics.base import ConnectorInfo
+    from src.timber_framing_generator.mep.routing.targets import RoutingTarget, TargetType
+
+    building = context["building"]
+    walls = routing_walls(_building_walls(context))
+    walls_by_id = {wall["id"]: wall for wall in walls}
+    builder = UnifiedGraphBuilder(wall_grid_resolution=1.0, floor_grid_resolution=2.0)
+
+    def mdg_factory(zone):
+        zone_walls = [walls_by_id[w] for w in zone.wall_ids if w in walls_by_id]
+        return builder.build_from_walls(zone_walls, floor_bounds=zone.bounds)
+
+    targets = []
+    for target in building.targets:
+        fields = dict(target)
+        fields["target_type"] = TargetType(fields["target_type"])
+        targets.append(RoutingTarget(**fields))
+    return {
+        "connectors": [ConnectorInfo(**c) for c in building.connectors],
+        "walls": walls,
+        "targets": targets,
+        "mdg_factory": mdg_factory,
+    }
+
+
+def _route_building(inputs: Dict[str, Any]) -> Any:
+    from src.timber_framing_generator.mep.routing.orchestrator import SequentialOrchestrator
+    return SequentialOrchestrator().route_building(
+        inputs["connectors"], inputs["walls"], inputs["targets"], inputs["mdg_factory"]
+    )
+
+
+def _routing_summary(result: Any) -> Dict[str, Any]:
+    stats = result.statistics
+    return {
+        "zones": stats.total_zones,
+        "connectors": stats.total_connectors,
+        "failed_routes": stats.failed_routes,
+    }
+
+
+PIPELINE_STAGES: List[Stage] = [
+    Stage("serialize_walls", "WallData JSON deserialize, validate, serialize",
+          _round_trip_walls, _prepare_wall_json, _json_summary),
+    Stage("panels", "decompose_all_walls with corner handling",
+          _decompose_panels, _building_walls, _panels_summary),
+    Stage("cells", "batch cell decomposition of every panel",
+          _decompose_cells, _prepare_cell_inputs, _cells_summary,
+          after=("panels",)),
+    Stage("joints", "find_optimal_joints per wall",
+          _optimize_joints, _prepare_joint_inputs, _joints_summary),
+    Stage("sheathing", "generate_wall_sheathing on every face",
+          _sheathe_walls, _building_walls, _sheathing_summary),
+    Stage("framing_cut_list", "optimize_cut_list over a stud layout of every wall",
+          _cut_list, _prepare_members, _cut_list_summary),
+    Stage("clash_detection", "BVH clash detection over every wall's members",
+          _detect_clashes, _prepare_world_members, _clash_summary),
+    Stage("serialize_panels", "panel results JSON round trip",
+          _serialize_panels, lambda ctx: ctx["panels"], _json_summary,
+          after=("panels",)),
+    Stage("routing_graph", "UnifiedGraphBuilder.build_from_walls per floor",
+          _build_graphs, _prepare_graph_inputs, _graphs_summary,
+          requires=("networkx",)),
+    Stage("routing", "SequentialOrchestrator.route_building",
+          _route_building, _prepare_routing, _routing_summary,
+          requires=("networkx",)),
+    Stage("serialize_routes", "orchestration result to JSON",
+          _serialize_routes, lambda ctx: ctx["routing"], _json_summary,
+          after=("routing",)),
+]
+
+
+def get_stages(names: Optional[Sequence[str]] = None) -> List[Stage]:
+    """
+    Stages in pipeline order, optionally filtered by name.
+
+    Raises:
+        ValueError: If a name is not a stage
+    """
+    if not names:
+        return list(PIPELINE_STAGES)
+    known = {stage.name for stage in PIPELINE_STAGES}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(unknown)}")
+    return [stage for stage in PIPELINE_STAGES if stage.name in names]
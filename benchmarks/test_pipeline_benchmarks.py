@@ -0,0 +1,35 @@
+# File: benchmarks/test_pipeline_benchmarks.py
+"""
+pytest-benchmark entry points for the pipeline stages.
+
+Not part of the regular test run (testpaths is tests/). Run with:
+    python -m pytest benchmarks --benchmark-only
+    python -m pytest benchmarks --benchmark-autosave --benchmark-compare
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.generators import generate_building  # noqa: E402
+from benchmarks.stages import PIPELINE_STAGES  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def context():
+    """Building plus every stage output, computed once (untimed)."""
+    ctx = {"building": generate_building(num_walls=200, seed="pipeline")}
+    for stage in PIPELINE_STAGES:
+        if stage.skip_reason(ctx) is None:
+            ctx[stage.name] = stage.run(stage.prepare(ctx))
+    return ctx
+
+
+@pytest.mark.parametrize("stage", PIPELINE_STAGES, ids=lambda s: s.name)
+def test_stage(benchmark, context, stage):
+    reason = stage.skip_reason(context)
+    if reason:
+        pytest.skip(reason)
+    benchmark.extra_info["description"] = stage.description
+    inputs = stage.prepare(context)
+    benchmark(stage.run, inputs)
@@ -1,54 +1,180 @@
 # clients/python/timber_api_client.py
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import json
+import random
 import time
 import uuid
-from typing import Dict, Any, Optional, List, Tuple
+from typing import (
+    Dict, Any, Optional, List, Tuple, Iterator, Iterable, Callable, AsyncIterator
+)
+
+# Statuses worth retrying: rate limiting and transient gateway errors
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Statuses for which a rejected submission was never accepted, so POST
+# may be retried without creating a duplicate job
+SUBMIT_RETRY_STATUSES = (429, 503)
+
+# Seconds to wait for each streamed event; servers send heartbeats every
+# STREAM_HEARTBEAT_SECONDS (15 by default)
+DEFAULT_STREAM_TIMEOUT = 60.0
+
+
+def backoff_delays(
+    initial: float = 0.25,
+    maximum: float = 10.0,
+    factor: float = 2.0,
+    jitter: float = 0.1
+) -> Iterator[float]:
+    """
+    Exponential backoff delays with jitter, capped at ``maximum``.
+
+    Args:
+        initial: First delay in seconds
+        maximum: Largest delay in seconds
+        factor: Growth factor per step
+        jitter: Random spread as a fraction of each delay
+
+    Yields:
+        Delays in seconds
+    """
+    delay = initial
+    while True:
+        yield delay * (1.0 + random.uniform(-jitter, jitter))
+        delay = min(maximum, delay * factor)
+
+
+def _retry_after(headers: Any, default: float) -> float:
+    """Seconds from a Retry-After header, or the backoff default."""
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_event_line(line: str, is_sse: bool) -> Optional[Dict[str, Any]]:
+    """Decode one NDJSON line or SSE line; None for lines without data."""
+    if not line:
+        return None
+    if is_sse:
+        # Only data lines carry the JSON body; event names repeat it
+        if not line.startswith("data:"):
+            return None
+        line = line[len("data:"):].strip()
+    return json.loads(line)
+
 
 class TimberFramingClient:
     """
     Client for the Timber Framing API.
-    
+
     This client provides methods to interact with the Timber Framing API,
     including submitting wall data for analysis, checking job status,
-    and retrieving results.
-    
+    and retrieving results. Job completion is followed over the API's
+    NDJSON event streams rather than by polling.
+
+    Requests share one pooled keep-alive session. Idempotent requests are
+    retried on connection errors and 429/502/503/504; submissions are
+    retried only on 429/503, when the server accepted nothing.
+
     Attributes:
         base_url: Base URL of the API
         api_key: API key for authentication
         headers: Headers to include in all requests
+        session: Pooled requests session
     """
-    
-    def __init__(self, base_url: str, api_key: str):
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 10,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize the client.
-        
+
         Args:
             base_url: Base URL of the API (e.g., "https://api.timber-framing.com")
             api_key: API key for authentication
+            timeout: Seconds to wait for a regular response
+            max_retries: Retries for failed requests
+            backoff_factor: Base of the exponential retry backoff (seconds)
+            pool_maxsize: Keep-alive connections kept per host
+            session: Session to use instead of creating one
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.headers = {"X-API-Key": api_key}
-        
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        if session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        session.headers.update(self.headers)
+        self.session = session
+        # job_id -> (ETag, job) of unfinished jobs, for conditional polling
+        self._job_etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "TimberFramingClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _submit(self, path: str, payload: Dict[str, Any], **kwargs) -> requests.Response:
+        """POST, retrying with backoff while the server rejects with 429/503."""
+        kwargs.setdefault("timeout", self.timeout)
+        delays = backoff_delays(initial=self.backoff_factor)
+        for attempt in range(self.max_retries + 1):
+            response = self.session.post(f"{self.base_url}{path}", json=payload, **kwargs)
+            if response.status_code not in SUBMIT_RETRY_STATUSES or attempt == self.max_retries:
+                break
+            response.close()
+            time.sleep(_retry_after(response.headers, next(delays)))
+        response.raise_for_status()
+        return response
+
     def check_connection(self) -> Tuple[bool, str]:
         """
         Check if the API is accessible.
-        
+
         Returns:
             Tuple of (success, message)
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/health",
-                headers=self.headers
-            )
+            response = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
             if response.status_code == 200:
                 return True, "Connection successful"
             else:
                 return False, f"API returned status code {response.status_code}"
         except Exception as e:
             return False, f"Connection error: {str(e)}"
-            
+
     def analyze_wall(
         self,
         wall_data: Dict[str, Any],
@@ -58,90 +184,605 @@ class TimberFramingClient:
     ) -> Dict[str, Any]:
         """
         Submit a wall for analysis and optionally wait for results.
-        
+
         Args:
             wall_data: Wall data dictionary with properties and openings
-            polling: Whether to poll for results or return immediately
-            max_polls: Maximum number of polling attempts
-            poll_interval: Seconds between polling attempts
-            
+            polling: Whether to wait for results or return immediately
+            max_polls: Wait limit, in units of poll_interval
+            poll_interval: First delay between polls when falling back
+                to polling
+
         Returns:
             Dictionary with job data or analysis results
-            
+
         Raises:
             requests.HTTPError: If the API request fails
-            TimeoutError: If polling times out before job completes
+            TimeoutError: If the job does not finish in time
         """
         # Submit the job
-        response = requests.post(
-            f"{self.base_url}/walls/analyze",
-            json=wall_data,
-            headers=self.headers
-        )
-        response.raise_for_status()
-        job_data = response.json()
+        job_data = self._submit("/walls/analyze", wall_data).json()
         job_id = job_data["job_id"]
-        
+
         if not polling:
             return job_data
-            
-        # Poll for results
-        for _ in range(max_polls):
+
+        return self.wait_for_job(
+            job_id, timeout=max_polls * poll_interval, poll_interval=poll_interval
+        )
+
+    def wait_for_job(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        Wait for a job to finish using the job progress stream.
+
+        Falls back to polling with exponential backoff against servers
+        without the /job/{job_id}/events endpoint.
+
+        Args:
+            job_id: Job ID returned by analyze_wall
+            timeout: Seconds to wait in total (None waits indefinitely)
+            poll_interval: First delay between polls when falling back
+
+        Returns:
+            Dictionary with job status and results
+
+        Raises:
+            requests.HTTPError: If the API request fails
+            TimeoutError: If the job does not finish in time
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        try:
+            for event in self.stream_job_events(job_id):
+                if event["event"] == "job":
+                    return self.get_analysis_result(job_id)
+                if event["event"] == "error":
+                    raise RuntimeError(f"Job {job_id}: {event.get('error')}")
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in (404, 405):
+                raise
+            # Older server without event streams
+            return self.poll_job(job_id, deadline, poll_interval)
+        except requests.exceptions.ReadTimeout:
+            pass
+
+        raise TimeoutError(f"Timed out waiting for job {job_id} to complete")
+
+    def poll_job(
+        self,
+        job_id: str,
+        deadline: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_interval: float = 10.0
+    ) -> Dict[str, Any]:
+        """
+        Poll a job with exponential backoff until it finishes.
+
+        Args:
+            job_id: Job ID returned by analyze_wall
+            deadline: time.monotonic() value to give up at (None: never)
+            poll_interval: First delay between polls
+            max_interval: Largest delay between polls
+
+        Returns:
+            Dictionary with job status and results
+
+        Raises:
+            TimeoutError: If the deadline passes first
+        """
+        for delay in backoff_delays(poll_interval, max_interval):
             result = self.get_analysis_result(job_id)
             if result["status"] in ["completed", "failed"]:
                 return result
-            time.sleep(poll_interval)
-            
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                delay = min(delay, remaining)
+            time.sleep(delay)
         raise TimeoutError(f"Timed out waiting for job {job_id} to complete")
-        
+
+    def stream_job_events(
+        self,
+        job_id: str,
+        timeout: Optional[float] = DEFAULT_STREAM_TIMEOUT
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a job's progress events until it finishes.
+
+        Args:
+            job_id: Job ID returned by analyze_wall
+            timeout: Seconds to wait for each event (None waits indefinitely)
+
+        Yields:
+            Event dictionaries ("status", "heartbeat", "job", "done", "error")
+
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        with self.session.get(
+            f"{self.base_url}/walls/job/{job_id}/events",
+            headers={"Accept": "application/x-ndjson"},
+            stream=True,
+            timeout=(self.timeout, timeout)
+        ) as response:
+            response.raise_for_status()
+            yield from _iter_stream_events(response)
+
+    def stream_walls_batch(
+        self,
+        walls: Iterable[Dict[str, Any]],
+        timeout: Optional[float] = DEFAULT_STREAM_TIMEOUT
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Submit walls as one batch and iterate over the result stream.
+
+        Args:
+            walls: Wall data dictionaries
+            timeout: Seconds to wait for each event (None waits indefinitely)
+
+        Yields:
+            Event dictionaries: "batch" (job IDs in input order), one "job"
+            per wall in completion order (with its input "index"),
+            "heartbeat" and a final "done"
+
+        Raises:
+            requests.HTTPError: If the API request fails (503 when the
+                server's job queue has no room for the batch)
+        """
+        response = self._submit(
+            "/walls/analyze/batch",
+            {"walls": list(walls)},
+            headers={"Accept": "application/x-ndjson"},
+            stream=True,
+            timeout=(self.timeout, timeout)
+        )
+        with response:
+            yield from _iter_stream_events(response)
+
+    def analyze_walls_batch(
+        self,
+        walls: Iterable[Dict[str, Any]],
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        timeout: Optional[float] = DEFAULT_STREAM_TIMEOUT
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many walls with one request.
+
+        Args:
+            walls: Wall data dictionaries
+            on_result: Called with (input index, job event) as each wall
+                finishes
+            timeout: Seconds to wait for each event (None waits indefinitely)
+
+        Returns:
+            Job events in input order, each with job_id, status and result
+            or error
+
+        Raises:
+            requests.HTTPError: If the API request fails
+            RuntimeError: If the stream ends before every wall finished
+        """
+        walls = list(walls)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(walls)
+        for event in self.stream_walls_batch(walls, timeout=timeout):
+            if event["event"] == "job":
+                results[event["index"]] = event
+                if on_result:
+                    on_result(event["index"], event)
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            raise RuntimeError(f"Batch stream ended before {len(missing)} walls finished")
+        return results
+
     def get_analysis_result(self, job_id: str) -> Dict[str, Any]:
         """
         Get the results of a wall analysis job.
-        
+
         Args:
             job_id: Job ID returned by analyze_wall
-            
+
         Returns:
             Dictionary with job status and results
-            
+
         Raises:
             requests.HTTPError: If the API request fails
         """
-        response = requests.get(
+        # Repeated polls send the last ETag; 304 means the job is unchanged
+        cached = self._job_etags.get(job_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.session.get(
             f"{self.base_url}/walls/job/{job_id}",
-            headers=self.headers
+            headers=headers,
+            timeout=self.timeout
         )
+        if response.status_code == 304 and cached:
+            return cached[1]
         response.raise_for_status()
-        return response.json()
-        
+        job = response.json()
+        etag = response.headers.get("ETag")
+        if etag and job.get("status") not in ("completed", "failed"):
+            self._job_etags[job_id] = (etag, job)
+        else:
+            self._job_etags.pop(job_id, None)
+        return job
+
     def list_jobs(
-        self, 
-        limit: int = 10, 
+        self,
+        limit: int = 10,
         offset: int = 0,
         status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         List wall analysis jobs.
-        
+
         Args:
             limit: Maximum number of jobs to return
             offset: Number of jobs to skip
             status: Optional filter for job status
-            
+
         Returns:
             List of job dictionaries
-            
+
         Raises:
             requests.HTTPError: If the API request fails
         """
         params = {"limit": limit, "offset": offset}
         if status:
             params["status"] = status
-            
-        response = requests.get(
+
+        response = self.session.get(
             f"{self.base_url}/walls/",
-            headers=self.headers,
-            params=params
+            params=params,
+            timeout=self.timeout
         )
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+
+def _iter_stream_events(response: requests.Response) -> Iterator[Dict[str, Any]]:
+    """Decode an NDJSON or server-sent event response into event dicts."""
+    is_sse = response.headers.get("content-type", "").startswith("text/event-stream")
+    for line in response.iter_lines(decode_unicode=True):
+        event = _parse_event_line(line, is_sse)
+        if event is not None:
+            yield event
+
+
+class AsyncTimberFramingClient:
+    """
+    Asynchronous client for the Timber Framing API (requires httpx).
+
+    Shares one pooled httpx.AsyncClient. analyze_walls submits many walls
+    concurrently, at most ``max_in_flight`` at a time, and waits on each
+    job's progress stream (or polls with exponential backoff on servers
+    without it). Pass ``transport=httpx.ASGITransport(app)`` to run
+    against an in-process FastAPI app.
+
+    Usage:
+        async with AsyncTimberFramingClient(url, key, max_in_flight=16) as client:
+            results = await client.analyze_walls(walls)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_in_flight: int = 8,
+        max_connections: int = 20,
+        transport: Any = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Base URL of the API
+            api_key: API key for authentication
+            timeout: Seconds to wait for a regular response
+            max_retries: Retries for failed requests
+            backoff_factor: First retry delay in seconds (doubles per retry)
+            max_in_flight: Walls analyze_walls keeps in progress at once
+            max_connections: Pooled connections
+            transport: httpx transport to use instead of the network
+        """
+        import httpx
+        self._httpx = httpx
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_in_flight = max(1, max_in_flight)
+
+        if transport is None:
+            # Connection errors are retried by the transport
+            transport = httpx.AsyncHTTPTransport(
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                )
+            )
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"X-API-Key": api_key},
+            timeout=timeout,
+            transport=transport
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncTimberFramingClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, path: str, retry_statuses=RETRY_STATUSES, **kwargs):
+        """Send a request, retrying with backoff on the given statuses."""
+        delays = backoff_delays(initial=self.backoff_factor)
+        for attempt in range(self.max_retries + 1):
+            response = await self.client.request(method, path, **kwargs)
+            if response.status_code not in retry_statuses or attempt == self.max_retries:
+                break
+            await asyncio.sleep(_retry_after(response.headers, next(delays)))
+        response.raise_for_status()
+        return response
+
+    async def check_connection(self) -> Tuple[bool, str]:
+        """
+        Check if the API is accessible.
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            response = await self.client.get("/health")
+            if response.status_code == 200:
+                return True, "Connection successful"
+            return False, f"API returned status code {response.status_code}"
+        except Exception as e:
+            return False, f"Connection error: {str(e)}"
+
+    async def submit_wall(self, wall_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a wall for analysis without waiting.
+
+        Args:
+            wall_data: Wall data dictionary with properties and openings
+
+        Returns:
+            Job dictionary with job_id and status
+        """
+        response = await self._request(
+            "POST", "/walls/analyze", retry_statuses=SUBMIT_RETRY_STATUSES, json=wall_data
+        )
+        return response.json()
+
+    async def get_analysis_result(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get the results of a wall analysis job.
+
+        Args:
+            job_id: Job ID returned by submit_wall
+
+        Returns:
+            Dictionary with job status and results
+        """
+        response = await self._request("GET", f"/walls/job/{job_id}")
+        return response.json()
+
+    async def list_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List wall analysis jobs.
+
+        Args:
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+            status: Optional filter for job status
+
+        Returns:
+            List of job dictionaries
+        """
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        response = await self._request("GET", "/walls/", params=params)
+        return response.json()
+
+    async def _stream(self, method: str, path: str, timeout: Optional[float], **kwargs):
+        """Yield decoded events from a streaming endpoint."""
+        request_timeout = self._httpx.Timeout(self.timeout, read=timeout)
+        async with self.client.stream(
+            method, path, headers={"Accept": "application/x-ndjson"},
+            timeout=request_timeout, **kwargs
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                response.raise_for_status()
+            is_sse = response.headers.get("content-type", "").startswith("text/event-stream")
+            async for line in response.aiter_lines():
+                event = _parse_event_line(line, is_sse)
+                if event is not None:
+                    yield event
+
+    def stream_job_events(
+        self,
+        job_id: str,
+        timeout: Optional[float] = DEFAULT_STREAM_TIMEOUT
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over a job's progress events until it finishes.
+
+        Args:
+            job_id: Job ID returned by submit_wall
+            timeout: Seconds to wait for each event (None waits indefinitely)
+
+        Returns:
+            Async iterator of event dictionaries
+        """
+        return self._stream("GET", f"/walls/job/{job_id}/events", timeout)
+
+    def stream_walls_batch(
+        self,
+        walls: Iterable[Dict[str, Any]],
+        timeout: Optional[float] = DEFAULT_STREAM_TIMEOUT
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Submit walls as one batch and iterate over the result stream.
+
+        Args:
+            walls: Wall data dictionaries
+            timeout: Seconds to wait for each event (None waits indefinitely)
+
+        Returns:
+            Async iterator of event dictionaries (see
+            TimberFramingClient.stream_walls_batch)
+        """
+        return self._stream("POST", "/walls/analyze/batch", timeout, json={"walls": list(walls)})
+
+    async def wait_for_job(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.25,
+        max_interval: float = 10.0
+    ) -> Dict[str, Any]:
+        """
+        Wait for a job to finish.
+
+        Uses the job progress stream; against servers without it, polls
+        with exponential backoff from poll_interval up to max_interval.
+
+        Args:
+            job_id: Job ID returned by submit_wall
+            timeout: Seconds to wait in total (None waits indefinitely)
+            poll_interval: First delay between polls when falling back
+            max_interval: Largest delay between polls
+
+        Returns:
+            Dictionary with job status and results
+
+        Raises:
+            TimeoutError: If the job does not finish in time
+        """
+        async def follow():
+            try:
+                async for event in self.stream_job_events(job_id):
+                    if event["event"] == "job":
+                        return await self.get_analysis_result(job_id)
+                    if event["event"] == "error":
+                        raise RuntimeError(f"Job {job_id}: {event.get('error')}")
+            except self._httpx.HTTPStatusError as e:
+                if e.response.status_code not in (404, 405):
+                    raise
+            # Stream unavailable or closed early: poll with backoff
+            for delay in backoff_delays(poll_interval, max_interval):
+                result = await self.get_analysis_result(job_id)
+                if result["status"] in ["completed", "failed"]:
+                    return result
+                await asyncio.sleep(delay)
+
+        try:
+            return await asyncio.wait_for(follow(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out waiting for job {job_id} to complete")
+
+    async def analyze_wall(
+        self,
+        wall_data: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit a wall and wait for its results.
+
+        Args:
+            wall_data: Wall data dictionary with properties and openings
+            timeout: Seconds to wait for the job (None waits indefinitely)
+
+        Returns:
+            Dictionary with job status and results
+        """
+        job = await self.submit_wall(wall_data)
+        return await self.wait_for_job(job["job_id"], timeout=timeout)
+
+    async def analyze_walls(
+        self,
+        walls: Iterable[Dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many walls concurrently, one job per wall.
+
+        Args:
+            walls: Wall data dictionaries
+            max_in_flight: Walls submitted or running at once (defaults to
+                the client's max_in_flight)
+            timeout: Seconds to wait for each job (None waits indefinitely)
+            on_result: Called with (input index, job) as each wall finishes
+
+        Returns:
+            Job dictionaries in input order
+        """
+        semaphore = asyncio.Semaphore(max_in_flight or self.max_in_flight)
+
+        async def run(index: int, wall: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.analyze_wall(wall, timeout=timeout)
+            if on_result:
+                on_result(index, result)
+            return result
+
+        return await asyncio.gather(*(run(i, wall) for i, wall in enumerate(walls)))
+
+    async def analyze_walls_batch(
+        self,
+        walls: Iterable[Dict[str, Any]],
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        timeout: Optional[float] = DEFAULT_STREAM_TIMEOUT
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many walls with one batch request.
+
+        Args:
+            walls: Wall data dictionaries
+            on_result: Called with (input index, job event) as each wall
+                finishes
+            timeout: Seconds to wait for each event (None waits indefinitely)
+
+        Returns:
+            Job events in input order
+
+        Raises:
+            RuntimeError: If the stream ends before every wall finished
+        """
+        walls = list(walls)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(walls)
+        async for event in self.stream_walls_batch(walls, timeout=timeout):
+            if event["event"] == "job":
+                results[event["index"]] = event
+                if on_result:
+                    on_result(event["index"], event)
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            raise RuntimeError(f"Batch stream ended before {len(missing)} walls finished")
+        return results
@@ -0,0 +1,119 @@
+# File: scripts/benchmark_cut_list.py
+"""
+Cut-list optimizer benchmark against one stick per member.
+
+Generates seeded framing members (JSON dictionaries as written by the
+framing step) across several profiles - studs, plates, headers, sills,
+cripples and blocking - and compares:
+
+- naive: every member bought as the shortest stock length that holds it
+- optimized: optimize_cut_list over all members at once, with and
+  without the bounded improvement pass
+
+Usage:
+    python scripts/benchmark_cut_list.py
+    python scripts/benchmark_cut_list.py --members 200000 --kerf 0
+"""
+
+import argparse
+import bisect
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.timber_framing_generator.cutting import (  # noqa: E402
+    DEFAULT_KERF,
+    get_purchase_report,
+    optimize_cut_list,
+)
+
+STOCK = [8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0]
+
+# (element_type, profile, length range in feet, weight)
+MEMBER_MIX = [
+    ("stud", "2x4", (7.70, 7.71), 40),
+    ("stud", "2x6", (8.70, 8.71), 15),
+    ("bottom_plate", "2x4", (2.0, 19.0), 6),
+    ("top_plate", "2x4", (2.0, 19.0), 6),
+    ("header", "2x10", (3.0, 8.0), 5),
+    ("sill", "2x4", (2.0, 6.0), 5),
+    ("header_cripple", "2x4", (0.5, 2.0), 8),
+    ("sill_cripple", "2x4", (1.0, 3.5), 8),
+    ("row_blocking", "2x4", (1.2, 1.35), 7),
+]
+
+
+def make_member(rng: random.Random, index: int) -> dict:
+    """One member dictionary with a horizontal or vertical centerline."""
+    element_type, profile, (lo, hi), _ = rng.choices(
+        MEMBER_MIX, weights=[m[3] for m in MEMBER_MIX]
+    )[0]
+    length = rng.uniform(lo, hi)
+    x = rng.uniform(0.0, 100.0)
+    vertical = element_type in ("stud", "header_cripple", "sill_cripple")
+    return {
+        "id": f"{element_type}_{index}",
+        "element_type": element_type,
+        "profile": {"name": profile, "material_system": "timber"},
+        "centerline_start": {"x": x, "y": 0.0, "z": 0.0},
+        "centerline_end": (
+            {"x": x, "y": 0.0, "z": length} if vertical
+            else {"x": x + length, "y": 0.0, "z": 0.0}
+        ),
+    }
+
+
+def timed(fn):
+    """Run fn once and return (result, milliseconds)."""
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--members", type=int, default=100000, help="number of members")
+    parser.add_argument("--kerf", type=float, default=DEFAULT_KERF * 12.0, help="saw kerf (inches)")
+    parser.add_argument("--seed", default="cut-list", help="random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    members = [make_member(rng, i) for i in range(args.members)]
+    kerf = args.kerf / 12.0
+
+    naive_total = 0.0
+    for m in members:
+        s, e = m["centerline_start"], m["centerline_end"]
+        length = abs(e["x"] - s["x"]) + abs(e["z"] - s["z"])
+        naive_total += STOCK[bisect.bisect_left(STOCK, length - 1e-6)]
+
+    plain, plain_ms = timed(
+        lambda: optimize_cut_list(members, STOCK, kerf, improvement_limit=0)
+    )
+    improved, improved_ms = timed(lambda: optimize_cut_list(members, STOCK, kerf))
+    plain_report = get_purchase_report(plain)
+    report = get_purchase_report(improved)
+
+    print(f"{args.members} members, {len(improved)} profiles, kerf {args.kerf:.3f} in")
+    print(f"  naive (one stick per member) {args.members:10d} sticks "
+          f"{naive_total:12.1f} ft")
+    print(f"  FFD + downsize               {plain_report['total_sticks']:10d} sticks "
+          f"{plain_report['total_stock_length_ft']:12.1f} ft  "
+          f"waste {plain_report['waste_percentage']:.1f}%  {plain_ms:8.1f} ms")
+    print(f"  + improvement pass           {report['total_sticks']:10d} sticks "
+          f"{report['total_stock_length_ft']:12.1f} ft  "
+          f"waste {report['waste_percentage']:.1f}%  {improved_ms:8.1f} ms")
+    for profile, stats in report["profiles"].items():
+        purchase = ", ".join(f"{n}x{length:g}'" for length, n in sorted(
+            (float(k), v) for k, v in stats["purchase"].items()
+        ))
+        print(f"    {profile:<6} {stats['members']:>7} members -> {purchase}")
+
+
+if __name__ == "__main__":
+    main()
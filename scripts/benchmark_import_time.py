@@ -0,0 +1,133 @@
+# File: scripts/benchmark_import_time.py
+"""
+Import-time benchmark for the Grasshopper component entry points.
+
+Each ``scripts/gh_*.py`` component imports a slice of the
+``timber_framing_generator`` package on every solve. This script collects
+the package imports of every component (statically, without running it -
+the components need Rhino/Grasshopper), then times those imports in a
+fresh interpreter per component so results are cold-start numbers.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeat 5 --json import_times.json
+
+Components whose imports need Rhino/Revit at import time are reported as
+errors rather than timed.
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_PREFIX = "src.timber_framing_generator"
+
+# Runs in the child interpreter: import statements in, timing JSON out
+_TIMER_SOURCE = """
+import json, sys, time
+t0 = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - t0
+count = sum(1 for k in sys.modules if "timber_framing_generator" in k)
+print(json.dumps({"seconds": elapsed, "modules": count}))
+"""
+
+
+def collect_entry_point_imports(script_path: str) -> List[str]:
+    """
+    Collect the package import statements of a component script.
+
+    Args:
+        script_path: Path to a scripts/gh_*.py file
+
+    Returns:
+        Import statements (source text) targeting the package
+    """
+    with open(script_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    statements = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and \
+                node.module.startswith(PACKAGE_PREFIX):
+            names = ", ".join(alias.name for alias in node.names)
+            statements.append(f"from {node.module} import {names}")
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.startswith(PACKAGE_PREFIX):
+                    statements.append(f"import {alias.name}")
+    return statements
+
+
+def time_imports(statements: List[str], repeat: int) -> Dict:
+    """
+    Time a block of import statements in fresh interpreters.
+
+    Args:
+        statements: Import statements to execute
+        repeat: Number of cold runs
+
+    Returns:
+        Dict with median/min milliseconds and module count, or an error
+    """
+    code = "\n".join(statements)
+    samples = []
+    modules = 0
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", _TIMER_SOURCE, code],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            last_line = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+            return {"error": last_line}
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        samples.append(result["seconds"] * 1000.0)
+        modules = result["modules"]
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "modules": modules,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=3, help="cold runs per entry point")
+    parser.add_argument("--json", dest="json_path", help="write results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    scripts = sorted(glob.glob(os.path.join(PROJECT_ROOT, "scripts", "gh_*.py")))
+    for script_path in scripts:
+        name = os.path.basename(script_path)
+        statements = collect_entry_point_imports(script_path)
+        if not statements:
+            continue
+        results[name] = time_imports(statements, args.repeat)
+
+    width = max((len(name) for name in results), default=10)
+    print(f"{'entry point':<{width}}  {'median ms':>10}  {'min ms':>8}  {'modules':>7}")
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<{width}}  ERROR: {result['error']}")
+        else:
+            print(
+                f"{name:<{width}}  {result['median_ms']:>10.2f}  "
+                f"{result['min_ms']:>8.2f}  {result['modules']:>7}"
+            )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
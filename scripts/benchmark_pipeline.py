@@ -0,0 +1,100 @@
+# File: scripts/benchmark_pipeline.py
+"""
+End-to-end pipeline benchmark with a stored baseline.
+
+Generates a seeded synthetic building and measures each pipeline stage
+(benchmarks.stages) for time and peak memory, then compares against
+benchmarks/baseline.json. Exits with status 1 when a stage regressed or
+failed, so it can gate changes locally. Runs without Rhino or Revit;
+routing stages are skipped when networkx is not installed.
+
+Usage:
+    python scripts/benchmark_pipeline.py
+    python scripts/benchmark_pipeline.py --walls 1000 --stages panels joints
+    python scripts/benchmark_pipeline.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.runner import (  # noqa: E402
+    BASELINE_PATH,
+    compare_to_baseline,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+from benchmarks.stages import PIPELINE_STAGES  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--walls", type=int, default=200, help="number of walls")
+    parser.add_argument("--openings", type=float, default=0.5, help="opening density (0-1)")
+    parser.add_argument("--fixtures", type=int, default=12, help="fixtures per floor")
+    parser.add_argument("--seed", default="pipeline", help="random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage")
+    parser.add_argument("--stages", nargs="+", choices=[s.name for s in PIPELINE_STAGES],
+                        help="stages to run (default: all)")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory runs")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="record this run as the scenario's baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.5,
+                        help="allowed slowdown before failing (0.5 = 50%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25,
+                        help="allowed peak memory growth before failing")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    run = run_suite(args.walls, args.openings, args.fixtures, args.seed,
+                    stages=args.stages, repeat=args.repeat, memory=not args.no_memory)
+    baseline = load_baseline(args.baseline)["scenarios"].get(run["scenario"], {})
+    base_stages = baseline.get("stages", {})
+
+    print(f"Scenario: {run['scenario']}")
+    print("Building: " + ", ".join(f"{k}={v}" for k, v in run["building"].items()))
+    print()
+    print(f"{'stage':<18} {'best ms':>10} {'median ms':>10} {'peak KiB':>10} {'baseline ms':>12}")
+    for r in run["stages"]:
+        if r.status != "ok":
+            print(f"{r.name:<18} {r.status}: {r.reason}")
+            continue
+        base = base_stages.get(r.name)
+        base_ms = f"{base['seconds'] * 1000:.1f}" if base else "-"
+        print(f"{r.name:<18} {r.seconds * 1000:>10.1f} {r.median_seconds * 1000:>10.1f} "
+              f"{r.peak_kib:>10.0f} {base_ms:>12}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**run, "stages": [r.to_dict() for r in run["stages"]]}, f, indent=2)
+
+    errors = [r for r in run["stages"] if r.status == "error"]
+    if args.update_baseline:
+        save_baseline(run, args.baseline)
+        print(f"\nBaseline updated: {args.baseline}")
+        return 1 if errors else 0
+
+    if not base_stages:
+        print("\nNo baseline for this scenario; run with --update-baseline to record one.")
+        return 1 if errors else 0
+
+    comparison = compare_to_baseline(run["stages"], base_stages,
+                                     args.time_tolerance, args.memory_tolerance)
+    for message in comparison["changed_outputs"]:
+        print(f"\nOutput changed: {message}")
+    for message in comparison["regressions"]:
+        print(f"\nREGRESSION: {message}")
+    if not comparison["regressions"] and not errors:
+        print("\nNo regressions against baseline.")
+    return 1 if comparison["regressions"] or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
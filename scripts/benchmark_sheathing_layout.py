@@ -0,0 +1,153 @@
+# File: scripts/benchmark_sheathing_layout.py
+"""
+Sheathing layout and geometry benchmark on synthetic facades.
+
+Generates seeded facades (long walls with many openings) totalling about
+``--panels`` sheathing panels and times:
+
+- layout: SheathingGenerator.generate_sheathing (sorted opening sweep)
+- scan: the per-panel scan over every opening that layout used to do
+  (SheathingGenerator._find_cutouts for each panel), checked for equality
+- geometry: per-panel box creation vs batched mode, both headless. The
+  per-panel path uses a pure-Python stand-in factory; the batched path
+  uses the 'bounds' backend (and 'rhino3dm' when installed)
+
+Usage:
+    python scripts/benchmark_sheathing_layout.py
+    python scripts/benchmark_sheathing_layout.py --panels 20000 --walls 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.timber_framing_generator.sheathing.sheathing_generator import (  # noqa: E402
+    SheathingGenerator,
+)
+from src.timber_framing_generator.sheathing.sheathing_geometry import (  # noqa: E402
+    create_sheathing_breps_batch,
+)
+
+WALL_HEIGHT = 24.0  # 3 rows of 4x8
+
+
+class _TupleFactory:
+    """Headless stand-in for RhinoCommonFactory (boxes as bounds tuples)."""
+
+    def create_box_from_corners_and_thickness(self, corners, extrusion_vector):
+        dx, dy, dz = extrusion_vector
+        points = list(corners) + [(x + dx, y + dy, z + dz) for x, y, z in corners]
+        return (
+            tuple(min(p[k] for p in points) for k in range(3)),
+            tuple(max(p[k] for p in points) for k in range(3)),
+        )
+
+    def boolean_difference_multiple(self, brep, cutouts):
+        return brep
+
+
+def make_facade(rng: random.Random, wall_id: str, length: float) -> Dict:
+    """One long wall with a window or door roughly every 5 feet."""
+    openings = []
+    u = rng.uniform(1.0, 4.0)
+    while u < length - 6.0:
+        if rng.random() < 0.2:
+            openings.append({
+                "opening_type": "door", "u_start": u, "width": 3.0,
+                "v_start": 0.0, "height": 7.0,
+            })
+        else:
+            openings.append({
+                "opening_type": "window", "u_start": u, "width": rng.uniform(2, 4),
+                "v_start": rng.choice([3.0, 11.0, 19.0]), "height": rng.uniform(2, 4),
+            })
+        u += rng.uniform(4.5, 7.0)
+    s = 2 ** -0.5
+    return {
+        "wall_id": wall_id,
+        "wall_length": length,
+        "wall_height": WALL_HEIGHT,
+        "wall_thickness": 0.5,
+        "openings": openings,
+        "base_plane": {
+            "origin": {"x": rng.uniform(0, 100), "y": rng.uniform(0, 100), "z": 0.0},
+            "x_axis": {"x": s, "y": s, "z": 0.0},
+            "y_axis": {"x": 0.0, "y": 0.0, "z": 1.0},
+            "z_axis": {"x": s, "y": -s, "z": 0.0},
+        },
+    }
+
+
+def timed(fn):
+    """Run fn once and return (result, milliseconds)."""
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--panels", type=int, default=10000, help="approximate total panels")
+    parser.add_argument("--walls", type=int, default=10, help="number of facades")
+    parser.add_argument("--seed", default="sheathing-layout", help="random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows = int(WALL_HEIGHT / 8.0)
+    length = 4.0 * args.panels / (args.walls * rows)
+    walls = [make_facade(rng, f"wall_{i}", length) for i in range(args.walls)]
+    generators = [SheathingGenerator(w, {"panel_size": "4x8"}) for w in walls]
+
+    panels_by_wall: List[List] = []
+    _, layout_ms = timed(
+        lambda: panels_by_wall.extend(g.generate_sheathing() for g in generators)
+    )
+    panel_count = sum(len(p) for p in panels_by_wall)
+    opening_count = sum(len(g.openings) for g in generators)
+
+    def scan():
+        mismatches = 0
+        for generator, panels in zip(generators, panels_by_wall):
+            for p in panels:
+                if generator._find_cutouts(p.u_start, p.u_end, p.v_start, p.v_end) != p.cutouts:
+                    mismatches += 1
+        return mismatches
+
+    mismatches, scan_ms = timed(scan)
+
+    sheathing = [
+        {"wall_id": w["wall_id"], "sheathing_panels": [p.to_dict() for p in panels]}
+        for w, panels in zip(walls, panels_by_wall)
+    ]
+    factory = _TupleFactory()
+    _, per_panel_ms = timed(lambda: create_sheathing_breps_batch(sheathing, walls, factory))
+    _, batched_ms = timed(
+        lambda: create_sheathing_breps_batch(sheathing, walls, factory, backend="bounds")
+    )
+
+    print(f"facades: {args.walls} x {length:.0f} ft, {panel_count} panels, "
+          f"{opening_count} openings")
+    print(f"  layout (sweep)            {layout_ms:10.1f} ms")
+    print(f"  cutouts by per-panel scan {scan_ms:10.1f} ms  "
+          f"({'identical' if mismatches == 0 else f'{mismatches} MISMATCHES'})")
+    print(f"  geometry per panel        {per_panel_ms:10.1f} ms")
+    print(f"  geometry batched (bounds) {batched_ms:10.1f} ms")
+
+    try:
+        _, r3_ms = timed(
+            lambda: create_sheathing_breps_batch(sheathing, walls, None, backend="rhino3dm")
+        )
+        print(f"  geometry batched (rhino3dm, no booleans) {r3_ms:10.1f} ms")
+    except ImportError:
+        print("  rhino3dm not installed; skipping rhino3dm backend")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# File: scripts/benchmark_sheathing_nesting.py
+"""
+Sheet nesting benchmark against the per-wall material summary.
+
+Generates seeded walls of varied length and height with openings, lays
+out sheathing with SheathingGenerator, then compares:
+
+- summary: SheathingGenerator.get_material_summary per wall, where every
+  full or partial piece is a stock sheet
+- nesting: nest_sheathing_panels over all walls at once
+
+Usage:
+    python scripts/benchmark_sheathing_nesting.py
+    python scripts/benchmark_sheathing_nesting.py --walls 2000 --stock 4x10
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.timber_framing_generator.sheathing.sheathing_generator import (  # noqa: E402
+    SheathingGenerator,
+)
+from src.timber_framing_generator.sheathing.sheathing_nesting import (  # noqa: E402
+    get_nesting_summary,
+    nest_sheathing_panels,
+)
+
+
+def make_wall(rng: random.Random, index: int) -> dict:
+    """A wall with a few windows and maybe a door."""
+    length = rng.uniform(6.0, 40.0)
+    openings = []
+    u = rng.uniform(1.0, 4.0)
+    while u < length - 5.0:
+        if rng.random() < 0.25:
+            openings.append({"opening_type": "door", "u_start": u, "width": 3.0,
+                             "v_start": 0.0, "height": 6.8})
+        else:
+            openings.append({"opening_type": "window", "u_start": u,
+                             "width": rng.uniform(2.0, 4.0), "v_start": 3.0,
+                             "height": rng.uniform(2.0, 4.0)})
+        u += rng.uniform(6.0, 12.0)
+    return {
+        "wall_id": f"wall_{index}",
+        "wall_length": length,
+        "wall_height": rng.choice([8.0, 9.0, 10.0]),
+        "openings": openings,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--walls", type=int, default=1500, help="number of walls")
+    parser.add_argument("--stock", default="4x8", help="stock sheet size")
+    parser.add_argument("--seed", default="sheathing-nesting", help="random seed")
+    parser.add_argument("--no-rotation", action="store_true", help="keep strength axis vertical")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    config = {"panel_size": args.stock}
+    panels = []
+    summary_sheets = 0
+    summary_waste = 0.0
+    t0 = time.perf_counter()
+    for i in range(args.walls):
+        generator = SheathingGenerator(make_wall(rng, i), config)
+        for face in ("exterior", "interior"):
+            wall_panels = generator.generate_sheathing(face=face)
+            summary = generator.get_material_summary(wall_panels)
+            summary_sheets += summary["total_panels"]
+            summary_waste += summary["waste_area_sqft"]
+            panels.extend(wall_panels)
+    layout_ms = (time.perf_counter() - t0) * 1000.0
+
+    t0 = time.perf_counter()
+    results = nest_sheathing_panels(
+        panels, stock=args.stock, allow_rotation=not args.no_rotation
+    )
+    nest_ms = (time.perf_counter() - t0) * 1000.0
+    nesting = get_nesting_summary(results)
+
+    stock = next(iter(results.values())).stock
+    sheet_area = stock.width_feet * stock.height_feet
+    net_area = sum(p.area_net for p in panels)
+
+    print(f"{args.walls} walls, {len(panels)} pieces, stock {stock.name}")
+    print(f"  layout + per-wall summaries {layout_ms:10.1f} ms")
+    print(f"  nesting                     {nest_ms:10.1f} ms")
+    print(f"  sheets (summary)            {summary_sheets:10d}  "
+          f"waste {100 * (1 - net_area / (summary_sheets * sheet_area)):.1f}% "
+          f"(summary reports cutouts only: {summary_waste:.0f} sq ft)")
+    nested_sheets = nesting["total_sheets_with_nesting"]
+    print(f"  sheets (nested)             {nested_sheets:10d}  "
+          f"waste {100 * (1 - net_area / (nested_sheets * sheet_area)):.1f}%")
+    for material, stats in nesting["materials"].items():
+        print(f"    {material:<28} {stats['sheets_without_nesting']:>7} -> "
+              f"{stats['sheets_with_nesting']:>7} sheets, "
+              f"off-cut waste {stats['waste_percentage']:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,7 +30,7 @@ Dependencies:
     - Rhino.Geometry: Core geometry types
     - Grasshopper: DataTree for output organization
     - timber_framing_generator.core: JSON schemas
-    - timber_framing_generator.cell_decomposition: Panel-aware functions
+    - timber_framing_generator.cell_decomposition: Batch decomposer (headless)
 
 Performance Considerations:
     - Processing time scales linearly with wall count
@@ -99,7 +99,6 @@ Version: 1.1.0
 import sys
 import json
 import traceback
-from dataclasses import asdict
 
 # .NET / CLR
 import clr
@@ -112,14 +111,6 @@ import Grasshopper
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
-# =============================================================================
-# Force Module Reload (CPython 3 in Rhino 8)
-# =============================================================================
-
-_modules_to_clear = [k for k in sys.modules.keys() if 'timber_framing_generator' in k]
-for mod in _modules_to_clear:
-    del sys.modules[mod]
-
 # =============================================================================
 # Project Setup
 # =============================================================================
@@ -128,16 +119,16 @@ PROJECT_PATH = r"C:\Users\Fernando Maytorena\OneDrive\Documentos\GitHub\timber_f
 if PROJECT_PATH not in sys.path:
     sys.path.insert(0, PROJECT_PATH)
 
-from src.timber_framing_generator.core.json_schemas import (
-    CellData, CellInfo, CellCorners, Point3D,
-    deserialize_wall_data, FramingJSONEncoder
-)
+# Re-import only modules whose source changed since the last solve
+from src.timber_framing_generator.dev_utils.reload_modules import reload_changed_modules
+_reloaded_modules = reload_changed_modules()
+print(f"[RELOAD] Reloaded {len(_reloaded_modules)} changed timber_framing_generator modules")
+
+from src.timber_framing_generator.core.json_schemas import FramingJSONEncoder
 from src.timber_framing_generator.utils.geometry_factory import get_factory
-from src.timber_framing_generator.cell_decomposition import (
-    get_openings_in_range,
-    clip_opening_to_range,
-    check_opening_spans_panel_joint,
-    generate_panel_cell_id,
+from src.timber_framing_generator.cell_decomposition.batch_decomposer import (
+    decompose_wall,
+    panels_by_wall,
 )
 
 # =============================================================================
@@ -291,7 +282,7 @@ def create_cell_surface(corners):
     """Create a visualization surface from cell corners using RhinoCommonFactory.
 
     Args:
-        corners: CellCorners with bottom_left, bottom_right, top_right, top_left
+        corners: CellCorners dict with bottom_left, bottom_right, top_right, top_left
 
     Returns:
         NurbsSurface for visualization, or None if creation fails
@@ -299,10 +290,10 @@ def create_cell_surface(corners):
     try:
         factory = get_factory()
         return factory.create_surface_from_corners(
-            (corners.bottom_left.x, corners.bottom_left.y, corners.bottom_left.z),
-            (corners.bottom_right.x, corners.bottom_right.y, corners.bottom_right.z),
-            (corners.top_right.x, corners.top_right.y, corners.top_right.z),
-            (corners.top_left.x, corners.top_left.y, corners.top_left.z),
+            *[
+                (corners[key]['x'], corners[key]['y'], corners[key]['z'])
+                for key in ('bottom_left', 'bottom_right', 'top_right', 'top_left')
+            ]
         )
     except Exception as e:
         log_debug(f"Error creating cell surface: {e}")
@@ -324,532 +315,27 @@ def parse_panels_json(panels_json_str):
     return data if isinstance(data, list) else [data]
 
 
-def get_panels_for_wall(panels_data, wall_id):
-    """Get panels for a specific wall from the panels data.
-
-    Args:
-        panels_data: List of panel result dictionaries
-        wall_id: Wall ID to look up
-
-    Returns:
-        List of panel dictionaries for this wall
-    """
-    # Convert to string for comparison (handles int vs str mismatch)
-    wall_id_str = str(wall_id)
-    for result in panels_data:
-        if str(result.get('wall_id', '')) == wall_id_str:
-            return result.get('panels', [])
-    return []
-
-
-def decompose_panel_to_cells(wall_dict, panel, wall_index, panel_index):
-    """Decompose a single panel (wall segment) to cells.
-
-    Args:
-        wall_dict: Wall data dictionary from JSON
-        panel: Panel dictionary with id, u_start, u_end, etc.
-        wall_index: Index for this wall
-        panel_index: Index for this panel within the wall
-
-    Returns:
-        Tuple of (CellData, list of surfaces, list of type labels)
-    """
-    wall_id = wall_dict.get('wall_id', f'wall_{wall_index}')
-    panel_id = panel.get('id', f'{wall_id}_panel_{panel_index}')
-    panel_u_start = panel.get('u_start', 0)
-    panel_u_end = panel.get('u_end', wall_dict.get('wall_length', 0))
-    panel_length = panel_u_end - panel_u_start
-
-    wall_height = wall_dict.get('wall_height', 0)
-    base_elevation = wall_dict.get('base_elevation', 0)
-
-    base_plane = wall_dict.get('base_plane', {})
-    origin = base_plane.get('origin', {'x': 0, 'y': 0, 'z': 0})
-    x_axis = base_plane.get('x_axis', {'x': 1, 'y': 0, 'z': 0})
-
-    cells = []
-    surfaces = []
-    type_labels = []
-
-    all_openings = wall_dict.get('openings', [])
-    panel_openings = get_openings_in_range(all_openings, panel_u_start, panel_u_end)
-
-    log_debug(f"Panel {panel_id}: range u={panel_u_start:.2f} to {panel_u_end:.2f}, {len(panel_openings)} openings")
-
-    def world_point(u_coord, v_coord):
-        return Point3D(
-            origin['x'] + x_axis['x'] * u_coord,
-            origin['y'] + x_axis['y'] * u_coord,
-            base_elevation + v_coord
-        )
-
-    cell_idx = 0
-
-    if not panel_openings:
-        corners = CellCorners(
-            bottom_left=world_point(panel_u_start, 0),
-            bottom_right=world_point(panel_u_end, 0),
-            top_right=world_point(panel_u_end, wall_height),
-            top_left=world_point(panel_u_start, wall_height),
-        )
-        cell = CellInfo(
-            id=generate_panel_cell_id(wall_id, panel_index, "SC", cell_idx),
-            cell_type="SC",
-            u_start=panel_u_start,
-            u_end=panel_u_end,
-            v_start=0,
-            v_end=wall_height,
-            corners=corners,
-            panel_id=panel_id,
-        )
-        cells.append(cell)
-        srf = create_cell_surface(corners)
-        if srf:
-            surfaces.append(srf)
-        type_labels.append("SC")
-    else:
-        sorted_openings = sorted(panel_openings, key=lambda o: o.get('u_start', 0))
-        current_u = panel_u_start
-
-        for opening in sorted_openings:
-            clipped = clip_opening_to_range(opening, panel_u_start, panel_u_end)
-            if not clipped:
-                continue
-
-            o_u_start = clipped.get('u_start', 0)
-            o_u_end = clipped.get('u_end', 0)
-            o_v_start = clipped.get('v_start', 0)
-            o_v_end = clipped.get('v_end', 0)
-            o_type = clipped.get('opening_type', 'window')
-            o_id = clipped.get('id', f'opening_{cell_idx}')
-
-            # Stud cell before opening
-            if current_u < o_u_start:
-                corners = CellCorners(
-                    bottom_left=world_point(current_u, 0),
-                    bottom_right=world_point(o_u_start, 0),
-                    top_right=world_point(o_u_start, wall_height),
-                    top_left=world_point(current_u, wall_height),
-                )
-                cell = CellInfo(
-                    id=generate_panel_cell_id(wall_id, panel_index, "SC", cell_idx),
-                    cell_type="SC",
-                    u_start=current_u,
-                    u_end=o_u_start,
-                    v_start=0,
-                    v_end=wall_height,
-                    corners=corners,
-                    panel_id=panel_id,
-                )
-                cells.append(cell)
-                srf = create_cell_surface(corners)
-                if srf:
-                    surfaces.append(srf)
-                type_labels.append("SC")
-                cell_idx += 1
-
-            # Header cripple cell (above opening)
-            if o_v_end < wall_height:
-                corners = CellCorners(
-                    bottom_left=world_point(o_u_start, o_v_end),
-                    bottom_right=world_point(o_u_end, o_v_end),
-                    top_right=world_point(o_u_end, wall_height),
-                    top_left=world_point(o_u_start, wall_height),
-                )
-                cell = CellInfo(
-                    id=generate_panel_cell_id(wall_id, panel_index, "HCC", cell_idx),
-                    cell_type="HCC",
-                    u_start=o_u_start,
-                    u_end=o_u_end,
-                    v_start=o_v_end,
-                    v_end=wall_height,
-                    corners=corners,
-                    opening_id=o_id,
-                    panel_id=panel_id,
-                )
-                cells.append(cell)
-                srf = create_cell_surface(corners)
-                if srf:
-                    surfaces.append(srf)
-                type_labels.append("HCC")
-                cell_idx += 1
-
-            # Opening cell
-            corners = CellCorners(
-                bottom_left=world_point(o_u_start, o_v_start),
-                bottom_right=world_point(o_u_end, o_v_start),
-                top_right=world_point(o_u_end, o_v_end),
-                top_left=world_point(o_u_start, o_v_end),
-            )
-            cell = CellInfo(
-                id=generate_panel_cell_id(wall_id, panel_index, "OC", cell_idx),
-                cell_type="OC",
-                u_start=o_u_start,
-                u_end=o_u_end,
-                v_start=o_v_start,
-                v_end=o_v_end,
-                corners=corners,
-                opening_id=o_id,
-                opening_type=o_type,
-                panel_id=panel_id,
-            )
-            cells.append(cell)
-            srf = create_cell_surface(corners)
-            if srf:
-                surfaces.append(srf)
-            type_labels.append("OC")
-            cell_idx += 1
-
-            # Sill cripple cell (below window)
-            if o_v_start > 0 and o_type == 'window':
-                corners = CellCorners(
-                    bottom_left=world_point(o_u_start, 0),
-                    bottom_right=world_point(o_u_end, 0),
-                    top_right=world_point(o_u_end, o_v_start),
-                    top_left=world_point(o_u_start, o_v_start),
-                )
-                cell = CellInfo(
-                    id=generate_panel_cell_id(wall_id, panel_index, "SCC", cell_idx),
-                    cell_type="SCC",
-                    u_start=o_u_start,
-                    u_end=o_u_end,
-                    v_start=0,
-                    v_end=o_v_start,
-                    corners=corners,
-                    opening_id=o_id,
-                    panel_id=panel_id,
-                )
-                cells.append(cell)
-                srf = create_cell_surface(corners)
-                if srf:
-                    surfaces.append(srf)
-                type_labels.append("SCC")
-                cell_idx += 1
-
-            current_u = o_u_end
-
-        # Final stud cell after last opening
-        if current_u < panel_u_end:
-            corners = CellCorners(
-                bottom_left=world_point(current_u, 0),
-                bottom_right=world_point(panel_u_end, 0),
-                top_right=world_point(panel_u_end, wall_height),
-                top_left=world_point(current_u, wall_height),
-            )
-            cell = CellInfo(
-                id=generate_panel_cell_id(wall_id, panel_index, "SC", cell_idx),
-                cell_type="SC",
-                u_start=current_u,
-                u_end=panel_u_end,
-                v_start=0,
-                v_end=wall_height,
-                corners=corners,
-                panel_id=panel_id,
-            )
-            cells.append(cell)
-            srf = create_cell_surface(corners)
-            if srf:
-                surfaces.append(srf)
-            type_labels.append("SC")
-
-    cell_data = CellData(
-        wall_id=wall_id,
-        cells=cells,
-        metadata={
-            'wall_length': wall_dict.get('wall_length', 0),
-            'wall_height': wall_height,
-            'panel_id': panel_id,
-            'panel_u_start': panel_u_start,
-            'panel_u_end': panel_u_end,
-        }
-    )
-
-    return cell_data, surfaces, type_labels
-
-
-def decompose_wall_json_to_cells(wall_dict, wall_index):
-    """Decompose a single wall from JSON to cells (legacy mode).
+def add_cells_to_trees(cell_data, cell_srf, cell_types, tree_idx):
+    """Add one CellData entry's surfaces and type labels to the output trees.
 
     Args:
-        wall_dict: Wall data dictionary from JSON
-        wall_index: Index for this wall
-
-    Returns:
-        Tuple of (CellData, list of surfaces, list of type labels)
+        cell_data: CellData dictionary from the batch decomposer
+        cell_srf: DataTree for cell surfaces
+        cell_types: DataTree for cell type labels
+        tree_idx: Branch index for this entry
     """
-    wall_id = wall_dict.get('wall_id', f'wall_{wall_index}')
-    wall_length = wall_dict.get('wall_length', 0)
-    wall_height = wall_dict.get('wall_height', 0)
-    base_elevation = wall_dict.get('base_elevation', 0)
-
-    base_plane = wall_dict.get('base_plane', {})
-    origin = base_plane.get('origin', {'x': 0, 'y': 0, 'z': 0})
-    x_axis = base_plane.get('x_axis', {'x': 1, 'y': 0, 'z': 0})
-
-    cells = []
-    surfaces = []
-    type_labels = []
-    openings = wall_dict.get('openings', [])
-
-    log_debug(f"Wall {wall_id}: L={wall_length:.2f}, H={wall_height:.2f}, {len(openings)} openings")
-
-    if not openings:
-        corners = CellCorners(
-            bottom_left=Point3D(origin['x'], origin['y'], base_elevation),
-            bottom_right=Point3D(
-                origin['x'] + x_axis['x'] * wall_length,
-                origin['y'] + x_axis['y'] * wall_length,
-                base_elevation
-            ),
-            top_right=Point3D(
-                origin['x'] + x_axis['x'] * wall_length,
-                origin['y'] + x_axis['y'] * wall_length,
-                base_elevation + wall_height
-            ),
-            top_left=Point3D(origin['x'], origin['y'], base_elevation + wall_height),
-        )
-        cell = CellInfo(
-            id=f"{wall_id}_SC_0",
-            cell_type="SC",
-            u_start=0,
-            u_end=wall_length,
-            v_start=0,
-            v_end=wall_height,
-            corners=corners,
-        )
-        cells.append(cell)
-        srf = create_cell_surface(corners)
+    srf_idx = 0
+    for cell in cell_data['cells']:
+        srf = create_cell_surface(cell['corners'])
         if srf:
-            surfaces.append(srf)
-        type_labels.append("SC")
-    else:
-        sorted_openings = sorted(openings, key=lambda o: o.get('u_start', 0))
-        current_u = 0
-        cell_idx = 0
-
-        for opening in sorted_openings:
-            o_u_start = opening.get('u_start', 0)
-            o_u_end = opening.get('u_end', 0)
-            o_v_start = opening.get('v_start', 0)
-            o_v_end = opening.get('v_end', 0)
-            o_type = opening.get('opening_type', 'window')
-            o_id = opening.get('id', f'opening_{cell_idx}')
-
-            # Stud cell before opening
-            if current_u < o_u_start:
-                corners = CellCorners(
-                    bottom_left=Point3D(
-                        origin['x'] + x_axis['x'] * current_u,
-                        origin['y'] + x_axis['y'] * current_u,
-                        base_elevation
-                    ),
-                    bottom_right=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_start,
-                        origin['y'] + x_axis['y'] * o_u_start,
-                        base_elevation
-                    ),
-                    top_right=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_start,
-                        origin['y'] + x_axis['y'] * o_u_start,
-                        base_elevation + wall_height
-                    ),
-                    top_left=Point3D(
-                        origin['x'] + x_axis['x'] * current_u,
-                        origin['y'] + x_axis['y'] * current_u,
-                        base_elevation + wall_height
-                    ),
-                )
-                cell = CellInfo(
-                    id=f"{wall_id}_SC_{cell_idx}",
-                    cell_type="SC",
-                    u_start=current_u,
-                    u_end=o_u_start,
-                    v_start=0,
-                    v_end=wall_height,
-                    corners=corners,
-                )
-                cells.append(cell)
-                srf = create_cell_surface(corners)
-                if srf:
-                    surfaces.append(srf)
-                type_labels.append("SC")
-                cell_idx += 1
-
-            # Header cripple cell (above opening)
-            if o_v_end < wall_height:
-                corners = CellCorners(
-                    bottom_left=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_start,
-                        origin['y'] + x_axis['y'] * o_u_start,
-                        base_elevation + o_v_end
-                    ),
-                    bottom_right=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_end,
-                        origin['y'] + x_axis['y'] * o_u_end,
-                        base_elevation + o_v_end
-                    ),
-                    top_right=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_end,
-                        origin['y'] + x_axis['y'] * o_u_end,
-                        base_elevation + wall_height
-                    ),
-                    top_left=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_start,
-                        origin['y'] + x_axis['y'] * o_u_start,
-                        base_elevation + wall_height
-                    ),
-                )
-                cell = CellInfo(
-                    id=f"{wall_id}_HCC_{cell_idx}",
-                    cell_type="HCC",
-                    u_start=o_u_start,
-                    u_end=o_u_end,
-                    v_start=o_v_end,
-                    v_end=wall_height,
-                    corners=corners,
-                    opening_id=o_id,
-                )
-                cells.append(cell)
-                srf = create_cell_surface(corners)
-                if srf:
-                    surfaces.append(srf)
-                type_labels.append("HCC")
-                cell_idx += 1
-
-            # Opening cell
-            corners = CellCorners(
-                bottom_left=Point3D(
-                    origin['x'] + x_axis['x'] * o_u_start,
-                    origin['y'] + x_axis['y'] * o_u_start,
-                    base_elevation + o_v_start
-                ),
-                bottom_right=Point3D(
-                    origin['x'] + x_axis['x'] * o_u_end,
-                    origin['y'] + x_axis['y'] * o_u_end,
-                    base_elevation + o_v_start
-                ),
-                top_right=Point3D(
-                    origin['x'] + x_axis['x'] * o_u_end,
-                    origin['y'] + x_axis['y'] * o_u_end,
-                    base_elevation + o_v_end
-                ),
-                top_left=Point3D(
-                    origin['x'] + x_axis['x'] * o_u_start,
-                    origin['y'] + x_axis['y'] * o_u_start,
-                    base_elevation + o_v_end
-                ),
-            )
-            cell = CellInfo(
-                id=f"{wall_id}_OC_{cell_idx}",
-                cell_type="OC",
-                u_start=o_u_start,
-                u_end=o_u_end,
-                v_start=o_v_start,
-                v_end=o_v_end,
-                corners=corners,
-                opening_id=o_id,
-                opening_type=o_type,
-            )
-            cells.append(cell)
-            srf = create_cell_surface(corners)
-            if srf:
-                surfaces.append(srf)
-            type_labels.append("OC")
-            cell_idx += 1
-
-            # Sill cripple cell (below window)
-            if o_v_start > 0 and o_type == 'window':
-                corners = CellCorners(
-                    bottom_left=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_start,
-                        origin['y'] + x_axis['y'] * o_u_start,
-                        base_elevation
-                    ),
-                    bottom_right=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_end,
-                        origin['y'] + x_axis['y'] * o_u_end,
-                        base_elevation
-                    ),
-                    top_right=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_end,
-                        origin['y'] + x_axis['y'] * o_u_end,
-                        base_elevation + o_v_start
-                    ),
-                    top_left=Point3D(
-                        origin['x'] + x_axis['x'] * o_u_start,
-                        origin['y'] + x_axis['y'] * o_u_start,
-                        base_elevation + o_v_start
-                    ),
-                )
-                cell = CellInfo(
-                    id=f"{wall_id}_SCC_{cell_idx}",
-                    cell_type="SCC",
-                    u_start=o_u_start,
-                    u_end=o_u_end,
-                    v_start=0,
-                    v_end=o_v_start,
-                    corners=corners,
-                    opening_id=o_id,
-                )
-                cells.append(cell)
-                srf = create_cell_surface(corners)
-                if srf:
-                    surfaces.append(srf)
-                type_labels.append("SCC")
-                cell_idx += 1
-
-            current_u = o_u_end
-
-        # Final stud cell after last opening
-        if current_u < wall_length:
-            corners = CellCorners(
-                bottom_left=Point3D(
-                    origin['x'] + x_axis['x'] * current_u,
-                    origin['y'] + x_axis['y'] * current_u,
-                    base_elevation
-                ),
-                bottom_right=Point3D(
-                    origin['x'] + x_axis['x'] * wall_length,
-                    origin['y'] + x_axis['y'] * wall_length,
-                    base_elevation
-                ),
-                top_right=Point3D(
-                    origin['x'] + x_axis['x'] * wall_length,
-                    origin['y'] + x_axis['y'] * wall_length,
-                    base_elevation + wall_height
-                ),
-                top_left=Point3D(
-                    origin['x'] + x_axis['x'] * current_u,
-                    origin['y'] + x_axis['y'] * current_u,
-                    base_elevation + wall_height
-                ),
-            )
-            cell = CellInfo(
-                id=f"{wall_id}_SC_{cell_idx}",
-                cell_type="SC",
-                u_start=current_u,
-                u_end=wall_length,
-                v_start=0,
-                v_end=wall_height,
-                corners=corners,
-            )
-            cells.append(cell)
-            srf = create_cell_surface(corners)
-            if srf:
-                surfaces.append(srf)
-            type_labels.append("SC")
-
-    cell_data = CellData(
-        wall_id=wall_id,
-        cells=cells,
-        metadata={'wall_length': wall_length, 'wall_height': wall_height}
-    )
-
-    return cell_data, surfaces, type_labels
+            cell_srf.Add(srf, GH_Path(tree_idx, srf_idx))
+            srf_idx += 1
+    for j, cell in enumerate(cell_data['cells']):
+        cell_types.Add(cell['cell_type'], GH_Path(tree_idx, j))
 
 
 def process_decomposition(wall_list, panels_data):
-    """Process all walls/panels through decomposition.
+    """Process all walls/panels through the batch decomposer.
 
     Args:
         wall_list: List of wall dictionaries
@@ -871,57 +357,35 @@ def process_decomposition(wall_list, panels_data):
         log_lines.append("=== LEGACY MODE (no panels) ===")
         log_lines.append(f"Processing {len(wall_list)} walls")
 
+    wall_panels = panels_by_wall(panels_data)
+
     for wall_idx, wall_dict in enumerate(wall_list):
         wall_id = wall_dict.get('wall_id', f'wall_{wall_idx}')
+        panels = wall_panels.get(str(wall_id))
 
         try:
-            if panels_data:
-                wall_panels = get_panels_for_wall(panels_data, wall_id)
-
-                if not wall_panels:
-                    log_lines.append(f"Wall {wall_idx} ({wall_id}): No panels, using whole-wall mode")
-                    cell_data, surfaces, type_labels = decompose_wall_json_to_cells(wall_dict, wall_idx)
-                    all_cell_data.append(cell_data)
-
-                    for j, srf in enumerate(surfaces):
-                        cell_srf.Add(srf, GH_Path(tree_idx, j))
-                    for j, label in enumerate(type_labels):
-                        cell_types.Add(label, GH_Path(tree_idx, j))
-
-                    log_lines.append(f"  Cells: {len(cell_data.cells)}")
-                    tree_idx += 1
-                else:
-                    log_lines.append(f"Wall {wall_idx} ({wall_id}): {len(wall_panels)} panels")
-
-                    for panel_idx, panel in enumerate(wall_panels):
-                        panel_id = panel.get('id', f'{wall_id}_panel_{panel_idx}')
-                        cell_data, surfaces, type_labels = decompose_panel_to_cells(
-                            wall_dict, panel, wall_idx, panel_idx
-                        )
-                        all_cell_data.append(cell_data)
-
-                        for j, srf in enumerate(surfaces):
-                            cell_srf.Add(srf, GH_Path(tree_idx, j))
-                        for j, label in enumerate(type_labels):
-                            cell_types.Add(label, GH_Path(tree_idx, j))
-
-                        log_lines.append(f"  Panel {panel_idx}: {len(cell_data.cells)} cells")
-                        tree_idx += 1
-            else:
-                cell_data, surfaces, type_labels = decompose_wall_json_to_cells(wall_dict, wall_idx)
-                all_cell_data.append(cell_data)
-
-                for j, srf in enumerate(surfaces):
-                    cell_srf.Add(srf, GH_Path(tree_idx, j))
-                for j, label in enumerate(type_labels):
-                    cell_types.Add(label, GH_Path(tree_idx, j))
-
-                log_lines.append(f"Wall {wall_idx} ({wall_id}): {len(cell_data.cells)} cells")
-                tree_idx += 1
-
+            entries = decompose_wall(wall_dict, panels, wall_idx)
         except Exception as e:
             log_lines.append(f"Wall {wall_idx}: ERROR - {str(e)}")
             log_lines.append(traceback.format_exc())
+            continue
+
+        if panels_data and not panels:
+            log_lines.append(f"Wall {wall_idx} ({wall_id}): No panels, using whole-wall mode")
+        elif panels:
+            log_lines.append(f"Wall {wall_idx} ({wall_id}): {len(panels)} panels")
+
+        for panel_idx, cell_data in enumerate(entries):
+            all_cell_data.append(cell_data)
+            add_cells_to_trees(cell_data, cell_srf, cell_types, tree_idx)
+            tree_idx += 1
+
+            if panels:
+                log_lines.append(f"  Panel {panel_idx}: {len(cell_data['cells'])} cells")
+            elif panels_data:
+                log_lines.append(f"  Cells: {len(cell_data['cells'])}")
+            else:
+                log_lines.append(f"Wall {wall_idx} ({wall_id}): {len(cell_data['cells'])} cells")
 
     return all_cell_data, cell_srf, cell_types, log_lines
 
@@ -988,10 +452,9 @@ def main():
 
         # Serialize to JSON
         if all_cell_data:
-            cell_dicts = [asdict(cd) for cd in all_cell_data]
-            cell_json = json.dumps(cell_dicts, cls=FramingJSONEncoder, indent=2)
+            cell_json = json.dumps(all_cell_data, cls=FramingJSONEncoder, indent=2)
 
-            total_cells = sum(len(cd.cells) for cd in all_cell_data)
+            total_cells = sum(len(cd['cells']) for cd in all_cell_data)
             log_lines.append("")
             log_lines.append(f"=== SUMMARY ===")
             log_lines.append(f"Total entries: {len(all_cell_data)}")
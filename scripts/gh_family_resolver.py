@@ -470,7 +470,12 @@ def main():
         # -----------------------------------------------------------------
         log_info("Starting family resolution...")
         resolver = FamilyResolver(provider=provider, cache=cache)
-        result = resolver.resolve(doc=doc, framing_json=framing_json_str)
+        try:
+            result = resolver.resolve(doc=doc, framing_json=framing_json_str)
+        finally:
+            # Each solve builds a new provider; release its download
+            # threads' kept-alive sockets now rather than at GC
+            provider.close()
 
         # Append resolver's log to our info
         info_lines.append("Resolution Log:")
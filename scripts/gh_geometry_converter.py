@@ -122,14 +122,6 @@ import Grasshopper
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
-# =============================================================================
-# Force Module Reload (CPython 3 in Rhino 8)
-# =============================================================================
-
-_modules_to_clear = [k for k in sys.modules.keys() if 'timber_framing_generator' in k]
-for mod in _modules_to_clear:
-    del sys.modules[mod]
-
 # =============================================================================
 # Project Setup
 # =============================================================================
@@ -138,7 +130,13 @@ PROJECT_PATH = r"C:\Users\Fernando Maytorena\OneDrive\Documentos\GitHub\timber_f
 if PROJECT_PATH not in sys.path:
     sys.path.insert(0, PROJECT_PATH)
 
+# Re-import only modules whose source changed since the last solve
+from src.timber_framing_generator.dev_utils.reload_modules import reload_changed_modules
+_reloaded_modules = reload_changed_modules()
+print(f"[RELOAD] Reloaded {len(_reloaded_modules)} changed timber_framing_generator modules")
+
 from src.timber_framing_generator.utils.geometry_factory import get_factory
+from src.timber_framing_generator.utils.geometry_batch import CenterlineArrays
 from src.timber_framing_generator.core.json_schemas import (
     deserialize_framing_results, FramingElementData, Point3D
 )
@@ -302,66 +300,6 @@ def element_type_to_branch_index(element_type):
         return len(TYPE_ORDER) + hash(element_type) % 100
 
 
-def create_brep_from_element(element, factory):
-    """Create a Brep from a framing element.
-
-    Args:
-        element: FramingElementData with centerline and profile info
-        factory: RhinoCommonFactory instance
-
-    Returns:
-        Brep geometry or None if creation fails
-    """
-    start = element.centerline_start
-    end = element.centerline_end
-
-    dx = end.x - start.x
-    dy = end.y - start.y
-    dz = end.z - start.z
-    length = (dx*dx + dy*dy + dz*dz) ** 0.5
-
-    if length < 0.001:
-        return None
-
-    direction = (dx/length, dy/length, dz/length)
-
-    # Extract wall direction from element metadata
-    wall_x_axis = None
-    wall_z_axis = None
-    if element.metadata:
-        wall_x_axis = element.metadata.get('wall_x_axis')
-        wall_z_axis = element.metadata.get('wall_z_axis')
-
-    return factory.create_box_brep_from_centerline(
-        start_point=(start.x, start.y, start.z),
-        direction=direction,
-        length=length,
-        width=element.profile.width,
-        depth=element.profile.depth,
-        wall_x_axis=wall_x_axis,
-        wall_z_axis=wall_z_axis,
-    )
-
-
-def create_centerline_from_element(element, factory):
-    """Create a LineCurve centerline from a framing element.
-
-    Args:
-        element: FramingElementData with centerline info
-        factory: RhinoCommonFactory instance
-
-    Returns:
-        LineCurve geometry or None if creation fails
-    """
-    start = element.centerline_start
-    end = element.centerline_end
-
-    return factory.create_line_curve(
-        (start.x, start.y, start.z),
-        (end.x, end.y, end.z)
-    )
-
-
 def get_element_wall_id(element):
     """Extract wall ID from element metadata or cell_id.
 
@@ -387,6 +325,9 @@ def get_element_wall_id(element):
 def process_geometry(results, filter_types_list, wall_filter, factory):
     """Process all elements to geometry.
 
+    Filtered elements are converted in one batch call so box bounds are
+    computed in bulk and RhinoCommon constructors are resolved once.
+
     Args:
         results: Deserialized FramingResults
         filter_types_list: List of element types to include (or None)
@@ -404,40 +345,52 @@ def process_geometry(results, filter_types_list, wall_filter, factory):
     element_ids = []
     unique_walls = set()
 
+    # Apply filters and collect columnar data
+    selected = []
     for element in results.elements:
         elem_type = element.element_type.lower()
         elem_wall_id = get_element_wall_id(element)
         unique_walls.add(elem_wall_id)
 
-        # Apply filters
         if filter_types_list and elem_type not in filter_types_list:
             continue
         if wall_filter and elem_wall_id != wall_filter:
             continue
 
-        # Create Brep
-        brep = create_brep_from_element(element, factory)
-        if brep:
-            breps.append(brep)
-
-            # Group by type
-            branch_idx = element_type_to_branch_index(elem_type)
-            if branch_idx not in type_groups:
-                type_groups[branch_idx] = []
-                type_names[branch_idx] = elem_type
-            type_groups[branch_idx].append(brep)
-
-            # Group by wall
-            if elem_wall_id not in wall_groups:
-                wall_groups[elem_wall_id] = []
-            wall_groups[elem_wall_id].append(brep)
-
-            # Create centerline
-            centerline = create_centerline_from_element(element, factory)
-            if centerline:
-                centerlines.append(centerline)
-
-            element_ids.append(element.id)
+        selected.append((element, elem_type, elem_wall_id))
+
+    arrays = CenterlineArrays.from_elements(element for element, _, _ in selected)
+
+    # Create all Breps in one call (None for degenerate centerlines)
+    batch_breps = factory.create_box_breps_from_centerlines(arrays)
+
+    kept = [i for i, brep in enumerate(batch_breps) if brep]
+    batch_centerlines = factory.create_line_curves_batch(
+        [arrays.starts[i] for i in kept],
+        [arrays.ends[i] for i in kept],
+    )
+
+    for i, centerline in zip(kept, batch_centerlines):
+        element, elem_type, elem_wall_id = selected[i]
+        brep = batch_breps[i]
+        breps.append(brep)
+
+        # Group by type
+        branch_idx = element_type_to_branch_index(elem_type)
+        if branch_idx not in type_groups:
+            type_groups[branch_idx] = []
+            type_names[branch_idx] = elem_type
+        type_groups[branch_idx].append(brep)
+
+        # Group by wall
+        if elem_wall_id not in wall_groups:
+            wall_groups[elem_wall_id] = []
+        wall_groups[elem_wall_id].append(brep)
+
+        if centerline:
+            centerlines.append(centerline)
+
+        element_ids.append(element.id)
 
     return breps, type_groups, type_names, wall_groups, centerlines, element_ids, unique_walls
 
@@ -109,14 +109,6 @@ import Grasshopper
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
-# =============================================================================
-# Force Module Reload (CPython 3 in Rhino 8)
-# =============================================================================
-
-_modules_to_clear = [k for k in sys.modules.keys() if 'timber_framing_generator' in k]
-for mod in _modules_to_clear:
-    del sys.modules[mod]
-
 # =============================================================================
 # Project Setup
 # =============================================================================
@@ -125,6 +117,11 @@ PROJECT_PATH = r"C:\Users\Fernando Maytorena\OneDrive\Documentos\GitHub\timber_f
 if PROJECT_PATH not in sys.path:
     sys.path.insert(0, PROJECT_PATH)
 
+# Re-import only modules whose source changed since the last solve
+from src.timber_framing_generator.dev_utils.reload_modules import reload_changed_modules
+_reloaded_modules = reload_changed_modules()
+print(f"[RELOAD] Reloaded {len(_reloaded_modules)} changed timber_framing_generator modules")
+
 from src.timber_framing_generator.mep.routing import (
     build_routing_graph,
     UnifiedGraphBuilder,
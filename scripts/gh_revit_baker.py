@@ -84,15 +84,6 @@ Usage:
 import sys
 import json
 
-# =============================================================================
-# Force Module Reload (CPython 3 in Rhino 8)
-# =============================================================================
-# Clear cached modules to ensure fresh imports when script changes
-_modules_to_clear = [k for k in sys.modules.keys() if 'timber_framing_generator' in k]
-for mod in _modules_to_clear:
-    del sys.modules[mod]
-print(f"[RELOAD] Cleared {len(_modules_to_clear)} cached timber_framing_generator modules")
-
 # =============================================================================
 # RhinoCommon Setup
 # =============================================================================
@@ -116,11 +107,17 @@ PROJECT_PATH = r"C:\Users\Fernando Maytorena\OneDrive\Documentos\GitHub\timber_f
 if PROJECT_PATH not in sys.path:
     sys.path.insert(0, PROJECT_PATH)
 
+# Re-import only modules whose source changed since the last solve
+from src.timber_framing_generator.dev_utils.reload_modules import reload_changed_modules
+_reloaded_modules = reload_changed_modules()
+print(f"[RELOAD] Reloaded {len(_reloaded_modules)} changed timber_framing_generator modules")
+
 from src.timber_framing_generator.utils.geometry_factory import get_factory
 from src.timber_framing_generator.core.json_schemas import (
     deserialize_framing_results, FramingElementData, Point3D
 )
 from src.timber_framing_generator.core.material_system import ElementType
+from src.timber_framing_generator.families.type_matcher import TypeMatcher
 
 # =============================================================================
 # Element Classification
@@ -150,75 +147,6 @@ BEAM_ELEMENT_TYPES = {
     ElementType.SILL.value,
 }
 
-# Default type mapping for common profiles
-# Maps framing generator profile names to Revit family type names
-DEFAULT_TYPE_MAPPING = {
-    # Timber profiles
-    "2x4": "2x4",
-    "2x6": "2x6",
-    "2x8": "2x8",
-    "2x10": "2x10",
-    "2x12": "2x12",
-    # CFS profiles - map to Clark Dietrich naming with (50) yield strength suffix
-    # 350-series (3.5" web)
-    "350S125-33": "350S125-33(50)",
-    "350S125-43": "350S125-43(50)",
-    "350S125-54": "350S125-54(50)",
-    "350S125-68": "350S125-68(50)",
-    "350S162-33": "350S162-33(50)",
-    "350S162-43": "350S162-43(50)",
-    "350S162-54": "350S162-54(50)",
-    "350T125-33": "350T125-33(50)",
-    "350T125-43": "350T125-43(50)",
-    "350T125-54": "350T125-54(50)",
-    "350T250-54": "350T250-54(50)",
-    # 362-series (3.625" web) - Clark Dietrich standard
-    "362S125-33": "362S125-33(50)",
-    "362S125-43": "362S125-43(50)",
-    "362S125-54": "362S125-54(50)",
-    "362S125-68": "362S125-68(50)",
-    "362S162-33": "362S162-33(50)",
-    "362S162-43": "362S162-43(50)",
-    "362S162-54": "362S162-54(50)",
-    "362S162-68": "362S162-68(50)",
-    "362T125-33": "362T125-33(50)",
-    "362T125-43": "362T125-43(50)",
-    "362T125-54": "362T125-54(50)",
-    "362T125-68": "362T125-68(50)",
-    "362T250-54": "362T250-54(50)",
-    "362T250-68": "362T250-68(50)",
-    # 400-series (4" web)
-    "400S125-33": "400S125-33(50)",
-    "400S125-43": "400S125-43(50)",
-    "400S125-54": "400S125-54(50)",
-    "400S125-68": "400S125-68(50)",
-    "400T125-54": "400T125-54(50)",
-    "400T250-54": "400T250-54(50)",
-    # 550-series (5.5" web)
-    "550S125-33": "550S125-33(50)",
-    "550S125-43": "550S125-43(50)",
-    "550S125-54": "550S125-54(50)",
-    "550S125-68": "550S125-68(50)",
-    "550S250-97": "550S250-97(50)",
-    "550T125-54": "550T125-54(50)",
-    "550T200-54": "550T200-54(50)",
-    "550T250-54": "550T250-54(50)",
-    # 600-series (6" web)
-    "600S162-33": "600S162-33(50)",
-    "600S162-43": "600S162-43(50)",
-    "600S162-54": "600S162-54(50)",
-    "600S162-68": "600S162-68(50)",
-    "600T125-33": "600T125-33(50)",
-    "600T125-43": "600T125-43(50)",
-    "600T125-54": "600T125-54(50)",
-    # 800-series (8" web)
-    "800S162-54": "800S162-54(50)",
-    "800S162-68": "800S162-68(50)",
-    "800T125-54": "800T125-54(50)",
-    "800T125-68": "800T125-68(50)",
-}
-
-
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -249,220 +177,6 @@ def classify_element(element_type: str) -> str:
         return "unknown"
 
 
-def parse_cfs_profile_name(profile_name: str) -> dict:
-    """
-    Parse a CFS profile name into its components.
-
-    Examples:
-        "362S125-54" -> {"series": "362", "type": "S", "flange": "125", "gauge": "54"}
-        "600T125-54(50)" -> {"series": "600", "type": "T", "flange": "125", "gauge": "54"}
-
-    Returns:
-        Dict with profile components or None if not a CFS profile
-    """
-    import re
-    # Match patterns like 362S125-54 or 600T125-54(50)
-    pattern = r'^(\d{3})([ST])(\d{3})-(\d{2,3})(?:\(\d+\))?$'
-    match = re.match(pattern, profile_name.upper())
-    if match:
-        return {
-            "series": match.group(1),
-            "type": match.group(2),
-            "flange": match.group(3),
-            "gauge": match.group(4),
-        }
-    return None
-
-
-def find_similar_cfs_profile(profile_name: str, type_name_map: dict,
-                              debug: bool = False) -> tuple:
-    """
-    Find a similar CFS profile when exact match isn't available.
-
-    Matching priority:
-    1. Same profile type (S/T), same flange (125/162/250), same gauge - different series
-    2. Same profile type, different flange, same gauge
-    3. Any CFS profile of same type (S/T)
-
-    Args:
-        profile_name: Source profile (e.g., "362S125-54")
-        type_name_map: Dict of lowercase type names to Revit types
-        debug: Print debug info
-
-    Returns:
-        Tuple of (matched_type, match_quality) or (None, None)
-    """
-    if debug:
-        print(f"  [CFS MATCH] Starting CFS match for '{profile_name}'")
-
-    source = parse_cfs_profile_name(profile_name)
-    if not source:
-        if debug:
-            print(f"  [CFS MATCH] Source profile '{profile_name}' did not parse as CFS")
-        return None, None
-
-    if debug:
-        print(f"  [CFS MATCH] Source parsed: {source}")
-
-    # Parse all available CFS types
-    cfs_types = []
-    sample_type_names = []
-    for type_name, rt in type_name_map.items():
-        if len(sample_type_names) < 10:
-            sample_type_names.append(type_name)
-        parsed = parse_cfs_profile_name(type_name)
-        if parsed:
-            cfs_types.append((type_name, rt, parsed))
-
-    if debug:
-        print(f"  [CFS MATCH] Sample type names from map: {sample_type_names}")
-        print(f"  [CFS MATCH] Found {len(cfs_types)} CFS types out of {len(type_name_map)} total")
-        if cfs_types:
-            print(f"  [CFS MATCH] CFS types found: {[t[0] for t in cfs_types[:5]]}")
-
-    if not cfs_types:
-        if debug:
-            print(f"  [CFS MATCH] No CFS types found in available Revit types")
-        return None, None
-
-    if debug:
-        print(f"  Source profile parsed: {source}")
-        print(f"  Available CFS types: {len(cfs_types)}")
-
-    # Priority 1: Same type (S/T), same gauge, prefer similar series
-    candidates = []
-    for type_name, rt, parsed in cfs_types:
-        if parsed["type"] == source["type"] and parsed["gauge"] == source["gauge"]:
-            # Calculate series difference (closer = better)
-            series_diff = abs(int(parsed["series"]) - int(source["series"]))
-            flange_match = 1 if parsed["flange"] == source["flange"] else 0
-            # Score: prefer same flange, then closer series
-            score = (flange_match * 1000) + (1000 - series_diff)
-            candidates.append((score, type_name, rt))
-
-    if candidates:
-        candidates.sort(reverse=True)  # Highest score first
-        best = candidates[0]
-        if debug:
-            print(f"  CFS similar match: '{profile_name}' -> '{best[1]}' (score={best[0]})")
-        return best[2], 'cfs_similar'
-
-    # Priority 2: Same type (S/T), any gauge - for when gauge differs
-    for type_name, rt, parsed in cfs_types:
-        if parsed["type"] == source["type"]:
-            if debug:
-                print(f"  CFS type match: '{profile_name}' -> '{type_name}'")
-            return rt, 'cfs_type_match'
-
-    # Priority 3: Any CFS type at all (last resort within CFS family)
-    if cfs_types:
-        type_name, rt, _ = cfs_types[0]
-        if debug:
-            print(f"  CFS fallback: '{profile_name}' -> '{type_name}'")
-        return rt, 'cfs_fallback'
-
-    return None, None
-
-
-def find_matching_revit_type(profile_name: str, revit_types: list,
-                              user_mapping: dict = None,
-                              debug_first_n: int = 0) -> tuple:
-    """
-    Find a matching Revit type for a profile name.
-
-    Matching strategy (in order):
-    1. User-provided mapping (exact match)
-    2. Exact match with Revit type name
-    3. Profile name contained in Revit type name
-    4. Default mapping
-    5. Similar CFS profile (same type/gauge, different series)
-    6. Fallback to first available type
-
-    Args:
-        profile_name: Profile name from framing element (e.g., "2x4")
-        revit_types: List of available Revit family types
-        user_mapping: Optional dict of profile_name -> revit_type_name
-        debug_first_n: If > 0, print debug info for first N calls
-
-    Returns:
-        Tuple of (matched_type, match_quality) where match_quality is:
-        'exact', 'contains', 'default', 'cfs_similar', 'fallback', or None
-    """
-    if not revit_types:
-        return None, None
-
-    profile_lower = profile_name.lower().strip()
-
-    # Build mapping of revit type names to types
-    type_name_map = {}
-    type_name_list = []  # For debug output
-    for rt in revit_types:
-        try:
-            # Get type name - handle both Revit API objects and strings
-            if hasattr(rt, 'Name'):
-                name = rt.Name
-            elif hasattr(rt, 'get_Name'):
-                name = rt.get_Name()
-            else:
-                name = str(rt)
-            type_name_map[name.lower()] = rt
-            type_name_list.append(name)
-        except Exception as e:
-            type_name_list.append(f"ERROR: {e}")
-            continue
-
-    # Debug output for first few calls
-    if debug_first_n > 0:
-        print(f"\n[TYPE MATCH DEBUG] Profile: '{profile_name}' -> '{profile_lower}'")
-        print(f"  Available types ({len(type_name_list)}): {type_name_list[:5]}...")
-
-    # 1. User-provided mapping
-    if user_mapping and profile_name in user_mapping:
-        target_name = user_mapping[profile_name].lower()
-        if target_name in type_name_map:
-            return type_name_map[target_name], 'user_mapping'
-        if debug_first_n > 0:
-            print(f"  User mapping '{profile_name}' -> '{user_mapping[profile_name]}' NOT FOUND in types")
-
-    # 2. Exact match
-    if profile_lower in type_name_map:
-        return type_name_map[profile_lower], 'exact'
-
-    # 3. Profile name contained in type name (e.g., "2x4" in "Stud - 2x4")
-    for type_name, rt in type_name_map.items():
-        if profile_lower in type_name:
-            if debug_first_n > 0:
-                print(f"  Contains match: '{profile_lower}' in '{type_name}'")
-            return rt, 'contains'
-
-    if debug_first_n > 0:
-        print(f"  No contains match found for '{profile_lower}'")
-
-    # 4. Default mapping
-    if profile_name in DEFAULT_TYPE_MAPPING:
-        default_target = DEFAULT_TYPE_MAPPING[profile_name].lower()
-        if default_target in type_name_map:
-            return type_name_map[default_target], 'default'
-        # Also try pattern matching with default
-        for type_name, rt in type_name_map.items():
-            if default_target in type_name:
-                return rt, 'default_contains'
-
-    # 5. NEW: Find similar CFS profile when exact match fails
-    # This handles cases where generator uses 362-series but Revit has 350/600-series
-    cfs_match, cfs_quality = find_similar_cfs_profile(
-        profile_name, type_name_map, debug=(debug_first_n > 0)
-    )
-    if cfs_match:
-        return cfs_match, cfs_quality
-
-    # 6. Fallback to first available type
-    if revit_types:
-        return revit_types[0], 'fallback'
-
-    return None, None
-
-
 def create_centerline_curve(element: FramingElementData, factory):
     """
     Create a LineCurve centerline from a framing element.
@@ -898,6 +612,10 @@ if run and elements_json:
         column_type_names = [get_type_name(rt) for rt in column_type_list[:5]]
         beam_type_names = [get_type_name(rt) for rt in beam_type_list[:5]]
 
+        # Index available types once per bake; profile lookups are memoized
+        column_matcher = TypeMatcher(column_type_list, user_type_mapping)
+        beam_matcher = TypeMatcher(beam_type_list, user_type_mapping)
+
         debug_lines.append(f"Available Column Types: {len(column_type_list)}")
         debug_lines.append(f"  First 5 names: {column_type_names}")
         debug_lines.append(f"Available Beam Types: {len(beam_type_list)}")
@@ -983,24 +701,18 @@ if run and elements_json:
                 # Profile name for type matching
                 profile_name = element.profile.name
 
-                # Enable debug for first few type matches
-                debug_type_match = (column_count + beam_count) < 3
-
-                # Determine which type list to use based on classification
+                # Determine which type matcher to use based on classification
                 if classification == "column":
-                    type_list = column_type_list
+                    type_matcher = column_matcher
                 elif classification == "beam":
-                    type_list = beam_type_list
+                    type_matcher = beam_matcher
                 else:
                     unmapped.append(f"Unknown: {element.id} ({elem_type})")
                     skipped_count += 1
                     continue
 
                 # Match to Revit type
-                matched_type, match_quality = find_matching_revit_type(
-                    profile_name, type_list, user_type_mapping,
-                    debug_first_n=1 if debug_type_match else 0
-                )
+                matched_type, match_quality = type_matcher.match(profile_name)
 
                 if matched_type is None:
                     unmapped.append(f"{classification.title()}: {element.id} ({profile_name})")
@@ -1354,6 +1066,7 @@ if run and elements_json:
         debug_lines.append("")
 
         debug_lines.append("Type Matching Stats:")
+        debug_lines.append(f"  unique profiles: columns={column_matcher.cache_size}, beams={beam_matcher.cache_size}")
         for quality, count in type_match_stats.items():
             if count > 0:
                 debug_lines.append(f"  {quality}: {count}")
@@ -116,14 +116,6 @@ import Grasshopper
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
-# =============================================================================
-# Force Module Reload (CPython 3 in Rhino 8)
-# =============================================================================
-
-_modules_to_clear = [k for k in sys.modules.keys() if 'timber_framing_generator' in k]
-for mod in _modules_to_clear:
-    del sys.modules[mod]
-
 # =============================================================================
 # Project Setup
 # =============================================================================
@@ -132,6 +124,11 @@ PROJECT_PATH = r"C:\Users\Fernando Maytorena\OneDrive\Documentos\GitHub\timber_f
 if PROJECT_PATH not in sys.path:
     sys.path.insert(0, PROJECT_PATH)
 
+# Re-import only modules whose source changed since the last solve
+from src.timber_framing_generator.dev_utils.reload_modules import reload_changed_modules
+_reloaded_modules = reload_changed_modules()
+print(f"[RELOAD] Reloaded {len(_reloaded_modules)} changed timber_framing_generator modules")
+
 from src.timber_framing_generator.utils.geometry_factory import get_factory
 from src.timber_framing_generator.sheathing.sheathing_geometry import (
     create_sheathing_breps,
@@ -383,8 +380,11 @@ def process_sheathing_geometry(sheathing_list, walls_by_id, wall_filter, factory
             log_warning(f"Wall {wall_id}: No base_plane found, skipping")
             continue
 
-        # Create geometry for this wall's panels
-        geometries = create_sheathing_breps(sheathing_data, wall_data, factory)
+        # Create geometry for this wall's panels (boxes batched, booleans
+        # only for panels with cutouts)
+        geometries = create_sheathing_breps(
+            sheathing_data, wall_data, factory, backend="rhinocommon"
+        )
 
         for geom in geometries:
             if geom.brep is not None:
@@ -6,6 +6,7 @@ This module provides:
 - Cell types (SC, OC, HCC, SCC, WBC) creation and manipulation
 - Wall-to-cell decomposition algorithms
 - Panel-aware cell decomposition helpers
+- Headless batch decomposition of wall JSON (batch_decomposer)
 
 Example:
     >>> from src.timber_framing_generator.cell_decomposition import (
@@ -36,6 +37,13 @@ from .cell_segmentation import (
     generate_panel_cell_id,
 )
 
+from .batch_decomposer import (
+    prepare_openings,
+    decompose_wall,
+    decompose_walls,
+    panels_by_wall,
+)
+
 __all__ = [
     # Cell types
     "CellDataDict",
@@ -54,4 +62,9 @@ __all__ = [
     "check_opening_spans_panel_joint",
     "get_panel_id_prefix",
     "generate_panel_cell_id",
+    # Batch decomposition
+    "prepare_openings",
+    "decompose_wall",
+    "decompose_walls",
+    "panels_by_wall",
 ]
@@ -0,0 +1,278 @@
+# File: src/timber_framing_generator/cell_decomposition/batch_decomposer.py
+"""
+Headless batch cell decomposition over wall JSON.
+
+``decompose_wall_to_cells`` needs an ``rg.Plane`` and works one wall at a
+time. This module decomposes WallData JSON dicts (Wall Analyzer output)
+without Rhino, so the Cell Decomposer script, ``WallComponent`` and
+offline tooling share one implementation that scales to thousands of
+walls:
+
+- Openings are sorted and clipped to the wall once per wall; panels
+  reuse the sorted list and only clip to their own range
+- Corner points come from the wall's shared ``utils.wall_frame`` frame
+  (``origin + u * x_axis + v * y_axis``, what ``Plane.PointAt`` computes)
+- Panel-aware slicing clips openings with ``clip_opening_to_range`` and
+  names cells with ``generate_panel_cell_id``
+
+Output entries are plain dicts in the ``asdict(CellData)`` layout, ready
+for ``json.dumps`` or ``deserialize_cell_data``.
+
+Usage:
+    from src.timber_framing_generator.cell_decomposition.batch_decomposer import (
+        decompose_walls,
+    )
+
+    entries = decompose_walls(wall_list, panels_data)
+    cell_json = json.dumps(entries)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from src.timber_framing_generator.cell_decomposition.cell_segmentation import (
+    clip_opening_to_range,
+    generate_panel_cell_id,
+    get_openings_in_range,
+)
+from src.timber_framing_generator.utils.wall_frame import WallFrame, wall_frame
+
+# Cell type codes, in the order cells are emitted around each opening
+STUD_CELL = "SC"
+HEADER_CRIPPLE_CELL = "HCC"
+OPENING_CELL = "OC"
+SILL_CRIPPLE_CELL = "SCC"
+
+CORNER_KEYS = ("bottom_left", "bottom_right", "top_right", "top_left")
+
+
+def _frame(wall: Dict[str, Any]) -> WallFrame:
+    """
+    Shared frame of a WallData dict's base plane.
+
+    A missing base plane falls back to world X along the wall, world Z up
+    and the wall's base elevation.
+    """
+    plane = wall.get("base_plane")
+    if plane:
+        return wall_frame(plane)
+    return WallFrame((0.0, 0.0, float(wall.get("base_elevation", 0.0))), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0))
+
+
+def _corners(frame: WallFrame, u_start: float, u_end: float, v_start: float, v_end: float) -> Dict[str, Dict[str, float]]:
+    """CellCorners dict of a (u, v) rectangle."""
+    points = frame.to_world([(u_start, v_start), (u_end, v_start), (u_end, v_end), (u_start, v_end)])
+    return {
+        key: {"x": p[0], "y": p[1], "z": p[2]}
+        for key, p in zip(CORNER_KEYS, points)
+    }
+
+
+def prepare_openings(
+    openings: Iterable[Dict[str, Any]],
+    wall_length: float,
+) -> List[Dict[str, Any]]:
+    """
+    Sort a wall's openings by U and clip them to the wall.
+
+    Openings entirely outside the wall are dropped.
+
+    Args:
+        openings: Opening dictionaries with u_start/u_end/v_start/v_end
+        wall_length: Wall length
+
+    Returns:
+        Clipped opening copies sorted by u_start
+    """
+    clipped = []
+    for opening in openings:
+        inside = clip_opening_to_range(opening, 0.0, wall_length)
+        if inside is not None:
+            clipped.append(inside)
+    clipped.sort(key=lambda o: o.get("u_start", 0))
+    return clipped
+
+
+def _decompose_range(
+    frame: WallFrame,
+    openings: Sequence[Dict[str, Any]],
+    u_start: float,
+    u_end: float,
+    wall_height: float,
+    cell_id,
+    panel_id: Optional[str],
+) -> List[Dict[str, Any]]:
+    """
+    Cells of one U range of a wall.
+
+    Args:
+        frame: Wall frame for corner points
+        openings: Sorted openings already clipped to [u_start, u_end]
+        u_start: Range start
+        u_end: Range end
+        wall_height: Wall height
+        cell_id: Callable (cell_type, index) -> cell ID
+        panel_id: Panel ID stored on each cell, or None
+
+    Returns:
+        CellInfo dictionaries in emission order
+    """
+    cells: List[Dict[str, Any]] = []
+
+    def add(cell_type, index, u0, u1, v0, v1, opening_id=None, opening_type=None):
+        cells.append({
+            "id": cell_id(cell_type, index),
+            "cell_type": cell_type,
+            "u_start": u0,
+            "u_end": u1,
+            "v_start": v0,
+            "v_end": v1,
+            "corners": _corners(frame, u0, u1, v0, v1),
+            "opening_id": opening_id,
+            "opening_type": opening_type,
+            "panel_id": panel_id,
+            "metadata": {},
+        })
+
+    if not openings:
+        add(STUD_CELL, 0, u_start, u_end, 0, wall_height)
+        return cells
+
+    current_u = u_start
+    index = 0
+    for opening in openings:
+        o_u_start = opening.get("u_start", 0)
+        o_u_end = opening.get("u_end", 0)
+        o_v_start = opening.get("v_start", 0)
+        o_v_end = opening.get("v_end", 0)
+        o_type = opening.get("opening_type", "window")
+        o_id = opening.get("id", f"opening_{index}")
+
+        # Stud cell before opening
+        if current_u < o_u_start:
+            add(STUD_CELL, index, current_u, o_u_start, 0, wall_height)
+            index += 1
+
+        # Header cripple cell (above opening)
+        if o_v_end < wall_height:
+            add(HEADER_CRIPPLE_CELL, index, o_u_start, o_u_end, o_v_end, wall_height, opening_id=o_id)
+            index += 1
+
+        add(OPENING_CELL, index, o_u_start, o_u_end, o_v_start, o_v_end,
+            opening_id=o_id, opening_type=o_type)
+        index += 1
+
+        # Sill cripple cell (below window)
+        if o_v_start > 0 and o_type == "window":
+            add(SILL_CRIPPLE_CELL, index, o_u_start, o_u_end, 0, o_v_start, opening_id=o_id)
+            index += 1
+
+        current_u = max(current_u, o_u_end)
+
+    # Final stud cell after last opening
+    if current_u < u_end:
+        add(STUD_CELL, index, current_u, u_end, 0, wall_height)
+
+    return cells
+
+
+def _cell_data(wall_id: str, cells: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Dict[str, Any]:
+    return {"wall_id": wall_id, "cells": cells, "wall_data_ref": None, "metadata": metadata}
+
+
+def decompose_wall(
+    wall: Dict[str, Any],
+    panels: Optional[Sequence[Dict[str, Any]]] = None,
+    wall_index: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Decompose one wall, whole or per panel.
+
+    Args:
+        wall: WallData dictionary
+        panels: Panel dictionaries (id, u_start, u_end) for panel-aware
+            slicing; None or empty decomposes the whole wall
+        wall_index: Fallback ID index for walls without wall_id
+
+    Returns:
+        One CellData dictionary for the wall, or one per panel
+    """
+    wall_id = wall.get("wall_id", f"wall_{wall_index}")
+    wall_length = wall.get("wall_length", 0)
+    wall_height = wall.get("wall_height", 0)
+    frame = _frame(wall)
+    openings = prepare_openings(wall.get("openings", []), wall_length)
+
+    if not panels:
+        cells = _decompose_range(
+            frame, openings, 0, wall_length, wall_height,
+            lambda cell_type, index: f"{wall_id}_{cell_type}_{index}",
+            None,
+        )
+        return [_cell_data(wall_id, cells, {"wall_length": wall_length, "wall_height": wall_height})]
+
+    entries = []
+    for panel_index, panel in enumerate(panels):
+        panel_id = panel.get("id", f"{wall_id}_panel_{panel_index}")
+        panel_u_start = panel.get("u_start", 0)
+        panel_u_end = panel.get("u_end", wall_length)
+
+        panel_openings = []
+        for opening in get_openings_in_range(openings, panel_u_start, panel_u_end):
+            clipped = clip_opening_to_range(opening, panel_u_start, panel_u_end)
+            if clipped is not None:
+                panel_openings.append(clipped)
+
+        cells = _decompose_range(
+            frame, panel_openings, panel_u_start, panel_u_end, wall_height,
+            lambda cell_type, index, p=panel_index: generate_panel_cell_id(wall_id, p, cell_type, index),
+            panel_id,
+        )
+        entries.append(_cell_data(wall_id, cells, {
+            "wall_length": wall_length,
+            "wall_height": wall_height,
+            "panel_id": panel_id,
+            "panel_u_start": panel_u_start,
+            "panel_u_end": panel_u_end,
+        }))
+    return entries
+
+
+def panels_by_wall(panels_data: Optional[Iterable[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Index Panel Decomposer results by wall ID.
+
+    Args:
+        panels_data: Panel result dictionaries with wall_id and panels
+
+    Returns:
+        Panel lists keyed by str(wall_id); the first result per wall wins
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for result in panels_data or []:
+        index.setdefault(str(result.get("wall_id", "")), result.get("panels", []))
+    return index
+
+
+def decompose_walls(
+    walls: Sequence[Dict[str, Any]],
+    panels_data: Optional[Iterable[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Decompose many walls in one call.
+
+    Walls with panels in ``panels_data`` are sliced per panel; the rest
+    are decomposed whole.
+
+    Args:
+        walls: WallData dictionaries
+        panels_data: Panel Decomposer results (optional)
+
+    Returns:
+        CellData dictionaries, walls in order, panels in order within a wall
+    """
+    panel_index = panels_by_wall(panels_data)
+    entries: List[Dict[str, Any]] = []
+    for wall_index, wall in enumerate(walls):
+        wall_id = wall.get("wall_id", f"wall_{wall_index}")
+        entries.extend(decompose_wall(wall, panel_index.get(str(wall_id)), wall_index))
+    return entries
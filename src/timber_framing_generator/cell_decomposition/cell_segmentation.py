@@ -1,7 +1,14 @@
 # File: timber_framing_generator/cell_decomposition/cell_segmentation.py
 
 from typing import List, Dict, Union, Optional, Tuple
-import Rhino.Geometry as rg
+
+# Rhino is only needed for decompose_wall_to_cells; the JSON helpers
+# below (and batch_decomposer, which uses them) run headless.
+try:
+    import Rhino.Geometry as rg
+except ImportError:
+    rg = None
+
 from src.timber_framing_generator.cell_decomposition.cell_types import (
     create_wall_boundary_cell_data,
     create_opening_cell_data,
@@ -10,6 +17,7 @@ from src.timber_framing_generator.cell_decomposition.cell_types import (
     create_header_cripple_cell_data,
     CellDataDict,  # Import the type hint
 )
+from src.timber_framing_generator.utils.wall_frame import to_point3d, wall_frame
 
 
 # =============================================================================
@@ -143,8 +151,8 @@ def _calculate_corner_points(
 ) -> List:
     """
     Calculates corner points for a cell data dictionary based on u and v ranges
-    using the provided base_plane. The method uses base_plane.PointAt(u, v) so that
-    the points are correctly placed in the plane's coordinate system.
+    using the provided base_plane. The points are computed on the wall's cached
+    WallFrame (Plane.PointAt math) and converted to Point3d at the end.
 
     If u_start > u_end or v_start > v_end, the values are swapped so that the lower value comes first.
     """
@@ -154,21 +162,18 @@ def _calculate_corner_points(
     if v_start > v_end:
         v_start, v_end = v_end, v_start
 
-    # Use the plane's local coordinate system. In RhinoCommon, Plane.PointAt(u, v) returns:
+    # Same math as Plane.PointAt(u, v) on the wall's shared frame:
     #   base_plane.Origin + (base_plane.XAxis * u) + (base_plane.YAxis * v)
-    pt1 = base_plane.PointAt(u_start, v_start)
-    pt2 = base_plane.PointAt(u_end, v_start)
-    pt3 = base_plane.PointAt(u_end, v_end)
-    pt4 = base_plane.PointAt(u_start, v_end)
-
-    return [pt1, pt2, pt3, pt4]
+    return to_point3d(wall_frame(base_plane).to_world([
+        (u_start, v_start), (u_end, v_start), (u_end, v_end), (u_start, v_end),
+    ]))
 
 
 def decompose_wall_to_cells(
     wall_length: float,
     wall_height: float,
     opening_data_list: List[Dict[str, Union[str, float]]],
-    base_plane: rg.Plane,
+    base_plane: "rg.Plane",
 ) -> Dict[str, Union[CellDataDict, List[CellDataDict]]]:
     """
     Decomposes a wall into cells (dictionaries) based on openings and a base plane.
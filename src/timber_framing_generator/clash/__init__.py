@@ -0,0 +1,54 @@
+# File: src/timber_framing_generator/clash/__init__.py
+"""
+Clash detection for framing members and MEP routes.
+
+Builds a bounding-volume hierarchy over oriented member boxes and route
+capsules and reports typed clashes (member/member, route/member,
+penetrations and route/route).
+
+Example:
+    >>> from src.timber_framing_generator.clash import (
+    ...     detect_clashes, wall_domain_frames
+    ... )
+    >>> report = detect_clashes(elements, routes, frames=wall_domain_frames(walls))
+    >>> report.counts()
+"""
+
+from ..utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "BVH": ".bvh",
+    "ClashType": ".clash_detection",
+    "ClashItem": ".clash_detection",
+    "Clash": ".clash_detection",
+    "ClashReport": ".clash_detection",
+    "ClashDetector": ".clash_detection",
+    "DomainFrame": ".clash_detection",
+    "OrientedBox": ".clash_detection",
+    "DEFAULT_TOLERANCE": ".clash_detection",
+    "PENETRABLE_TYPES": ".clash_detection",
+    "member_box": ".clash_detection",
+    "wall_domain_frames": ".clash_detection",
+    "floor_domain_frame": ".clash_detection",
+    "detect_clashes": ".clash_detection",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
+
+__all__ = [
+    "BVH",
+    "ClashType",
+    "ClashItem",
+    "Clash",
+    "ClashReport",
+    "ClashDetector",
+    "DomainFrame",
+    "OrientedBox",
+    "DEFAULT_TOLERANCE",
+    "PENETRABLE_TYPES",
+    "member_box",
+    "wall_domain_frames",
+    "floor_domain_frame",
+    "detect_clashes",
+]
@@ -0,0 +1,206 @@
+# File: src/timber_framing_generator/clash/bvh.py
+"""
+Bounding-volume hierarchy over axis-aligned boxes.
+
+The hierarchy is a binary tree built top-down by splitting each node's
+items at the median of their box centers along the node's longest axis.
+Nodes are stored in flat, index-aligned lists (no per-node objects), and
+leaves hold up to ``leaf_size`` items.
+
+Queries:
+
+- ``query(lo, hi)``: items whose boxes overlap a box, O(log n + k)
+- ``overlapping_pairs()``: every overlapping item pair, found by
+  traversing the tree against itself; O(n log n + k) for the spatially
+  sparse inputs of building models (k = pairs reported)
+
+The tree is pure Python and geometry-agnostic: callers supply one
+(min, max) box per item and run their own exact tests on the pairs.
+
+Usage:
+    from src.timber_framing_generator.clash.bvh import BVH
+
+    tree = BVH([((0, 0, 0), (1, 1, 1)), ((0.5, 0, 0), (2, 1, 1))])
+    tree.overlapping_pairs()   # [(0, 1)]
+"""
+
+from typing import List, Sequence, Tuple
+
+Vector3 = Tuple[float, float, float]
+Bounds = Tuple[Vector3, Vector3]
+
+DEFAULT_LEAF_SIZE = 4
+
+
+def _overlaps(a_min: Vector3, a_max: Vector3, b_min: Vector3, b_max: Vector3) -> bool:
+    return (
+        a_min[0] <= b_max[0] and b_min[0] <= a_max[0]
+        and a_min[1] <= b_max[1] and b_min[1] <= a_max[1]
+        and a_min[2] <= b_max[2] and b_min[2] <= a_max[2]
+    )
+
+
+class BVH:
+    """
+    Static bounding-volume hierarchy over a list of boxes.
+
+    Args:
+        bounds: One (min_point, max_point) box per item; item i is
+            reported by its index i
+        leaf_size: Maximum items per leaf node
+    """
+
+    def __init__(self, bounds: Sequence[Bounds], leaf_size: int = DEFAULT_LEAF_SIZE) -> None:
+        self.bounds = list(bounds)
+        self.leaf_size = max(1, leaf_size)
+        # Node arrays; a leaf has left == -1 and covers order[start:start + count]
+        self.node_min: List[Vector3] = []
+        self.node_max: List[Vector3] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.start: List[int] = []
+        self.count: List[int] = []
+        self.order: List[int] = list(range(len(self.bounds)))
+        if self.bounds:
+            self._build()
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.left)
+
+    def _new_node(self, start: int, count: int) -> int:
+        lo = [float("inf")] * 3
+        hi = [float("-inf")] * 3
+        bounds = self.bounds
+        for i in self.order[start:start + count]:
+            b_min, b_max = bounds[i]
+            for k in range(3):
+                if b_min[k] < lo[k]:
+                    lo[k] = b_min[k]
+                if b_max[k] > hi[k]:
+                    hi[k] = b_max[k]
+        self.node_min.append((lo[0], lo[1], lo[2]))
+        self.node_max.append((hi[0], hi[1], hi[2]))
+        self.left.append(-1)
+        self.right.append(-1)
+        self.start.append(start)
+        self.count.append(count)
+        return len(self.left) - 1
+
+    def _build(self) -> None:
+        bounds = self.bounds
+        centers = [
+            ((b_min[0] + b_max[0]) * 0.5, (b_min[1] + b_max[1]) * 0.5, (b_min[2] + b_max[2]) * 0.5)
+            for b_min, b_max in bounds
+        ]
+        stack = [self._new_node(0, len(bounds))]
+        while stack:
+            node = stack.pop()
+            start, count = self.start[node], self.count[node]
+            if count <= self.leaf_size:
+                continue
+
+            items = self.order[start:start + count]
+            spans = [
+                max(centers[i][k] for i in items) - min(centers[i][k] for i in items)
+                for k in range(3)
+            ]
+            axis = spans.index(max(spans))
+            if spans[axis] <= 0.0:
+                # Coincident centers cannot be separated; keep one leaf
+                continue
+
+            items.sort(key=lambda i: centers[i][axis])
+            self.order[start:start + count] = items
+            half = count // 2
+            self.left[node] = self._new_node(start, half)
+            self.right[node] = self._new_node(start + half, count - half)
+            stack.append(self.left[node])
+            stack.append(self.right[node])
+
+    def query(self, lo: Vector3, hi: Vector3) -> List[int]:
+        """
+        Items whose boxes overlap a box.
+
+        Args:
+            lo: Query box minimum point
+            hi: Query box maximum point
+
+        Returns:
+            Item indices (unordered)
+        """
+        if not self.bounds:
+            return []
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if not _overlaps(self.node_min[node], self.node_max[node], lo, hi):
+                continue
+            if self.left[node] < 0:
+                start = self.start[node]
+                for i in self.order[start:start + self.count[node]]:
+                    b_min, b_max = self.bounds[i]
+                    if _overlaps(b_min, b_max, lo, hi):
+                        found.append(i)
+            else:
+                stack.append(self.left[node])
+                stack.append(self.right[node])
+        return found
+
+    def overlapping_pairs(self) -> List[Tuple[int, int]]:
+        """
+        Every pair of items whose boxes overlap.
+
+        Returns:
+            Sorted (i, j) index pairs with i < j
+        """
+        if not self.bounds:
+            return []
+        bounds = self.bounds
+        node_min, node_max = self.node_min, self.node_max
+        left, right = self.left, self.right
+        order, start, count = self.order, self.start, self.count
+        pairs = []
+
+        # (a, a) entries compare a node's items among themselves
+        stack = [(0, 0)]
+        while stack:
+            a, b = stack.pop()
+            if a == b:
+                if left[a] < 0:
+                    items = order[start[a]:start[a] + count[a]]
+                    for x in range(len(items)):
+                        i = items[x]
+                        i_min, i_max = bounds[i]
+                        for j in items[x + 1:]:
+                            if _overlaps(i_min, i_max, bounds[j][0], bounds[j][1]):
+                                pairs.append((i, j) if i < j else (j, i))
+                else:
+                    stack.append((left[a], left[a]))
+                    stack.append((right[a], right[a]))
+                    stack.append((left[a], right[a]))
+                continue
+
+            if not _overlaps(node_min[a], node_max[a], node_min[b], node_max[b]):
+                continue
+            a_leaf, b_leaf = left[a] < 0, left[b] < 0
+            if a_leaf and b_leaf:
+                b_items = order[start[b]:start[b] + count[b]]
+                for i in order[start[a]:start[a] + count[a]]:
+                    i_min, i_max = bounds[i]
+                    for j in b_items:
+                        if _overlaps(i_min, i_max, bounds[j][0], bounds[j][1]):
+                            pairs.append((i, j) if i < j else (j, i))
+            elif b_leaf or (not a_leaf and count[a] >= count[b]):
+                stack.append((left[a], b))
+                stack.append((right[a], b))
+            else:
+                stack.append((a, left[b]))
+                stack.append((a, right[b]))
+
+        pairs.sort()
+        return pairs
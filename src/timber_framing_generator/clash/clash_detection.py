@@ -0,0 +1,806 @@
+# File: src/timber_framing_generator/clash/clash_detection.py
+"""
+Clash detection between framing members and MEP routes.
+
+Every framing member becomes an oriented box around its centerline and
+every route segment a capsule (the segment swept by the pipe radius).
+One bounding-volume hierarchy over all volumes finds candidate pairs;
+exact tests then decide which candidates clash:
+
+- box / box: separating-axis test; the smallest overlap is the depth
+- capsule / box: segment-to-box distance against the pipe radius
+- capsule / capsule: segment-to-segment distance against both radii
+
+Clashes are typed (:class:`ClashType`):
+
+- MEMBER_MEMBER: two framing members overlap
+- ROUTE_MEMBER: a route runs into a plate, header, sill, blocking...
+- PENETRATION: a route crosses a stud-like member; expected, and sized
+  and checked by ``mep.plumbing.penetration_rules``
+- ROUTE_ROUTE: two routes occupy the same space, other than where a run
+  of one system ties into another run of that system
+
+Contacts shallower than ``tolerance`` (members bearing on each other,
+pipes tying into a shared main) are not clashes.
+
+Member boxes follow the orientation convention of
+``utils.geometry_batch.compute_box_bounds``: vertical members put the
+profile width along the wall and depth through it; horizontal members
+are laid flat (depth through the wall, width vertical).
+
+Route segments are 2D in their routing domain. Segments with 3D
+coordinates are used as-is; others are placed with a
+:class:`DomainFrame` per domain ID (see :func:`wall_domain_frames`).
+
+Usage:
+    from src.timber_framing_generator.clash import detect_clashes, wall_domain_frames
+
+    report = detect_clashes(
+        framing_results.elements,
+        routes=routing_result.routes,
+        frames=wall_domain_frames(walls),
+    )
+    for clash in report.hard_clashes:
+        print(clash.clash_type.value, clash.first.id, clash.second.id)
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from ..utils.wall_frame import WallFrame, wall_frame
+from .bvh import BVH, Bounds, Vector3
+
+# Contacts shallower than this are not clashes: 1/32 inch
+DEFAULT_TOLERANCE = 1.0 / 32.0 / 12.0
+
+# Route diameter when neither the route nor the caller gives one: 1 inch
+DEFAULT_ROUTE_DIAMETER = 0.0833
+
+# Members a route may cross through a bored hole (as penetration_rules)
+PENETRABLE_TYPES = frozenset({
+    "stud", "king_stud", "trimmer",
+    "header_cripple", "sill_cripple", "cripple_stud",
+})
+
+# A route crossing a member within this angle cosine of its axis runs
+# along it (a clash) rather than through it (a penetration)
+_PARALLEL_COS = 0.5
+
+# Centerlines shorter than this produce no volume (geometry_batch)
+MIN_CENTERLINE_LENGTH = 0.001
+
+# Golden-section iterations for segment-to-box distance
+_SEARCH_ITERATIONS = 48
+_INV_PHI = (5 ** 0.5 - 1) / 2
+
+_EPS = 1e-9
+
+
+class ClashType(Enum):
+    """Kind of clash between two volumes."""
+    MEMBER_MEMBER = "member_member"
+    ROUTE_MEMBER = "route_member"
+    PENETRATION = "penetration"
+    ROUTE_ROUTE = "route_route"
+
+
+@dataclass(frozen=True)
+class ClashItem:
+    """
+    One side of a clash.
+
+    Attributes:
+        kind: "member" or "route"
+        id: Framing element ID or route ID
+        item_type: Element type (stud, header...) or route system type
+        wall_id: Wall of a member, when known
+        segment_index: Index of the route segment
+    """
+    kind: str
+    id: str
+    item_type: str
+    wall_id: Optional[str] = None
+    segment_index: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "kind": self.kind,
+            "id": self.id,
+            "item_type": self.item_type,
+            "wall_id": self.wall_id,
+            "segment_index": self.segment_index,
+        }
+
+
+@dataclass
+class Clash:
+    """
+    A detected clash.
+
+    Attributes:
+        clash_type: Kind of clash
+        first: Member side for route/member clashes, else the lower index
+        second: The other side
+        depth: Overlap depth (feet); for routes, radius minus distance
+        location: Approximate world point of the clash
+    """
+    clash_type: ClashType
+    first: ClashItem
+    second: ClashItem
+    depth: float
+    location: Vector3
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "clash_type": self.clash_type.value,
+            "first": self.first.to_dict(),
+            "second": self.second.to_dict(),
+            "depth": round(self.depth, 6),
+            "location": [round(c, 6) for c in self.location],
+        }
+
+
+@dataclass
+class ClashReport:
+    """
+    Result of a clash detection run.
+
+    Attributes:
+        clashes: Detected clashes, in volume order
+        member_count: Members with a volume
+        segment_count: Route segments with a volume
+        unplaced_segments: 2D segments whose domain had no frame
+        candidate_pairs: Pairs whose bounds overlapped (exact tests run)
+    """
+    clashes: List[Clash] = field(default_factory=list)
+    member_count: int = 0
+    segment_count: int = 0
+    unplaced_segments: int = 0
+    candidate_pairs: int = 0
+
+    @property
+    def hard_clashes(self) -> List[Clash]:
+        """Clashes other than expected penetrations."""
+        return [c for c in self.clashes if c.clash_type != ClashType.PENETRATION]
+
+    def by_type(self, clash_type: ClashType) -> List[Clash]:
+        """Clashes of one type."""
+        return [c for c in self.clashes if c.clash_type == clash_type]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of clashes per type value."""
+        counts = {t.value: 0 for t in ClashType}
+        for clash in self.clashes:
+            counts[clash.clash_type.value] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "clashes": [c.to_dict() for c in self.clashes],
+            "counts": self.counts(),
+            "member_count": self.member_count,
+            "segment_count": self.segment_count,
+            "unplaced_segments": self.unplaced_segments,
+            "candidate_pairs": self.candidate_pairs,
+        }
+
+
+# =============================================================================
+# Domain placement
+# =============================================================================
+
+@dataclass
+class DomainFrame:
+    """
+    Placement of a 2D routing domain in world space.
+
+    Points are placed with the domain's ``utils.wall_frame`` frame; wall
+    domains share the cached frame of their wall's base plane.
+
+    Attributes:
+        origin: World point of domain (0, 0)
+        u_axis: World direction of domain U (unit length)
+        v_axis: World direction of domain V (unit length)
+        frame: WallFrame doing the conversion (built from the axes if
+            not given)
+    """
+    origin: Vector3
+    u_axis: Vector3 = (1.0, 0.0, 0.0)
+    v_axis: Vector3 = (0.0, 1.0, 0.0)
+    frame: Optional[WallFrame] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.frame is None:
+            self.frame = WallFrame(self.origin, self.u_axis, self.v_axis)
+
+    @classmethod
+    def from_plane(cls, plane: Any) -> "DomainFrame":
+        """Frame of a wall base plane (dict, PlaneData or rg.Plane)."""
+        frame = wall_frame(plane)
+        return cls(frame.origin, frame.x_axis, frame.y_axis, frame)
+
+    def to_world(self, point: Sequence[float]) -> Vector3:
+        """World point of a domain (u, v) point."""
+        return self.frame.to_world_point(point[0], point[1])
+
+
+def _xyz(value: Any) -> Vector3:
+    """(x, y, z) of a Point3D/Vector3D, its dictionary or a sequence."""
+    if isinstance(value, Mapping):
+        return (float(value.get("x", 0.0)), float(value.get("y", 0.0)), float(value.get("z", 0.0)))
+    if hasattr(value, "x"):
+        return (float(value.x), float(value.y), float(value.z))
+    return (float(value[0]), float(value[1]), float(value[2]) if len(value) > 2 else 0.0)
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, Mapping):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def wall_domain_frames(walls: Iterable[Any]) -> Dict[str, DomainFrame]:
+    """
+    Frames of wall cavity domains, keyed by wall ID.
+
+    Wall domains use the wall ID as domain ID, with U along the wall from
+    its base plane origin and V up from the wall base.
+
+    Args:
+        walls: WallData objects or dictionaries
+
+    Returns:
+        Dictionary of wall ID to DomainFrame
+    """
+    frames = {}
+    for wall in walls:
+        wall_id = _field(wall, "wall_id") or _field(wall, "id")
+        plane = _field(wall, "base_plane")
+        if wall_id is None or plane is None:
+            continue
+        frames[str(wall_id)] = DomainFrame.from_plane(plane)
+    return frames
+
+
+def floor_domain_frame(elevation: float = 0.0) -> DomainFrame:
+    """Frame of a floor cavity domain, whose (u, v) are world X and Y."""
+    return DomainFrame(origin=(0.0, 0.0, elevation))
+
+
+# =============================================================================
+# Volumes
+# =============================================================================
+
+def _normalize(v: Sequence[float]) -> Optional[Vector3]:
+    mag = (v[0] * v[0] + v[1] * v[1] + v[2] * v[2]) ** 0.5
+    if mag < _EPS:
+        return None
+    return (v[0] / mag, v[1] / mag, v[2] / mag)
+
+
+def _cross(a: Vector3, b: Vector3) -> Vector3:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+@dataclass
+class OrientedBox:
+    """
+    Box with arbitrary orientation.
+
+    Attributes:
+        center: World center point
+        axes: Three orthonormal box axes; axes[0] runs along the member
+        half: Half extents along each axis
+    """
+    center: Vector3
+    axes: Tuple[Vector3, Vector3, Vector3]
+    half: Vector3
+
+    def bounds(self) -> Bounds:
+        """Axis-aligned bounds."""
+        c, axes, half = self.center, self.axes, self.half
+        extent = [
+            sum(abs(axes[i][k]) * half[i] for i in range(3))
+            for k in range(3)
+        ]
+        return (
+            (c[0] - extent[0], c[1] - extent[1], c[2] - extent[2]),
+            (c[0] + extent[0], c[1] + extent[1], c[2] + extent[2]),
+        )
+
+
+def member_box(
+    start: Vector3,
+    end: Vector3,
+    width: float,
+    depth: float,
+    wall_x_axis: Optional[Sequence[float]] = None,
+    wall_z_axis: Optional[Sequence[float]] = None,
+) -> Optional[OrientedBox]:
+    """
+    Oriented box of a framing member.
+
+    Args:
+        start: Centerline start point
+        end: Centerline end point
+        width: Profile width
+        depth: Profile depth
+        wall_x_axis: Optional wall X-axis (along wall length)
+        wall_z_axis: Optional wall Z-axis (wall normal)
+
+    Returns:
+        OrientedBox, or None for a degenerate centerline
+    """
+    d = (end[0] - start[0], end[1] - start[1], end[2] - start[2])
+    length = (d[0] * d[0] + d[1] * d[1] + d[2] * d[2]) ** 0.5
+    if length < MIN_CENTERLINE_LENGTH:
+        return None
+    axis = (d[0] / length, d[1] / length, d[2] / length)
+
+    if abs(axis[2]) > 0.9:
+        x_axis = _normalize(wall_x_axis) if wall_x_axis else None
+        z_axis = _normalize(wall_z_axis) if wall_z_axis else None
+        if x_axis is None or z_axis is None:
+            # Legacy World axes
+            x_axis, z_axis = (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)
+        # Re-orthogonalize against slightly tilted centerlines
+        perp2 = _normalize(_cross(axis, x_axis)) or z_axis
+        perp1 = _cross(perp2, axis)
+        half_w, half_d = width / 2.0, depth / 2.0
+    else:
+        # Laid flat: depth through the wall (horizontal), width vertical
+        perp1 = _normalize((-axis[1], axis[0], 0.0)) or (0.0, 1.0, 0.0)
+        perp2 = _cross(axis, perp1)
+        half_w, half_d = depth / 2.0, width / 2.0
+
+    center = (
+        (start[0] + end[0]) * 0.5,
+        (start[1] + end[1]) * 0.5,
+        (start[2] + end[2]) * 0.5,
+    )
+    return OrientedBox(center, (axis, perp1, perp2), (length / 2.0, half_w, half_d))
+
+
+def _member_fields(element: Any) -> Tuple[str, str, Any, Any, float, float, Mapping]:
+    """
+    Extract (id, element_type, start, end, width, depth, metadata).
+
+    Accepts FramingElementData, FramingElement or their JSON dictionaries.
+    """
+    profile = _field(element, "profile") or {}
+    element_type = _field(element, "element_type", "")
+    return (
+        str(_field(element, "id", "")),
+        str(getattr(element_type, "value", element_type)),
+        _field(element, "centerline_start"),
+        _field(element, "centerline_end"),
+        float(_field(profile, "width", 0.0) or 0.0),
+        float(_field(profile, "depth", 0.0) or 0.0),
+        _field(element, "metadata") or {},
+    )
+
+
+def _route_fields(route: Any) -> Tuple[str, str, Optional[float], List[Any]]:
+    """Extract (id, system_type, diameter or None, segments) of a Route or dict."""
+    metadata = _field(route, "metadata") or {}
+    diameter = metadata.get("diameter", metadata.get("pipe_size"))
+    if diameter is None and isinstance(route, Mapping):
+        diameter = route.get("pipe_size")
+    route_id = _field(route, "id") or _field(route, "route_id") or ""
+    return (
+        str(route_id),
+        str(_field(route, "system_type", "") or ""),
+        float(diameter) if diameter is not None else None,
+        list(_field(route, "segments") or []),
+    )
+
+
+# =============================================================================
+# Exact tests
+# =============================================================================
+
+def box_box_overlap(a: OrientedBox, b: OrientedBox) -> float:
+    """
+    Penetration depth of two oriented boxes by the separating-axis test.
+
+    Returns:
+        Smallest overlap over the 15 candidate axes; zero or negative
+        when the boxes touch or are separated
+    """
+    A, B = a.axes, b.axes
+    ha, hb = a.half, b.half
+    R = [[_dot(A[i], B[j]) for j in range(3)] for i in range(3)]
+    AbsR = [[abs(R[i][j]) for j in range(3)] for i in range(3)]
+    d = (b.center[0] - a.center[0], b.center[1] - a.center[1], b.center[2] - a.center[2])
+    t = (_dot(d, A[0]), _dot(d, A[1]), _dot(d, A[2]))
+
+    best = float("inf")
+    for i in range(3):
+        rb = hb[0] * AbsR[i][0] + hb[1] * AbsR[i][1] + hb[2] * AbsR[i][2]
+        best = min(best, ha[i] + rb - abs(t[i]))
+        if best <= 0.0:
+            return best
+    for j in range(3):
+        ra = ha[0] * AbsR[0][j] + ha[1] * AbsR[1][j] + ha[2] * AbsR[2][j]
+        s = t[0] * R[0][j] + t[1] * R[1][j] + t[2] * R[2][j]
+        best = min(best, ra + hb[j] - abs(s))
+        if best <= 0.0:
+            return best
+    for i in range(3):
+        i1, i2 = (i + 1) % 3, (i + 2) % 3
+        for j in range(3):
+            # |A_i x B_j| = sin of the angle between them; parallel axes add nothing
+            length = (max(0.0, 1.0 - R[i][j] * R[i][j])) ** 0.5
+            if length < 1e-6:
+                continue
+            j1, j2 = (j + 1) % 3, (j + 2) % 3
+            ra = ha[i1] * AbsR[i2][j] + ha[i2] * AbsR[i1][j]
+            rb = hb[j1] * AbsR[i][j2] + hb[j2] * AbsR[i][j1]
+            s = abs(t[i2] * R[i1][j] - t[i1] * R[i2][j])
+            best = min(best, (ra + rb - s) / length)
+            if best <= 0.0:
+                return best
+    return best
+
+
+def _box_distance_sq(local: Vector3, half: Vector3) -> float:
+    total = 0.0
+    for k in range(3):
+        excess = abs(local[k]) - half[k]
+        if excess > 0.0:
+            total += excess * excess
+    return total
+
+
+def segment_box_distance(p: Vector3, q: Vector3, box: OrientedBox) -> Tuple[float, float]:
+    """
+    Distance from a segment to an oriented box.
+
+    The squared distance from a point moving along the segment to a box
+    is convex in the segment parameter, so a golden-section search finds
+    its minimum.
+
+    Returns:
+        (distance, t): distance and segment parameter of the closest point
+    """
+    c, axes, half = box.center, box.axes, box.half
+    dp = (p[0] - c[0], p[1] - c[1], p[2] - c[2])
+    dq = (q[0] - c[0], q[1] - c[1], q[2] - c[2])
+    lp = (_dot(dp, axes[0]), _dot(dp, axes[1]), _dot(dp, axes[2]))
+    lq = (_dot(dq, axes[0]), _dot(dq, axes[1]), _dot(dq, axes[2]))
+    step = (lq[0] - lp[0], lq[1] - lp[1], lq[2] - lp[2])
+
+    def f(t: float) -> float:
+        return _box_distance_sq(
+            (lp[0] + step[0] * t, lp[1] + step[1] * t, lp[2] + step[2] * t), half)
+
+    lo, hi = 0.0, 1.0
+    x1 = hi - _INV_PHI * (hi - lo)
+    x2 = lo + _INV_PHI * (hi - lo)
+    f1, f2 = f(x1), f(x2)
+    for _ in range(_SEARCH_ITERATIONS):
+        if f1 <= f2:
+            hi, x2, f2 = x2, x1, f1
+            x1 = hi - _INV_PHI * (hi - lo)
+            f1 = f(x1)
+        else:
+            lo, x1, f1 = x1, x2, f2
+            x2 = lo + _INV_PHI * (hi - lo)
+            f2 = f(x2)
+    t, best = (x1, f1) if f1 <= f2 else (x2, f2)
+    for end in (0.0, 1.0):
+        value = f(end)
+        if value < best:
+            t, best = end, value
+    return best ** 0.5, t
+
+
+def segment_segment_closest(
+    p1: Vector3, q1: Vector3, p2: Vector3, q2: Vector3
+) -> Tuple[float, float, float]:
+    """
+    Closest points of two segments.
+
+    Returns:
+        (distance, s, t): distance and the parameters of the closest
+        points on the first and second segment
+    """
+    d1 = (q1[0] - p1[0], q1[1] - p1[1], q1[2] - p1[2])
+    d2 = (q2[0] - p2[0], q2[1] - p2[1], q2[2] - p2[2])
+    r = (p1[0] - p2[0], p1[1] - p2[1], p1[2] - p2[2])
+    a, e, f = _dot(d1, d1), _dot(d2, d2), _dot(d2, r)
+
+    def clamp(x: float) -> float:
+        return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+    if a <= _EPS and e <= _EPS:
+        s = t = 0.0
+    elif a <= _EPS:
+        s, t = 0.0, clamp(f / e)
+    else:
+        c = _dot(d1, r)
+        if e <= _EPS:
+            s, t = clamp(-c / a), 0.0
+        else:
+            b = _dot(d1, d2)
+            denom = a * e - b * b
+            s = clamp((b * f - c * e) / denom) if denom > _EPS else 0.0
+            t = (b * s + f) / e
+            if t < 0.0:
+                s, t = clamp(-c / a), 0.0
+            elif t > 1.0:
+                s, t = clamp((b - c) / a), 1.0
+
+    c1 = (p1[0] + d1[0] * s, p1[1] + d1[1] * s, p1[2] + d1[2] * s)
+    c2 = (p2[0] + d2[0] * t, p2[1] + d2[1] * t, p2[2] + d2[2] * t)
+    dx, dy, dz = c1[0] - c2[0], c1[1] - c2[1], c1[2] - c2[2]
+    return (dx * dx + dy * dy + dz * dz) ** 0.5, s, t
+
+
+def _lerp(p: Vector3, q: Vector3, t: float) -> Vector3:
+    return (p[0] + (q[0] - p[0]) * t, p[1] + (q[1] - p[1]) * t, p[2] + (q[2] - p[2]) * t)
+
+
+# =============================================================================
+# Detector
+# =============================================================================
+
+@dataclass
+class _Capsule:
+    start: Vector3
+    end: Vector3
+    radius: float
+
+
+class ClashDetector:
+    """
+    Collects member and route volumes and finds clashes between them.
+
+    Args:
+        tolerance: Overlaps up to this depth are contacts, not clashes
+        clearance: Extra radius around every route (e.g. required
+            clearance to framing)
+        route_diameters: Diameter per system type for routes without one
+        default_diameter: Diameter when neither route nor table has one
+    """
+
+    def __init__(
+        self,
+        tolerance: float = DEFAULT_TOLERANCE,
+        clearance: float = 0.0,
+        route_diameters: Optional[Mapping[str, float]] = None,
+        default_diameter: float = DEFAULT_ROUTE_DIAMETER,
+    ) -> None:
+        self.tolerance = tolerance
+        self.clearance = clearance
+        self.route_diameters = dict(route_diameters or {})
+        self.default_diameter = default_diameter
+        self._items: List[ClashItem] = []
+        self._volumes: List[Any] = []
+        self._unplaced = 0
+
+    def add_members(
+        self,
+        elements: Iterable[Any],
+        wall_id: Optional[str] = None,
+        wall_x_axis: Optional[Any] = None,
+        wall_z_axis: Optional[Any] = None,
+    ) -> int:
+        """
+        Add framing members.
+
+        Wall axes and wall ID default to the element's
+        ``metadata['wall_x_axis']``, ``metadata['wall_z_axis']`` and
+        ``metadata['wall_id']``.
+
+        Args:
+            elements: FramingElementData, FramingElement or dictionaries
+            wall_id: Wall of the elements
+            wall_x_axis: Wall X-axis of the elements
+            wall_z_axis: Wall Z-axis (normal) of the elements
+
+        Returns:
+            Number of members added (degenerate centerlines are skipped)
+        """
+        added = 0
+        for element in elements:
+            element_id, element_type, start, end, width, depth, metadata = _member_fields(element)
+            if start is None or end is None:
+                continue
+            x_axis = wall_x_axis if wall_x_axis is not None else metadata.get("wall_x_axis")
+            z_axis = wall_z_axis if wall_z_axis is not None else metadata.get("wall_z_axis")
+            box = member_box(
+                _xyz(start), _xyz(end), width, depth,
+                _xyz(x_axis) if x_axis is not None else None,
+                _xyz(z_axis) if z_axis is not None else None,
+            )
+            if box is None:
+                continue
+            self._items.append(ClashItem(
+                "member", element_id, element_type.lower(),
+                wall_id=wall_id or metadata.get("wall_id") or _field(element, "wall_id"),
+            ))
+            self._volumes.append(box)
+            added += 1
+        return added
+
+    def add_framing_results(self, results: Any) -> int:
+        """
+        Add the members of a FramingResults (object or dictionary).
+
+        Returns:
+            Number of members added
+        """
+        x_axis = _field(results, "wall_x_axis")
+        z_axis = _field(results, "wall_z_axis")
+        return self.add_members(
+            _field(results, "elements") or [],
+            wall_id=_field(results, "wall_id"),
+            wall_x_axis=x_axis,
+            wall_z_axis=z_axis,
+        )
+
+    def add_routes(
+        self,
+        routes: Iterable[Any],
+        frames: Optional[Mapping[str, DomainFrame]] = None,
+    ) -> int:
+        """
+        Add route segments as capsules.
+
+        Args:
+            routes: Route objects or route dictionaries
+            frames: Domain frames for 2D segments, keyed by domain ID
+
+        Returns:
+            Number of segments added; 2D segments without a frame are
+            counted in the report's ``unplaced_segments`` instead
+        """
+        frames = frames or {}
+        added = 0
+        for route in routes:
+            route_id, system_type, diameter, segments = _route_fields(route)
+            if diameter is None:
+                diameter = self.route_diameters.get(system_type.lower(), self.default_diameter)
+            radius = diameter / 2.0 + self.clearance
+            for index, segment in enumerate(segments):
+                start, end = _field(segment, "start"), _field(segment, "end")
+                if start is None or end is None:
+                    continue
+                if len(start) >= 3 and len(end) >= 3:
+                    p, q = _xyz(start), _xyz(end)
+                else:
+                    frame = frames.get(_field(segment, "domain_id", "") or "")
+                    if frame is None:
+                        self._unplaced += 1
+                        continue
+                    p, q = frame.to_world(start), frame.to_world(end)
+                self._items.append(ClashItem(
+                    "route", route_id, system_type, segment_index=index,
+                ))
+                self._volumes.append(_Capsule(p, q, radius))
+                added += 1
+        return added
+
+    def _bounds(self, volume: Any) -> Bounds:
+        if isinstance(volume, OrientedBox):
+            return volume.bounds()
+        p, q, r = volume.start, volume.end, volume.radius
+        return (
+            (min(p[0], q[0]) - r, min(p[1], q[1]) - r, min(p[2], q[2]) - r),
+            (max(p[0], q[0]) + r, max(p[1], q[1]) + r, max(p[2], q[2]) + r),
+        )
+
+    def detect(self, types: Optional[Iterable[ClashType]] = None) -> ClashReport:
+        """
+        Find clashes between all added volumes.
+
+        Args:
+            types: Clash types to report (default: all)
+
+        Returns:
+            ClashReport
+        """
+        wanted: Set[ClashType] = set(types) if types is not None else set(ClashType)
+        report = ClashReport(
+            member_count=sum(1 for v in self._volumes if isinstance(v, OrientedBox)),
+            unplaced_segments=self._unplaced,
+        )
+        report.segment_count = len(self._volumes) - report.member_count
+
+        tree = BVH([self._bounds(v) for v in self._volumes])
+        pairs = tree.overlapping_pairs()
+        report.candidate_pairs = len(pairs)
+
+        for i, j in pairs:
+            clash = self._test(i, j, wanted)
+            if clash is not None:
+                report.clashes.append(clash)
+        return report
+
+    def _test(self, i: int, j: int, wanted: Set[ClashType]) -> Optional[Clash]:
+        a, b = self._volumes[i], self._volumes[j]
+        a_box, b_box = isinstance(a, OrientedBox), isinstance(b, OrientedBox)
+
+        if a_box and b_box:
+            if ClashType.MEMBER_MEMBER not in wanted:
+                return None
+            depth = box_box_overlap(a, b)
+            if depth <= self.tolerance:
+                return None
+            (a_min, a_max), (b_min, b_max) = a.bounds(), b.bounds()
+            location = tuple(
+                (max(a_min[k], b_min[k]) + min(a_max[k], b_max[k])) * 0.5 for k in range(3)
+            )
+            return Clash(ClashType.MEMBER_MEMBER, self._items[i], self._items[j], depth, location)
+
+        if a_box or b_box:
+            box, capsule = (a, b) if a_box else (b, a)
+            member, route = (self._items[i], self._items[j]) if a_box else (self._items[j], self._items[i])
+            clash_type = ClashType.ROUTE_MEMBER
+            if member.item_type in PENETRABLE_TYPES:
+                direction = _normalize((
+                    capsule.end[0] - capsule.start[0],
+                    capsule.end[1] - capsule.start[1],
+                    capsule.end[2] - capsule.start[2],
+                ))
+                if direction is None or abs(_dot(direction, box.axes[0])) < _PARALLEL_COS:
+                    clash_type = ClashType.PENETRATION
+            if clash_type not in wanted:
+                return None
+            distance, t = segment_box_distance(capsule.start, capsule.end, box)
+            depth = capsule.radius - distance
+            if depth <= self.tolerance:
+                return None
+            return Clash(clash_type, member, route, depth, _lerp(capsule.start, capsule.end, t))
+
+        if ClashType.ROUTE_ROUTE not in wanted:
+            return None
+        first, second = self._items[i], self._items[j]
+        if first.id == second.id:
+            return None
+        distance, s, t = segment_segment_closest(a.start, a.end, b.start, b.end)
+        depth = a.radius + b.radius - distance
+        if depth <= self.tolerance:
+            return None
+        if first.item_type == second.item_type and distance <= self.tolerance and (
+            s in (0.0, 1.0) or t in (0.0, 1.0)
+        ):
+            # A run of the same system ending on another: a tie-in
+            return None
+        location = _lerp(_lerp(a.start, a.end, s), _lerp(b.start, b.end, t), 0.5)
+        return Clash(ClashType.ROUTE_ROUTE, first, second, depth, location)
+
+
+def detect_clashes(
+    members: Iterable[Any] = (),
+    routes: Iterable[Any] = (),
+    frames: Optional[Mapping[str, DomainFrame]] = None,
+    types: Optional[Iterable[ClashType]] = None,
+    **kwargs: Any,
+) -> ClashReport:
+    """
+    Find clashes among framing members and MEP routes.
+
+    Args:
+        members: Framing elements (objects or dictionaries)
+        routes: Routes (objects or dictionaries)
+        frames: Domain frames for 2D route segments
+        types: Clash types to report (default: all)
+        **kwargs: ClashDetector options (tolerance, clearance, ...)
+
+    Returns:
+        ClashReport
+    """
+    detector = ClashDetector(**kwargs)
+    detector.add_members(members)
+    detector.add_routes(routes, frames)
+    return detector.detect(types)
@@ -2,12 +2,11 @@
 """
 Wall component module.
 
-This module will contain wall-specific implementations:
-- Wall data extraction from Revit
-- Wall cell decomposition (WBC, OC, SC, SCC, HCC)
-- Wall framing element types
+This module contains wall-specific implementations:
+- WallComponent: BuildingComponent for walls, decomposing WallData JSON
+  with the batch cell decomposer
 
-Currently, wall functionality resides in:
+Most wall functionality still resides in:
 - cell_decomposition/: Cell decomposition logic
 - wall_data/: Revit data extraction
 - framing_elements/: Element generators
@@ -16,7 +15,12 @@ This module serves as a placeholder for future migration of wall-specific
 code into a component-based architecture.
 """
 
+from .wall_component import WallComponent, WALL_ELEMENT_TYPES
+
+__all__ = [
+    "WallComponent",
+    "WALL_ELEMENT_TYPES",
+]
+
 # Future imports will go here when wall code is migrated
-# from .wall_component import WallComponent
 # from .wall_extractor import extract_wall_data
-# from .wall_decomposer import decompose_wall
@@ -0,0 +1,119 @@
+# File: src/timber_framing_generator/components/walls/wall_component.py
+"""
+Wall implementation of the BuildingComponent interface.
+
+Wall data arrives as WallData JSON dicts (the Wall Analyzer output);
+cell decomposition runs on the headless batch decomposer, so the same
+code path serves one wall or thousands.
+"""
+
+from typing import Any, Dict, List
+
+from src.timber_framing_generator.cell_decomposition.batch_decomposer import (
+    decompose_wall,
+    decompose_walls,
+    panels_by_wall,
+)
+from src.timber_framing_generator.core.building_component import BuildingComponent
+from src.timber_framing_generator.core.component_types import ComponentType
+from src.timber_framing_generator.core.material_system import ElementType
+
+WALL_ELEMENT_TYPES = [
+    ElementType.BOTTOM_PLATE,
+    ElementType.TOP_PLATE,
+    ElementType.STUD,
+    ElementType.KING_STUD,
+    ElementType.TRIMMER,
+    ElementType.HEADER,
+    ElementType.SILL,
+    ElementType.HEADER_CRIPPLE,
+    ElementType.SILL_CRIPPLE,
+    ElementType.ROW_BLOCKING,
+]
+
+
+def _flatten(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [cell for entry in entries for cell in entry["cells"]]
+
+
+class WallComponent(BuildingComponent):
+    """
+    Wall component: SC, OC, HCC and SCC cells from WallData JSON.
+
+    Decomposition config:
+        panels_data: Panel Decomposer results (list of dicts with
+            wall_id and panels); walls listed there are sliced per panel
+            and their cells carry panel-aware IDs and panel_id
+    """
+
+    @property
+    def component_type(self) -> ComponentType:
+        return ComponentType.WALL
+
+    def extract_data(self, revit_element: Any) -> Dict[str, Any]:
+        """
+        Return WallData JSON for a wall.
+
+        Revit extraction runs in the Wall Analyzer component; this accepts
+        its per-wall output.
+
+        Args:
+            revit_element: WallData dictionary
+
+        Returns:
+            The wall dictionary
+
+        Raises:
+            TypeError: If given anything other than a WallData dict
+        """
+        if not isinstance(revit_element, dict):
+            raise TypeError(
+                "WallComponent expects WallData JSON dicts; extract Revit walls "
+                "with the Wall Analyzer (wall_data.revit_data_extractor) first"
+            )
+        return revit_element
+
+    def decompose_to_cells(
+        self,
+        component_data: Dict[str, Any],
+        config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Decompose one wall into cells.
+
+        Args:
+            component_data: WallData dictionary
+            config: Decomposition configuration (see class docstring)
+
+        Returns:
+            CellInfo dictionaries of the wall (all panels, in order)
+        """
+        panels = panels_by_wall(config.get("panels_data")).get(
+            str(component_data.get("wall_id", "wall_0"))
+        )
+        return _flatten(decompose_wall(component_data, panels))
+
+    def decompose_many(
+        self,
+        components: List[Dict[str, Any]],
+        config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Decompose many walls with one batch decomposer call.
+
+        Args:
+            components: WallData dictionaries
+            config: Decomposition configuration (see class docstring)
+
+        Returns:
+            CellInfo dictionaries of all walls, in wall order
+        """
+        return _flatten(decompose_walls(components, config.get("panels_data")))
+
+    def get_framing_element_types(self) -> List[str]:
+        return [element_type.value for element_type in WALL_ELEMENT_TYPES]
+
+    def validate_component_data(self, component_data: Dict[str, Any]) -> bool:
+        """Check the WallData fields decomposition needs."""
+        required_keys = ["wall_id", "wall_length", "wall_height"]
+        return all(key in component_data for key in required_keys)
@@ -24,6 +24,7 @@ from src.timber_framing_generator.config.framing import (
     RepresentationType,
     PlateType,
     get_profile_for_wall_type,
+    clear_wall_type_cache,
 )
 
 from src.timber_framing_generator.config.assembly import (
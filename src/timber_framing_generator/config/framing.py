@@ -9,6 +9,7 @@ timber framing elements.
 import re
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from src.timber_framing_generator.config.units import ProjectUnits, convert_from_feet
@@ -322,6 +323,22 @@ def _thickness_to_profile(thickness: float) -> Optional[str]:
     return None
 
 
+# Wall-type name patterns, compiled once (see _infer_profile_from_thickness)
+# Number followed by inch mark or "inch"
+_INCH_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(?:"|inch|in\b)', re.IGNORECASE)
+# Dash followed by number at end (e.g., "W1 - 4")
+_DASH_PATTERN = re.compile(r'-\s*(\d+(?:\.\d+)?)\s*$')
+# Standalone number in the common wall thickness range (3-12)
+_STANDALONE_PATTERN = re.compile(r'\b([3-9]|1[0-2])(?:\.\d+)?\b')
+
+# Nominal sizes searched in wall-type names, largest first so "2x1" never
+# matches inside "2x12"
+_NOMINAL_SIZES = ("2X12", "2X10", "2X8", "2X6", "2X4", "2X3")
+
+# Distinct wall-type strings remembered by get_profile_for_wall_type()
+WALL_TYPE_CACHE_SIZE = 1024
+
+
 def _infer_profile_from_thickness(wall_type: str) -> Optional[str]:
     """
     Infer lumber profile from wall thickness mentioned in the name.
@@ -338,24 +355,18 @@ def _infer_profile_from_thickness(wall_type: str) -> Optional[str]:
     Returns:
         Profile name (e.g., "2x4") or None if no thickness found
     """
-    # Pattern: number followed by inch mark or "inch"
-    inch_pattern = r'(\d+(?:\.\d+)?)\s*(?:"|inch|in\b)'
-    match = re.search(inch_pattern, wall_type, re.IGNORECASE)
+    match = _INCH_PATTERN.search(wall_type)
     if match:
         thickness = float(match.group(1))
         return _thickness_to_profile(thickness)
 
-    # Pattern: dash followed by number at end (e.g., "W1 - 4")
-    dash_pattern = r'-\s*(\d+(?:\.\d+)?)\s*$'
-    match = re.search(dash_pattern, wall_type)
+    match = _DASH_PATTERN.search(wall_type)
     if match:
         thickness = float(match.group(1))
         return _thickness_to_profile(thickness)
 
-    # Pattern: standalone number that could be thickness (3-12 range)
     # Only match common wall thicknesses to avoid false positives
-    standalone_pattern = r'\b([3-9]|1[0-2])(?:\.\d+)?\b'
-    matches = re.findall(standalone_pattern, wall_type)
+    matches = _STANDALONE_PATTERN.findall(wall_type)
     for m in reversed(matches):  # Check from end (thickness often at end)
         thickness = float(m)
         profile = _thickness_to_profile(thickness)
@@ -365,6 +376,50 @@ def _infer_profile_from_thickness(wall_type: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=WALL_TYPE_CACHE_SIZE)
+def _resolve_wall_type_profile(wall_type: str) -> Optional[str]:
+    """
+    Profile name for a wall type, or None if it cannot be resolved.
+
+    Cached: every wall (and every plate, header and sill on it) asks for
+    the same handful of wall types.
+    """
+    # 1. Exact match
+    profile_name = WALL_TYPE_PROFILES.get(wall_type)
+    if profile_name and profile_name in PROFILES:
+        return profile_name
+
+    # 2. Normalized match (uppercase, no spaces)
+    normalized = wall_type.strip().upper().replace(" ", "")
+    profile_name = WALL_TYPE_PROFILES.get(normalized)
+    if profile_name and profile_name in PROFILES:
+        return profile_name
+
+    # 3. Pattern match - look for "2xN" anywhere in string
+    wall_upper = wall_type.upper()
+    for profile in _NOMINAL_SIZES:
+        if profile in wall_upper:
+            profile_lower = profile.lower()  # PROFILES uses lowercase keys
+            if profile_lower in PROFILES:
+                return profile_lower
+
+    # 4. Thickness extraction - find numbers that indicate wall thickness
+    profile_name = _infer_profile_from_thickness(wall_type)
+    if profile_name and profile_name in PROFILES:
+        return profile_name
+
+    return None
+
+
+def clear_wall_type_cache() -> None:
+    """
+    Forget cached wall-type resolutions.
+
+    Call after changing WALL_TYPE_PROFILES or PROFILES at runtime.
+    """
+    _resolve_wall_type_profile.cache_clear()
+
+
 def get_profile_for_wall_type(wall_type: str) -> ProfileDimensions:
     """
     Gets the appropriate profile dimensions for a wall type.
@@ -376,6 +431,9 @@ def get_profile_for_wall_type(wall_type: str) -> ProfileDimensions:
     4. Thickness extraction from name (e.g., "Basic Wall - W1 - 4" → 2x4)
     5. Raise error with helpful message
 
+    Resolved names are cached per wall-type string (see
+    clear_wall_type_cache()).
+
     Args:
         wall_type: The wall type identifier. Supports formats like:
             - Standard: "2x4 EXT", "2x6 INT"
@@ -388,29 +446,8 @@ def get_profile_for_wall_type(wall_type: str) -> ProfileDimensions:
     Raises:
         KeyError: If wall type cannot be resolved to a known profile
     """
-    # 1. Exact match
-    profile_name = WALL_TYPE_PROFILES.get(wall_type)
-    if profile_name and profile_name in PROFILES:
-        return PROFILES[profile_name]
-
-    # 2. Normalized match (uppercase, no spaces)
-    normalized = wall_type.strip().upper().replace(" ", "")
-    profile_name = WALL_TYPE_PROFILES.get(normalized)
-    if profile_name and profile_name in PROFILES:
-        return PROFILES[profile_name]
-
-    # 3. Pattern match - look for "2xN" anywhere in string
-    # Check from largest to smallest to avoid "2x1" matching in "2x12"
-    wall_upper = wall_type.upper()
-    for profile in ["2X12", "2X10", "2X8", "2X6", "2X4", "2X3"]:
-        if profile in wall_upper:
-            profile_lower = profile.lower()  # PROFILES uses lowercase keys
-            if profile_lower in PROFILES:
-                return PROFILES[profile_lower]
-
-    # 4. Thickness extraction - find numbers that indicate wall thickness
-    profile_name = _infer_profile_from_thickness(wall_type)
-    if profile_name and profile_name in PROFILES:
+    profile_name = _resolve_wall_type_profile(wall_type)
+    if profile_name is not None:
         return PROFILES[profile_name]
 
     # 5. Failed - raise error with helpful message
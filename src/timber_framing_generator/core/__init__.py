@@ -9,61 +9,62 @@ and enums for supporting:
 - MEP system integration (Plumbing, HVAC, Electrical)
 """
 
-# Material system (existing)
-from .material_system import (
-    MaterialSystem,
-    ElementType,
-    FramingStrategy,
-    ElementProfile,
-    FramingElement,
-    StrategyFactory,
-    get_framing_strategy,
-    register_strategy,
-    list_available_materials,
-)
+from ..utils.lazy_imports import lazy_exports
 
-# Component types (NEW)
-from .component_types import ComponentType
-
-# Building component abstraction (NEW)
-from .building_component import BuildingComponent
-
-# MEP system abstractions (NEW)
-from .mep_system import (
-    MEPDomain,
-    MEPConnector,
-    MEPRoute,
-    MEPSystem,
-)
-
-# JSON schemas (existing)
-from .json_schemas import (
-    # Data classes
-    Point3D,
-    Vector3D,
-    PlaneData,
-    OpeningData,
-    WallData,
-    CellCorners,
-    CellInfo,
-    CellData,
-    ProfileData,
-    FramingElementData,
-    FramingResults,
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    # Material system (existing)
+    "MaterialSystem": ".material_system",
+    "ElementType": ".material_system",
+    "FramingStrategy": ".material_system",
+    "ElementProfile": ".material_system",
+    "FramingElement": ".material_system",
+    "GenerationContext": ".material_system",
+    "StrategyFactory": ".material_system",
+    "get_framing_strategy": ".material_system",
+    "register_strategy": ".material_system",
+    "list_available_materials": ".material_system",
+    # Component types (NEW)
+    "ComponentType": ".component_types",
+    # Building component abstraction (NEW)
+    "BuildingComponent": ".building_component",
+    # MEP system abstractions (NEW)
+    "MEPDomain": ".mep_system",
+    "MEPConnector": ".mep_system",
+    "MEPRoute": ".mep_system",
+    "MEPSystem": ".mep_system",
+    # JSON schemas (existing) - data classes
+    "Point3D": ".json_schemas",
+    "Vector3D": ".json_schemas",
+    "PlaneData": ".json_schemas",
+    "OpeningData": ".json_schemas",
+    "WallData": ".json_schemas",
+    "CellCorners": ".json_schemas",
+    "CellInfo": ".json_schemas",
+    "CellData": ".json_schemas",
+    "ProfileData": ".json_schemas",
+    "FramingElementData": ".json_schemas",
+    "FramingResults": ".json_schemas",
     # Enums
-    CellType,
-    OpeningType,
+    "CellType": ".json_schemas",
+    "OpeningType": ".json_schemas",
     # Serialization
-    serialize_wall_data,
-    deserialize_wall_data,
-    serialize_cell_data,
-    deserialize_cell_data,
-    serialize_framing_results,
-    deserialize_framing_results,
+    "serialize_wall_data": ".json_schemas",
+    "deserialize_wall_data": ".json_schemas",
+    "serialize_cell_data": ".json_schemas",
+    "deserialize_cell_data": ".json_schemas",
+    "serialize_framing_results": ".json_schemas",
+    "deserialize_framing_results": ".json_schemas",
     # Validation
-    validate_wall_data,
-    validate_cell_data,
-)
+    "validate_wall_data": ".json_schemas",
+    "validate_cell_data": ".json_schemas",
+    "validate_wall_data_batch": ".json_schemas",
+    "validate_cell_data_batch": ".json_schemas",
+    "compile_validator": ".json_schemas",
+    "SchemaValidator": ".json_schemas",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Material system
@@ -72,6 +73,7 @@ __all__ = [
     "FramingStrategy",
     "ElementProfile",
     "FramingElement",
+    "GenerationContext",
     "StrategyFactory",
     "get_framing_strategy",
     "register_strategy",
@@ -107,4 +109,8 @@ __all__ = [
     "deserialize_framing_results",
     "validate_wall_data",
     "validate_cell_data",
+    "validate_wall_data_batch",
+    "validate_cell_data_batch",
+    "compile_validator",
+    "SchemaValidator",
 ]
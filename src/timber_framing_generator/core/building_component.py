@@ -99,6 +99,30 @@ class BuildingComponent(ABC):
         """
         pass
 
+    def decompose_many(
+        self,
+        components: List[Dict[str, Any]],
+        config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Decompose many components of this type into cells.
+
+        The default implementation calls decompose_to_cells() per
+        component. Subclasses with a batch engine override this to
+        decompose the whole list in one call.
+
+        Args:
+            components: Extracted component data, one dict per component
+            config: Decomposition configuration shared by all components
+
+        Returns:
+            Cell dictionaries of all components, in component order
+        """
+        cells: List[Dict[str, Any]] = []
+        for component_data in components:
+            cells.extend(self.decompose_to_cells(component_data, config))
+        return cells
+
     @abstractmethod
     def get_framing_element_types(self) -> List[str]:
         """
@@ -26,7 +26,7 @@ Usage:
 
 import json
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple, Type, Union
 from enum import Enum
 
 
@@ -408,31 +408,35 @@ def deserialize_framing_results(json_str: str) -> FramingResults:
 # =============================================================================
 # Validation Helpers
 # =============================================================================
+#
+# Each schema's checks are compiled once into a closure (see
+# compile_validator) that reads dataclass fields directly instead of
+# deep-copying them with asdict(), and tests required keys with one set
+# comparison before falling back to per-field messages. Pass
+# trusted=True for data produced by our own upstream components to skip
+# validation (and JSON parsing) entirely.
 
-def validate_wall_data(data: Union[str, Dict, WallData]) -> Tuple[bool, List[str]]:
-    """
-    Validate wall data structure.
+# Checker: schema record (dict or dataclass __dict__) -> error messages
+Checker = Callable[[Dict[str, Any]], List[str]]
 
-    Args:
-        data: JSON string, dict, or WallData object
+_MISSING = object()
 
-    Returns:
-        Tuple of (is_valid, list of error messages)
-    """
-    errors = []
 
-    try:
-        if isinstance(data, str):
-            data = json.loads(data)
+def _fields(record: Any) -> Any:
+    """Field mapping of a dataclass instance; dicts (and anything else) as-is."""
+    return record if isinstance(record, dict) else getattr(record, "__dict__", record)
+
 
-        if isinstance(data, WallData):
-            data = asdict(data)
+def _compile_wall_data() -> Checker:
+    required = ('wall_id', 'wall_length', 'wall_height', 'base_plane')
+    required_keys = frozenset(required)
+
+    def check(data: Dict[str, Any]) -> List[str]:
+        errors = []
 
         # Required fields
-        required = ['wall_id', 'wall_length', 'wall_height', 'base_plane']
-        for field in required:
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
+        if not required_keys <= data.keys():
+            errors.extend(f"Missing required field: {name}" for name in required if name not in data)
 
         # Dimension validation
         if data.get('wall_length', 0) <= 0:
@@ -441,37 +445,20 @@ def validate_wall_data(data: Union[str, Dict, WallData]) -> Tuple[bool, List[str
             errors.append("wall_height must be positive")
 
         # Base plane validation
-        if 'base_plane' in data:
-            plane = data['base_plane']
-            if 'origin' not in plane:
-                errors.append("base_plane missing origin")
-
-    except json.JSONDecodeError as e:
-        errors.append(f"Invalid JSON: {str(e)}")
-    except Exception as e:
-        errors.append(f"Validation error: {str(e)}")
+        plane = data.get('base_plane', _MISSING)
+        if plane is not _MISSING and 'origin' not in _fields(plane):
+            errors.append("base_plane missing origin")
 
-    return len(errors) == 0, errors
+        return errors
 
+    return check
 
-def validate_cell_data(data: Union[str, Dict, CellData]) -> Tuple[bool, List[str]]:
-    """
-    Validate cell data structure.
-
-    Args:
-        data: JSON string, dict, or CellData object
-
-    Returns:
-        Tuple of (is_valid, list of error messages)
-    """
-    errors = []
 
-    try:
-        if isinstance(data, str):
-            data = json.loads(data)
+def _compile_cell_data() -> Checker:
+    cell_keys = frozenset(('cell_type', 'u_start', 'u_end', 'v_start', 'v_end'))
 
-        if isinstance(data, CellData):
-            data = asdict(data)
+    def check(data: Dict[str, Any]) -> List[str]:
+        errors = []
 
         # Required fields
         if 'wall_id' not in data:
@@ -479,8 +466,11 @@ def validate_cell_data(data: Union[str, Dict, CellData]) -> Tuple[bool, List[str
         if 'cells' not in data:
             errors.append("Missing required field: cells")
 
-        # Cell validation
+        # Cell validation; complete cells cost one set comparison
         for i, cell in enumerate(data.get('cells', [])):
+            cell = _fields(cell)
+            if cell_keys <= cell.keys():
+                continue
             if 'cell_type' not in cell:
                 errors.append(f"Cell {i} missing cell_type")
             if 'u_start' not in cell or 'u_end' not in cell:
@@ -488,12 +478,183 @@ def validate_cell_data(data: Union[str, Dict, CellData]) -> Tuple[bool, List[str
             if 'v_start' not in cell or 'v_end' not in cell:
                 errors.append(f"Cell {i} missing V coordinates")
 
-    except json.JSONDecodeError as e:
-        errors.append(f"Invalid JSON: {str(e)}")
-    except Exception as e:
-        errors.append(f"Validation error: {str(e)}")
+        return errors
+
+    return check
+
+
+# Schema -> factory of its compiled checker
+_CHECK_COMPILERS: Dict[type, Callable[[], Checker]] = {
+    WallData: _compile_wall_data,
+    CellData: _compile_cell_data,
+}
+
+_VALIDATORS: Dict[type, "SchemaValidator"] = {}
+
+
+class SchemaValidator:
+    """
+    Validator for one schema, built once by compile_validator().
+
+    Accepts JSON strings, dicts or instances of the schema dataclass.
+
+    Args:
+        schema: Schema dataclass (e.g. WallData)
+        check: Compiled checker returning error messages for a record
+    """
+
+    __slots__ = ("schema", "_check")
+
+    def __init__(self, schema: type, check: Checker) -> None:
+        self.schema = schema
+        self._check = check
+
+    def errors(self, data: Union[str, Dict, Any]) -> List[str]:
+        """Error messages for one record; empty if valid."""
+        try:
+            if isinstance(data, str):
+                data = json.loads(data)
+            return self._check(_fields(data))
+        except json.JSONDecodeError as e:
+            return [f"Invalid JSON: {str(e)}"]
+        except Exception as e:
+            return [f"Validation error: {str(e)}"]
+
+    def validate(self, data: Union[str, Dict, Any], trusted: bool = False) -> Tuple[bool, List[str]]:
+        """
+        Validate one record.
+
+        Args:
+            data: JSON string, dict, or schema instance
+            trusted: Skip validation for data from our own components
+
+        Returns:
+            Tuple of (is_valid, list of error messages)
+        """
+        if trusted:
+            return True, []
+        errors = self.errors(data)
+        return len(errors) == 0, errors
+
+    def validate_many(
+        self,
+        items: Union[str, Iterable[Any]],
+        trusted: bool = False,
+    ) -> Tuple[bool, Dict[int, List[str]]]:
+        """
+        Validate an array of records in one pass.
+
+        Args:
+            items: JSON array string, or iterable of JSON strings, dicts
+                or schema instances
+            trusted: Skip validation for data from our own components
+
+        Returns:
+            Tuple of (all_valid, error messages keyed by item index);
+            valid items are omitted
+        """
+        if trusted:
+            return True, {}
+        if isinstance(items, str):
+            try:
+                items = json.loads(items)
+            except json.JSONDecodeError as e:
+                return False, {-1: [f"Invalid JSON: {str(e)}"]}
+            if not isinstance(items, list):
+                return False, {-1: ["Expected a JSON array"]}
+
+        failures = {}
+        errors_of = self.errors
+        for index, item in enumerate(items):
+            errors = errors_of(item)
+            if errors:
+                failures[index] = errors
+        return len(failures) == 0, failures
+
+
+def compile_validator(schema: Type) -> SchemaValidator:
+    """
+    The compiled validator of a schema, built on first use.
+
+    Args:
+        schema: WallData or CellData
+
+    Returns:
+        Shared SchemaValidator for the schema
+
+    Raises:
+        KeyError: If the schema has no validation rules
+    """
+    validator = _VALIDATORS.get(schema)
+    if validator is None:
+        if schema not in _CHECK_COMPILERS:
+            raise KeyError(f"No validator for schema: {getattr(schema, '__name__', schema)}")
+        validator = _VALIDATORS[schema] = SchemaValidator(schema, _CHECK_COMPILERS[schema]())
+    return validator
 
-    return len(errors) == 0, errors
+
+def validate_wall_data(data: Union[str, Dict, WallData], trusted: bool = False) -> Tuple[bool, List[str]]:
+    """
+    Validate wall data structure.
+
+    Args:
+        data: JSON string, dict, or WallData object
+        trusted: Skip validation for data from our own components
+
+    Returns:
+        Tuple of (is_valid, list of error messages)
+    """
+    return compile_validator(WallData).validate(data, trusted)
+
+
+def validate_cell_data(data: Union[str, Dict, CellData], trusted: bool = False) -> Tuple[bool, List[str]]:
+    """
+    Validate cell data structure.
+
+    Args:
+        data: JSON string, dict, or CellData object
+        trusted: Skip validation for data from our own components
+
+    Returns:
+        Tuple of (is_valid, list of error messages)
+    """
+    return compile_validator(CellData).validate(data, trusted)
+
+
+def validate_wall_data_batch(
+    walls: Union[str, Iterable[Union[str, Dict, WallData]]],
+    trusted: bool = False,
+) -> Tuple[bool, Dict[int, List[str]]]:
+    """
+    Validate many walls in one pass.
+
+    Args:
+        walls: JSON array string, or iterable of JSON strings, dicts or
+            WallData objects
+        trusted: Skip validation for data from our own components
+
+    Returns:
+        Tuple of (all_valid, error messages keyed by wall index)
+    """
+    return compile_validator(WallData).validate_many(walls, trusted)
+
+
+def validate_cell_data_batch(
+    cell_data: Union[str, Iterable[Union[str, Dict, CellData]]],
+    trusted: bool = False,
+) -> Tuple[bool, Dict[int, List[str]]]:
+    """
+    Validate many CellData records in one pass.
+
+    Args:
+        cell_data: JSON array string, or iterable of JSON strings, dicts
+            or CellData objects
+        trusted: Skip validation for data from our own components
+
+    Returns:
+        Tuple of (all_valid, error messages keyed by record index)
+    """
+    return compile_validator(CellData).validate_many(cell_data, trusted)
 
 
 # =============================================================================
@@ -138,6 +138,24 @@ class FramingElement:
         return dz > max(dx, dy)
 
 
+@dataclass
+class GenerationContext:
+    """
+    Per-wall state of one generate_framing() run.
+
+    Strategies are registered as shared instances, so anything one
+    create_*_members step hands to the next (plate geometry, wall
+    properties, ...) lives here rather than on the strategy. One
+    strategy can then frame many walls at once from several threads.
+
+    Attributes:
+        wall_id: ID of the wall being framed (for logging)
+        state: Intermediate results keyed by strategy-defined names
+    """
+    wall_id: str = "unknown"
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
 class FramingStrategy(ABC):
     """
     Abstract base class for material-specific framing strategies.
@@ -148,6 +166,10 @@ class FramingStrategy(ABC):
     The strategy pattern allows the core framing pipeline to remain
     material-agnostic while delegating material-specific decisions
     to the appropriate strategy implementation.
+
+    Implementations must not keep per-wall state on self: generate_framing
+    passes one GenerationContext through all create_*_members calls of a
+    wall, and a strategy instance may be running several walls at once.
     """
 
     @property
@@ -191,7 +213,8 @@ class FramingStrategy(ABC):
         self,
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate horizontal members (plates/tracks).
@@ -200,6 +223,8 @@ class FramingStrategy(ABC):
             wall_data: Wall geometry and properties
             cell_data: Cell decomposition data
             config: Configuration parameters
+            context: State shared with the wall's later steps (a fresh
+                one is used if None)
 
         Returns:
             List of FramingElement for horizontal members
@@ -212,7 +237,8 @@ class FramingStrategy(ABC):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         horizontal_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate vertical members (studs, king studs, trimmers).
@@ -222,6 +248,7 @@ class FramingStrategy(ABC):
             cell_data: Cell decomposition data
             horizontal_members: Previously generated horizontal members
             config: Configuration parameters
+            context: State shared between the wall's steps
 
         Returns:
             List of FramingElement for vertical members
@@ -234,7 +261,8 @@ class FramingStrategy(ABC):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         existing_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate opening-related members (headers, sills, cripples).
@@ -244,6 +272,7 @@ class FramingStrategy(ABC):
             cell_data: Cell decomposition data
             existing_members: Previously generated members
             config: Configuration parameters
+            context: State shared between the wall's steps
 
         Returns:
             List of FramingElement for opening members
@@ -256,7 +285,8 @@ class FramingStrategy(ABC):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         existing_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate bracing/blocking members.
@@ -266,6 +296,7 @@ class FramingStrategy(ABC):
             cell_data: Cell decomposition data
             existing_members: Previously generated members
             config: Configuration parameters
+            context: State shared between the wall's steps
 
         Returns:
             List of FramingElement for bracing members
@@ -282,7 +313,9 @@ class FramingStrategy(ABC):
         Generate all framing elements for a wall.
 
         This is the main entry point that orchestrates element generation
-        in the correct order based on get_generation_sequence().
+        in the correct order based on get_generation_sequence(). Each call
+        gets its own GenerationContext, so it is safe to call concurrently
+        on one strategy instance.
 
         Args:
             wall_data: Wall geometry and properties
@@ -293,26 +326,29 @@ class FramingStrategy(ABC):
             List of all FramingElement objects for this wall
         """
         config = config or {}
+        context = GenerationContext(wall_id=cell_data.get("wall_id", "unknown"))
         all_elements: List[FramingElement] = []
 
         # Generate in sequence to respect dependencies
-        horizontal = self.create_horizontal_members(wall_data, cell_data, config)
+        horizontal = self.create_horizontal_members(
+            wall_data, cell_data, config, context
+        )
         all_elements.extend(horizontal)
 
         vertical = self.create_vertical_members(
-            wall_data, cell_data, horizontal, config
+            wall_data, cell_data, horizontal, config, context
         )
         all_elements.extend(vertical)
 
         existing = horizontal + vertical
         opening = self.create_opening_members(
-            wall_data, cell_data, existing, config
+            wall_data, cell_data, existing, config, context
         )
         all_elements.extend(opening)
 
         existing.extend(opening)
         bracing = self.create_bracing_members(
-            wall_data, cell_data, existing, config
+            wall_data, cell_data, existing, config, context
         )
         all_elements.extend(bracing)
 
@@ -0,0 +1,41 @@
+# File: src/timber_framing_generator/cutting/__init__.py
+"""
+Cut-list optimization for framing members.
+
+Packs member lengths into purchasable stock lengths per profile and
+reports purchases and waste.
+
+Example:
+    >>> from src.timber_framing_generator.cutting import (
+    ...     optimize_cut_list, get_purchase_report
+    ... )
+    >>> results = optimize_cut_list(framing_results.elements)
+    >>> report = get_purchase_report(results)
+"""
+
+from ..utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "Cut": ".cut_list",
+    "StockStick": ".cut_list",
+    "ProfileCutList": ".cut_list",
+    "DEFAULT_KERF": ".cut_list",
+    "default_stock_lengths": ".cut_list",
+    "pack_lengths": ".cut_list",
+    "optimize_cut_list": ".cut_list",
+    "get_purchase_report": ".cut_list",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
+
+__all__ = [
+    "Cut",
+    "StockStick",
+    "ProfileCutList",
+    "DEFAULT_KERF",
+    "default_stock_lengths",
+    "pack_lengths",
+    "optimize_cut_list",
+    "get_purchase_report",
+]
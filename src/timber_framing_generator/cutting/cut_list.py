@@ -0,0 +1,453 @@
+# File: src/timber_framing_generator/cutting/cut_list.py
+"""
+Stock-length cut-list optimization for framing members.
+
+Framing output is a list of members with centerline lengths. This module
+groups members by profile name and packs their lengths into purchasable
+stock lengths (1D cutting stock), producing per-profile purchase lists,
+cut lists and waste statistics.
+
+Algorithm per profile:
+
+1. First-fit decreasing: members sorted longest first go into the first
+   open stick with room (max segment tree search, O(log n) per member);
+   new sticks are opened at the longest stock length.
+2. Downsize: each stick is bought at the shortest stock length that
+   holds its cuts, and sticks whose cuts would cost no more bought
+   separately are split (no needless shared cuts).
+3. Bounded improvement: the least-utilized sticks (at most
+   ``improvement_limit``) are emptied when all of their cuts fit into
+   other sticks and the length saved exceeds the cost of buying those
+   sticks at longer stock lengths.
+
+Members longer than the longest stock are reported as oversize (they
+need a splice or special-order stock) rather than packed.
+
+Usage:
+    from src.timber_framing_generator.cutting import optimize_cut_list
+
+    results = optimize_cut_list(framing_results.elements)
+    for profile, cut_list in results.items():
+        print(profile, cut_list.purchase(), cut_list.waste_percentage)
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from ..utils.segment_tree import MaxSegmentTree
+
+# Default saw kerf: 1/8 inch
+DEFAULT_KERF = 0.125 / 12.0
+
+# Default number of sticks the improvement pass tries to eliminate
+DEFAULT_IMPROVEMENT_LIMIT = 256
+
+# Length tolerance (feet)
+_EPS = 1e-6
+
+StockSpec = Union[Sequence[float], Mapping[str, Sequence[float]], None]
+
+
+@dataclass
+class Cut:
+    """
+    One member cut from a stock stick.
+
+    Attributes:
+        element_id: ID of the framing member
+        length: Cut length (feet)
+        element_type: Member type (stud, top_plate, ...)
+    """
+    element_id: str
+    length: float
+    element_type: str = ""
+
+
+@dataclass
+class StockStick:
+    """
+    One purchased stick and the cuts taken from it.
+
+    Attributes:
+        stock_length: Purchased length (feet)
+        cuts: Cuts in cutting order
+        kerf: Saw kerf between cuts (feet)
+    """
+    stock_length: float
+    cuts: List[Cut] = field(default_factory=list)
+    kerf: float = DEFAULT_KERF
+
+    @property
+    def used_length(self) -> float:
+        """Length consumed by cuts and the kerfs between them."""
+        if not self.cuts:
+            return 0.0
+        return sum(c.length for c in self.cuts) + self.kerf * (len(self.cuts) - 1)
+
+    @property
+    def offcut(self) -> float:
+        """Length left over after the last cut."""
+        return self.stock_length - self.used_length
+
+
+@dataclass
+class ProfileCutList:
+    """
+    Cut list and purchase report for one profile.
+
+    Attributes:
+        profile: Profile name (e.g., "2x4", "362S125-54")
+        material_system: "timber" or "cfs"
+        stock_lengths: Stock lengths considered (feet, ascending)
+        sticks: Purchased sticks with their cuts
+        oversize: Members longer than the longest stock
+        kerf: Saw kerf used (feet)
+    """
+    profile: str
+    material_system: str
+    stock_lengths: List[float]
+    sticks: List[StockStick] = field(default_factory=list)
+    oversize: List[Cut] = field(default_factory=list)
+    kerf: float = DEFAULT_KERF
+
+    @property
+    def member_count(self) -> int:
+        return sum(len(s.cuts) for s in self.sticks)
+
+    @property
+    def stock_total(self) -> float:
+        """Total purchased length (feet)."""
+        return sum(s.stock_length for s in self.sticks)
+
+    @property
+    def cut_total(self) -> float:
+        """Total member length (feet)."""
+        return sum(c.length for s in self.sticks for c in s.cuts)
+
+    @property
+    def waste_length(self) -> float:
+        """Purchased length not ending up in members, kerf included (feet)."""
+        return self.stock_total - self.cut_total
+
+    @property
+    def waste_percentage(self) -> float:
+        total = self.stock_total
+        return self.waste_length / total * 100 if total > 0 else 0.0
+
+    def purchase(self) -> Dict[float, int]:
+        """
+        Sticks to buy per stock length.
+
+        Returns:
+            Dictionary mapping stock length (feet) to count, ascending
+        """
+        counts: Dict[float, int] = {}
+        for stick in self.sticks:
+            counts[stick.stock_length] = counts.get(stick.stock_length, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def to_dict(self, include_cuts: bool = True) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            include_cuts: Include the per-stick cut list
+
+        Returns:
+            Dictionary report
+        """
+        report = {
+            "profile": self.profile,
+            "material_system": self.material_system,
+            "members": self.member_count,
+            "purchase": {f"{length:g}": n for length, n in self.purchase().items()},
+            "sticks": len(self.sticks),
+            "stock_length_ft": round(self.stock_total, 3),
+            "cut_length_ft": round(self.cut_total, 3),
+            "waste_length_ft": round(self.waste_length, 3),
+            "waste_percentage": round(self.waste_percentage, 1),
+            "oversize": [
+                {"element_id": c.element_id, "length": round(c.length, 4)}
+                for c in self.oversize
+            ],
+        }
+        if include_cuts:
+            report["cut_list"] = [
+                {
+                    "stock_length": stick.stock_length,
+                    "cuts": [
+                        {"element_id": c.element_id, "length": round(c.length, 4)}
+                        for c in stick.cuts
+                    ],
+                    "offcut": round(stick.offcut, 4),
+                }
+                for stick in self.sticks
+            ]
+        return report
+
+
+def _member_fields(element: Any) -> Tuple[str, str, str, str, float]:
+    """
+    Extract (id, element_type, profile name, material system, length).
+
+    Accepts FramingElementData, FramingElement or their JSON dictionaries.
+    """
+    if isinstance(element, Mapping):
+        profile = element.get("profile") or {}
+        start = element.get("centerline_start") or {}
+        end = element.get("centerline_end") or {}
+        dx = end.get("x", 0.0) - start.get("x", 0.0)
+        dy = end.get("y", 0.0) - start.get("y", 0.0)
+        dz = end.get("z", 0.0) - start.get("z", 0.0)
+        return (
+            str(element.get("id", "")),
+            str(element.get("element_type", "")),
+            str(profile.get("name", "unknown")),
+            str(profile.get("material_system", "timber")),
+            (dx * dx + dy * dy + dz * dz) ** 0.5,
+        )
+
+    profile = element.profile
+    material_system = getattr(profile, "material_system", "timber")
+    element_type = getattr(element, "element_type", "")
+    return (
+        str(element.id),
+        str(getattr(element_type, "value", element_type)),
+        str(profile.name),
+        str(getattr(material_system, "value", material_system)),
+        float(element.length),
+    )
+
+
+def default_stock_lengths(profile: str, material_system: str) -> List[float]:
+    """
+    Get the default stock lengths for a profile.
+
+    Timber uses TIMBER_STOCK_LENGTHS; CFS uses get_cfs_stock_lengths.
+    Profile tables are imported on first use.
+
+    Args:
+        profile: Profile name
+        material_system: "timber" or "cfs"
+
+    Returns:
+        Stock lengths in feet, ascending
+    """
+    if material_system.lower() == "cfs":
+        from ..materials.cfs.cfs_profiles import get_cfs_stock_lengths
+        return sorted(get_cfs_stock_lengths(profile))
+    from ..materials.timber.timber_profiles import TIMBER_STOCK_LENGTHS
+    return sorted(TIMBER_STOCK_LENGTHS)
+
+
+def pack_lengths(
+    cuts: List[Cut],
+    stock_lengths: Sequence[float],
+    kerf: float = DEFAULT_KERF,
+    improvement_limit: int = DEFAULT_IMPROVEMENT_LIMIT
+) -> Tuple[List[StockStick], List[Cut]]:
+    """
+    Pack cuts of one profile into stock sticks.
+
+    Args:
+        cuts: Cuts to pack
+        stock_lengths: Available stock lengths (feet)
+        kerf: Saw kerf between cuts (feet)
+        improvement_limit: Max sticks the improvement pass tries to empty
+
+    Returns:
+        Tuple of (sticks, oversize cuts)
+    """
+    stock = sorted(set(float(s) for s in stock_lengths if s > 0))
+    if not stock:
+        raise ValueError("At least one positive stock length is required")
+    longest = stock[-1]
+
+    oversize = [c for c in cuts if c.length > longest + _EPS]
+    ordered = sorted(
+        (c for c in cuts if c.length <= longest + _EPS),
+        key=lambda c: -c.length,
+    )
+
+    # Pass 1: first-fit decreasing into longest-stock sticks. Room is
+    # what a further cut may use: remaining length minus one kerf.
+    room = MaxSegmentTree(len(ordered))
+    bins: List[List[Cut]] = []
+    used: List[float] = []
+    for cut in ordered:
+        i = room.first_at_least(cut.length - _EPS)
+        if i < 0:
+            i = len(bins)
+            bins.append([cut])
+            used.append(cut.length)
+        else:
+            bins[i].append(cut)
+            used[i] += kerf + cut.length
+        room.set(i, longest - used[i] - kerf)
+
+    # Pass 2: buy the shortest stock that holds each stick
+    def fit_stock(length: float) -> float:
+        return stock[bisect.bisect_left(stock, length - _EPS)]
+
+    stock_of = [fit_stock(u) for u in used]
+
+    # Sharing a stick only pays if it saves length; otherwise buy each cut
+    # its own stick (e.g. two precut-length studs, not one double stick)
+    for i in range(len(bins)):
+        if len(bins[i]) > 1:
+            separate = [fit_stock(c.length) for c in bins[i]]
+            if sum(separate) <= stock_of[i] + _EPS:
+                for cut, length in zip(bins[i][1:], separate[1:]):
+                    bins.append([cut])
+                    used.append(cut.length)
+                    stock_of.append(length)
+                bins[i] = bins[i][:1]
+                used[i] = bins[i][0].length
+                stock_of[i] = separate[0]
+
+    # Pass 3: bounded improvement - empty the least-utilized sticks into
+    # other sticks when the length saved beats any upsizing it causes
+    if improvement_limit > 0 and len(bins) > 1:
+        _eliminate_sticks(bins, used, stock_of, longest, kerf, fit_stock, improvement_limit)
+
+    sticks = [
+        StockStick(stock_length=stock_of[i], cuts=bins[i], kerf=kerf)
+        for i in range(len(bins)) if bins[i]
+    ]
+    return sticks, oversize
+
+
+def _eliminate_sticks(
+    bins: List[List[Cut]],
+    used: List[float],
+    stock_of: List[float],
+    longest: float,
+    kerf: float,
+    fit_stock: Callable[[float], float],
+    limit: int
+) -> None:
+    """Move cuts out of low-utilization sticks where it saves length, in place."""
+    # Sorted (room, index) list; room is what one more cut may use if the
+    # stick were bought at the longest stock. key_of holds each stick's
+    # current entry so it can be removed exactly.
+    key_of = [(longest - used[i] - kerf, i) for i in range(len(bins))]
+    room = sorted(key_of)
+    candidates = sorted(range(len(bins)), key=lambda i: used[i] / stock_of[i])[:limit]
+
+    def replace_key(index: int, new_key: Tuple[float, int]) -> None:
+        room.pop(bisect.bisect_left(room, key_of[index]))
+        key_of[index] = new_key
+        bisect.insort(room, new_key)
+
+    for victim in candidates:
+        if not bins[victim]:
+            continue
+        room.pop(bisect.bisect_left(room, key_of[victim]))
+
+        moves = []  # (cut, target index, target's previous key)
+        new_used: Dict[int, float] = {}
+        for cut in sorted(bins[victim], key=lambda c: -c.length):
+            # Best fit: the tightest room that still takes the cut
+            pos = bisect.bisect_left(room, (cut.length - _EPS, -1))
+            if pos == len(room):
+                break
+            target = room[pos][1]
+            moves.append((cut, target, key_of[target]))
+            new_used[target] = new_used.get(target, used[target]) + kerf + cut.length
+            replace_key(target, (key_of[target][0] - cut.length - kerf, target))
+
+        upsizing = sum(fit_stock(u) - stock_of[t] for t, u in new_used.items())
+        if len(moves) < len(bins[victim]) or upsizing >= stock_of[victim] - _EPS:
+            # Roll back every tentative move
+            for _, target, old_key in reversed(moves):
+                replace_key(target, old_key)
+            bisect.insort(room, key_of[victim])
+            continue
+
+        for cut, target, _ in moves:
+            bins[target].append(cut)
+        for target, length in new_used.items():
+            used[target] = length
+            stock_of[target] = fit_stock(length)
+        bins[victim] = []
+        used[victim] = 0.0
+
+
+def optimize_cut_list(
+    elements: Iterable[Any],
+    stock_lengths: StockSpec = None,
+    kerf: float = DEFAULT_KERF,
+    improvement_limit: int = DEFAULT_IMPROVEMENT_LIMIT
+) -> Dict[str, ProfileCutList]:
+    """
+    Build per-profile cut lists for framing members.
+
+    Args:
+        elements: FramingElementData / FramingElement objects or their
+            JSON dictionaries, from any number of walls
+        stock_lengths: Stock lengths for every profile (list), per profile
+            name (dict; missing profiles use defaults), or None for the
+            material defaults
+        kerf: Saw kerf between cuts (feet)
+        improvement_limit: Max sticks per profile the improvement pass
+            tries to eliminate (0 disables it)
+
+    Returns:
+        Dictionary mapping profile name to ProfileCutList
+    """
+    groups: Dict[str, List[Cut]] = {}
+    systems: Dict[str, str] = {}
+    for element in elements:
+        element_id, element_type, profile, system, length = _member_fields(element)
+        if length <= _EPS:
+            continue
+        groups.setdefault(profile, []).append(Cut(element_id, length, element_type))
+        systems.setdefault(profile, system)
+
+    results = {}
+    for profile, cuts in groups.items():
+        if isinstance(stock_lengths, Mapping):
+            lengths = stock_lengths.get(profile)
+        else:
+            lengths = stock_lengths
+        if lengths is None:
+            lengths = default_stock_lengths(profile, systems[profile])
+
+        sticks, oversize = pack_lengths(cuts, lengths, kerf, improvement_limit)
+        results[profile] = ProfileCutList(
+            profile=profile,
+            material_system=systems[profile],
+            stock_lengths=sorted(float(s) for s in lengths),
+            sticks=sticks,
+            oversize=oversize,
+            kerf=kerf,
+        )
+
+    return results
+
+
+def get_purchase_report(results: Dict[str, ProfileCutList]) -> Dict[str, Any]:
+    """
+    Summarize cut lists into a purchase and waste report.
+
+    Args:
+        results: Output of optimize_cut_list
+
+    Returns:
+        Dictionary with per-profile purchases and overall totals
+    """
+    profiles = {
+        name: cut_list.to_dict(include_cuts=False)
+        for name, cut_list in sorted(results.items())
+    }
+    stock_total = sum(r.stock_total for r in results.values())
+    waste_total = sum(r.waste_length for r in results.values())
+    return {
+        "profiles": profiles,
+        "total_sticks": sum(len(r.sticks) for r in results.values()),
+        "total_stock_length_ft": round(stock_total, 3),
+        "total_waste_length_ft": round(waste_total, 3),
+        "waste_percentage": round(waste_total / stock_total * 100, 1) if stock_total > 0 else 0.0,
+        "oversize_members": sum(len(r.oversize) for r in results.values()),
+    }
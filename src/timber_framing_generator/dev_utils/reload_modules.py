@@ -3,6 +3,15 @@
 import sys
 import importlib
 import os
+import time
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Set
+
+# Approximate load times of project modules seen by reload_changed_modules()
+_module_loaded_at: Dict[str, float] = {}
+
+# Time of the previous reload_changed_modules() call
+_last_check: Optional[float] = None
 
 
 def clear_module_cache(project_root):
@@ -44,3 +53,112 @@ def reload_project_modules(project_root):
                     print(f"Reloaded module: {module_name}")
             except Exception as e:
                 print(f"Error reloading {module_name}: {e}")
+
+
+def _load_time(module: ModuleType, source_mtime: float) -> float:
+    """Estimate when a module first seen by reload_changed_modules was loaded.
+
+    Importing from source writes the module's pyc, so the pyc mtime is the
+    load time unless bytecode writing is disabled or failed. Any module not
+    seen by the previous call was imported after it, so that call's time is
+    a lower bound; using the later of the two can only cause an extra
+    reload, never a missed one. With neither available (modules imported
+    before the first call without a pyc) the current source is assumed to
+    be the loaded one.
+    """
+    loaded_at = _last_check
+    cached = getattr(module, "__cached__", None)
+    if cached and not sys.dont_write_bytecode:
+        try:
+            pyc_mtime = os.path.getmtime(cached)
+        except OSError:
+            pass
+        else:
+            loaded_at = pyc_mtime if loaded_at is None else max(loaded_at, pyc_mtime)
+    return source_mtime if loaded_at is None else loaded_at
+
+
+def _references_any(module: ModuleType, stale: Set[str]) -> bool:
+    """Check whether a module holds names imported from any stale module.
+
+    A package's attributes pointing at its own submodules are ignored; the
+    import system rebinds those when the submodule is re-imported.
+    """
+    child_prefix = module.__name__ + "."
+    for value in list(vars(module).values()):
+        if isinstance(value, ModuleType):
+            if value.__name__ in stale and not value.__name__.startswith(child_prefix):
+                return True
+        elif getattr(value, "__module__", None) in stale:
+            return True
+    return False
+
+
+def reload_changed_modules(
+    markers: Iterable[str] = ("timber_framing_generator",),
+) -> List[str]:
+    """
+    Evict project modules whose source file changed since the last call.
+
+    Development helper for Grasshopper components, which re-run their script
+    on every solve. Instead of clearing every project module (and paying the
+    full import cost each time), only modules whose file mtime changed are
+    removed from sys.modules, together with any project module that imported
+    names from them. The next import statement re-executes just those.
+
+    A module is stale when its source is newer than the time it was loaded,
+    so edits made between a module's import and the next call are caught
+    as well.
+
+    Args:
+        markers: Substrings identifying project module names
+
+    Returns:
+        Names of the evicted modules
+    """
+    global _last_check
+    check_time = time.time()
+    markers = tuple(markers)
+    modules = {
+        name: module
+        for name, module in list(sys.modules.items())
+        if module is not None
+        and name != __name__
+        and any(marker in name for marker in markers)
+        and getattr(module, "__file__", None)
+    }
+
+    # Forget modules removed from sys.modules by other means; a re-import
+    # is then treated as a newly seen module
+    for name in [name for name in _module_loaded_at if name not in modules]:
+        del _module_loaded_at[name]
+
+    changed: Set[str] = set()
+    for name, module in modules.items():
+        try:
+            mtime = os.path.getmtime(module.__file__)
+        except OSError:
+            changed.add(name)
+            continue
+        loaded_at = _module_loaded_at.get(name)
+        if loaded_at is None:
+            loaded_at = _module_loaded_at[name] = _load_time(module, mtime)
+        if mtime > loaded_at:
+            changed.add(name)
+
+    # Propagate to dependents until no new stale module is found
+    stale = set(changed)
+    grew = bool(stale)
+    while grew:
+        grew = False
+        for name, module in modules.items():
+            if name not in stale and _references_any(module, stale):
+                stale.add(name)
+                grew = True
+
+    for name in stale:
+        sys.modules.pop(name, None)
+        _module_loaded_at.pop(name, None)
+
+    _last_check = check_time
+    return sorted(stale)
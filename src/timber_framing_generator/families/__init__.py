@@ -16,33 +16,37 @@ Usage:
     )
 """
 
-# Manifest schema
-from .manifest import (
-    FamilyTypeInfo,
-    FamilyEntry,
-    FamilyManifest,
-    parse_manifest,
-    serialize_manifest,
-    validate_manifest,
-    get_required_profiles,
-    get_families_for_elements,
-)
+from ..utils.lazy_imports import lazy_exports
 
-# Providers
-from .providers import (
-    FamilyProvider,
-    GitHubProvider,
-    LocalFileProvider,
-)
-
-# Cache
-from .cache import FamilyCache
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    # Manifest schema
+    "FamilyTypeInfo": ".manifest",
+    "FamilyEntry": ".manifest",
+    "FamilyManifest": ".manifest",
+    "parse_manifest": ".manifest",
+    "serialize_manifest": ".manifest",
+    "validate_manifest": ".manifest",
+    "get_required_profiles": ".manifest",
+    "get_families_for_elements": ".manifest",
+    # Providers
+    "FamilyProvider": ".providers",
+    "GitHubProvider": ".providers",
+    "LocalFileProvider": ".providers",
+    # Cache
+    "FamilyCache": ".cache",
+    "ManifestCache": ".manifest_cache",
+    # Profile -> Revit type matching
+    "DEFAULT_TYPE_MAPPING": ".type_matcher",
+    "TypeMatcher": ".type_matcher",
+    "find_matching_revit_type": ".type_matcher",
+    "parse_cfs_profile_name": ".type_matcher",
+    # Resolver
+    "ResolutionResult": ".resolver",
+    "FamilyResolver": ".resolver",
+}
 
-# Resolver
-from .resolver import (
-    ResolutionResult,
-    FamilyResolver,
-)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Manifest
@@ -60,6 +64,12 @@ __all__ = [
     "LocalFileProvider",
     # Cache
     "FamilyCache",
+    "ManifestCache",
+    # Type matching
+    "DEFAULT_TYPE_MAPPING",
+    "TypeMatcher",
+    "find_matching_revit_type",
+    "parse_cfs_profile_name",
     # Resolver
     "ResolutionResult",
     "FamilyResolver",
@@ -6,20 +6,34 @@ Manages a local directory (default: %APPDATA%/TimberFramingGenerator/families/)
 that stores downloaded .rfa files with SHA256 checksum verification. Supports
 offline mode by serving cached families when the network is unavailable.
 
+The cache manifest is kept in memory. Changes are written immediately
+by default, or once at the end of a ``transaction()`` block, always by
+writing a temp file and renaming it over the old one, so a crash leaves
+either the old or the new manifest, never a truncated one. With
+``max_size_bytes`` set, least recently used families are evicted to
+keep the directory under the cap.
+
 Usage:
     from src.timber_framing_generator.families.cache import FamilyCache
 
     cache = FamilyCache()
     if cache.is_cached("TFG_Stud_2x4", expected_sha256="abc123"):
         path = cache.get_cached_path("TFG_Stud_2x4")
+
+    with cache.transaction():  # one manifest write for many changes
+        for key, path, rel in downloads:
+            cache.store(key, path, rel)
 """
 
+import contextlib
 import hashlib
 import json
 import logging
 import os
 import shutil
-from typing import Dict, List, Optional
+import tempfile
+import time
+from typing import Dict, Iterator, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -49,16 +63,29 @@ class FamilyCache:
     """Manages a local cache of downloaded Revit family (.rfa) files.
 
     The cache stores files in a directory structure mirroring the manifest's
-    file paths, and tracks metadata (SHA256, download time) in a local
+    file paths, and tracks metadata (SHA256, size, last use) in a local
     cache_manifest.json file.
 
     Args:
         cache_dir: Path to cache directory. Defaults to %APPDATA%/TimberFramingGenerator/families/.
+        max_size_bytes: Size cap for cached .rfa files. None (default) means
+                        unbounded; otherwise least recently used families
+                        are evicted when a store exceeds it.
     """
 
-    def __init__(self, cache_dir: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size_bytes: Optional[int] = None,
+    ) -> None:
         self._cache_dir = cache_dir or _get_default_cache_dir()
+        self._max_size_bytes = max_size_bytes
         self._cache_manifest: Dict[str, Dict] = {}
+        self._dirty = False
+        self._batch_depth = 0
+        # Families used in the open transaction; never evicted by it
+        self._pinned: Set[str] = set()
+        self.manifest_writes = 0
         self._ensure_cache_dir()
         self._load_cache_manifest()
 
@@ -84,14 +111,71 @@ class FamilyCache:
         else:
             self._cache_manifest = {}
 
-    def _save_cache_manifest(self) -> None:
-        """Save the cache manifest to disk."""
+    def flush(self) -> None:
+        """Write the cache manifest to disk if it changed.
+
+        Writes a temp file in the cache directory, syncs it and renames it
+        over cache_manifest.json.
+        """
+        if not self._dirty:
+            return
         manifest_path = os.path.join(self._cache_dir, CACHE_MANIFEST_FILENAME)
         try:
-            with open(manifest_path, "w", encoding="utf-8") as f:
-                json.dump(self._cache_manifest, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_dir, prefix=".cache_manifest.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._cache_manifest, f, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, manifest_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
         except OSError as e:
             logger.error("Failed to save cache manifest: %s", e)
+            return
+        self._dirty = False
+        self.manifest_writes += 1
+
+    def _changed(self) -> None:
+        """Record a manifest change; written now unless in a transaction."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def _touch(self, family_key: str) -> None:
+        """Record a use of a family for LRU eviction.
+
+        Use times are saved with the next write rather than forcing one.
+        """
+        self._cache_manifest[family_key]["last_used"] = time.time()
+        self._dirty = True
+        if self._batch_depth:
+            self._pinned.add(family_key)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["FamilyCache"]:
+        """Batch manifest changes into one write.
+
+        Blocks nest; the manifest is written when the outermost block
+        exits (also on an exception, since cached files are already in
+        place). Families stored or looked up inside the block are not
+        evicted by stores in the same block.
+
+        Yields:
+            This cache
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._pinned.clear()
+                self.flush()
 
     def compute_sha256(self, file_path: str) -> str:
         """Compute SHA256 hash of a file.
@@ -141,7 +225,7 @@ class FamilyCache:
         if not os.path.exists(file_path):
             # File was deleted outside of cache manager
             del self._cache_manifest[family_key]
-            self._save_cache_manifest()
+            self._changed()
             return False
 
         # Skip checksum verification for placeholder hashes
@@ -151,6 +235,7 @@ class FamilyCache:
                 # Hash mismatch — file may be outdated
                 return False
 
+        self._touch(family_key)
         return True
 
     def get_cached_path(self, family_key: str) -> Optional[str]:
@@ -169,6 +254,7 @@ class FamilyCache:
         if not os.path.exists(file_path):
             return None
 
+        self._touch(family_key)
         return file_path
 
     def store(
@@ -202,8 +288,14 @@ class FamilyCache:
         self._cache_manifest[family_key] = {
             "relative_path": relative_path,
             "sha256": sha256,
+            "size": os.path.getsize(dest_path),
+            "last_used": time.time(),
         }
-        self._save_cache_manifest()
+        if self._batch_depth:
+            self._pinned.add(family_key)
+        if self._max_size_bytes is not None:
+            self._evict_to(self._max_size_bytes, keep={family_key})
+        self._changed()
 
         logger.info("Cached family '%s' at %s", family_key, dest_path)
         return dest_path
@@ -220,13 +312,73 @@ class FamilyCache:
         if family_key not in self._cache_manifest:
             return False
 
+        self._delete(family_key)
+        self._changed()
+        return True
+
+    def _delete(self, family_key: str) -> None:
+        """Remove a family's file and entry (the change is not written)."""
         file_path = self._get_file_path(family_key)
         if os.path.exists(file_path):
             os.remove(file_path)
-
         del self._cache_manifest[family_key]
-        self._save_cache_manifest()
-        return True
+        self._pinned.discard(family_key)
+
+    def _entry_size(self, family_key: str) -> int:
+        """Size of a cached file; entries written before sizes were tracked
+        are measured once."""
+        entry = self._cache_manifest[family_key]
+        if "size" not in entry:
+            file_path = self._get_file_path(family_key)
+            entry["size"] = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        return entry["size"]
+
+    def total_size(self) -> int:
+        """Total size in bytes of all cached .rfa files."""
+        return sum(self._entry_size(key) for key in self._cache_manifest)
+
+    def _evict_to(self, max_bytes: int, keep: Set[str]) -> List[str]:
+        """Evict least recently used families until the cache fits."""
+        total = self.total_size()
+        if total <= max_bytes:
+            return []
+        protected = keep | self._pinned
+        # Stable sort: ties keep insertion order (oldest first)
+        candidates = sorted(
+            (key for key in self._cache_manifest if key not in protected),
+            key=lambda key: self._cache_manifest[key].get("last_used", 0.0),
+        )
+        evicted = []
+        for family_key in candidates:
+            if total <= max_bytes:
+                break
+            total -= self._entry_size(family_key)
+            self._delete(family_key)
+            evicted.append(family_key)
+        if evicted:
+            logger.info("Evicted %d families from cache: %s", len(evicted), evicted)
+        return evicted
+
+    def evict(self, max_bytes: Optional[int] = None) -> List[str]:
+        """Evict least recently used families until the cache fits a size cap.
+
+        Families used in an open transaction are kept even if the cache
+        then stays over the cap.
+
+        Args:
+            max_bytes: Size cap in bytes. Defaults to max_size_bytes.
+
+        Returns:
+            Keys of the evicted families, least recently used first
+        """
+        if max_bytes is None:
+            max_bytes = self._max_size_bytes
+        if max_bytes is None:
+            return []
+        evicted = self._evict_to(max_bytes, keep=set())
+        if evicted:
+            self._changed()
+        return evicted
 
     def clear_cache(self) -> int:
         """Remove all cached families.
@@ -241,7 +393,8 @@ class FamilyCache:
                 os.remove(file_path)
 
         self._cache_manifest = {}
-        self._save_cache_manifest()
+        self._pinned.clear()
+        self._changed()
         return count
 
     def list_cached(self) -> List[str]:
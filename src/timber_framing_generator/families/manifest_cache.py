@@ -0,0 +1,223 @@
+# File: src/timber_framing_generator/families/manifest_cache.py
+"""
+Local copy of the remote family manifest for conditional requests.
+
+Each manifest URL gets one JSON file under ``<cache_dir>/manifests/``
+holding the raw manifest text, its ETag and Last-Modified validators and
+when it was last confirmed current. Providers use it to:
+
+- skip the request entirely while the copy is younger than ``ttl``
+- revalidate with If-None-Match / If-Modified-Since after that, reusing
+  the copy on 304 Not Modified
+- fall back to the copy when the remote source is unreachable
+
+Parsed manifests are also kept in memory for the life of the process.
+The Grasshopper components purge the package from sys.modules on every
+solve, so freshness is judged from the on-disk timestamp, not the
+in-memory copy; a warm solve then costs one small file read.
+
+Usage:
+    from src.timber_framing_generator.families.manifest_cache import ManifestCache
+
+    manifest_cache = ManifestCache(family_cache.cache_dir)
+    manifest = provider.fetch_manifest(manifest_cache)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from src.timber_framing_generator.families.manifest import (
+    FamilyManifest,
+    parse_manifest,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFESTS_SUBDIR = "manifests"
+DEFAULT_MANIFEST_TTL_SECONDS = 300
+
+# Parsed copies shared by every ManifestCache in the process, by file path
+_memory: Dict[str, "CachedManifest"] = {}
+_memory_lock = threading.Lock()
+
+
+@dataclass
+class CachedManifest:
+    """A stored manifest and its HTTP validators.
+
+    Attributes:
+        url: Manifest URL
+        content: Raw manifest JSON text
+        etag: ETag response header, if the server sent one
+        last_modified: Last-Modified response header, if sent
+        checked_at: Epoch seconds the copy was last confirmed current
+    """
+    url: str
+    content: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0
+    _parsed: Optional[FamilyManifest] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "checked_at": self.checked_at,
+            "content": self.content,
+        }
+
+
+class ManifestCache:
+    """Stores remote manifests beside a FamilyCache.
+
+    Args:
+        cache_dir: FamilyCache directory; copies go in its manifests/ subdirectory
+        ttl: Seconds a copy is used without asking the server
+    """
+
+    def __init__(
+        self, cache_dir: str, ttl: float = DEFAULT_MANIFEST_TTL_SECONDS
+    ) -> None:
+        self._dir = os.path.join(cache_dir, MANIFESTS_SUBDIR)
+        self.ttl = ttl
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._dir, f"{digest}.json")
+
+    def lookup(self, url: str) -> Optional[CachedManifest]:
+        """Stored copy of a manifest URL, or None.
+
+        Args:
+            url: Manifest URL
+
+        Returns:
+            CachedManifest from memory or disk, or None if never stored
+            (or the stored file is unreadable)
+        """
+        path = self._path(url)
+        with _memory_lock:
+            cached = _memory.get(path)
+        if cached is not None:
+            return cached
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Ignoring unreadable manifest copy %s: %s", path, e)
+            return None
+        if data.get("url") != url or not isinstance(data.get("content"), str):
+            return None
+
+        cached = CachedManifest(
+            url=url,
+            content=data["content"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            checked_at=float(data.get("checked_at", 0.0)),
+        )
+        with _memory_lock:
+            _memory[path] = cached
+        return cached
+
+    def is_fresh(self, cached: CachedManifest) -> bool:
+        """Whether a copy can be used without revalidating."""
+        age = time.time() - cached.checked_at
+        return 0 <= age < self.ttl
+
+    @staticmethod
+    def conditional_headers(cached: Optional[CachedManifest]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating a copy."""
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def parsed(self, cached: CachedManifest) -> FamilyManifest:
+        """The copy's manifest, parsed once per process.
+
+        Raises:
+            ValueError: If the stored content is not a valid manifest
+        """
+        if cached._parsed is None:
+            try:
+                cached._parsed = parse_manifest(cached.content)
+            except (json.JSONDecodeError, KeyError) as e:
+                raise ValueError(f"Invalid manifest copy of {cached.url}: {e}") from e
+        return cached._parsed
+
+    def store(
+        self,
+        url: str,
+        content: str,
+        manifest: FamilyManifest,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedManifest:
+        """Record a manifest fetched with a 200 response.
+
+        Args:
+            url: Manifest URL
+            content: Raw manifest text
+            manifest: Parsed manifest (reused by later lookups)
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            The new CachedManifest
+        """
+        cached = CachedManifest(
+            url=url,
+            content=content,
+            etag=etag,
+            last_modified=last_modified,
+            checked_at=time.time(),
+            _parsed=manifest,
+        )
+        self._save(cached)
+        return cached
+
+    def touch(self, cached: CachedManifest) -> None:
+        """Mark a copy current after a 304 response."""
+        cached.checked_at = time.time()
+        self._save(cached)
+
+    def _save(self, cached: CachedManifest) -> None:
+        path = self._path(cached.url)
+        with _memory_lock:
+            _memory[path] = cached
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            # Write-then-rename so a crash never leaves a truncated copy
+            fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cached.to_dict(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to save manifest copy %s: %s", path, e)
+
+    def clear(self) -> None:
+        """Forget every stored manifest in this directory."""
+        with _memory_lock:
+            for path in [p for p in _memory if os.path.dirname(p) == self._dir]:
+                del _memory[path]
+        if os.path.isdir(self._dir):
+            for name in os.listdir(self._dir):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self._dir, name))
@@ -7,28 +7,39 @@ to allow swapping between different family sources:
 - Tier 1: GitHubProvider (free, direct download from GitHub raw URLs)
 - Tier 2: CloudAPIProvider (future: GCS + FastAPI with signed URLs)
 
+Providers may download concurrently: the resolver calls
+``download_verified`` from up to ``max_concurrency`` threads at once.
+The resolver fetches the manifest through ``fetch_manifest`` with a
+ManifestCache, which remote providers use for conditional requests and
+offline fallback.
+
 Usage:
     from src.timber_framing_generator.families.providers import GitHubProvider
 
     provider = GitHubProvider()
-    manifest = provider.get_manifest()
+    manifest = provider.fetch_manifest(ManifestCache(cache.cache_dir))
     success = provider.download_family(entry, "/path/to/dest.rfa")
 """
 
+import hashlib
+import http.client
 import json
 import logging
 import os
-import tempfile
-import urllib.request
-import urllib.error
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
 from src.timber_framing_generator.families.manifest import (
     FamilyEntry,
     FamilyManifest,
     parse_manifest,
 )
+from src.timber_framing_generator.families.manifest_cache import (
+    CachedManifest,
+    ManifestCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +49,24 @@ DEFAULT_GITHUB_BASE_URL = (
 )
 DEFAULT_MANIFEST_FILENAME = "manifest.json"
 DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_MAX_CONNECTIONS = 4
+USER_AGENT = "TimberFramingGenerator/1.0"
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 3
+
+
+def has_real_checksum(sha256: Optional[str]) -> bool:
+    """Whether a manifest hash should be verified (not empty or a placeholder)."""
+    return bool(sha256) and not sha256.startswith("placeholder")
+
+
+def hash_file(file_path: str) -> str:
+    """Hex SHA256 of a file, read in chunks."""
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
 
 
 # =============================================================================
@@ -49,8 +78,18 @@ class FamilyProvider(ABC):
 
     All providers must implement get_manifest() and download_family()
     to support the family resolution pipeline.
+
+    Attributes:
+        max_concurrency: Downloads the resolver may run at once. Providers
+            that are safe to call from several threads raise this.
+        manifest_status: How the last fetch_manifest() was served:
+            "fetched", "revalidated" (304), "fresh" (within the cache TTL,
+            no request) or "offline" (stored copy, source unreachable)
     """
 
+    max_concurrency: int = 1
+    manifest_status: str = "fetched"
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -70,6 +109,27 @@ class FamilyProvider(ABC):
         """
         ...
 
+    def fetch_manifest(
+        self, manifest_cache: Optional[ManifestCache] = None
+    ) -> FamilyManifest:
+        """Fetch the manifest, reusing a stored copy where the provider can.
+
+        The default implementation ignores the cache and calls
+        get_manifest(); remote providers override it.
+
+        Args:
+            manifest_cache: Stored manifest copies (None to always fetch)
+
+        Returns:
+            Parsed FamilyManifest
+
+        Raises:
+            ConnectionError: If the remote source is unreachable
+            ValueError: If the manifest is invalid
+        """
+        self.manifest_status = "fetched"
+        return self.get_manifest()
+
     @abstractmethod
     def download_family(
         self, family_entry: FamilyEntry, dest_path: str
@@ -85,6 +145,139 @@ class FamilyProvider(ABC):
         """
         ...
 
+    def download_verified(
+        self, family_entry: FamilyEntry, dest_path: str
+    ) -> Optional[str]:
+        """Download a family and verify it against the manifest checksum.
+
+        The default implementation downloads, then hashes the file.
+        Providers that stream can hash while writing instead.
+
+        Args:
+            family_entry: FamilyEntry from the manifest
+            dest_path: Local path to save the .rfa file
+
+        Returns:
+            SHA256 of the downloaded file, or None if the download failed
+            or the checksum did not match (the file is removed)
+        """
+        if not self.download_family(family_entry, dest_path):
+            return None
+        digest = hash_file(dest_path)
+        if has_real_checksum(family_entry.sha256) and digest != family_entry.sha256:
+            logger.error(
+                "Checksum mismatch for %s: expected %s, got %s",
+                family_entry.file, family_entry.sha256, digest,
+            )
+            os.remove(dest_path)
+            return None
+        return digest
+
+    def close(self) -> None:
+        """Release network resources (no-op by default)."""
+
+    def __enter__(self) -> "FamilyProvider":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# =============================================================================
+# Keep-alive HTTP connections
+# =============================================================================
+
+class HTTPConnectionPool:
+    """Keep-alive HTTP(S) connections, one per host per thread.
+
+    urllib opens a new connection (and TLS handshake) per request. Each
+    download thread instead reuses its own connection to a host for as
+    long as the server keeps it open, reconnecting once if a kept-alive
+    connection turns out to be closed.
+
+    Args:
+        timeout: Socket timeout in seconds
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> None:
+        self._timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: List[http.client.HTTPConnection] = []
+        self.connections_opened = 0
+
+    def _connections(self) -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        return conns
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc, timeout=self._timeout)
+        elif scheme == "http":
+            conn = http.client.HTTPConnection(netloc, timeout=self._timeout)
+        else:
+            raise ValueError(f"Unsupported URL scheme '{scheme}'")
+        with self._lock:
+            self._all.append(conn)
+            self.connections_opened += 1
+        return conn
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> http.client.HTTPResponse:
+        """Send a GET and return the response (headers read, body not).
+
+        The caller must read the body to the end (or close the response)
+        before the thread's next request to the same host.
+
+        Args:
+            url: Absolute http(s) URL
+            headers: Extra request headers (e.g. conditional headers)
+
+        Raises:
+            OSError: On connection failure
+            http.client.HTTPException: On a malformed response
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+        request_headers.update(headers or {})
+
+        conns = self._connections()
+        while True:
+            conn = conns.get(key)
+            reused = conn is not None
+            if conn is None:
+                conn = conns[key] = self._connect(*key)
+            try:
+                conn.request("GET", path, headers=request_headers)
+                return conn.getresponse()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                del conns[key]
+                with self._lock:
+                    self._all.remove(conn)
+                # A kept-alive connection may have been closed by the
+                # server; retry once on a fresh one
+                if not reused:
+                    raise
+
+    def close(self) -> None:
+        """Close every open connection of any thread.
+
+        Worker threads' connections outlive the threads, so the owner of
+        the pool must call this when it is done downloading.
+        """
+        with self._lock:
+            conns, self._all = self._all, []
+        for conn in conns:
+            conn.close()
+
 
 # =============================================================================
 # Tier 1: GitHub Provider
@@ -97,11 +290,16 @@ class GitHubProvider(FamilyProvider):
     GitHub's raw.githubusercontent.com. No authentication required
     for public repositories.
 
+    Downloads reuse keep-alive connections (one per host per thread) and
+    hash the bytes as they are written, so a file is read only once.
+
     Args:
         base_url: Base URL for family files. Defaults to the project's GitHub repo.
         manifest_url: Full URL to manifest.json. If not provided, constructed
                      from base_url + "manifest.json".
         timeout: Request timeout in seconds.
+        max_connections: Concurrent downloads allowed (max_concurrency).
+        manifest_cache: Stored manifest copies used by get_manifest().
     """
 
     def __init__(
@@ -109,10 +307,15 @@ class GitHubProvider(FamilyProvider):
         base_url: Optional[str] = None,
         manifest_url: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        manifest_cache: Optional[ManifestCache] = None,
     ) -> None:
         self._base_url = (base_url or DEFAULT_GITHUB_BASE_URL).rstrip("/")
         self._manifest_url = manifest_url
         self._timeout = timeout
+        self.max_concurrency = max(1, max_connections)
+        self._pool = HTTPConnectionPool(timeout)
+        self._manifest_cache = manifest_cache
 
     @property
     def provider_name(self) -> str:
@@ -131,6 +334,8 @@ class GitHubProvider(FamilyProvider):
     def get_manifest(self) -> FamilyManifest:
         """Fetch and parse manifest.json from GitHub.
 
+        Uses the provider's own manifest_cache, if it was given one.
+
         Returns:
             Parsed FamilyManifest
 
@@ -138,27 +343,74 @@ class GitHubProvider(FamilyProvider):
             ConnectionError: If GitHub is unreachable
             ValueError: If manifest is invalid
         """
+        return self.fetch_manifest(self._manifest_cache)
+
+    def fetch_manifest(
+        self, manifest_cache: Optional[ManifestCache] = None
+    ) -> FamilyManifest:
+        """Fetch manifest.json, revalidating a stored copy when there is one.
+
+        A copy younger than the cache TTL is used without a request. An
+        older one is revalidated with If-None-Match / If-Modified-Since
+        and reused on 304. If GitHub is unreachable (or answers with an
+        error) the stored copy is used regardless of age.
+
+        Args:
+            manifest_cache: Stored manifest copies (None to always fetch)
+
+        Returns:
+            Parsed FamilyManifest
+
+        Raises:
+            ConnectionError: If GitHub is unreachable and there is no copy
+            ValueError: If the fetched manifest is invalid
+        """
         url = self._get_manifest_url()
-        logger.info("Fetching manifest from %s", url)
+        cached = manifest_cache.lookup(url) if manifest_cache else None
+        stored = self._cached_manifest(manifest_cache, cached) if cached else None
+        if stored is None:
+            cached = None
+        elif manifest_cache.is_fresh(cached):
+            self.manifest_status = "fresh"
+            return stored
 
+        logger.info("Fetching manifest from %s", url)
         try:
-            req = urllib.request.Request(url)
-            req.add_header("User-Agent", "TimberFramingGenerator/1.0")
-            with urllib.request.urlopen(req, timeout=self._timeout) as response:
-                content = response.read().decode("utf-8")
-        except urllib.error.URLError as e:
-            raise ConnectionError(
-                f"Failed to fetch manifest from {url}: {e}"
-            ) from e
-
+            response = self._pool.get(url, ManifestCache.conditional_headers(cached))
+            body = response.read()
+            if response.status == 304 and stored is None:
+                raise ConnectionError("unexpected HTTP 304")
+            if response.status not in (200, 304):
+                raise ConnectionError(f"HTTP {response.status}")
+        except (OSError, http.client.HTTPException) as e:
+            # ConnectionError is an OSError, so HTTP errors land here too
+            if stored is None:
+                raise ConnectionError(
+                    f"Failed to fetch manifest from {url}: {e}"
+                ) from e
+            logger.warning(
+                "Failed to fetch manifest from %s (%s); using stored copy", url, e
+            )
+            self.manifest_status = "offline"
+            return stored
+
+        if response.status == 304:
+            manifest_cache.touch(cached)
+            self.manifest_status = "revalidated"
+            return stored
+
+        content = body.decode("utf-8")
         try:
-            manifest = parse_manifest(content)
+            manifest = self._finish_manifest(parse_manifest(content))
         except (json.JSONDecodeError, KeyError) as e:
             raise ValueError(f"Invalid manifest at {url}: {e}") from e
-
-        # Override base_url if manifest specifies one
-        if not manifest.base_url:
-            manifest.base_url = self._base_url
+        if manifest_cache is not None:
+            manifest_cache.store(
+                url, content, manifest,
+                etag=response.getheader("ETag"),
+                last_modified=response.getheader("Last-Modified"),
+            )
+        self.manifest_status = "fetched"
 
         logger.info(
             "Manifest loaded: %d families, Revit %s",
@@ -167,6 +419,22 @@ class GitHubProvider(FamilyProvider):
         )
         return manifest
 
+    def _finish_manifest(self, manifest: FamilyManifest) -> FamilyManifest:
+        # Override base_url if manifest specifies one
+        if not manifest.base_url:
+            manifest.base_url = self._base_url
+        return manifest
+
+    def _cached_manifest(
+        self, manifest_cache: ManifestCache, cached: CachedManifest
+    ) -> Optional[FamilyManifest]:
+        """Parsed stored copy, or None if it is corrupt."""
+        try:
+            return self._finish_manifest(manifest_cache.parsed(cached))
+        except ValueError as e:
+            logger.warning("Ignoring stored manifest: %s", e)
+            return None
+
     def download_family(
         self, family_entry: FamilyEntry, dest_path: str
     ) -> bool:
@@ -177,7 +445,24 @@ class GitHubProvider(FamilyProvider):
             dest_path: Local path to save the file
 
         Returns:
-            True if download succeeded
+            True if download succeeded (and the checksum matched)
+        """
+        return self.download_verified(family_entry, dest_path) is not None
+
+    def download_verified(
+        self, family_entry: FamilyEntry, dest_path: str
+    ) -> Optional[str]:
+        """Download a .rfa file, hashing it while it is written.
+
+        Safe to call from several threads at once.
+
+        Args:
+            family_entry: FamilyEntry with file path and sha256
+            dest_path: Local path to save the file
+
+        Returns:
+            SHA256 of the file, or None on failure or checksum mismatch
+            (a partial or mismatched file is removed)
         """
         url = f"{self._base_url}/{family_entry.file}"
         logger.info("Downloading %s from %s", family_entry.file, url)
@@ -185,27 +470,60 @@ class GitHubProvider(FamilyProvider):
         try:
             # Ensure destination directory exists
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-
-            req = urllib.request.Request(url)
-            req.add_header("User-Agent", "TimberFramingGenerator/1.0")
-
-            with urllib.request.urlopen(req, timeout=self._timeout) as response:
-                with open(dest_path, "wb") as f:
-                    while True:
-                        chunk = response.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-
-            logger.info("Downloaded %s to %s", family_entry.file, dest_path)
-            return True
-
-        except urllib.error.URLError as e:
+            digest = self._stream_to_file(url, dest_path)
+        except (OSError, http.client.HTTPException, ValueError) as e:
             logger.error("Download failed for %s: %s", url, e)
-            return False
-        except OSError as e:
-            logger.error("Failed to write %s: %s", dest_path, e)
-            return False
+            digest = None
+
+        if digest is not None and has_real_checksum(family_entry.sha256) \
+                and digest != family_entry.sha256:
+            logger.error(
+                "Checksum mismatch for %s: expected %s, got %s",
+                url, family_entry.sha256, digest,
+            )
+            digest = None
+
+        if digest is None:
+            if os.path.exists(dest_path):
+                os.remove(dest_path)
+            return None
+
+        logger.info("Downloaded %s to %s", family_entry.file, dest_path)
+        return digest
+
+    def _stream_to_file(self, url: str, dest_path: str) -> Optional[str]:
+        """GET url into dest_path, following redirects; return the SHA256."""
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._pool.get(url)
+            if response.status in (301, 302, 303, 307, 308):
+                location = response.getheader("Location")
+                response.read()
+                if not location:
+                    break
+                url = urljoin(url, location)
+                continue
+            if response.status != 200:
+                # Drain the body so the connection can be reused
+                response.read()
+                logger.error("Download failed for %s: HTTP %d", url, response.status)
+                return None
+
+            sha256 = hashlib.sha256()
+            with open(dest_path, "wb") as f:
+                while True:
+                    chunk = response.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sha256.update(chunk)
+                    f.write(chunk)
+            return sha256.hexdigest()
+
+        logger.error("Too many redirects for %s", url)
+        return None
+
+    def close(self) -> None:
+        """Close kept-alive connections."""
+        self._pool.close()
 
 
 # =============================================================================
@@ -222,6 +540,8 @@ class LocalFileProvider(FamilyProvider):
         families_dir: Path to local directory containing manifest.json and .rfa files
     """
 
+    max_concurrency = DEFAULT_MAX_CONNECTIONS
+
     def __init__(self, families_dir: str) -> None:
         self._families_dir = families_dir
 
@@ -261,7 +581,7 @@ class LocalFileProvider(FamilyProvider):
             return False
 
         try:
-            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
             import shutil
             shutil.copy2(source_path, dest_path)
             return True
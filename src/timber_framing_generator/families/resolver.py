@@ -10,8 +10,9 @@ Usage:
     from src.timber_framing_generator.families.resolver import FamilyResolver
     from src.timber_framing_generator.families.providers import GitHubProvider
 
-    resolver = FamilyResolver(provider=GitHubProvider())
-    result = resolver.resolve(doc=revit_doc, framing_json=framing_json_str)
+    with GitHubProvider() as provider:  # closes kept-alive connections
+        resolver = FamilyResolver(provider=provider)
+        result = resolver.resolve(doc=revit_doc, framing_json=framing_json_str)
 
     if result.status == "all_resolved":
         enriched_json = resolver.enrich_framing_json(framing_json_str, result)
@@ -19,9 +20,11 @@ Usage:
 
 import json
 import logging
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from src.timber_framing_generator.families.manifest import (
     FamilyManifest,
@@ -31,6 +34,7 @@ from src.timber_framing_generator.families.manifest import (
     parse_manifest,
 )
 from src.timber_framing_generator.families.cache import FamilyCache
+from src.timber_framing_generator.families.manifest_cache import ManifestCache
 from src.timber_framing_generator.families.providers import (
     FamilyProvider,
     GitHubProvider,
@@ -38,6 +42,8 @@ from src.timber_framing_generator.families.providers import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_DOWNLOAD_WORKERS = 4
+
 
 @dataclass
 class ResolutionResult:
@@ -77,7 +83,8 @@ class FamilyResolver:
     """Orchestrates the full family resolution pipeline.
 
     Pipeline steps:
-    1. Fetch manifest from provider (or use cached manifest)
+    1. Fetch manifest from provider, revalidating the copy stored beside
+       the cache (offline: the stored copy, else cache-only mode)
     2. Parse framing_json to determine which profiles are needed
     3. Check which families are already loaded in Revit
     4. For missing families: check cache, download if needed
@@ -85,11 +92,20 @@ class FamilyResolver:
     6. Activate all required FamilySymbols
     7. Return resolution status with diagnostics
 
+    Downloads (step 4) run on a bounded thread pool; everything that
+    touches the cache manifest or Revit runs on the calling thread, and
+    results are recorded in manifest order regardless of which download
+    finishes first.
+
     Args:
         provider: FamilyProvider for fetching manifest and .rfa files.
                  Defaults to GitHubProvider.
         cache: FamilyCache for local caching. Defaults to standard cache dir.
         manifest: Pre-loaded manifest (skips fetching from provider).
+        max_workers: Download threads, further capped by the provider's
+                    max_concurrency.
+        manifest_cache: Stored manifest copies. Defaults to one in the
+                    cache directory.
     """
 
     def __init__(
@@ -97,10 +113,15 @@ class FamilyResolver:
         provider: Optional[FamilyProvider] = None,
         cache: Optional[FamilyCache] = None,
         manifest: Optional[FamilyManifest] = None,
+        max_workers: int = DEFAULT_MAX_DOWNLOAD_WORKERS,
+        manifest_cache: Optional[ManifestCache] = None,
     ) -> None:
         self._provider = provider or GitHubProvider()
+        self._owns_provider = provider is None
         self._cache = cache or FamilyCache()
         self._manifest = manifest
+        self._max_workers = max(1, max_workers)
+        self._manifest_cache = manifest_cache or ManifestCache(self._cache.cache_dir)
 
     @property
     def provider(self) -> FamilyProvider:
@@ -110,6 +131,20 @@ class FamilyResolver:
     def cache(self) -> FamilyCache:
         return self._cache
 
+    def close(self) -> None:
+        """Close the default provider created by this resolver.
+
+        A provider passed in stays open; whoever created it closes it.
+        """
+        if self._owns_provider:
+            self._provider.close()
+
+    def __enter__(self) -> "FamilyResolver":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _fetch_manifest(self, result: ResolutionResult) -> Optional[FamilyManifest]:
         """Fetch manifest from provider, with error handling.
 
@@ -124,10 +159,10 @@ class FamilyResolver:
             return self._manifest
 
         try:
-            manifest = self._provider.get_manifest()
+            manifest = self._provider.fetch_manifest(self._manifest_cache)
             result.log.append(
                 f"Fetched manifest from {self._provider.provider_name}: "
-                f"{len(manifest.families)} families"
+                f"{len(manifest.families)} families ({self._provider.manifest_status})"
             )
             return manifest
         except ConnectionError as e:
@@ -179,6 +214,16 @@ class FamilyResolver:
         Returns:
             ResolutionResult with status, resolved mappings, and diagnostics
         """
+        # One cache manifest write per resolve, however many families change
+        with self._cache.transaction():
+            return self._resolve(doc, framing_json)
+
+    def _resolve(
+        self,
+        doc: Optional[Any],
+        framing_json: Optional[str],
+    ) -> ResolutionResult:
+        """Body of resolve(), run inside a cache transaction."""
         result = ResolutionResult()
         result.log.append(f"Starting family resolution (provider: {self._provider.provider_name})")
 
@@ -217,10 +262,25 @@ class FamilyResolver:
             except ImportError:
                 result.log.append("Revit loader not available (not in Revit environment)")
 
-        # Step 4-6: Process each needed family
+        # Step 4: Check Revit and the local cache; download the rest
+        local_paths: Dict[str, str] = {}
+        to_download: Dict[str, FamilyEntry] = {}
+        for family_key, family_entry in needed_families.items():
+            if family_key in loaded_in_revit:
+                continue
+            is_cached = self._cache.is_cached(family_key, family_entry.sha256)
+            cached_path = self._cache.get_cached_path(family_key) if is_cached else None
+            if cached_path:
+                local_paths[family_key] = cached_path
+            else:
+                to_download[family_key] = family_entry
+        downloaded = self._download_families(to_download, result)
+
+        # Step 5-6: Load into Revit (serially, on this thread) in manifest order
         for family_key, family_entry in needed_families.items():
             self._resolve_single_family(
-                family_key, family_entry, doc, loaded_in_revit, result
+                family_key, family_entry, doc, loaded_in_revit, result,
+                local_paths.get(family_key), downloaded.get(family_key),
             )
 
         # Step 7: Build profile -> type mapping from resolved families
@@ -251,8 +311,10 @@ class FamilyResolver:
         doc: Optional[Any],
         loaded_in_revit: Dict[str, Dict],
         result: ResolutionResult,
+        cached_path: Optional[str] = None,
+        downloaded_path: Optional[str] = None,
     ) -> None:
-        """Resolve a single family through the full pipeline.
+        """Record one family's outcome and load it into Revit.
 
         Args:
             family_key: Manifest family key
@@ -260,6 +322,8 @@ class FamilyResolver:
             doc: Revit Document (or None)
             loaded_in_revit: Already-loaded families from Revit
             result: ResolutionResult to update
+            cached_path: Path of a valid cached file, if there was one
+            downloaded_path: Path of the freshly downloaded file, if any
         """
         # Check if already loaded in Revit
         if family_key in loaded_in_revit:
@@ -267,19 +331,14 @@ class FamilyResolver:
             result.log.append(f"  {family_key}: already loaded in Revit")
             return
 
-        # Check local cache
-        is_cached = self._cache.is_cached(family_key, family_entry.sha256)
-        cached_path = self._cache.get_cached_path(family_key) if is_cached else None
-
-        if not cached_path:
-            # Download from provider
-            cached_path = self._download_and_cache(family_key, family_entry, result)
-            if not cached_path:
-                result.missing.append(family_key)
-                return
-        else:
+        if cached_path:
             result.cached.append(family_key)
             result.log.append(f"  {family_key}: using cached file")
+        elif downloaded_path:
+            cached_path = downloaded_path
+        else:
+            result.missing.append(family_key)
+            return
 
         # Load into Revit if doc is available
         if doc is not None:
@@ -296,13 +355,104 @@ class FamilyResolver:
                 result.cached.append(family_key)
             result.log.append(f"  {family_key}: cached (no Revit doc to load into)")
 
+    def _download_families(
+        self,
+        families: Dict[str, FamilyEntry],
+        result: ResolutionResult,
+    ) -> Dict[str, str]:
+        """Download families concurrently and store them in the cache.
+
+        Downloads run on up to ``max_workers`` threads (capped by the
+        provider's max_concurrency). Each goes to its own temp file and is
+        checksum-verified by the provider; the cache is updated here, on
+        the calling thread, in manifest order.
+
+        Args:
+            families: Family key -> FamilyEntry to download
+            result: ResolutionResult for logging
+
+        Returns:
+            Family key -> cached file path for successful downloads
+        """
+        if not families:
+            return {}
+
+        workers = min(self._max_workers, self._provider.max_concurrency, len(families))
+        result.log.append(
+            f"Downloading {len(families)} families with {workers} worker(s)"
+        )
+        if workers == 1:
+            outcomes = [self._download_to_temp(entry) for entry in families.values()]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="family-download"
+            ) as executor:
+                outcomes = list(executor.map(self._download_to_temp, families.values()))
+
+        paths: Dict[str, str] = {}
+        for (family_key, family_entry), (tmp_path, sha256, error) in zip(
+            families.items(), outcomes
+        ):
+            if error:
+                result.log.append(f"  {family_key}: {error}")
+                continue
+            cached_path = self._store_download(family_key, family_entry, tmp_path, sha256, result)
+            if cached_path:
+                paths[family_key] = cached_path
+        return paths
+
+    def _download_to_temp(
+        self, family_entry: FamilyEntry
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Download one family to a temp file (runs on a worker thread).
+
+        Returns:
+            Tuple of (temp path, SHA256, error message or None)
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(suffix=".rfa")
+            os.close(fd)
+            sha256 = self._provider.download_verified(family_entry, tmp_path)
+        except Exception as e:
+            sha256 = None
+            error = f"download error: {e}"
+        else:
+            error = None if sha256 else "download FAILED"
+        if error and tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return tmp_path, sha256, error
+
+    def _store_download(
+        self,
+        family_key: str,
+        family_entry: FamilyEntry,
+        tmp_path: str,
+        sha256: str,
+        result: ResolutionResult,
+    ) -> Optional[str]:
+        """Move a verified download into the cache and remove the temp file."""
+        try:
+            cached_path = self._cache.store(
+                family_key, tmp_path, family_entry.file, sha256
+            )
+        except Exception as e:
+            result.log.append(f"  {family_key}: download error: {e}")
+            return None
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        result.log.append(f"  {family_key}: downloaded and cached")
+        return cached_path
+
     def _download_and_cache(
         self,
         family_key: str,
         family_entry: FamilyEntry,
         result: ResolutionResult,
     ) -> Optional[str]:
-        """Download a family and store in cache.
+        """Download a single family and store in cache.
 
         Args:
             family_key: Manifest family key
@@ -312,38 +462,11 @@ class FamilyResolver:
         Returns:
             Path to cached file, or None if download failed
         """
-        try:
-            # Download to a temp file first
-            import tempfile
-            with tempfile.NamedTemporaryFile(
-                suffix=".rfa", delete=False
-            ) as tmp:
-                tmp_path = tmp.name
-
-            success = self._provider.download_family(family_entry, tmp_path)
-            if not success:
-                result.log.append(f"  {family_key}: download FAILED")
-                return None
-
-            # Store in cache
-            cached_path = self._cache.store(
-                family_key,
-                tmp_path,
-                family_entry.file,
-                family_entry.sha256,
-            )
-
-            # Clean up temp file
-            import os
-            if os.path.exists(tmp_path) and tmp_path != cached_path:
-                os.remove(tmp_path)
-
-            result.log.append(f"  {family_key}: downloaded and cached")
-            return cached_path
-
-        except Exception as e:
-            result.log.append(f"  {family_key}: download error: {e}")
+        tmp_path, sha256, error = self._download_to_temp(family_entry)
+        if error:
+            result.log.append(f"  {family_key}: {error}")
             return None
+        return self._store_download(family_key, family_entry, tmp_path, sha256, result)
 
     def _load_into_revit(
         self,
@@ -0,0 +1,351 @@
+# File: src/timber_framing_generator/families/type_matcher.py
+"""
+Profile name to Revit family type matching for the Revit Baker.
+
+The baker needs to resolve every framing element's profile name (e.g.
+"2x4", "362S125-54") to one of the Revit family types loaded in the
+document. Profiles repeat heavily across a building while the set of
+available types is fixed for a bake, so :class:`TypeMatcher` indexes the
+types once and memoizes each profile's resolution.
+
+Matching strategy (in order):
+    1. User-provided mapping (exact match)
+    2. Exact match with Revit type name
+    3. Profile name contained in Revit type name
+    4. Default mapping (exact, then contained)
+    5. Similar CFS profile (same type/gauge, different series)
+    6. Fallback to first available type
+
+Revit types are only accessed through their ``Name`` / ``get_Name()``
+members (falling back to ``str()``), so plain strings can stand in for
+Revit ``ElementType`` objects in tests.
+
+Usage:
+    from src.timber_framing_generator.families.type_matcher import TypeMatcher
+
+    matcher = TypeMatcher(revit_column_types, user_mapping)
+    revit_type, quality = matcher.match("2x4")
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default type mapping for common profiles
+# Maps framing generator profile names to Revit family type names
+DEFAULT_TYPE_MAPPING: Dict[str, str] = {
+    # Timber profiles
+    "2x4": "2x4",
+    "2x6": "2x6",
+    "2x8": "2x8",
+    "2x10": "2x10",
+    "2x12": "2x12",
+    # CFS profiles - map to Clark Dietrich naming with (50) yield strength suffix
+    # 350-series (3.5" web)
+    "350S125-33": "350S125-33(50)",
+    "350S125-43": "350S125-43(50)",
+    "350S125-54": "350S125-54(50)",
+    "350S125-68": "350S125-68(50)",
+    "350S162-33": "350S162-33(50)",
+    "350S162-43": "350S162-43(50)",
+    "350S162-54": "350S162-54(50)",
+    "350T125-33": "350T125-33(50)",
+    "350T125-43": "350T125-43(50)",
+    "350T125-54": "350T125-54(50)",
+    "350T250-54": "350T250-54(50)",
+    # 362-series (3.625" web) - Clark Dietrich standard
+    "362S125-33": "362S125-33(50)",
+    "362S125-43": "362S125-43(50)",
+    "362S125-54": "362S125-54(50)",
+    "362S125-68": "362S125-68(50)",
+    "362S162-33": "362S162-33(50)",
+    "362S162-43": "362S162-43(50)",
+    "362S162-54": "362S162-54(50)",
+    "362S162-68": "362S162-68(50)",
+    "362T125-33": "362T125-33(50)",
+    "362T125-43": "362T125-43(50)",
+    "362T125-54": "362T125-54(50)",
+    "362T125-68": "362T125-68(50)",
+    "362T250-54": "362T250-54(50)",
+    "362T250-68": "362T250-68(50)",
+    # 400-series (4" web)
+    "400S125-33": "400S125-33(50)",
+    "400S125-43": "400S125-43(50)",
+    "400S125-54": "400S125-54(50)",
+    "400S125-68": "400S125-68(50)",
+    "400T125-54": "400T125-54(50)",
+    "400T250-54": "400T250-54(50)",
+    # 550-series (5.5" web)
+    "550S125-33": "550S125-33(50)",
+    "550S125-43": "550S125-43(50)",
+    "550S125-54": "550S125-54(50)",
+    "550S125-68": "550S125-68(50)",
+    "550S250-97": "550S250-97(50)",
+    "550T125-54": "550T125-54(50)",
+    "550T200-54": "550T200-54(50)",
+    "550T250-54": "550T250-54(50)",
+    # 600-series (6" web)
+    "600S162-33": "600S162-33(50)",
+    "600S162-43": "600S162-43(50)",
+    "600S162-54": "600S162-54(50)",
+    "600S162-68": "600S162-68(50)",
+    "600T125-33": "600T125-33(50)",
+    "600T125-43": "600T125-43(50)",
+    "600T125-54": "600T125-54(50)",
+    # 800-series (8" web)
+    "800S162-54": "800S162-54(50)",
+    "800S162-68": "800S162-68(50)",
+    "800T125-54": "800T125-54(50)",
+    "800T125-68": "800T125-68(50)",
+}
+
+# Match patterns like 362S125-54 or 600T125-54(50)
+_CFS_PROFILE_PATTERN = re.compile(r'^(\d{3})([ST])(\d{3})-(\d{2,3})(?:\(\d+\))?$')
+
+# Substring index granularity for the 'contains' stage
+_NGRAM_SIZE = 3
+
+
+def parse_cfs_profile_name(profile_name: str) -> Optional[Dict[str, str]]:
+    """
+    Parse a CFS profile name into its components.
+
+    Examples:
+        "362S125-54" -> {"series": "362", "type": "S", "flange": "125", "gauge": "54"}
+        "600T125-54(50)" -> {"series": "600", "type": "T", "flange": "125", "gauge": "54"}
+
+    Returns:
+        Dict with profile components or None if not a CFS profile
+    """
+    match = _CFS_PROFILE_PATTERN.match(profile_name.upper())
+    if match:
+        return {
+            "series": match.group(1),
+            "type": match.group(2),
+            "flange": match.group(3),
+            "gauge": match.group(4),
+        }
+    return None
+
+
+def get_revit_type_name(revit_type: Any) -> str:
+    """
+    Get the display name of a Revit type (or a plain string stand-in).
+
+    Args:
+        revit_type: Revit ElementType, or any object with a Name member
+
+    Returns:
+        Type name string
+    """
+    if hasattr(revit_type, 'Name'):
+        return revit_type.Name
+    elif hasattr(revit_type, 'get_Name'):
+        return revit_type.get_Name()
+    return str(revit_type)
+
+
+def _ngrams(text: str) -> Set[str]:
+    """Return the set of fixed-size substrings of text."""
+    return {text[i:i + _NGRAM_SIZE] for i in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+class TypeMatcher:
+    """Resolves profile names to Revit family types for one bake.
+
+    All per-type work (name extraction, lowercasing, CFS parsing and the
+    substring index) happens once in the constructor; :meth:`match` results
+    are memoized per profile name, so repeated profiles are a dict hit.
+
+    Args:
+        revit_types: Available Revit family types (in picker order)
+        user_mapping: Optional dict of profile_name -> revit_type_name
+    """
+
+    def __init__(
+        self,
+        revit_types: List[Any],
+        user_mapping: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self._revit_types = list(revit_types) if revit_types else []
+        self._user_mapping = user_mapping or {}
+        self._memo: Dict[str, Tuple[Any, Optional[str]]] = {}
+
+        # Lowercase type name -> type (last duplicate wins, first position kept)
+        self._type_name_map: Dict[str, Any] = {}
+        self.type_names: List[str] = []
+        for rt in self._revit_types:
+            try:
+                name = get_revit_type_name(rt)
+                self._type_name_map[name.lower()] = rt
+                self.type_names.append(name)
+            except Exception as e:
+                self.type_names.append(f"ERROR: {e}")
+                continue
+
+        # Ordered names and n-gram postings (name positions) for 'contains'
+        self._ordered_names: List[str] = list(self._type_name_map)
+        self._ngram_index: Dict[str, Set[int]] = {}
+        for position, type_name in enumerate(self._ordered_names):
+            for gram in _ngrams(type_name):
+                self._ngram_index.setdefault(gram, set()).add(position)
+
+        # Pre-parsed CFS types in map order
+        self._cfs_types: List[Tuple[str, Any, Dict[str, str]]] = []
+        for type_name, rt in self._type_name_map.items():
+            parsed = parse_cfs_profile_name(type_name)
+            if parsed:
+                self._cfs_types.append((type_name, rt, parsed))
+
+    @property
+    def cache_size(self) -> int:
+        """Number of memoized profile resolutions."""
+        return len(self._memo)
+
+    def match(self, profile_name: str) -> Tuple[Any, Optional[str]]:
+        """
+        Find a matching Revit type for a profile name.
+
+        Args:
+            profile_name: Profile name from framing element (e.g., "2x4")
+
+        Returns:
+            Tuple of (matched_type, match_quality) where match_quality is:
+            'user_mapping', 'exact', 'contains', 'default', 'default_contains',
+            'cfs_similar', 'cfs_type_match', 'cfs_fallback', 'fallback', or None
+        """
+        cached = self._memo.get(profile_name)
+        if cached is not None:
+            return cached
+        result = self._resolve(profile_name)
+        self._memo[profile_name] = result
+        return result
+
+    def _resolve(self, profile_name: str) -> Tuple[Any, Optional[str]]:
+        """Run the full matching strategy for an uncached profile."""
+        if not self._revit_types:
+            return None, None
+
+        type_name_map = self._type_name_map
+        profile_lower = profile_name.lower().strip()
+
+        # 1. User-provided mapping
+        if profile_name in self._user_mapping:
+            target_name = self._user_mapping[profile_name].lower()
+            if target_name in type_name_map:
+                return type_name_map[target_name], 'user_mapping'
+            logger.debug(
+                f"User mapping '{profile_name}' -> "
+                f"'{self._user_mapping[profile_name]}' not found in types"
+            )
+
+        # 2. Exact match
+        if profile_lower in type_name_map:
+            return type_name_map[profile_lower], 'exact'
+
+        # 3. Profile name contained in type name (e.g., "2x4" in "Stud - 2x4")
+        type_name = self._first_containing(profile_lower)
+        if type_name is not None:
+            return type_name_map[type_name], 'contains'
+
+        # 4. Default mapping
+        if profile_name in DEFAULT_TYPE_MAPPING:
+            default_target = DEFAULT_TYPE_MAPPING[profile_name].lower()
+            if default_target in type_name_map:
+                return type_name_map[default_target], 'default'
+            type_name = self._first_containing(default_target)
+            if type_name is not None:
+                return type_name_map[type_name], 'default_contains'
+
+        # 5. Similar CFS profile (e.g. generator uses 362-series, Revit has 350/600)
+        cfs_match, cfs_quality = self._find_similar_cfs_profile(profile_name)
+        if cfs_match:
+            return cfs_match, cfs_quality
+
+        # 6. Fallback to first available type
+        return self._revit_types[0], 'fallback'
+
+    def _first_containing(self, needle: str) -> Optional[str]:
+        """Return the first type name (in map order) containing needle."""
+        if len(needle) < _NGRAM_SIZE:
+            for type_name in self._ordered_names:
+                if needle in type_name:
+                    return type_name
+            return None
+
+        candidates: Optional[Set[int]] = None
+        for gram in _ngrams(needle):
+            postings = self._ngram_index.get(gram)
+            if not postings:
+                return None
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return None
+
+        for position in sorted(candidates):
+            type_name = self._ordered_names[position]
+            if needle in type_name:
+                return type_name
+        return None
+
+    def _find_similar_cfs_profile(self, profile_name: str) -> Tuple[Any, Optional[str]]:
+        """
+        Find a similar CFS profile when exact match isn't available.
+
+        Matching priority:
+        1. Same profile type (S/T), same gauge - prefer same flange, then closest series
+        2. Same profile type, any gauge
+        3. Any CFS profile (last resort within CFS family)
+
+        Returns:
+            Tuple of (matched_type, match_quality) or (None, None)
+        """
+        source = parse_cfs_profile_name(profile_name)
+        if not source or not self._cfs_types:
+            return None, None
+
+        # Priority 1: Same type (S/T), same gauge, prefer similar series
+        best = None
+        for type_name, rt, parsed in self._cfs_types:
+            if parsed["type"] == source["type"] and parsed["gauge"] == source["gauge"]:
+                series_diff = abs(int(parsed["series"]) - int(source["series"]))
+                flange_match = 1 if parsed["flange"] == source["flange"] else 0
+                # Score: prefer same flange, then closer series
+                key = ((flange_match * 1000) + (1000 - series_diff), type_name)
+                if best is None or key > best[0]:
+                    best = (key, rt)
+        if best is not None:
+            logger.debug(f"CFS similar match: '{profile_name}' -> '{best[0][1]}'")
+            return best[1], 'cfs_similar'
+
+        # Priority 2: Same type (S/T), any gauge - for when gauge differs
+        for type_name, rt, parsed in self._cfs_types:
+            if parsed["type"] == source["type"]:
+                return rt, 'cfs_type_match'
+
+        # Priority 3: Any CFS type at all
+        return self._cfs_types[0][1], 'cfs_fallback'
+
+
+def find_matching_revit_type(
+    profile_name: str,
+    revit_types: List[Any],
+    user_mapping: Optional[Dict[str, str]] = None,
+) -> Tuple[Any, Optional[str]]:
+    """
+    Find a matching Revit type for a single profile name.
+
+    Convenience wrapper for one-off lookups; build a :class:`TypeMatcher`
+    once when resolving many elements against the same type list.
+
+    Args:
+        profile_name: Profile name from framing element (e.g., "2x4")
+        revit_types: List of available Revit family types
+        user_mapping: Optional dict of profile_name -> revit_type_name
+
+    Returns:
+        Tuple of (matched_type, match_quality)
+    """
+    return TypeMatcher(revit_types, user_mapping).match(profile_name)
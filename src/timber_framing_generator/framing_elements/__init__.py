@@ -1,14 +1,27 @@
 # src/framing_elements/__init__.py
 
-from .plates import create_plates
-from .studs import calculate_stud_locations, generate_stud
-from .framing_generator import FramingGenerator
-from .studs import StudGenerator
-from .location_data import get_plate_location_data
+from ..utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "create_plates": ".plates",
+    "calculate_stud_locations": ".studs",
+    "generate_stud": ".studs",
+    "FramingGenerator": ".framing_generator",
+    "StudGenerator": ".studs",
+    "get_plate_location_data": ".location_data",
+    "BlockingPlan": ".blocking_planner",
+    "plan_row_blocking": ".blocking_planner",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     "create_plates",
     "calculate_stud_locations",
     "generate_stud",
-    "FramingGenerator" "StudGenerator",
+    "FramingGenerator",
+    "StudGenerator",
+    "BlockingPlan",
+    "plan_row_blocking",
 ]
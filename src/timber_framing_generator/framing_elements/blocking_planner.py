@@ -0,0 +1,391 @@
+# File: src/timber_framing_generator/framing_elements/blocking_planner.py
+
+"""
+Data-first row blocking planner.
+
+Row blocking only depends on where the vertical members sit along the wall
+(their u-coordinates), the cell bounds and the block heights. This module
+derives block placements from that data alone - no Rhino geometry - and
+returns them as columnar centerline data. Brep creation is left to the
+caller (RowBlockingGenerator for legacy Brep output, or the geometry
+converter via FramingElement centerlines).
+
+Pipeline:
+    1. calculate_block_heights()      wall height -> row heights
+    2. assign_vertical_positions()    member u-coordinates -> positions per cell
+    3. plan_row_blocking()            positions per cell -> BlockingPlan
+
+Cell stud positions use the same dictionary format as
+RowBlockingGenerator.stud_positions:
+    {cell_id: {'positions': [u, ...], 'v_start': v0, 'v_end': v1, 'cell_type': 'SC'}}
+A bare list of positions is also accepted (treated as a full-height SC cell).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.timber_framing_generator.config.framing import BlockingPattern
+from src.timber_framing_generator.core.material_system import (
+    ElementProfile,
+    ElementType,
+    FramingElement,
+)
+from src.timber_framing_generator.utils.wall_frame import wall_frame
+
+Vec3 = Tuple[float, float, float]
+
+# Placement tolerances (feet), matching RowBlockingGenerator
+CELL_MEMBER_TOLERANCE = 0.1    # Stud/cripple inside cell bounds
+CELL_EDGE_TOLERANCE = 0.3      # King stud/trimmer at a cell edge (~3.6")
+DUPLICATE_TOLERANCE = 0.1      # Positions closer than this are the same member
+MIN_BAY_WIDTH = 0.5            # Minimum 6" between studs to place a block
+DEFAULT_STUD_WIDTH = 1.5 / 12  # Subtracted from the bay to get block length
+
+
+@dataclass
+class BlockingPlan:
+    """
+    Row blocking placements in wall-local coordinates.
+
+    Columnar: entry ``i`` of every list describes one block. The block runs
+    along the wall from ``u_starts[i]`` to ``u_ends[i]`` with its centerline
+    at height ``heights[i]`` above the wall base.
+
+    Attributes:
+        cell_ids: Cell the block belongs to
+        u_starts: Block start along the wall
+        u_ends: Block end along the wall
+        heights: Centerline height above the wall base
+    """
+    cell_ids: List[str] = field(default_factory=list)
+    u_starts: List[float] = field(default_factory=list)
+    u_ends: List[float] = field(default_factory=list)
+    heights: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.cell_ids)
+
+    @property
+    def lengths(self) -> List[float]:
+        """Block lengths."""
+        return [end - start for start, end in zip(self.u_starts, self.u_ends)]
+
+    @property
+    def u_centers(self) -> List[float]:
+        """Block midpoints along the wall."""
+        return [(start + end) / 2 for start, end in zip(self.u_starts, self.u_ends)]
+
+    def centerlines(self, base_plane: Any) -> Tuple[List[Vec3], List[Vec3]]:
+        """
+        Map block centerlines to world coordinates.
+
+        Points come from the wall's shared ``utils.wall_frame`` frame.
+
+        Args:
+            base_plane: Wall base plane - an rg.Plane or the JSON dict form
+                ({origin, x_axis, y_axis}); X runs along the wall, Y up it
+
+        Returns:
+            Tuple of (start points, end points) as (x, y, z) tuples
+        """
+        frame = wall_frame(base_plane)
+        starts = frame.to_world(zip(self.u_starts, self.heights))
+        ends = frame.to_world(zip(self.u_ends, self.heights))
+        return starts, ends
+
+    def to_framing_elements(
+        self,
+        base_plane: Any,
+        profile: ElementProfile,
+        id_prefix: str = "blocking",
+        element_type: ElementType = ElementType.ROW_BLOCKING,
+        wall_id: Optional[str] = None,
+    ) -> List[FramingElement]:
+        """
+        Convert the plan to FramingElements (centerline data, no geometry).
+
+        Args:
+            base_plane: Wall base plane (rg.Plane or JSON dict)
+            profile: Blocking profile
+            id_prefix: Element id prefix; ids are ``{prefix}_{i}``
+            element_type: Element type to assign
+            wall_id: Wall identifier stored in metadata
+
+        Returns:
+            List of FramingElement, one per block
+        """
+        starts, ends = self.centerlines(base_plane)
+        half = profile.width / 2
+        elements = []
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            center_z = (start[2] + end[2]) / 2
+            elements.append(FramingElement(
+                id=f"{id_prefix}_{i}",
+                element_type=element_type,
+                profile=profile,
+                centerline_start=start,
+                centerline_end=end,
+                u_coord=(self.u_starts[i] + self.u_ends[i]) / 2,
+                v_start=center_z - half,
+                v_end=center_z + half,
+                cell_id=self.cell_ids[i],
+                metadata={"wall_id": wall_id},
+            ))
+        return elements
+
+
+def calculate_block_heights(
+    wall_height: float,
+    first_block_height: Optional[float],
+    block_spacing: float,
+) -> List[float]:
+    """
+    Calculate row blocking heights above the wall base.
+
+    The first row sits at ``first_block_height``; further rows follow every
+    ``block_spacing`` while they fit. Without a first height, rows go at
+    1/3 and 2/3 of the wall height.
+
+    Args:
+        wall_height: Wall height in feet
+        first_block_height: Height of the first row in feet
+        block_spacing: Vertical spacing between rows in feet
+
+    Returns:
+        List of row heights
+    """
+    if not first_block_height:
+        return [wall_height / 3, 2 * wall_height / 3]
+
+    heights = [first_block_height]
+    remaining_height = wall_height - first_block_height
+    if block_spacing and remaining_height > block_spacing:
+        for i in range(int(remaining_height / block_spacing)):
+            heights.append(first_block_height + block_spacing * (i + 1))
+    return heights
+
+
+def assign_vertical_positions(
+    cells: Sequence[Dict[str, Any]],
+    wall_height: float,
+    stud_positions: Iterable[float] = (),
+    king_stud_positions: Iterable[float] = (),
+    trimmer_positions: Iterable[float] = (),
+    header_cripple_positions: Iterable[float] = (),
+    sill_cripple_positions: Iterable[float] = (),
+    cell_positions: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Assign vertical member u-coordinates to the cells they bound.
+
+    Rules (same as RowBlockingGenerator):
+    - Studs go to the first SC cell containing them (within 0.1')
+    - King studs go to every SC cell whose start or end edge they sit on
+    - Trimmers go to every SCC cell whose start or end edge they sit on
+    - Header cripples go to every HCC cell containing them
+    - Sill cripples go to every SCC cell containing them
+    King studs and trimmers are skipped when a member is already recorded
+    at (nearly) the same position.
+
+    Args:
+        cells: Cell dicts with id/cell_id, cell_type/type, u_start, u_end,
+            v_start and v_end
+        wall_height: Wall height, default v_end for cells lacking one
+        stud_positions: Standard stud u-coordinates
+        king_stud_positions: King stud u-coordinates
+        trimmer_positions: Trimmer u-coordinates
+        header_cripple_positions: Header cripple u-coordinates
+        sill_cripple_positions: Sill cripple u-coordinates
+        cell_positions: Existing positions dict to extend (modified in place)
+
+    Returns:
+        Positions dict keyed by cell id
+    """
+    result: Dict[str, Dict[str, Any]] = cell_positions if cell_positions is not None else {}
+
+    by_type: Dict[str, List[Tuple[str, float, float, Dict[str, Any]]]] = {}
+    for cell in cells:
+        cell_type = cell.get("cell_type", cell.get("type", ""))
+        cell_id = cell.get("id", cell.get("cell_id", ""))
+        by_type.setdefault(cell_type, []).append(
+            (cell_id, cell.get("u_start", 0), cell.get("u_end", 0), cell)
+        )
+
+    def entry(cell_id: str, cell_type: str, cell: Dict[str, Any]) -> Dict[str, Any]:
+        if cell_id not in result:
+            result[cell_id] = {
+                'positions': [],
+                'v_start': cell.get("v_start", 0),
+                'v_end': cell.get("v_end", wall_height),
+                'cell_type': cell_type,
+            }
+        return result[cell_id]
+
+    def add_inside(positions: Iterable[float], cell_type: str, first_only: bool) -> None:
+        candidates = by_type.get(cell_type, [])
+        for u in positions:
+            for cell_id, u_start, u_end, cell in candidates:
+                if u_start - CELL_MEMBER_TOLERANCE <= u <= u_end + CELL_MEMBER_TOLERANCE:
+                    entry(cell_id, cell_type, cell)['positions'].append(u)
+                    if first_only:
+                        break
+
+    def add_at_edges(positions: Iterable[float], cell_type: str) -> None:
+        candidates = by_type.get(cell_type, [])
+        for u in positions:
+            for cell_id, u_start, u_end, cell in candidates:
+                if (abs(u - u_start) < CELL_EDGE_TOLERANCE
+                        or abs(u - u_end) < CELL_EDGE_TOLERANCE):
+                    existing = entry(cell_id, cell_type, cell)['positions']
+                    if not any(abs(u - p) < DUPLICATE_TOLERANCE for p in existing):
+                        existing.append(u)
+
+    add_inside(stud_positions, "SC", first_only=True)
+    add_at_edges(king_stud_positions, "SC")
+    add_at_edges(trimmer_positions, "SCC")
+    add_inside(header_cripple_positions, "HCC", first_only=False)
+    add_inside(sill_cripple_positions, "SCC", first_only=False)
+    return result
+
+
+def plan_row_blocking(
+    cell_positions: Dict[str, Any],
+    block_heights: Sequence[float],
+    block_width: float,
+    pattern: BlockingPattern = BlockingPattern.INLINE,
+    wall_height: Optional[float] = None,
+    stud_width: float = DEFAULT_STUD_WIDTH,
+    stagger_offset: Optional[float] = None,
+) -> BlockingPlan:
+    """
+    Plan row blocking between adjacent vertical members in every cell.
+
+    For each cell, positions are sorted and every bay at least 6" wide gets
+    one block per row height that lies inside the cell (with a half block
+    margin at the cell's top and bottom). Block length is the bay minus one
+    stud width.
+
+    INLINE keeps every bay at the row height. STAGGERED shifts every other
+    bay in a cell by ``stagger_offset`` (default: one block width) so both
+    block ends can be face-nailed through the shared stud; if the shifted
+    block would leave the cell, it is shifted the other way instead, and
+    left at the row height if neither fits.
+
+    Args:
+        cell_positions: Positions per cell (see module docstring)
+        block_heights: Row heights above the wall base
+        block_width: Vertical dimension of a block
+        pattern: BlockingPattern.INLINE or BlockingPattern.STAGGERED
+        wall_height: Default v_end for list-format cells
+        stud_width: Stud width subtracted from each bay
+        stagger_offset: Vertical offset for STAGGERED bays
+
+    Returns:
+        BlockingPlan with one entry per block
+    """
+    plan = BlockingPlan()
+    margin = block_width / 2
+    staggered = pattern == BlockingPattern.STAGGERED
+    offset = block_width if stagger_offset is None else stagger_offset
+    half_stud = stud_width / 2
+
+    for cell_id, cell_data in cell_positions.items():
+        if isinstance(cell_data, dict):
+            raw_positions = cell_data.get('positions', [])
+            v_start = cell_data.get('v_start', 0)
+            v_end = cell_data.get('v_end', wall_height)
+        else:
+            raw_positions = cell_data
+            v_start = 0
+            v_end = wall_height
+        if v_end is None:
+            v_end = max(block_heights, default=0.0) + block_width
+
+        positions = sorted(_to_floats(raw_positions))
+        if len(positions) < 2:
+            continue
+
+        low, high = v_start + margin, v_end - margin
+        rows = [h for h in block_heights if low < h < high]
+        if not rows:
+            continue
+
+        bays = [
+            (left, right) for left, right in zip(positions, positions[1:])
+            if right - left >= MIN_BAY_WIDTH
+        ]
+        for bay_index, (left, right) in enumerate(bays):
+            u0, u1 = left + half_stud, right - half_stud
+            shift = staggered and bay_index % 2 == 1
+            for h in rows:
+                if shift:
+                    if low < h + offset < high:
+                        h = h + offset
+                    elif low < h - offset < high:
+                        h = h - offset
+                plan.cell_ids.append(cell_id)
+                plan.u_starts.append(u0)
+                plan.u_ends.append(u1)
+                plan.heights.append(h)
+
+    return plan
+
+
+def _to_floats(values: Iterable[Any]) -> List[float]:
+    """Convert positions (floats or numeric strings) to floats, skipping bad ones."""
+    result = []
+    for value in values:
+        try:
+            result.append(float(value))
+        except (ValueError, TypeError):
+            continue
+    return result
+
+
+def plan_blocking_from_members(
+    cells: Sequence[Dict[str, Any]],
+    members: Iterable[FramingElement],
+    wall_height: float,
+    block_width: float,
+    block_heights: Sequence[float],
+    pattern: BlockingPattern = BlockingPattern.INLINE,
+    stud_width: float = DEFAULT_STUD_WIDTH,
+    include_trimmers: bool = False,
+) -> BlockingPlan:
+    """
+    Plan row blocking from already generated vertical FramingElements.
+
+    Member u-coordinates come straight from ``FramingElement.u_coord``, so
+    no geometry is inspected.
+
+    Args:
+        cells: Cell dicts for the wall (or panel)
+        members: Existing framing elements; only studs, king studs,
+            trimmers and cripples are used
+        wall_height: Wall height in feet
+        block_width: Vertical dimension of a block
+        block_heights: Row heights above the wall base
+        pattern: Blocking pattern
+        stud_width: Stud width subtracted from each bay
+        include_trimmers: Also use trimmers as SCC cell edges
+
+    Returns:
+        BlockingPlan
+    """
+    u_by_type: Dict[ElementType, List[float]] = {}
+    for member in members:
+        u_by_type.setdefault(member.element_type, []).append(member.u_coord)
+
+    positions = assign_vertical_positions(
+        cells,
+        wall_height,
+        stud_positions=u_by_type.get(ElementType.STUD, []),
+        king_stud_positions=u_by_type.get(ElementType.KING_STUD, []),
+        trimmer_positions=u_by_type.get(ElementType.TRIMMER, []) if include_trimmers else [],
+        header_cripple_positions=u_by_type.get(ElementType.HEADER_CRIPPLE, []),
+        sill_cripple_positions=u_by_type.get(ElementType.SILL_CRIPPLE, []),
+    )
+    return plan_row_blocking(
+        positions, block_heights, block_width, pattern,
+        wall_height=wall_height, stud_width=stud_width,
+    )
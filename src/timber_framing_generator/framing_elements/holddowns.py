@@ -25,6 +25,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+from src.timber_framing_generator.utils.wall_frame import wall_frame
+
 # Handle Rhino import
 try:
     import Rhino.Geometry as rg
@@ -246,27 +248,26 @@ def _generate_panelized_holddowns(
         # Left holddown for this panel
         if i == 0:
             # First panel: left end of wall
-            left_u = panel_u_start + offset_from_end
             position = HolddownPosition.LEFT
         else:
             # Interior panel: splice point
-            if not include_splices:
-                continue
-            left_u = panel_u_start + offset_from_end
             position = HolddownPosition.SPLICE
 
-        left_point = _calculate_point(base_plane, left_u, base_elevation)
-        holddowns.append(HolddownLocation(
-            id=f"{wall_id}_{panel_id}_holddown_left",
-            wall_id=wall_id,
-            panel_id=panel_id,
-            position=position,
-            point=left_point,
-            u_coordinate=left_u,
-            elevation=base_elevation,
-            stud_width=stud_width,
-            is_load_bearing=is_load_bearing,
-        ))
+        # Skipped splices must not skip the last panel's right holddown
+        if i == 0 or include_splices:
+            left_u = panel_u_start + offset_from_end
+            left_point = _calculate_point(base_plane, left_u, base_elevation)
+            holddowns.append(HolddownLocation(
+                id=f"{wall_id}_{panel_id}_holddown_left",
+                wall_id=wall_id,
+                panel_id=panel_id,
+                position=position,
+                point=left_point,
+                u_coordinate=left_u,
+                elevation=base_elevation,
+                stud_width=stud_width,
+                is_load_bearing=is_load_bearing,
+            ))
 
         # Right holddown for last panel only (to avoid duplicates at splices)
         if i == len(sorted_panels) - 1:
@@ -297,27 +298,20 @@ def _calculate_point(base_plane: Any, u_coordinate: float, elevation: float) ->
         elevation: Vertical position (feet)
 
     Returns:
-        Point3d if Rhino available, tuple otherwise
+        Point3d for a RhinoCommon plane, (x, y, z) tuple otherwise
     """
     if base_plane is None:
         # No plane available, return simple tuple
         return (u_coordinate, 0, elevation)
 
+    # u = along wall (XAxis), v = vertical (YAxis = World Z in our
+    # convention), w = 0 at the wall centerline. Elevation is absolute,
+    # so v is measured from the plane origin.
+    frame = wall_frame(base_plane)
+    point = frame.to_world_point(u_coordinate, elevation - frame.origin[2], 0.0)
     if RHINO_AVAILABLE and hasattr(base_plane, 'PointAt'):
-        # Use Plane.PointAt(u, v, w) where:
-        # u = along wall (XAxis)
-        # v = vertical (YAxis = World Z in our convention)
-        # w = through wall (ZAxis = wall normal)
-        # For holddowns, we want the point at wall centerline (w=0)
-        # and at the bottom plate level (v from elevation)
-
-        # Note: elevation is absolute, origin.Z is also absolute
-        # We need v relative to the origin
-        v_relative = elevation - base_plane.Origin.Z
-        return base_plane.PointAt(u_coordinate, v_relative, 0)
-    else:
-        # Fallback for non-Rhino environment
-        return (u_coordinate, 0, elevation)
+        return rg.Point3d(*point)
+    return point
 
 
 def get_holddown_summary(holddowns: List[HolddownLocation]) -> Dict[str, Any]:
@@ -16,6 +16,7 @@ from typing import Dict, List, Any, Optional, Tuple
 import math
 import Rhino.Geometry as rg
 from src.timber_framing_generator.utils.safe_rhino import safe_get_length, safe_get_bounding_box
+from src.timber_framing_generator.utils.wall_frame import to_point3d, wall_frame
 
 from src.timber_framing_generator.config.framing import (
     FRAMING_PARAMS,
@@ -28,6 +29,11 @@ from src.timber_framing_generator.framing_elements.blocking_parameters import (
     BlockingParameters,
     BlockingLayerConfig
 )
+from src.timber_framing_generator.framing_elements.blocking_planner import (
+    assign_vertical_positions,
+    calculate_block_heights,
+    plan_row_blocking,
+)
 
 
 class RowBlockingGenerator:
@@ -219,308 +225,61 @@ class RowBlockingGenerator:
         # Uses wall_data config if available (for material-specific dimensions)
         stud_width = get_framing_param("stud_width", self.wall_data, 1.5 / 12)  # Default to 1.5 inches in feet
 
-        # Store all generated blocks
-        all_blocks = []
-
-        # First, process regular studs and assign them to SC cells
-        # This is the PRIMARY source of blocking positions
-        print("\nProcessing regular studs:")
-        regular_stud_count = len(self.studs)
-        print(f"Total regular studs found: {regular_stud_count}")
-
-        for i, stud in enumerate(self.studs):
-            try:
-                # Get the bounding box of the stud
-                bbox = safe_get_bounding_box(stud, True)
-                if not bbox:
-                    print(f"  Stud {i+1}: Could not get bounding box")
-                    continue
-
-                # Use CENTER of bounding box for accurate stud position
-                # Using Min would give left edge, shifting blocking left by half stud width
-                center_pt = bbox.Center
-
-                # Get the u-coordinate (position along wall length)
-                u_coord = self._project_point_to_u_coordinate(center_pt, base_plane)
-
-                # Find the SC cell this stud belongs to
-                assigned = False
-                for cell in cells:
-                    # Try both "id" and "cell_id" keys (JSON uses "id", internal uses "cell_id")
-                    cell_id = cell.get("id", cell.get("cell_id", ""))
-                    cell_type = cell.get("cell_type", cell.get("type", ""))
-
-                    # Only process Stud Cells (SC)
-                    if cell_type != "SC":
-                        continue
-
-                    # Get cell bounds directly from cell data
-                    u_start = cell.get("u_start", 0)
-                    u_end = cell.get("u_end", 0)
-
-                    # Check if stud position is within cell bounds with a small tolerance
-                    if u_start - 0.1 <= u_coord <= u_end + 0.1:
-                        # Initialize the dict for this cell if not already done
-                        # Store both positions AND vertical bounds for filtering block heights
-                        if cell_id not in self.stud_positions:
-                            v_start = cell.get("v_start", 0)
-                            v_end = cell.get("v_end", self.wall_top_elevation - self.wall_base_elevation)
-                            self.stud_positions[cell_id] = {
-                                'positions': [],
-                                'v_start': v_start,
-                                'v_end': v_end,
-                                'cell_type': cell_type
-                            }
-
-                        # Add the stud position to this cell
-                        self.stud_positions[cell_id]['positions'].append(u_coord)
-                        assigned = True
-                        break  # Each stud belongs to one cell
-
-                if not assigned:
-                    # Stud might be a king stud or trimmer at cell boundary - skip silently
-                    pass
-            except Exception as e:
-                print(f"  Error processing stud {i+1}: {str(e)}")
-
-        # Also process king studs (they define cell boundaries)
-        print("\nProcessing king studs:")
-        king_stud_count = len(self.king_studs)
-        print(f"Total king studs found: {king_stud_count}")
-
-        for i, stud in enumerate(self.king_studs):
-            try:
-                bbox = safe_get_bounding_box(stud, True)
-                if not bbox:
-                    print(f"  King stud {i+1}: Could not get bounding box")
-                    continue
-
-                # Use center of bounding box for more accurate position
-                center_pt = bbox.Center
-                u_coord = self._project_point_to_u_coordinate(center_pt, base_plane)
-                print(f"  King stud {i+1}: u_coord={u_coord:.4f}")
-
-                # King studs are at SC cell boundaries - add to adjacent SC cells
-                for cell in cells:
-                    # Try both "id" and "cell_id" keys
-                    cell_id = cell.get("id", cell.get("cell_id", ""))
-                    cell_type = cell.get("cell_type", cell.get("type", ""))
-
-                    if cell_type != "SC":
-                        continue
-
-                    u_start = cell.get("u_start", 0)
-                    u_end = cell.get("u_end", 0)
-
-                    # King studs are at boundaries - use larger tolerance for edge matching
-                    # Account for stud width (0.125 ft = 1.5 inches)
-                    tolerance = 0.3  # ~3.6 inches tolerance
-                    at_start = abs(u_coord - u_start) < tolerance
-                    at_end = abs(u_coord - u_end) < tolerance
-
-                    if at_start or at_end:
-                        if cell_id not in self.stud_positions:
-                            v_start = cell.get("v_start", 0)
-                            v_end = cell.get("v_end", self.wall_top_elevation - self.wall_base_elevation)
-                            self.stud_positions[cell_id] = {
-                                'positions': [],
-                                'v_start': v_start,
-                                'v_end': v_end,
-                                'cell_type': cell_type
-                            }
-                        # Check if position is not already in list (with tolerance)
-                        already_exists = any(abs(u_coord - pos) < 0.1 for pos in self.stud_positions[cell_id]['positions'])
-                        if not already_exists:
-                            self.stud_positions[cell_id]['positions'].append(u_coord)
-                            edge = "start" if at_start else "end"
-                            print(f"    Added king stud to {cell_id} at {edge} edge")
-            except Exception as e:
-                print(f"  Error processing king stud {i+1}: {str(e)}")
-
-        # Process trimmers (they define SCC cell boundaries)
-        print("\nProcessing trimmers:")
-        trimmer_count = len(self.trimmers)
-        print(f"Total trimmers found: {trimmer_count}")
-
-        for i, trimmer in enumerate(self.trimmers):
-            try:
-                bbox = safe_get_bounding_box(trimmer, True)
-                if not bbox:
-                    print(f"  Trimmer {i+1}: Could not get bounding box")
-                    continue
-
-                # Use center of bounding box for position
-                center_pt = bbox.Center
-                u_coord = self._project_point_to_u_coordinate(center_pt, base_plane)
-                print(f"  Trimmer {i+1}: u_coord={u_coord:.4f}")
-
-                # Trimmers are at SCC cell boundaries - add to SCC cells
-                for cell in cells:
-                    cell_id = cell.get("id", cell.get("cell_id", ""))
-                    cell_type = cell.get("cell_type", cell.get("type", ""))
-
-                    if cell_type != "SCC":
-                        continue
-
-                    u_start = cell.get("u_start", 0)
-                    u_end = cell.get("u_end", 0)
+        # Member u-coordinates, one bounding box per Brep
+        wall_height = self.wall_top_elevation - self.wall_base_elevation
+        member_positions = {
+            "studs": self._member_u_coordinates(self.studs, base_plane),
+            "king studs": self._member_u_coordinates(self.king_studs, base_plane),
+            "trimmers": self._member_u_coordinates(self.trimmers, base_plane),
+            "header cripples": self._member_u_coordinates(self.header_cripples, base_plane),
+            "sill cripples": self._member_u_coordinates(self.sill_cripples, base_plane),
+        }
+        for name, positions in member_positions.items():
+            print(f"Total {name} found: {len(positions)}")
+
+        # Assign members to the cells they bound
+        assign_vertical_positions(
+            cells,
+            wall_height,
+            stud_positions=member_positions["studs"],
+            king_stud_positions=member_positions["king studs"],
+            trimmer_positions=member_positions["trimmers"],
+            header_cripple_positions=member_positions["header cripples"],
+            sill_cripple_positions=member_positions["sill cripples"],
+            cell_positions=self.stud_positions,
+        )
+        print(f"Total cells with stud positions: {len(self.stud_positions)}")
 
-                    # Check if trimmer is at this cell's edges
-                    tolerance = 0.3
-                    at_start = abs(u_coord - u_start) < tolerance
-                    at_end = abs(u_coord - u_end) < tolerance
+        # Generate and return the blocking elements
+        all_blocks = self._generate_row_blocking(self.stud_positions, block_width, block_thickness, base_plane)
+        print(f"Total blocks created: {len(all_blocks)}")
+        print("===== END ROW BLOCKING DIAGNOSTIC INFO =====")
+        return all_blocks
 
-                    if at_start or at_end:
-                        if cell_id not in self.stud_positions:
-                            v_start = cell.get("v_start", 0)
-                            v_end = cell.get("v_end", self.wall_top_elevation - self.wall_base_elevation)
-                            self.stud_positions[cell_id] = {
-                                'positions': [],
-                                'v_start': v_start,
-                                'v_end': v_end,
-                                'cell_type': cell_type
-                            }
-                        # Check if position is not already in list (with tolerance)
-                        already_exists = any(abs(u_coord - pos) < 0.1 for pos in self.stud_positions[cell_id]['positions'])
-                        if not already_exists:
-                            self.stud_positions[cell_id]['positions'].append(u_coord)
-                            edge = "start" if at_start else "end"
-                            print(f"    Added trimmer to {cell_id} at {edge} edge")
-            except Exception as e:
-                print(f"  Error processing trimmer {i+1}: {str(e)}")
+    def _member_u_coordinates(self, members: List[Any], base_plane: rg.Plane) -> List[float]:
+        """
+        Get the u-coordinate of each member Brep's bounding box center.
 
-        print(f"\nAfter processing regular and king studs: {len(self.stud_positions)} cells with stud positions")
-        for cell_id, cell_data in self.stud_positions.items():
-            positions = cell_data['positions']
-            v_start = cell_data['v_start']
-            v_end = cell_data['v_end']
-            print(f"  Cell {cell_id}: {len(positions)} studs, v_range=[{v_start:.2f}, {v_end:.2f}]")
+        Args:
+            members: Member Breps
+            base_plane: Wall base plane
 
-        # Process header cripples and assign them to cells
-        print("\nProcessing header cripples:")
-        header_cripple_count = len(self.header_cripples)
-        print(f"Total header cripples found: {header_cripple_count}")
-        
-        for i, cripple in enumerate(self.header_cripples):
+        Returns:
+            U coordinates of the members that have a bounding box
+        """
+        positions = []
+        for i, member in enumerate(members):
             try:
-                # Get the bounding box of the cripple
-                bbox = safe_get_bounding_box(cripple, True)
+                bbox = safe_get_bounding_box(member, True)
                 if not bbox:
-                    print(f"  Header Cripple {i+1}: Could not get bounding box")
+                    print(f"  Member {i+1}: Could not get bounding box")
                     continue
-
-                # Use CENTER for accurate position (not Min which gives left edge)
-                center_pt = bbox.Center
-
-                # Get the u-coordinate (position along wall length)
-                u_coord = self._project_point_to_u_coordinate(center_pt, base_plane)
-                print(f"  Header Cripple {i+1}: u-coordinate = {u_coord:.4f}, height: {center_pt.Z:.4f}")
-                
-                # Find the HCC cell this cripple belongs to
-                assigned = False
-                for cell in cells:
-                    # Try both "id" and "cell_id" keys
-                    cell_id = cell.get("id", cell.get("cell_id", ""))
-                    cell_type = cell.get("cell_type", cell.get("type", ""))
-                    
-                    # Only process HeaderCrippleCells
-                    if cell_type != "HCC":
-                        continue
-                        
-                    # Get cell bounds directly from cell data
-                    u_start = cell.get("u_start", 0)
-                    u_end = cell.get("u_end", 0)
-                    
-                    # Check if cripple position is within cell bounds with a small tolerance
-                    if u_start - 0.1 <= u_coord <= u_end + 0.1:
-                        # Initialize the dict for this cell if not already done
-                        if cell_id not in self.stud_positions:
-                            v_start = cell.get("v_start", 0)
-                            v_end = cell.get("v_end", self.wall_top_elevation - self.wall_base_elevation)
-                            self.stud_positions[cell_id] = {
-                                'positions': [],
-                                'v_start': v_start,
-                                'v_end': v_end,
-                                'cell_type': cell_type
-                            }
-
-                        # Add the cripple position to this cell
-                        self.stud_positions[cell_id]['positions'].append(u_coord)
-                        print(f"    Assigned header cripple at position {u_coord:.4f} to cell {cell_id} (u_start={u_start}, u_end={u_end})")
-                        assigned = True
-                
-                if not assigned:
-                    print(f"    WARNING: Could not assign header cripple at position {u_coord:.4f} to any HCC cell")
+                # Use CENTER for accurate position (Min would give the left edge)
+                positions.append(self._project_point_to_u_coordinate(bbox.Center, base_plane))
             except Exception as e:
-                print(f"  Error processing header cripple {i+1}: {str(e)}")
-        
-        # Process sill cripples and assign them to cells
-        print("\nProcessing sill cripples:")
-        sill_cripple_count = len(self.sill_cripples)
-        print(f"Total sill cripples found: {sill_cripple_count}")
-        
-        for i, cripple in enumerate(self.sill_cripples):
-            try:
-                # Get the bounding box of the cripple
-                bbox = safe_get_bounding_box(cripple, True)
-                if not bbox:
-                    print(f"  Sill Cripple {i+1}: Could not get bounding box")
-                    continue
-
-                # Use CENTER for accurate position (not Min which gives left edge)
-                center_pt = bbox.Center
-
-                # Get the u-coordinate (position along wall length)
-                u_coord = self._project_point_to_u_coordinate(center_pt, base_plane)
-                print(f"  Sill Cripple {i+1}: u-coordinate = {u_coord:.4f}, height: {center_pt.Z:.4f}")
-                
-                # Find the SCC cell this cripple belongs to
-                assigned = False
-                for cell in cells:
-                    # Try both "id" and "cell_id" keys
-                    cell_id = cell.get("id", cell.get("cell_id", ""))
-                    cell_type = cell.get("cell_type", cell.get("type", ""))
-                    
-                    # Only process SillCrippleCells
-                    if cell_type != "SCC":
-                        continue
-                        
-                    # Get cell bounds directly from cell data
-                    u_start = cell.get("u_start", 0)
-                    u_end = cell.get("u_end", 0)
-                    
-                    # Check if cripple position is within cell bounds with a small tolerance
-                    if u_start - 0.1 <= u_coord <= u_end + 0.1:
-                        # Initialize the dict for this cell if not already done
-                        if cell_id not in self.stud_positions:
-                            v_start = cell.get("v_start", 0)
-                            v_end = cell.get("v_end", self.wall_top_elevation - self.wall_base_elevation)
-                            self.stud_positions[cell_id] = {
-                                'positions': [],
-                                'v_start': v_start,
-                                'v_end': v_end,
-                                'cell_type': cell_type
-                            }
-
-                        # Add the cripple position to this cell
-                        self.stud_positions[cell_id]['positions'].append(u_coord)
-                        print(f"    Assigned sill cripple at position {u_coord:.4f} to cell {cell_id} (u_start={u_start}, u_end={u_end})")
-                        assigned = True
+                print(f"  Error processing member {i+1}: {str(e)}")
+        return positions
 
-                if not assigned:
-                    print(f"    WARNING: Could not assign sill cripple at position {u_coord:.4f} to any SCC cell")
-            except Exception as e:
-                print(f"  Error processing sill cripple {i+1}: {str(e)}")
-        
-        print("\nCompleted processing header and sill cripples")
-        print(f"Total cells with stud positions: {len(self.stud_positions)}")
-        
-        # Generate and return the blocking elements
-        all_blocks = self._generate_row_blocking(self.stud_positions, block_width, block_thickness, base_plane)
-        print(f"Total blocks created: {len(all_blocks)}")
-        print("===== END ROW BLOCKING DIAGNOSTIC INFO =====")
-        return all_blocks
-    
     def _project_point_to_u_coordinate(self, point: rg.Point3d, base_plane: rg.Plane) -> float:
         """
         Project a 3D point onto the wall base plane and get the U coordinate.
@@ -554,164 +313,7 @@ class RowBlockingGenerator:
                 print(f"Fallback also failed: {str(e2)}")
                 return 0.0
     
-    def _process_cripples(self, cells, hcc_cells, scc_cells):
-        """
-        Process header and sill cripples, assigning them to appropriate cells.
-        
-        Args:
-            cells: Dictionary of cells
-            hcc_cells: Output dictionary to store cells with header cripples
-            scc_cells: Output dictionary to store cells with sill cripples
-        """
-        print("\nProcessing header cripples:")
-        header_cripples_found = 0
-        
-        base_plane = self.wall_data.get('base_plane')
-        print(f"Base plane: Origin({base_plane.Origin.X:.4f}, {base_plane.Origin.Y:.4f}, {base_plane.Origin.Z:.4f})")
-        print(f"Base plane X-axis: ({base_plane.XAxis.X:.4f}, {base_plane.XAxis.Y:.4f}, {base_plane.XAxis.Z:.4f})")
-        print(f"Base plane Y-axis: ({base_plane.YAxis.X:.4f}, {base_plane.YAxis.Y:.4f}, {base_plane.YAxis.Z:.4f})")
-        
-        # Process header cripples
-        for hc in self.header_cripples:
-            header_cripples_found += 1
-            
-            # Get the u-coordinate and height range
-            try:
-                # For Brep objects, we need to extract the centerpoint
-                if isinstance(hc, rg.Brep):
-                    # Get the bounding box and use its center point
-                    bbox = safe_get_bounding_box(hc, True)
-                    hc_point = bbox.Center
-                    print(f"  HC{header_cripples_found} using bounding box center: ({hc_point.X:.4f}, {hc_point.Y:.4f}, {hc_point.Z:.4f})")
-                else:
-                    # Try to use centerline method if available
-                    if hasattr(hc, 'get_centerline_start_point'):
-                        hc_point = hc.get_centerline_start_point()
-                        print(f"  HC{header_cripples_found} using centerline start point")
-                    else:
-                        # Fallback to center of mass if neither available
-                        hc_point = rg.AreaMassProperties.Compute(hc).Centroid
-                        print(f"  HC{header_cripples_found} using centroid: ({hc_point.X:.4f}, {hc_point.Y:.4f}, {hc_point.Z:.4f})")
-            except Exception as e:
-                print(f"  Error getting point for header cripple: {str(e)}")
-                continue
-            
-            print(f"  HC{header_cripples_found} point: ({hc_point.X:.4f}, {hc_point.Y:.4f}, {hc_point.Z:.4f})")
-            
-            # Get the u-coordinate (position along wall length)
-            u_coord = self._project_point_to_u_coordinate(hc_point, base_plane)
-            print(f"  Header Cripple {header_cripples_found}: u-coordinate = {u_coord:.4f}, height range: {hc_point.Z:.4f} to {hc_point.Z:.4f}")
-            
-            # Find the HCC cell this cripple belongs to
-            found_cell = False
-            for cell_key, cell in cells.items():
-                if not cell_key.startswith("HCC_"):
-                    continue
-                    
-                # Extract u-range from cell key (format: HCC_start_end)
-                parts = cell_key.split("_")
-                if len(parts) >= 3:
-                    try:
-                        u_start = float(parts[1])
-                        u_end = float(parts[2])
-                        
-                        # Check if cripple is in this cell's range
-                        if u_start <= u_coord <= u_end:
-                            # Add the u-coordinate to the cell's vertical elements
-                            if 'vertical_elements' not in cell:
-                                cell['vertical_elements'] = []
-                            
-                            # Add as string to match format from framing generator
-                            u_str = f"{u_coord:.4f}"
-                            if u_str not in cell['vertical_elements']:
-                                cell['vertical_elements'].append(u_str)
-                                
-                            # Also add to HCC cells dictionary
-                            hcc_cells[cell_key] = cell
-                            found_cell = True
-                            
-                            print(f"    Assigned header cripple at position {u_coord:.4f} to cell {cell_key}")
-                    except (ValueError, IndexError):
-                        continue
-            
-            if not found_cell:
-                print(f"    WARNING: Could not assign header cripple at position {u_coord:.4f} to any HCC cell")
-        
-        print(f"Total header cripples found: {header_cripples_found}")
-        
-        # Process sill cripples
-        print("\nProcessing sill cripples:")
-        sill_cripples_found = 0
-        
-        for sc in self.sill_cripples:
-            sill_cripples_found += 1
-            
-            # Get the u-coordinate and height range
-            try:
-                # For Brep objects, we need to extract the centerpoint
-                if isinstance(sc, rg.Brep):
-                    # Get the bounding box and use its center point
-                    bbox = safe_get_bounding_box(sc, True)
-                    sc_point = bbox.Center
-                    print(f"  SC{sill_cripples_found} using bounding box center: ({sc_point.X:.4f}, {sc_point.Y:.4f}, {sc_point.Z:.4f})")
-                else:
-                    # Try to use centerline method if available
-                    if hasattr(sc, 'get_centerline_start_point'):
-                        sc_point = sc.get_centerline_start_point()
-                        print(f"  SC{sill_cripples_found} using centerline start point")
-                    else:
-                        # Fallback to center of mass if neither available
-                        sc_point = rg.AreaMassProperties.Compute(sc).Centroid
-                        print(f"  SC{sill_cripples_found} using centroid: ({sc_point.X:.4f}, {sc_point.Y:.4f}, {sc_point.Z:.4f})")
-            except Exception as e:
-                print(f"  Error getting point for sill cripple: {str(e)}")
-                continue
-            
-            print(f"  SC{sill_cripples_found} point: ({sc_point.X:.4f}, {sc_point.Y:.4f}, {sc_point.Z:.4f})")
-            
-            # Get the u-coordinate (position along wall length)
-            u_coord = self._project_point_to_u_coordinate(sc_point, base_plane)
-            print(f"  Sill Cripple {sill_cripples_found}: u-coordinate = {u_coord:.4f}, height range: {sc_point.Z:.4f} to {sc_point.Z:.4f}")
-            
-            # Find the SCC cell this cripple belongs to
-            found_cell = False
-            for cell_key, cell in cells.items():
-                if not cell_key.startswith("SCC_"):
-                    continue
-                    
-                # Extract u-range from cell key (format: SCC_start_end)
-                parts = cell_key.split("_")
-                if len(parts) >= 3:
-                    try:
-                        u_start = float(parts[1])
-                        u_end = float(parts[2])
-                        
-                        # Check if cripple is in this cell's range
-                        if u_start <= u_coord <= u_end:
-                            # Add the u-coordinate to the cell's vertical elements
-                            if 'vertical_elements' not in cell:
-                                cell['vertical_elements'] = []
-                            
-                            # Add as string to match format from framing generator
-                            u_str = f"{u_coord:.4f}"
-                            if u_str not in cell['vertical_elements']:
-                                cell['vertical_elements'].append(u_str)
-                                
-                            # Also add to SCC cells dictionary
-                            scc_cells[cell_key] = cell
-                            found_cell = True
-                            
-                            print(f"    Assigned sill cripple at position {u_coord:.4f} to cell {cell_key}")
-                    except (ValueError, IndexError):
-                        continue
-            
-            if not found_cell:
-                print(f"    WARNING: Could not assign sill cripple at position {u_coord:.4f} to any SCC cell")
-        
-        print(f"Total sill cripples found: {sill_cripples_found}")
-        print(f"Completed processing header and sill cripples")
-    
-    def _generate_row_blocking(self, cells, block_width, block_thickness, base_plane):
+    def _generate_row_blocking(self, cells, block_width, block_thickness, base_plane, pattern=None):
         """
         Generate row blocking elements for the given cells.
         
@@ -720,181 +322,62 @@ class RowBlockingGenerator:
             block_width: Width of blocking elements
             block_thickness: Thickness of blocking elements
             base_plane: Base plane of the wall
+            pattern: Blocking pattern (defaults to the configured pattern)
             
         Returns:
             List of row blocking Brep elements
         """
-        blocks = []
         include_blocking = self.blocking_params.include_blocking
         if not include_blocking:
             print("Blocking is disabled via parameters")
-            return blocks
+            return []
         
-        # Get blocking heights based on wall height
         wall_height = self.wall_top_elevation - self.wall_base_elevation
-        print(f"Wall height: {wall_height}")
-        print(f"Wall elevations: base={self.wall_base_elevation}, top={self.wall_top_elevation}")
-        
-        # Get block heights from pattern or calculate them
-        if self.blocking_params.first_block_height:
-            first_block_height = self.blocking_params.first_block_height
-            block_heights = [first_block_height]
-            
-            # If wall is higher than twice the first block height, add additional blocks
-            remaining_height = wall_height - first_block_height
-            spacing = self.blocking_params.block_spacing
-            
-            if remaining_height > spacing:
-                num_additional_blocks = int(remaining_height / spacing)
-                for i in range(num_additional_blocks):
-                    block_heights.append(first_block_height + spacing * (i + 1))
-        else:
-            # Default to 1/3 and 2/3 of wall height
-            block_heights = [wall_height / 3, 2 * wall_height / 3]
-        
-        print(f"Block profile dimensions: {{'thickness': {block_thickness}, 'width': {block_width}}}")
-        print(f"Block profile: 2x4, width: {block_width}, thickness: {block_thickness}")
+        block_heights = calculate_block_heights(
+            wall_height,
+            self.blocking_params.first_block_height,
+            self.blocking_params.block_spacing,
+        )
         print(f"Calculated block heights: {block_heights}")
         
-        # Process header and sill cripples
-        hcc_cells = {}
-        scc_cells = {}
-        self._process_cripples(cells, hcc_cells, scc_cells)
-        
-        # For each cell type, create blocks between studs
-        cells_with_studs = 0
-        for cell_key, cell_data in cells.items():
-            # Handle both old format (list) and new format (dict with 'positions')
-            if isinstance(cell_data, dict):
-                stud_positions = cell_data.get('positions', [])
-                cell_v_start = cell_data.get('v_start', 0)
-                cell_v_end = cell_data.get('v_end', wall_height)
-                cell_type = cell_data.get('cell_type', 'SC')
-            else:
-                # Old format: just a list of positions
-                stud_positions = cell_data
-                cell_v_start = 0
-                cell_v_end = wall_height
-                cell_type = 'SC'
-
-            # Skip cells without stud positions
-            if not stud_positions:
-                continue
-
-            print(f"Processing cell {cell_key} ({cell_type}) with {len(stud_positions)} vertical elements, v_range=[{cell_v_start:.2f}, {cell_v_end:.2f}]")
-            cells_with_studs += 1
-
-            # Filter block heights to only those within the cell's vertical bounds
-            # Add a small margin (half block width) to avoid blocks at exact boundaries
-            margin = block_width / 2
-            valid_block_heights = [
-                h for h in block_heights
-                if (cell_v_start + margin) < h < (cell_v_end - margin)
-            ]
-
-            if not valid_block_heights:
-                print(f"  No valid block heights within cell vertical bounds [{cell_v_start:.2f}, {cell_v_end:.2f}]")
-                continue
-
-            print(f"  Valid block heights for this cell: {valid_block_heights}")
-
-            # Create a cell dictionary with the required structure
-            cell_dict = {
-                'vertical_elements': stud_positions,
-                'cell_id': cell_key
-            }
-
-            blocks_in_cell = self._create_blocking_for_cell(
-                cell_dict,
-                valid_block_heights,  # Use filtered heights
-                block_thickness,
-                block_width,
-                base_plane
-            )
-            blocks.extend(blocks_in_cell)
-        
-        print(f"Total cells with stud positions: {cells_with_studs}")
-        print(f"Total blocks created: {len(blocks)}")
-        return blocks
+        plan = plan_row_blocking(
+            cells,
+            block_heights,
+            block_width,
+            pattern or self.blocking_params.pattern,
+            wall_height=wall_height,
+        )
+        print(f"Planned {len(plan)} blocks in {len(set(plan.cell_ids))} cells")
+        return self._create_blocks_from_plan(plan, block_width, block_thickness, base_plane)
     
-    def _create_blocking_for_cell(self, cell, block_heights, block_thickness, block_width, base_plane):
+    def _create_blocks_from_plan(self, plan, block_width, block_thickness, base_plane):
         """
-        Create blocking elements for a single cell.
+        Create block Breps for a BlockingPlan.
         
         Args:
-            cell: Dictionary with cell data
-            block_heights: List of heights for blocking elements
-            block_thickness: Thickness of blocking elements
+            plan: BlockingPlan with block placements
             block_width: Width of blocking elements
+            block_thickness: Thickness of blocking elements
             base_plane: Base plane of the wall
             
         Returns:
             List of blocking Brep elements
         """
         blocks = []
-        
-        # Extract vertical elements (stud positions)
-        # Sometimes these are stored as strings, so convert to floats
-        vertical_elements = cell.get('vertical_elements', [])
-        
-        # Try to handle both list and string formats
-        stud_positions = []
-        for pos in vertical_elements:
-            try:
-                # Handle string representation
-                if isinstance(pos, str):
-                    stud_positions.append(float(pos))
-                else:
-                    stud_positions.append(float(pos))
-            except (ValueError, TypeError) as e:
-                print(f"Error converting stud position {pos}: {str(e)}")
-                # Skip this position
-                continue
-        
-        # Sort stud positions
-        stud_positions = sorted(stud_positions)
-        
-        if len(stud_positions) < 2:
-            cell_id = cell.get('cell_id', 'unknown')
-            print(f"Not enough studs in cell {cell_id} to create blocking. Found {len(stud_positions)} positions.")
-            return blocks  # Need at least 2 studs to create blocking
-        
-        # Create blocking between adjacent studs
-        for i in range(len(stud_positions) - 1):
-            left_stud_pos = stud_positions[i]
-            right_stud_pos = stud_positions[i + 1]
-            
-            # Skip if studs are too close
-            if right_stud_pos - left_stud_pos < 0.5:  # Minimum 6" between studs
-                continue
-            
-            # Create a block at each height
-            for block_height in block_heights:
-                # block_height is relative to wall base, pass directly as v_coordinate
-                # (the method handles transformation to world coordinates via base_plane)
-
-                # Create center point for the block
-                center_u = (left_stud_pos + right_stud_pos) / 2
-                center_point = self._create_point_at_u_coordinate(
-                    center_u, block_height, base_plane
-                )
-                
-                # Calculate length (span between studs minus stud width)
-                block_length = right_stud_pos - left_stud_pos - 0.125
-                
-                # Create the block
-                block = self._create_block_brep(
-                    center_point, 
-                    block_length, 
-                    block_width, 
-                    block_thickness,
-                    base_plane
-                )
-                
-                if block:
-                    blocks.append(block)
-                    print(f"Created block between studs at {left_stud_pos:.4f} and {right_stud_pos:.4f} at height {block_height:.4f}")
-        
+        # All block centers in one frame conversion; Point3d only at the end
+        centers = to_point3d(wall_frame(base_plane).to_world(
+            [(u, height, 0.0) for u, height in zip(plan.u_centers, plan.heights)]
+        ))
+        for center_point, length in zip(centers, plan.lengths):
+            block = self._create_block_brep(
+                center_point,
+                length,
+                block_width,
+                block_thickness,
+                base_plane
+            )
+            if block:
+                blocks.append(block)
         return blocks
         
     def _create_point_at_u_coordinate(self, u_coordinate, v_coordinate, base_plane):
@@ -910,21 +393,10 @@ class RowBlockingGenerator:
             3D point in world coordinates
         """
         try:
-            # Start at the origin of the base plane
-            point = rg.Point3d(base_plane.Origin)
-
-            # Move along the X axis of the base plane by u_coordinate
-            x_vector = rg.Vector3d(base_plane.XAxis)
-            x_vector *= u_coordinate
-            point += x_vector
-
-            # Move along the Y axis (wall vertical) by v_coordinate
+            # origin + u * XAxis + v * YAxis
             # Note: v_coordinate is height above wall base, NOT world Z
-            y_vector = rg.Vector3d(base_plane.YAxis)
-            y_vector *= v_coordinate
-            point += y_vector
-
-            return point
+            frame = wall_frame(base_plane)
+            return rg.Point3d(*frame.to_world_point(u_coordinate, v_coordinate))
         except Exception as e:
             print(f"Error creating point at u-coordinate: {str(e)}")
 
@@ -990,23 +462,6 @@ class RowBlockingGenerator:
         print(f"Wall height: {wall_height}")
         print(f"Wall elevations: base={self.wall_base_elevation}, top={self.wall_top_elevation}")
         
-        # Get block heights from pattern or calculate them
-        if self.blocking_params.first_block_height:
-            first_block_height = self.blocking_params.first_block_height
-            block_heights = [first_block_height]
-            
-            # If wall is higher than twice the first block height, add additional blocks
-            remaining_height = wall_height - first_block_height
-            spacing = self.blocking_params.block_spacing
-            
-            if remaining_height > spacing:
-                num_additional_blocks = int(remaining_height / spacing)
-                for i in range(num_additional_blocks):
-                    block_heights.append(first_block_height + spacing * (i + 1))
-        else:
-            # Default to 1/3 and 2/3 of wall height
-            block_heights = [wall_height / 3, 2 * wall_height / 3]
-        
         # Get blocking pattern
         pattern = self.blocking_params.pattern
         
@@ -1042,28 +497,15 @@ class RowBlockingGenerator:
             
         print(f"Using block dimensions: width={block_width}, thickness={block_thickness}")
             
-        if pattern == BlockingPattern.STAGGERED:
-            print("Using STAGGERED blocking pattern")
-            # Create cells dictionary from stud_positions
-            cells_dict = {}
-            for cell_id, positions in self.stud_positions.items():
-                if positions:  # Only include cells with stud positions
-                    cells_dict[cell_id] = positions
-            
-            if cells_dict:
-                blocks = self._create_staggered_blocking(cells_dict, block_heights, block_thickness, block_width, base_plane)
-            else:
-                print("No cells with stud positions found for staggered blocking")
-        elif pattern == BlockingPattern.INLINE:
-            print("Using INLINE blocking pattern")
-            
-            # Check if we have stud positions
-            if self.stud_positions:
-                blocks = self._generate_row_blocking(self.stud_positions, block_width, block_thickness, base_plane)
-            else:
-                print("No stud positions found for inline blocking")
-        else:
+        if pattern not in (BlockingPattern.INLINE, BlockingPattern.STAGGERED):
             print(f"Unsupported blocking pattern: {pattern}")
+        elif self.stud_positions:
+            print(f"Using {pattern.name} blocking pattern")
+            blocks = self._generate_row_blocking(
+                self.stud_positions, block_width, block_thickness, base_plane, pattern
+            )
+        else:
+            print(f"No stud positions found for {pattern.name.lower()} blocking")
         
         print(f"Generated {len(blocks)} blocking elements")
         return blocks
@@ -1082,11 +524,7 @@ class RowBlockingGenerator:
         Returns:
             List of blocking Brep elements
         """
-        blocks = []
-        pattern = self.blocking_params.pattern
-        
-        print(f"Creating staggered blocking with pattern: {pattern}")
-        
-        # TODO: Implement staggered blocking pattern
-        
-        return blocks
+        print("Creating staggered blocking")
+        return self._generate_row_blocking(
+            cells, block_width, block_thickness, base_plane, BlockingPattern.STAGGERED
+        )
@@ -37,7 +37,9 @@ Usage:
     track_profile = get_cfs_profile(ElementType.BOTTOM_PLATE)
 """
 
-from typing import Dict
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from src.timber_framing_generator.core.material_system import (
     MaterialSystem,
@@ -869,6 +871,17 @@ DEFAULT_CFS_PROFILES_LOAD_BEARING: Dict[ElementType, str] = {
     ElementType.ROW_BLOCKING: "362S162-68",
 }
 
+# =============================================================================
+# Stock Lengths
+# =============================================================================
+
+# Mill stock lengths by profile type (feet). Studs ship cut to common wall
+# heights; track ships in 10' and 12' sticks.
+CFS_STOCK_LENGTHS: Dict[str, List[float]] = {
+    "stud": [8.0, 9.0, 10.0, 12.0, 14.0, 16.0, 20.0],
+    "track": [10.0, 12.0],
+}
+
 # =============================================================================
 # Profile Selection by Wall Width
 # =============================================================================
@@ -888,6 +901,22 @@ WALL_WIDTH_TO_SERIES: Dict[float, str] = {
 # Helper Functions
 # =============================================================================
 
+# Leading 3-digit web-depth series of a profile name ("362" in "362S125-54")
+_SERIES_PATTERN = re.compile(r'^\d{3}')
+
+# Full profile name: series, type (S/T), flange, gauge
+_PROFILE_NAME_PATTERN = re.compile(r'^(\d{3})([ST])(\d+)-(\d+)')
+
+# Profile type letter after the series
+_PROFILE_TYPE_PATTERN = re.compile(r'^\d{3}([ST])')
+
+# Flange widths tried, after the default's own, when a series lacks it
+_FALLBACK_FLANGES = ("125", "162", "200", "250")
+
+# Distinct wall thicknesses remembered by the thickness -> series lookup
+SERIES_CACHE_SIZE = 256
+
+
 def get_series_for_wall_thickness(wall_thickness_inches: float) -> str:
     """
     Get the appropriate CFS series for a given wall thickness.
@@ -911,6 +940,69 @@ def get_series_for_wall_thickness(wall_thickness_inches: float) -> str:
     return best_series
 
 
+@lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _series_bucket(wall_thickness_inches: float) -> str:
+    """Cached get_series_for_wall_thickness; walls repeat a few thicknesses."""
+    return get_series_for_wall_thickness(wall_thickness_inches)
+
+
+def _resolve_profile_name(default_profile_name: str, target_series: Optional[str]) -> str:
+    """
+    Profile name for a default profile moved to another series.
+
+    Replaces the series (e.g., "362S125-54" -> "600S125-54" for 6" walls).
+    If that profile does not exist, looks for one in the target series
+    with the same type (S/T) and gauge, trying common flange widths.
+
+    Args:
+        default_profile_name: Default profile name for the element
+        target_series: Series to move to, or None to keep the default
+
+    Returns:
+        Name of a profile in CFS_PROFILES
+    """
+    if target_series is None:
+        return default_profile_name
+
+    adjusted_name = _SERIES_PATTERN.sub(target_series, default_profile_name)
+    if adjusted_name in CFS_PROFILES:
+        return adjusted_name
+
+    match = _PROFILE_NAME_PATTERN.match(default_profile_name)
+    if match:
+        _, profile_type, flange, gauge = match.groups()
+        for try_flange in (flange,) + _FALLBACK_FLANGES:
+            try_name = f"{target_series}{profile_type}{try_flange}-{gauge}"
+            if try_name in CFS_PROFILES:
+                return try_name
+
+    return default_profile_name
+
+
+def _build_profile_table() -> Dict[Tuple[ElementType, Optional[str], bool], ElementProfile]:
+    """
+    Resolved profile for every (element_type, series, is_load_bearing).
+
+    Series None stands for "no wall thickness given".
+    """
+    table = {}
+    for is_load_bearing, defaults_table in (
+        (False, DEFAULT_CFS_PROFILES),
+        (True, DEFAULT_CFS_PROFILES_LOAD_BEARING),
+    ):
+        for element_type in ElementType:
+            default_profile_name = defaults_table.get(element_type, "362S125-54")
+            for series in (None,) + tuple(WALL_WIDTH_TO_SERIES.values()):
+                name = _resolve_profile_name(default_profile_name, series)
+                table[(element_type, series, is_load_bearing)] = CFS_PROFILES[name]
+    return table
+
+
+# Precomputed default-profile resolution: one dict hit per element in the
+# hot loop instead of regex series adjustment on every call
+CFS_PROFILE_TABLE: Dict[Tuple[ElementType, Optional[str], bool], ElementProfile] = _build_profile_table()
+
+
 def get_cfs_profile(
     element_type: ElementType,
     profile_override: str = None,
@@ -920,6 +1012,9 @@ def get_cfs_profile(
     """
     Get the CFS profile for a specific element type.
 
+    Resolution is a lookup in CFS_PROFILE_TABLE keyed by element type,
+    series for the wall thickness and load-bearing status.
+
     Args:
         element_type: The type of framing element
         profile_override: Optional profile name to use instead of default
@@ -948,36 +1043,16 @@ def get_cfs_profile(
             raise KeyError(f"Unknown CFS profile: {profile_override}")
         return CFS_PROFILES[profile_override]
 
-    # Get default profile for this element type based on load-bearing status
+    series = None if wall_thickness_inches is None else _series_bucket(float(wall_thickness_inches))
+    profile = CFS_PROFILE_TABLE.get((element_type, series, bool(is_load_bearing)))
+    if profile is not None:
+        return profile
+
+    # Element types outside the table (e.g. plain strings) resolve directly
     # Load-bearing walls use thicker gauges (68 mil vs 54 mil) and wider flanges
     defaults_table = DEFAULT_CFS_PROFILES_LOAD_BEARING if is_load_bearing else DEFAULT_CFS_PROFILES
     default_profile_name = defaults_table.get(element_type, "362S125-54")
-
-    # If wall thickness provided, adjust the series
-    if wall_thickness_inches is not None:
-        target_series = get_series_for_wall_thickness(wall_thickness_inches)
-        # Replace the series in the default profile name
-        # E.g., "362S125-54" -> "600S125-54" for 6" walls
-        import re
-        adjusted_name = re.sub(r'^\d{3}', target_series, default_profile_name)
-
-        # Check if the adjusted profile exists
-        if adjusted_name in CFS_PROFILES:
-            return CFS_PROFILES[adjusted_name]
-        else:
-            # Fallback: try to find a similar profile in the target series
-            # Look for any profile in the target series with same type (S/T) and gauge
-            match = re.match(r'^(\d{3})([ST])(\d+)-(\d+)', default_profile_name)
-            if match:
-                _, profile_type, flange, gauge = match.groups()
-                # Try common flange widths
-                for try_flange in [flange, "125", "162", "200", "250"]:
-                    try_name = f"{target_series}{profile_type}{try_flange}-{gauge}"
-                    if try_name in CFS_PROFILES:
-                        return CFS_PROFILES[try_name]
-
-    # Fallback to default
-    return CFS_PROFILES[default_profile_name]
+    return CFS_PROFILES[_resolve_profile_name(default_profile_name, series)]
 
 
 def list_available_profiles() -> list:
@@ -990,6 +1065,27 @@ def list_available_profiles() -> list:
     return list(CFS_PROFILES.keys())
 
 
+def get_cfs_stock_lengths(profile_name: str) -> List[float]:
+    """
+    Get the stock lengths a CFS profile is bought in.
+
+    The profile type comes from the profile's properties, or from the S/T
+    letter of the name for profiles without properties.
+
+    Args:
+        profile_name: CFS profile name (e.g., "362S125-54")
+
+    Returns:
+        Stock lengths in feet, ascending
+    """
+    profile = CFS_PROFILES.get(profile_name)
+    profile_type = profile.properties.get("profile_type") if profile else None
+    if profile_type not in CFS_STOCK_LENGTHS:
+        match = _PROFILE_TYPE_PATTERN.match(profile_name)
+        profile_type = "track" if match and match.group(1) == "T" else "stud"
+    return list(CFS_STOCK_LENGTHS[profile_type])
+
+
 def get_stud_profiles() -> Dict[str, ElementProfile]:
     """
     Get only stud profiles (C-sections with lips).
@@ -19,7 +19,8 @@ Usage:
     elements = strategy.generate_framing(wall_data, cell_data, config)
 """
 
-from typing import Dict, List, Any
+import re
+from typing import Dict, List, Any, Optional, Tuple
 import traceback
 
 from src.timber_framing_generator.core.material_system import (
@@ -28,6 +29,7 @@ from src.timber_framing_generator.core.material_system import (
     ElementType,
     ElementProfile,
     FramingElement,
+    GenerationContext,
     register_strategy,
 )
 from .cfs_profiles import (
@@ -47,6 +49,11 @@ from src.timber_framing_generator.materials.timber.element_adapters import (
 
 # Import panel-aware helper for filtering openings
 from src.timber_framing_generator.cell_decomposition import get_openings_in_range
+from src.timber_framing_generator.config.framing import BlockingPattern
+from src.timber_framing_generator.framing_elements.blocking_planner import (
+    calculate_block_heights,
+    plan_blocking_from_members,
+)
 
 # Import our custom logging module
 try:
@@ -57,6 +64,29 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 
+def resolve_wall_properties(wall_data: Dict[str, Any]) -> Tuple[Optional[float], bool]:
+    """
+    Wall properties that drive CFS profile selection.
+
+    Args:
+        wall_data: Wall data containing wall_thickness (in feet), optionally
+            wall_type (e.g. 'Basic Wall - W1 - 6"') and is_load_bearing
+
+    Returns:
+        Tuple of (wall thickness in inches or None if unknown, is_load_bearing)
+    """
+    thickness_inches = None
+    thickness_feet = wall_data.get("wall_thickness", 0)
+    if thickness_feet > 0:
+        thickness_inches = thickness_feet * 12
+    else:
+        # Try to infer from wall type name (e.g., "Basic Wall - W1 - 6\"")
+        match = re.search(r'(\d+)"', wall_data.get("wall_type", ""))
+        if match:
+            thickness_inches = float(match.group(1))
+    return thickness_inches, bool(wall_data.get("is_load_bearing", False))
+
+
 class CFSFramingStrategy(FramingStrategy):
     """
     CFS framing strategy implementing the FramingStrategy interface.
@@ -89,37 +119,25 @@ class CFSFramingStrategy(FramingStrategy):
     """
 
     def __init__(self):
-        """Initialize CFS strategy with wall property tracking."""
+        """Initialize CFS strategy with default wall properties."""
         self._current_wall_thickness_inches = None
         self._current_is_load_bearing = False
 
     def set_wall_properties(self, wall_data: Dict[str, Any]) -> None:
         """
-        Set current wall properties from wall data for profile selection.
+        Set default wall properties for get_profile() calls without them.
+
+        generate_framing() does not use these: it resolves each wall's
+        properties into its GenerationContext, so registered (shared)
+        strategy instances stay safe to use from several threads.
 
         Args:
             wall_data: Wall data containing wall_thickness (in feet) and is_load_bearing
         """
-        # Set wall thickness (in inches)
-        thickness_feet = wall_data.get("wall_thickness", 0)
-        if thickness_feet > 0:
-            self._current_wall_thickness_inches = thickness_feet * 12
-            logger.info(f"Set wall thickness for profile selection: {self._current_wall_thickness_inches:.2f} inches")
-        else:
-            # Try to infer from wall type name (e.g., "Basic Wall - W1 - 6\"")
-            wall_type = wall_data.get("wall_type", "")
-            import re
-            match = re.search(r'(\d+)"', wall_type)
-            if match:
-                self._current_wall_thickness_inches = float(match.group(1))
-                logger.info(f"Inferred wall thickness from type name: {self._current_wall_thickness_inches} inches")
-
-        # Set load-bearing status
-        self._current_is_load_bearing = wall_data.get("is_load_bearing", False)
-        if self._current_is_load_bearing:
-            logger.info("Wall is load-bearing - using structural profiles (68 mil gauge)")
-        else:
-            logger.info("Wall is non-bearing - using standard profiles (54 mil gauge)")
+        thickness, load_bearing = resolve_wall_properties(wall_data)
+        if thickness is not None:
+            self._current_wall_thickness_inches = thickness
+        self._current_is_load_bearing = load_bearing
 
     def set_wall_thickness(self, wall_data: Dict[str, Any]) -> None:
         """
@@ -230,10 +248,46 @@ class CFSFramingStrategy(FramingStrategy):
             is_load_bearing=load_bearing
         )
 
+    def _wall_properties(
+        self,
+        wall_data: Dict[str, Any],
+        context: GenerationContext
+    ) -> Tuple[Optional[float], bool]:
+        """
+        The wall's (thickness_inches, is_load_bearing), resolved once per context.
+        """
+        properties = context.state.get("wall_properties")
+        if properties is None:
+            properties = resolve_wall_properties(wall_data)
+            context.state["wall_properties"] = properties
+            thickness, load_bearing = properties
+            if thickness is not None:
+                logger.info(f"Wall thickness for profile selection: {thickness:.2f} inches")
+            if load_bearing:
+                logger.info("Wall is load-bearing - using structural profiles (68 mil gauge)")
+            else:
+                logger.info("Wall is non-bearing - using standard profiles (54 mil gauge)")
+        return properties
+
+    def _context_profile(
+        self,
+        element_type: ElementType,
+        config: Dict[str, Any],
+        context: GenerationContext
+    ) -> ElementProfile:
+        """get_profile() for the wall a context belongs to."""
+        thickness, load_bearing = context.state["wall_properties"]
+        return self.get_profile(
+            element_type, config,
+            wall_thickness_inches=thickness,
+            is_load_bearing=load_bearing,
+        )
+
     def _set_framing_config(
         self,
         wall_data: Dict[str, Any],
-        config: Dict[str, Any] = None
+        config: Dict[str, Any],
+        context: GenerationContext
     ) -> None:
         """
         Set CFS-specific framing dimensions in wall_data.
@@ -245,10 +299,11 @@ class CFSFramingStrategy(FramingStrategy):
         Args:
             wall_data: Wall data dict to modify (in-place)
             config: Optional configuration with profile overrides
+            context: Context holding the wall's properties
         """
         # Get the stud profile for dimension reference
-        stud_profile = self.get_profile(ElementType.STUD, config)
-        track_profile = self.get_profile(ElementType.BOTTOM_PLATE, config)
+        stud_profile = self._context_profile(ElementType.STUD, config, context)
+        track_profile = self._context_profile(ElementType.BOTTOM_PLATE, config, context)
 
         # CFS dimensions from profiles
         # Stud width = flange width (visible edge of C-section)
@@ -286,7 +341,8 @@ class CFSFramingStrategy(FramingStrategy):
         self,
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate tracks (horizontal members) for CFS framing.
@@ -299,6 +355,7 @@ class CFSFramingStrategy(FramingStrategy):
             wall_data: Wall geometry and properties
             cell_data: Cell decomposition data
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for tracks
@@ -306,11 +363,10 @@ class CFSFramingStrategy(FramingStrategy):
         logger.info("Creating horizontal members (CFS tracks)")
         elements = []
 
-        # Set wall thickness for profile selection
-        self.set_wall_thickness(wall_data)
-
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
+        context = context or GenerationContext(wall_id=wall_id)
+        self._wall_properties(wall_data, context)
 
         # Check if Rhino is available (only works inside Grasshopper)
         if not RHINO_AVAILABLE:
@@ -329,7 +385,7 @@ class CFSFramingStrategy(FramingStrategy):
             base_plane = rhino_wall_data.get("base_plane")
 
             # Set CFS-specific dimensions in wall_data for generators
-            self._set_framing_config(rhino_wall_data, config)
+            self._set_framing_config(rhino_wall_data, config, context)
 
             # Get configuration
             bottom_plate_layers = config.get("bottom_plate_layers", 1)
@@ -360,7 +416,7 @@ class CFSFramingStrategy(FramingStrategy):
             )
 
             # Convert to FramingElement with CFS track profile
-            bottom_profile = self.get_profile(ElementType.BOTTOM_PLATE, config)
+            bottom_profile = self._context_profile(ElementType.BOTTOM_PLATE, config, context)
             for i, plate in enumerate(bottom_plates):
                 elem = plate_geometry_to_framing_element(
                     plate=plate,
@@ -383,7 +439,7 @@ class CFSFramingStrategy(FramingStrategy):
             )
 
             # Convert to FramingElement with CFS track profile
-            top_profile = self.get_profile(ElementType.TOP_PLATE, config)
+            top_profile = self._context_profile(ElementType.TOP_PLATE, config, context)
             for i, plate in enumerate(top_plates):
                 elem = plate_geometry_to_framing_element(
                     plate=plate,
@@ -397,7 +453,7 @@ class CFSFramingStrategy(FramingStrategy):
                 logger.debug(f"Created top_track_{i}")
 
             # Store plate geometry for use by vertical member generation
-            self._plate_geometry = {
+            context.state["plate_geometry"] = {
                 "bottom_plates": bottom_plates,
                 "top_plates": top_plates,
                 "rhino_wall_data": rhino_wall_data,
@@ -416,7 +472,8 @@ class CFSFramingStrategy(FramingStrategy):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         horizontal_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate vertical members (studs, king studs, trimmers).
@@ -430,6 +487,7 @@ class CFSFramingStrategy(FramingStrategy):
             cell_data: Cell decomposition data
             horizontal_members: Previously generated tracks
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for vertical members
@@ -439,6 +497,8 @@ class CFSFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
+        context = context or GenerationContext(wall_id=wall_id)
+        self._wall_properties(wall_data, context)
 
         # Check if Rhino is available
         if not RHINO_AVAILABLE:
@@ -452,14 +512,15 @@ class CFSFramingStrategy(FramingStrategy):
             from src.timber_framing_generator.framing_elements.trimmers import TrimmerGenerator
 
             # Get stored plate geometry or reconstruct
-            if hasattr(self, "_plate_geometry"):
-                bottom_plates = self._plate_geometry["bottom_plates"]
-                top_plates = self._plate_geometry["top_plates"]
-                rhino_wall_data = self._plate_geometry["rhino_wall_data"]
+            plate_geometry = context.state.get("plate_geometry")
+            if plate_geometry:
+                bottom_plates = plate_geometry["bottom_plates"]
+                top_plates = plate_geometry["top_plates"]
+                rhino_wall_data = plate_geometry["rhino_wall_data"]
             else:
                 rhino_wall_data = reconstruct_wall_data(wall_data)
                 # Set CFS-specific dimensions (in case horizontal_members wasn't called)
-                self._set_framing_config(rhino_wall_data, config)
+                self._set_framing_config(rhino_wall_data, config, context)
                 openings_for_plates = rhino_wall_data.get("openings", [])
                 # Need to regenerate plates (pass openings to skip door locations)
                 from src.timber_framing_generator.framing_elements.plates import create_plates
@@ -498,7 +559,7 @@ class CFSFramingStrategy(FramingStrategy):
 
             # Generate king studs for each opening
             king_stud_breps = []
-            king_profile = self.get_profile(ElementType.KING_STUD, config)
+            king_profile = self._context_profile(ElementType.KING_STUD, config, context)
 
             if openings:
                 logger.debug(f"Creating king studs for {len(openings)} openings")
@@ -540,7 +601,7 @@ class CFSFramingStrategy(FramingStrategy):
 
             # Generate standard studs
             logger.debug("Creating standard CFS studs")
-            stud_profile = self.get_profile(ElementType.STUD, config)
+            stud_profile = self._context_profile(ElementType.STUD, config, context)
             stud_gen = StudGenerator(
                 rhino_wall_data,
                 bottom_plate,
@@ -573,7 +634,7 @@ class CFSFramingStrategy(FramingStrategy):
             # Generate trimmers for each opening
             if openings:
                 logger.debug("Creating trimmers")
-                trimmer_profile = self.get_profile(ElementType.TRIMMER, config)
+                trimmer_profile = self._context_profile(ElementType.TRIMMER, config, context)
                 trimmer_gen = TrimmerGenerator(rhino_wall_data)
                 plate_boundary = bottom_plate.get_boundary_data()
 
@@ -596,7 +657,7 @@ class CFSFramingStrategy(FramingStrategy):
                         logger.error(f"Error generating trimmers for opening {i}: {e}")
 
             # Store for opening member generation
-            self._vertical_geometry = {
+            context.state["vertical_geometry"] = {
                 "king_stud_breps": king_stud_breps,
                 "stud_breps": stud_breps,
             }
@@ -614,7 +675,8 @@ class CFSFramingStrategy(FramingStrategy):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         existing_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate opening-related members (headers, sills, cripples).
@@ -628,6 +690,7 @@ class CFSFramingStrategy(FramingStrategy):
             cell_data: Cell decomposition data
             existing_members: Previously generated members
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for opening members
@@ -637,6 +700,8 @@ class CFSFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
+        context = context or GenerationContext(wall_id=wall_id)
+        self._wall_properties(wall_data, context)
 
         # Check if Rhino is available
         if not RHINO_AVAILABLE:
@@ -651,14 +716,15 @@ class CFSFramingStrategy(FramingStrategy):
             from src.timber_framing_generator.framing_elements.sill_cripples import SillCrippleGenerator
 
             # Get wall data
-            if hasattr(self, "_plate_geometry"):
-                rhino_wall_data = self._plate_geometry["rhino_wall_data"]
-                top_plates = self._plate_geometry["top_plates"]
-                bottom_plates = self._plate_geometry["bottom_plates"]
+            plate_geometry = context.state.get("plate_geometry")
+            if plate_geometry:
+                rhino_wall_data = plate_geometry["rhino_wall_data"]
+                top_plates = plate_geometry["top_plates"]
+                bottom_plates = plate_geometry["bottom_plates"]
             else:
                 rhino_wall_data = reconstruct_wall_data(wall_data)
                 # Set CFS-specific dimensions (in case previous methods weren't called)
-                self._set_framing_config(rhino_wall_data, config)
+                self._set_framing_config(rhino_wall_data, config, context)
                 top_plates = []
                 bottom_plates = []
 
@@ -683,7 +749,7 @@ class CFSFramingStrategy(FramingStrategy):
 
             # Headers - use same profile as blocking (350S162-54 for CFS)
             logger.debug(f"Creating headers for {len(openings)} openings")
-            header_profile = self.get_profile(ElementType.ROW_BLOCKING, config)
+            header_profile = self._context_profile(ElementType.ROW_BLOCKING, config, context)
             logger.info(f"Header profile: {header_profile.name} (same as blocking)")
             logger.info(f"  Profile dimensions: width={header_profile.width*12}in, depth={header_profile.depth*12}in")
             header_gen = HeaderGenerator(rhino_wall_data)
@@ -716,7 +782,7 @@ class CFSFramingStrategy(FramingStrategy):
 
             # Sills (windows only)
             logger.debug("Creating sills for window openings")
-            sill_profile = self.get_profile(ElementType.SILL, config)
+            sill_profile = self._context_profile(ElementType.SILL, config, context)
             sill_gen = SillGenerator(rhino_wall_data)
 
             sill_breps = []
@@ -744,7 +810,7 @@ class CFSFramingStrategy(FramingStrategy):
             header_cripple_breps = []
             if top_plates:
                 logger.debug("Creating header cripples")
-                hc_profile = self.get_profile(ElementType.HEADER_CRIPPLE, config)
+                hc_profile = self._context_profile(ElementType.HEADER_CRIPPLE, config, context)
                 hc_gen = HeaderCrippleGenerator(rhino_wall_data)
                 top_plate_data = top_plates[0].get_boundary_data() if top_plates else {}
 
@@ -777,7 +843,7 @@ class CFSFramingStrategy(FramingStrategy):
             sill_cripple_breps = []
             if bottom_plates:
                 logger.debug("Creating sill cripples")
-                sc_profile = self.get_profile(ElementType.SILL_CRIPPLE, config)
+                sc_profile = self._context_profile(ElementType.SILL_CRIPPLE, config, context)
                 sc_gen = SillCrippleGenerator(rhino_wall_data)
                 bottom_plate_data = bottom_plates[0].get_boundary_data() if bottom_plates else {}
 
@@ -810,7 +876,7 @@ class CFSFramingStrategy(FramingStrategy):
                             sill_idx += 1
 
             # Store opening geometry for use by bracing members
-            self._opening_geometry = {
+            context.state["opening_geometry"] = {
                 "header_cripple_breps": header_cripple_breps,
                 "sill_cripple_breps": sill_cripple_breps,
             }
@@ -829,7 +895,8 @@ class CFSFramingStrategy(FramingStrategy):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         existing_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate bracing members (bridging for CFS).
@@ -847,6 +914,7 @@ class CFSFramingStrategy(FramingStrategy):
             cell_data: Cell decomposition data
             existing_members: Previously generated members
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for bracing members
@@ -856,11 +924,8 @@ class CFSFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
-
-        # Check if Rhino is available
-        if not RHINO_AVAILABLE:
-            logger.warning("Rhino not available - returning empty list.")
-            return elements
+        context = context or GenerationContext(wall_id=wall_id)
+        self._wall_properties(wall_data, context)
 
         # Check if blocking is enabled
         include_blocking = config.get("include_blocking", True)
@@ -869,67 +934,54 @@ class CFSFramingStrategy(FramingStrategy):
             return elements
 
         try:
-            from src.timber_framing_generator.framing_elements.row_blocking import RowBlockingGenerator
-
-            # Get wall data
-            if hasattr(self, "_plate_geometry"):
-                rhino_wall_data = self._plate_geometry["rhino_wall_data"]
-            else:
-                rhino_wall_data = reconstruct_wall_data(wall_data)
-                # Set CFS-specific dimensions (in case previous methods weren't called)
-                self._set_framing_config(rhino_wall_data, config)
-
-            base_plane = rhino_wall_data.get("base_plane")
+            # Blocking is planned from the u-coordinates of the vertical
+            # members already generated; no geometry is inspected or built
+            # here (the geometry converter creates Breps from centerlines).
+            cells = normalize_cells(cell_data.get("cells", []))
+            if not cells:
+                logger.debug("No cells - skipping bridging")
+                return elements
 
-            # Add cells to wall data
-            cells = cell_data.get("cells", [])
-            rhino_wall_data["cells"] = normalize_cells(cells)
+            base_plane = wall_data.get("base_plane")
+            plate_geometry = context.state.get("plate_geometry")
+            if plate_geometry:
+                base_plane = plate_geometry["rhino_wall_data"].get("base_plane", base_plane)
+            if base_plane is None:
+                logger.warning("No base plane - skipping bridging")
+                return elements
 
-            # Get stud breps for blocking placement
-            stud_breps = []
-            king_stud_breps = []
-            if hasattr(self, "_vertical_geometry"):
-                stud_breps = self._vertical_geometry.get("stud_breps", [])
-                king_stud_breps = self._vertical_geometry.get("king_stud_breps", [])
+            base_elevation = wall_data.get("wall_base_elevation", 0.0)
+            wall_height = wall_data.get(
+                "wall_top_elevation", base_elevation + wall_data.get("wall_height", 0.0)
+            ) - base_elevation
 
-            # Get cripple breps from opening geometry for blocking placement
-            header_cripple_breps = []
-            sill_cripple_breps = []
-            if hasattr(self, "_opening_geometry"):
-                header_cripple_breps = self._opening_geometry.get("header_cripple_breps", [])
-                sill_cripple_breps = self._opening_geometry.get("sill_cripple_breps", [])
-                logger.debug(f"Retrieved {len(header_cripple_breps)} header cripple breps and {len(sill_cripple_breps)} sill cripple breps for bridging")
-
-            # Create blocking generator (reusing timber logic for now)
-            # TODO: Implement CFS-specific bridging patterns
-            blocking_gen = RowBlockingGenerator(
-                wall_data=rhino_wall_data,
-                studs=stud_breps,
-                king_studs=king_stud_breps,
-                trimmers=[],
-                header_cripples=header_cripple_breps,
-                sill_cripples=sill_cripple_breps,
-                blocking_pattern=config.get("blocking_pattern", "INLINE"),
-                include_blocking=include_blocking,
-                block_spacing=config.get("block_spacing", 4.0),
-                first_block_height=config.get("first_block_height", 2.0),
+            blocking_profile = self._context_profile(ElementType.ROW_BLOCKING, config, context)
+            block_heights = calculate_block_heights(
+                wall_height,
+                config.get("first_block_height", 2.0),
+                config.get("block_spacing", 4.0),
+            )
+            pattern = (
+                BlockingPattern.STAGGERED
+                if str(config.get("blocking_pattern", "INLINE")).upper().strip() == "STAGGERED"
+                else BlockingPattern.INLINE
             )
 
-            blocking_breps = blocking_gen.generate_blocking()
-            blocking_profile = self.get_profile(ElementType.ROW_BLOCKING, config)
-
-            for i, brep in enumerate(blocking_breps):
-                elem = brep_to_framing_element(
-                    brep=brep,
-                    element_id=f"bridging_{i}",
-                    element_type=ElementType.ROW_BLOCKING,
-                    profile=blocking_profile,
-                    base_plane=base_plane,
-                    is_vertical=False,
-                    wall_id=wall_id,
-                )
-                if elem:
-                    elements.append(elem)
+            plan = plan_blocking_from_members(
+                cells,
+                existing_members,
+                wall_height,
+                block_width=blocking_profile.width,
+                block_heights=block_heights,
+                pattern=pattern,
+                include_trimmers=True,
+            )
+            elements = plan.to_framing_elements(
+                base_plane,
+                blocking_profile,
+                id_prefix="bridging",
+                wall_id=wall_id,
+            )
 
             logger.info(f"Created {len(elements)} bridging elements (CFS)")
 
@@ -23,7 +23,7 @@ Usage:
     stud_profile = get_timber_profile(ElementType.STUD)
 """
 
-from typing import Dict
+from typing import Dict, List
 
 from src.timber_framing_generator.core.material_system import (
     MaterialSystem,
@@ -130,6 +130,20 @@ DEFAULT_TIMBER_PROFILES: Dict[ElementType, str] = {
     ElementType.ROW_BLOCKING: "2x4",
 }
 
+# Precomputed default profile per element type (one dict hit per element)
+TIMBER_PROFILE_TABLE: Dict[ElementType, ElementProfile] = {
+    element_type: TIMBER_PROFILES[DEFAULT_TIMBER_PROFILES.get(element_type, "2x4")]
+    for element_type in ElementType
+}
+
+
+# =============================================================================
+# Stock Lengths
+# =============================================================================
+
+# Dimensional lumber is stocked in 2' increments from 8' to 20' (feet)
+TIMBER_STOCK_LENGTHS: List[float] = [8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0]
+
 
 # =============================================================================
 # Helper Functions
@@ -165,7 +179,11 @@ def get_timber_profile(
             raise KeyError(f"Unknown timber profile: {profile_override}")
         return TIMBER_PROFILES[profile_override]
 
-    # Get default profile for this element type
+    profile = TIMBER_PROFILE_TABLE.get(element_type)
+    if profile is not None:
+        return profile
+
+    # Element types outside the table (e.g. plain strings)
     profile_name = DEFAULT_TIMBER_PROFILES.get(element_type, "2x4")
     return TIMBER_PROFILES[profile_name]
 
@@ -27,6 +27,7 @@ from src.timber_framing_generator.core.material_system import (
     ElementType,
     ElementProfile,
     FramingElement,
+    GenerationContext,
     register_strategy,
 )
 from .timber_profiles import (
@@ -46,6 +47,11 @@ from .element_adapters import (
 
 # Import panel-aware helper for filtering openings
 from src.timber_framing_generator.cell_decomposition import get_openings_in_range
+from src.timber_framing_generator.config.framing import BlockingPattern
+from src.timber_framing_generator.framing_elements.blocking_planner import (
+    calculate_block_heights,
+    plan_blocking_from_members,
+)
 
 # Import our custom logging module
 try:
@@ -221,7 +227,8 @@ class TimberFramingStrategy(FramingStrategy):
         self,
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate plates (horizontal members) for timber framing.
@@ -233,6 +240,7 @@ class TimberFramingStrategy(FramingStrategy):
             wall_data: Wall geometry and properties
             cell_data: Cell decomposition data
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for plates
@@ -242,6 +250,7 @@ class TimberFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
+        context = context or GenerationContext(wall_id=wall_id)
 
         # Check if Rhino is available (only works inside Grasshopper)
         if not RHINO_AVAILABLE:
@@ -328,7 +337,7 @@ class TimberFramingStrategy(FramingStrategy):
                 logger.debug(f"Created top_plate_{i}")
 
             # Store plate geometry for use by vertical member generation
-            self._plate_geometry = {
+            context.state["plate_geometry"] = {
                 "bottom_plates": bottom_plates,
                 "top_plates": top_plates,
                 "rhino_wall_data": rhino_wall_data,
@@ -347,7 +356,8 @@ class TimberFramingStrategy(FramingStrategy):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         horizontal_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate vertical members (studs, king studs, trimmers).
@@ -360,6 +370,7 @@ class TimberFramingStrategy(FramingStrategy):
             cell_data: Cell decomposition data
             horizontal_members: Previously generated plates
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for vertical members
@@ -369,6 +380,7 @@ class TimberFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
+        context = context or GenerationContext(wall_id=wall_id)
 
         # Check if Rhino is available
         if not RHINO_AVAILABLE:
@@ -382,10 +394,11 @@ class TimberFramingStrategy(FramingStrategy):
             from src.timber_framing_generator.framing_elements.trimmers import TrimmerGenerator
 
             # Get stored plate geometry or reconstruct
-            if hasattr(self, "_plate_geometry"):
-                bottom_plates = self._plate_geometry["bottom_plates"]
-                top_plates = self._plate_geometry["top_plates"]
-                rhino_wall_data = self._plate_geometry["rhino_wall_data"]
+            plate_geometry = context.state.get("plate_geometry")
+            if plate_geometry:
+                bottom_plates = plate_geometry["bottom_plates"]
+                top_plates = plate_geometry["top_plates"]
+                rhino_wall_data = plate_geometry["rhino_wall_data"]
             else:
                 rhino_wall_data = reconstruct_wall_data(wall_data)
                 # Set timber-specific dimensions (in case horizontal_members wasn't called)
@@ -529,7 +542,7 @@ class TimberFramingStrategy(FramingStrategy):
                         logger.error(f"Error generating trimmers for opening {i}: {e}")
 
             # Store for opening member generation
-            self._vertical_geometry = {
+            context.state["vertical_geometry"] = {
                 "king_stud_breps": king_stud_breps,
                 "stud_breps": stud_breps,
             }
@@ -547,7 +560,8 @@ class TimberFramingStrategy(FramingStrategy):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         existing_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate opening-related members (headers, sills, cripples).
@@ -560,6 +574,7 @@ class TimberFramingStrategy(FramingStrategy):
             cell_data: Cell decomposition data
             existing_members: Previously generated members
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for opening members
@@ -569,6 +584,7 @@ class TimberFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
+        context = context or GenerationContext(wall_id=wall_id)
 
         # Check if Rhino is available
         if not RHINO_AVAILABLE:
@@ -583,10 +599,11 @@ class TimberFramingStrategy(FramingStrategy):
             from src.timber_framing_generator.framing_elements.sill_cripples import SillCrippleGenerator
 
             # Get wall data
-            if hasattr(self, "_plate_geometry"):
-                rhino_wall_data = self._plate_geometry["rhino_wall_data"]
-                top_plates = self._plate_geometry["top_plates"]
-                bottom_plates = self._plate_geometry["bottom_plates"]
+            plate_geometry = context.state.get("plate_geometry")
+            if plate_geometry:
+                rhino_wall_data = plate_geometry["rhino_wall_data"]
+                top_plates = plate_geometry["top_plates"]
+                bottom_plates = plate_geometry["bottom_plates"]
             else:
                 rhino_wall_data = reconstruct_wall_data(wall_data)
                 # Set timber-specific dimensions (in case previous methods weren't called)
@@ -744,7 +761,7 @@ class TimberFramingStrategy(FramingStrategy):
                             sill_idx += 1
 
             # Store opening geometry for use by bracing members (row blocking)
-            self._opening_geometry = {
+            context.state["opening_geometry"] = {
                 "header_cripple_breps": header_cripple_breps,
                 "sill_cripple_breps": sill_cripple_breps,
             }
@@ -763,7 +780,8 @@ class TimberFramingStrategy(FramingStrategy):
         wall_data: Dict[str, Any],
         cell_data: Dict[str, Any],
         existing_members: List[FramingElement],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
     ) -> List[FramingElement]:
         """
         Generate bracing members (row blocking for timber).
@@ -776,6 +794,7 @@ class TimberFramingStrategy(FramingStrategy):
             cell_data: Cell decomposition data
             existing_members: Previously generated members
             config: Configuration parameters
+            context: Per-wall state shared with the other create_* steps
 
         Returns:
             List of FramingElement for bracing members
@@ -785,11 +804,7 @@ class TimberFramingStrategy(FramingStrategy):
 
         # Extract wall_id for element metadata
         wall_id = cell_data.get('wall_id', 'unknown')
-
-        # Check if Rhino is available
-        if not RHINO_AVAILABLE:
-            logger.warning("Rhino not available - returning empty list.")
-            return elements
+        context = context or GenerationContext(wall_id=wall_id)
 
         # Check if blocking is enabled
         include_blocking = config.get("include_blocking", True)
@@ -798,67 +813,54 @@ class TimberFramingStrategy(FramingStrategy):
             return elements
 
         try:
-            from src.timber_framing_generator.framing_elements.row_blocking import RowBlockingGenerator
-
-            # Get wall data
-            if hasattr(self, "_plate_geometry"):
-                rhino_wall_data = self._plate_geometry["rhino_wall_data"]
-            else:
-                rhino_wall_data = reconstruct_wall_data(wall_data)
-                # Set timber-specific dimensions (in case previous methods weren't called)
-                self._set_framing_config(rhino_wall_data, config)
-
-            base_plane = rhino_wall_data.get("base_plane")
-
-            # Add cells to wall data
-            # Normalize cells - generators expect "type" but JSON uses "cell_type"
-            cells = cell_data.get("cells", [])
-            rhino_wall_data["cells"] = normalize_cells(cells)
+            # Blocking is planned from the u-coordinates of the vertical
+            # members already generated; no geometry is inspected or built
+            # here (the geometry converter creates Breps from centerlines).
+            cells = normalize_cells(cell_data.get("cells", []))
+            if not cells:
+                logger.debug("No cells - skipping blocking")
+                return elements
 
-            # Get stud breps for blocking placement
-            stud_breps = []
-            king_stud_breps = []
-            if hasattr(self, "_vertical_geometry"):
-                stud_breps = self._vertical_geometry.get("stud_breps", [])
-                king_stud_breps = self._vertical_geometry.get("king_stud_breps", [])
+            base_plane = wall_data.get("base_plane")
+            plate_geometry = context.state.get("plate_geometry")
+            if plate_geometry:
+                base_plane = plate_geometry["rhino_wall_data"].get("base_plane", base_plane)
+            if base_plane is None:
+                logger.warning("No base plane - skipping blocking")
+                return elements
 
-            # Get cripple breps from opening geometry for blocking placement
-            header_cripple_breps = []
-            sill_cripple_breps = []
-            if hasattr(self, "_opening_geometry"):
-                header_cripple_breps = self._opening_geometry.get("header_cripple_breps", [])
-                sill_cripple_breps = self._opening_geometry.get("sill_cripple_breps", [])
-                logger.debug(f"Retrieved {len(header_cripple_breps)} header cripple breps and {len(sill_cripple_breps)} sill cripple breps for blocking")
-
-            # Create blocking generator
-            blocking_gen = RowBlockingGenerator(
-                wall_data=rhino_wall_data,
-                studs=stud_breps,
-                king_studs=king_stud_breps,
-                trimmers=[],  # TODO: Add trimmers
-                header_cripples=header_cripple_breps,
-                sill_cripples=sill_cripple_breps,
-                blocking_pattern=config.get("blocking_pattern", "INLINE"),
-                include_blocking=include_blocking,
-                block_spacing=config.get("block_spacing", 4.0),
-                first_block_height=config.get("first_block_height", 2.0),
-            )
+            base_elevation = wall_data.get("wall_base_elevation", 0.0)
+            wall_height = wall_data.get(
+                "wall_top_elevation", base_elevation + wall_data.get("wall_height", 0.0)
+            ) - base_elevation
 
-            blocking_breps = blocking_gen.generate_blocking()
             blocking_profile = self.get_profile(ElementType.ROW_BLOCKING, config)
+            block_heights = calculate_block_heights(
+                wall_height,
+                config.get("first_block_height", 2.0),
+                config.get("block_spacing", 4.0),
+            )
+            pattern = (
+                BlockingPattern.STAGGERED
+                if str(config.get("blocking_pattern", "INLINE")).upper().strip() == "STAGGERED"
+                else BlockingPattern.INLINE
+            )
 
-            for i, brep in enumerate(blocking_breps):
-                elem = brep_to_framing_element(
-                    brep=brep,
-                    element_id=f"blocking_{i}",
-                    element_type=ElementType.ROW_BLOCKING,
-                    profile=blocking_profile,
-                    base_plane=base_plane,
-                    is_vertical=False,
-                    wall_id=wall_id,
-                )
-                if elem:
-                    elements.append(elem)
+            plan = plan_blocking_from_members(
+                cells,
+                existing_members,
+                wall_height,
+                block_width=blocking_profile.width,
+                block_heights=block_heights,
+                pattern=pattern,
+                include_trimmers=True,
+            )
+            elements = plan.to_framing_elements(
+                base_plane,
+                blocking_profile,
+                id_prefix="blocking",
+                wall_id=wall_id,
+            )
 
             logger.info(f"Created {len(elements)} blocking elements")
 
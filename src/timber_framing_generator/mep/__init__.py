@@ -22,15 +22,19 @@ Example:
     >>> routes = plumbing.calculate_routes(connectors, framing_data, [], config)
 """
 
-from src.timber_framing_generator.core.mep_system import (
-    MEPDomain,
-    MEPConnector,
-    MEPRoute,
-    MEPSystem,
-)
+from ..utils.lazy_imports import lazy_exports
 
-# Import plumbing system
-from .plumbing import PlumbingSystem
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "MEPDomain": "src.timber_framing_generator.core.mep_system",
+    "MEPConnector": "src.timber_framing_generator.core.mep_system",
+    "MEPRoute": "src.timber_framing_generator.core.mep_system",
+    "MEPSystem": "src.timber_framing_generator.core.mep_system",
+    # Import plumbing system
+    "PlumbingSystem": ".plumbing",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Core types
@@ -0,0 +1,319 @@
+# File: src/timber_framing_generator/mep/core/penetration_compliance.py
+"""
+Batch code-compliance checking for framing penetrations.
+
+``base.check_penetration_allowed`` checks one hole at a time. This module
+checks every penetration in a building in one pass over columnar data
+(:class:`PenetrationBatch`, one list per field, index-aligned) and
+returns pass/fail plus reason codes per penetration.
+
+Rules (IRC R602.6-style, per member type through :class:`MemberRule`):
+
+- Bored holes: diameter at most 40% of member depth in bearing walls,
+  60% in non-bearing walls; hole edge at least 5/8" from the member face
+- Notches: depth at most 25% of member depth in bearing walls, 40% in
+  non-bearing walls
+- Stacking: holes in the same member need a clear distance of at least
+  twice the larger diameter between them (checked between neighbours
+  along the member, so one sort per member)
+
+Usage:
+    from src.timber_framing_generator.mep.core.penetration_compliance import (
+        PenetrationBatch, check_penetrations,
+    )
+
+    batch = PenetrationBatch()
+    batch.append(hole_diameter=0.104, member_depth=0.292, member_id="stud_3", position=3.0)
+    result = check_penetrations(batch)
+    result.allowed[0], result.reasons[0]
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+
+class PenetrationKind(Enum):
+    """How a penetration is cut into the member."""
+    BORED = "bored"
+    NOTCHED = "notched"
+
+
+class ComplianceReason(Enum):
+    """Reason codes for failed penetrations."""
+    INVALID_SIZE = "invalid_size"          # non-positive hole or member size
+    BORED_RATIO = "bored_ratio"            # bored hole too large for member depth
+    NOTCH_RATIO = "notch_ratio"            # notch too deep for member depth
+    EDGE_DISTANCE = "edge_distance"        # bored hole too close to member face
+    HOLE_SPACING = "hole_spacing"          # too close to another hole in the member
+
+
+@dataclass(frozen=True)
+class MemberRule:
+    """
+    Penetration limits for one kind of member.
+
+    Attributes:
+        bored_ratio: Max bored hole diameter / member depth, bearing wall
+        bored_ratio_non_bearing: Same for non-bearing walls
+        notch_ratio: Max notch depth / member depth, bearing wall
+        notch_ratio_non_bearing: Same for non-bearing walls
+        min_edge_distance: Min distance from hole edge to member face (feet)
+        spacing_factor: Min clear distance between holes in one member,
+            as a multiple of the larger hole diameter
+    """
+    bored_ratio: float = 0.40
+    bored_ratio_non_bearing: float = 0.60
+    notch_ratio: float = 0.25
+    notch_ratio_non_bearing: float = 0.40
+    min_edge_distance: float = 0.625 / 12.0
+    spacing_factor: float = 2.0
+
+
+# Wall studs and similar vertical members
+STUD_RULE = MemberRule()
+
+# Floor and ceiling joists: holes within the middle third, notches 1/6
+JOIST_RULE = MemberRule(
+    bored_ratio=1.0 / 3.0,
+    bored_ratio_non_bearing=1.0 / 3.0,
+    notch_ratio=1.0 / 6.0,
+    notch_ratio_non_bearing=1.0 / 6.0,
+    min_edge_distance=2.0 / 12.0,
+)
+
+DEFAULT_MEMBER_RULES: Dict[str, MemberRule] = {
+    "joist": JOIST_RULE,
+    "floor_joist": JOIST_RULE,
+    "ceiling_joist": JOIST_RULE,
+    "rafter": JOIST_RULE,
+}
+
+# Above this ratio a permitted bored hole needs a reinforcing plate
+DEFAULT_REINFORCEMENT_RATIO = 0.33
+
+
+@dataclass
+class PenetrationBatch:
+    """
+    Columnar penetration data for a whole building.
+
+    All lists are index-aligned; entry i describes one penetration.
+
+    Attributes:
+        hole_diameters: Hole diameter, or notch depth, in feet
+        member_depths: Depth of the penetrated member in feet
+        member_types: Element type of the member (stud, joist...)
+        kinds: PenetrationKind value ("bored" or "notched")
+        edge_distances: Hole edge to nearest member face in feet;
+            None for a hole centered in the member depth
+        load_bearing: Whether the member is in a bearing wall
+        member_ids: Member ID for the stacking check (None = unknown)
+        positions: Hole center along the member in feet
+    """
+    hole_diameters: List[float] = field(default_factory=list)
+    member_depths: List[float] = field(default_factory=list)
+    member_types: List[str] = field(default_factory=list)
+    kinds: List[str] = field(default_factory=list)
+    edge_distances: List[Optional[float]] = field(default_factory=list)
+    load_bearing: List[bool] = field(default_factory=list)
+    member_ids: List[Optional[str]] = field(default_factory=list)
+    positions: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.hole_diameters)
+
+    def append(
+        self,
+        hole_diameter: float,
+        member_depth: float,
+        member_type: str = "stud",
+        kind: str = PenetrationKind.BORED.value,
+        edge_distance: Optional[float] = None,
+        load_bearing: bool = True,
+        member_id: Optional[str] = None,
+        position: float = 0.0,
+    ) -> None:
+        """Append one penetration to the batch."""
+        self.hole_diameters.append(hole_diameter)
+        self.member_depths.append(member_depth)
+        self.member_types.append(member_type)
+        self.kinds.append(kind)
+        self.edge_distances.append(edge_distance)
+        self.load_bearing.append(load_bearing)
+        self.member_ids.append(member_id)
+        self.positions.append(position)
+
+
+@dataclass
+class ComplianceResult:
+    """
+    Per-penetration outcome of a batch check.
+
+    Attributes:
+        allowed: Whether each penetration meets every rule
+        reasons: ComplianceReason values of the rules each one breaks
+        ratios: Hole diameter (or notch depth) / member depth
+        limits: Ratio limit that applied to each penetration
+        reinforcement_required: Permitted bored holes above the
+            reinforcement ratio
+    """
+    allowed: List[bool] = field(default_factory=list)
+    reasons: List[Tuple[str, ...]] = field(default_factory=list)
+    ratios: List[float] = field(default_factory=list)
+    limits: List[float] = field(default_factory=list)
+    reinforcement_required: List[bool] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.allowed)
+
+    def failures(self) -> List[int]:
+        """Indices of penetrations that fail."""
+        return [i for i, ok in enumerate(self.allowed) if not ok]
+
+    def reason_counts(self) -> Dict[str, int]:
+        """Number of penetrations failing each rule."""
+        counts = {reason.value: 0 for reason in ComplianceReason}
+        for reasons in self.reasons:
+            for reason in reasons:
+                counts[reason] += 1
+        return counts
+
+
+def check_penetrations(
+    batch: PenetrationBatch,
+    member_rules: Optional[Dict[str, MemberRule]] = None,
+    default_rule: MemberRule = STUD_RULE,
+    reinforcement_ratio: float = DEFAULT_REINFORCEMENT_RATIO,
+) -> ComplianceResult:
+    """
+    Check every penetration in a batch against code limits.
+
+    Args:
+        batch: Columnar penetration data
+        member_rules: Rules per member type (default: DEFAULT_MEMBER_RULES)
+        default_rule: Rule for member types not in member_rules
+        reinforcement_ratio: Bored-hole ratio above which reinforcement
+            is required
+
+    Returns:
+        ComplianceResult aligned with the batch
+    """
+    rules = DEFAULT_MEMBER_RULES if member_rules is None else member_rules
+    bored = PenetrationKind.BORED.value
+    count = len(batch)
+
+    ratios = [0.0] * count
+    limits = [0.0] * count
+    failed: List[List[ComplianceReason]] = [[] for _ in range(count)]
+    rule_of: List[MemberRule] = [default_rule] * count
+    rule_cache: Dict[str, MemberRule] = {}
+
+    for i, (hole, depth, member_type, kind, edge, bearing) in enumerate(zip(
+        batch.hole_diameters, batch.member_depths, batch.member_types,
+        batch.kinds, batch.edge_distances, batch.load_bearing,
+    )):
+        rule = rule_cache.get(member_type)
+        if rule is None:
+            rule = rules.get(member_type.lower(), default_rule) if member_type else default_rule
+            rule_cache[member_type] = rule
+        rule_of[i] = rule
+
+        if hole <= 0.0 or depth <= 0.0:
+            failed[i].append(ComplianceReason.INVALID_SIZE)
+            continue
+
+        ratio = hole / depth
+        ratios[i] = ratio
+        if kind == bored:
+            limit = rule.bored_ratio if bearing else rule.bored_ratio_non_bearing
+            limits[i] = limit
+            if ratio > limit:
+                failed[i].append(ComplianceReason.BORED_RATIO)
+            if edge is None:
+                edge = (depth - hole) / 2.0
+            if edge < rule.min_edge_distance:
+                failed[i].append(ComplianceReason.EDGE_DISTANCE)
+        else:
+            limit = rule.notch_ratio if bearing else rule.notch_ratio_non_bearing
+            limits[i] = limit
+            if ratio > limit:
+                failed[i].append(ComplianceReason.NOTCH_RATIO)
+
+    _check_spacing(batch, rule_of, failed)
+
+    allowed = [not reasons for reasons in failed]
+    return ComplianceResult(
+        allowed=allowed,
+        reasons=[tuple(reason.value for reason in reasons) for reasons in failed],
+        ratios=ratios,
+        limits=limits,
+        reinforcement_required=[
+            ok and kind == bored and ratio > reinforcement_ratio
+            for ok, kind, ratio in zip(allowed, batch.kinds, ratios)
+        ],
+    )
+
+
+def _check_spacing(
+    batch: PenetrationBatch,
+    rule_of: List[MemberRule],
+    failed: List[List[ComplianceReason]],
+) -> None:
+    """Flag holes too close to their neighbour in the same member."""
+    by_member: Dict[str, List[int]] = {}
+    for i, member_id in enumerate(batch.member_ids):
+        if member_id is not None:
+            by_member.setdefault(member_id, []).append(i)
+
+    holes, positions = batch.hole_diameters, batch.positions
+    for indices in by_member.values():
+        if len(indices) < 2:
+            continue
+        indices.sort(key=positions.__getitem__)
+        for a, b in zip(indices, indices[1:]):
+            larger = max(holes[a], holes[b])
+            clear = positions[b] - positions[a] - (holes[a] + holes[b]) / 2.0
+            if clear < rule_of[a].spacing_factor * larger:
+                for i in (a, b):
+                    if ComplianceReason.HOLE_SPACING not in failed[i]:
+                        failed[i].append(ComplianceReason.HOLE_SPACING)
+
+
+def describe_failure(
+    reason: str,
+    hole_diameter: float,
+    member_depth: float,
+    limit: float = 0.0,
+    edge_distance: Optional[float] = None,
+) -> str:
+    """
+    Human-readable description of a reason code.
+
+    Args:
+        reason: ComplianceReason value
+        hole_diameter: Hole diameter (or notch depth) in feet
+        member_depth: Member depth in feet
+        limit: Ratio limit that applied
+        edge_distance: Edge distance, if not a centered hole
+
+    Returns:
+        Description in the style of check_penetration_allowed
+    """
+    if reason == ComplianceReason.BORED_RATIO.value:
+        return (
+            f"Hole diameter ({hole_diameter*12:.2f}in) exceeds {limit*100:g}% "
+            f"of member depth ({member_depth*12:.2f}in)"
+        )
+    if reason == ComplianceReason.NOTCH_RATIO.value:
+        return (
+            f"Notch depth ({hole_diameter*12:.2f}in) exceeds {limit*100:g}% "
+            f"of member depth ({member_depth*12:.2f}in)"
+        )
+    if reason == ComplianceReason.EDGE_DISTANCE.value:
+        if edge_distance is None:
+            edge_distance = (member_depth - hole_diameter) / 2.0
+        return f"Insufficient edge distance ({edge_distance*12:.2f}in)"
+    if reason == ComplianceReason.HOLE_SPACING.value:
+        return "Too close to another penetration in the same member"
+    return f"Invalid penetration size ({hole_diameter*12:.2f}in in {member_depth*12:.2f}in member)"
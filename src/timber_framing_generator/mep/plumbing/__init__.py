@@ -20,36 +20,35 @@ Example:
     >>> routes = system.calculate_routes(connectors, framing_data, [], config)
 """
 
-from .plumbing_system import PlumbingSystem
-from .connector_extractor import (
-    extract_plumbing_connectors,
-    extract_connectors_from_json,
-)
-from .pipe_router import (
-    calculate_pipe_routes,
-    find_wall_entry,
-    extract_walls_from_framing,
-)
-from .penetration_rules import (
-    generate_plumbing_penetrations,
-    get_pipe_size_info,
-    STANDARD_PIPE_SIZES,
-    PLUMBING_PENETRATION_CLEARANCE,
-    MAX_PENETRATION_RATIO,
-)
-from .pipe_creator import (
-    PipeSegment,
-    PipeNetwork,
-    MergePointInfo,
-    parse_routes_json,
-    parse_routes_to_segments,
-    build_pipe_network,
-    build_all_pipe_networks,
-    get_networks_summary,
-    get_revit_system_type_name,
-    SYSTEM_TYPE_MAPPING,
-    WYE_FITTING_GAP,
-)
+from ...utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "PlumbingSystem": ".plumbing_system",
+    "extract_plumbing_connectors": ".connector_extractor",
+    "extract_connectors_from_json": ".connector_extractor",
+    "calculate_pipe_routes": ".pipe_router",
+    "find_wall_entry": ".pipe_router",
+    "extract_walls_from_framing": ".pipe_router",
+    "generate_plumbing_penetrations": ".penetration_rules",
+    "get_pipe_size_info": ".penetration_rules",
+    "STANDARD_PIPE_SIZES": ".penetration_rules",
+    "PLUMBING_PENETRATION_CLEARANCE": ".penetration_rules",
+    "MAX_PENETRATION_RATIO": ".penetration_rules",
+    "PipeSegment": ".pipe_creator",
+    "PipeNetwork": ".pipe_creator",
+    "MergePointInfo": ".pipe_creator",
+    "parse_routes_json": ".pipe_creator",
+    "parse_routes_to_segments": ".pipe_creator",
+    "build_pipe_network": ".pipe_creator",
+    "build_all_pipe_networks": ".pipe_creator",
+    "get_networks_summary": ".pipe_creator",
+    "get_revit_system_type_name": ".pipe_creator",
+    "SYSTEM_TYPE_MAPPING": ".pipe_creator",
+    "WYE_FITTING_GAP": ".pipe_creator",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Main class
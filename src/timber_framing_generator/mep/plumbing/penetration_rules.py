@@ -21,9 +21,14 @@ import logging
 from src.timber_framing_generator.core.mep_system import MEPRoute
 from src.timber_framing_generator.mep.core.base import (
     calculate_penetration_size,
-    check_penetration_allowed,
     distance_3d,
 )
+from src.timber_framing_generator.mep.core.penetration_compliance import (
+    MemberRule,
+    PenetrationBatch,
+    check_penetrations,
+    describe_failure,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +98,8 @@ def generate_plumbing_penetrations(
 
     For each route segment that passes through a stud or other
     vertical framing member, creates a penetration specification.
+    Code compliance of all penetrations is then checked in one batch,
+    including spacing between holes in the same member.
 
     Args:
         routes: Calculated MEP routes with path points
@@ -110,6 +117,7 @@ def generate_plumbing_penetrations(
             - system_type: Plumbing system type
             - is_allowed: Whether penetration meets code limits
             - warning: Description if not allowed
+            - reason_codes: ComplianceReason values of failed rules
             - reinforcement_required: Whether reinforcement is needed
     """
     penetrations = []
@@ -121,6 +129,8 @@ def generate_plumbing_penetrations(
         route_penetrations = _process_route_penetrations(route, studs)
         penetrations.extend(route_penetrations)
 
+    _apply_compliance(penetrations)
+
     logger.info(f"Generated {len(penetrations)} penetrations for {len(routes)} routes")
     return penetrations
 
@@ -350,16 +360,10 @@ def _create_penetration(
     profile = stud.get("profile", {})
     stud_depth = profile.get("depth", 0.292)  # Default 3.5"
 
-    # Check if penetration is allowed
-    is_allowed, warning = check_penetration_allowed(
-        hole_diameter,
-        stud_depth,
-        MAX_PENETRATION_RATIO
-    )
-
-    # Check if reinforcement is required
-    ratio = hole_diameter / stud_depth
-    reinforcement_required = ratio > REINFORCEMENT_THRESHOLD
+    # Wall ID and bearing flag qualify the member for the batch check
+    metadata = stud.get("metadata") or {}
+    wall_id = metadata.get("wall_id", stud.get("wall_id"))
+    load_bearing = metadata.get("load_bearing", metadata.get("is_load_bearing", True))
 
     return {
         "id": f"pen_{route.id}_{stud_id}",
@@ -374,13 +378,56 @@ def _create_penetration(
         "diameter": hole_diameter,
         "pipe_size": pipe_diameter,
         "system_type": route.system_type,
-        "is_allowed": is_allowed,
-        "warning": warning,
-        "reinforcement_required": reinforcement_required,
-        "penetration_ratio": ratio,
+        "member_depth": stud_depth,
+        "wall_id": wall_id,
+        "load_bearing": bool(load_bearing),
+        "is_allowed": True,
+        "warning": None,
+        "reason_codes": [],
+        "reinforcement_required": False,
+        "penetration_ratio": hole_diameter / stud_depth if stud_depth > 0 else 0.0,
     }
 
 
+def _apply_compliance(penetrations: List[Dict[str, Any]]) -> None:
+    """
+    Check all penetrations against code limits in one batch.
+
+    Fills is_allowed, warning, reason_codes and reinforcement_required.
+
+    Args:
+        penetrations: Penetration specifications from _create_penetration
+    """
+    batch = PenetrationBatch()
+    for pen in penetrations:
+        member_key = pen["element_id"]
+        if pen.get("wall_id") is not None:
+            member_key = f"{pen['wall_id']}:{member_key}"
+        batch.append(
+            hole_diameter=pen["diameter"],
+            member_depth=pen["member_depth"],
+            member_type=pen["element_type"],
+            load_bearing=pen["load_bearing"],
+            member_id=member_key,
+            position=pen["location"]["z"],
+        )
+
+    result = check_penetrations(
+        batch,
+        default_rule=MemberRule(bored_ratio=MAX_PENETRATION_RATIO),
+        reinforcement_ratio=REINFORCEMENT_THRESHOLD,
+    )
+    for i, pen in enumerate(penetrations):
+        reasons = list(result.reasons[i])
+        pen["is_allowed"] = result.allowed[i]
+        pen["reason_codes"] = reasons
+        pen["reinforcement_required"] = result.reinforcement_required[i]
+        pen["warning"] = "; ".join(
+            describe_failure(reason, pen["diameter"], pen["member_depth"], result.limits[i])
+            for reason in reasons
+        ) or None
+
+
 def get_pipe_size_info(diameter_ft: float) -> Dict[str, Any]:
     """
     Get standard pipe size information from diameter.
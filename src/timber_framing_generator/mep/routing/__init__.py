@@ -15,86 +15,89 @@ Components:
 - Graph Builders: Wall, floor, and unified graph construction
 """
 
-from .occupancy import OccupancyMap, OccupiedSegment
-from .domains import RoutingDomainType, RoutingDomain, Obstacle, Point2D
-from .targets import RoutingTarget, TargetType, TargetCandidate
-from .graph import MultiDomainGraph, TransitionEdge, TransitionType
-from .target_generator import (
-    TargetCandidateGenerator,
-    detect_wet_walls,
-    generate_targets_from_walls,
-    WetWallInfo,
-)
-from .heuristics import (
-    TargetHeuristic,
-    SanitaryHeuristic,
-    VentHeuristic,
-    SupplyHeuristic,
-    PowerHeuristic,
-    DataHeuristic,
-)
-from .heuristics.base import ConnectorInfo
-from .wall_graph import WallGraphBuilder, build_wall_graph_from_data
-from .floor_graph import FloorGraphBuilder, build_floor_graph_from_bounds
-from .graph_builder import (
-    UnifiedGraphBuilder,
-    TransitionGenerator,
-    build_routing_graph,
-)
-from .route_segment import RouteSegment, SegmentDirection, Route
-from .hanan_grid import (
-    HananGrid,
-    HananMST,
-    SteinerTreeBuilder,
-    compute_hanan_mst,
-)
-from .pathfinding import (
-    AStarPathfinder,
-    PathReconstructor,
-    PathResult,
-    find_shortest_path,
-    find_path_as_route,
-)
-from .multi_domain_pathfinder import MultiDomainPathfinder
-from .routing_result import (
-    RoutingResult,
-    RoutingStatistics,
-    FailedConnector,
-    RoutingRequest,
-)
-from .oahs_router import (
-    OAHSRouter,
-    ConnectorSequencer,
-    ConflictResolver,
-    create_oahs_router,
-)
-from .trade_config import (
-    Trade,
-    TradeConfig,
-    RoutingZone,
-    create_default_trade_config,
-    create_plumbing_only_config,
-    create_electrical_only_config,
-)
-from .orchestrator import (
-    SequentialOrchestrator,
-    ZonePartitionStrategy,
-    DefaultZoneStrategy,
-    SingleZoneStrategy,
-    OrchestrationResult,
-    OrchestrationStatistics,
-    create_orchestrator,
-    create_single_zone_orchestrator,
-)
-from .postprocess import (
-    SlopeCalculator,
-    ElbowOptimizer,
-    FlowDirectionAssigner,
-    SanitaryPostProcessor,
-    PostProcessResult,
-    SlopeInfo,
-    apply_sanitary_postprocess,
-)
+from ...utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "OccupancyMap": ".occupancy",
+    "OccupiedSegment": ".occupancy",
+    "RoutingDomainType": ".domains",
+    "RoutingDomain": ".domains",
+    "Obstacle": ".domains",
+    "Point2D": ".domains",
+    "RoutingTarget": ".targets",
+    "TargetType": ".targets",
+    "TargetCandidate": ".targets",
+    "MultiDomainGraph": ".graph",
+    "TransitionEdge": ".graph",
+    "TransitionType": ".graph",
+    "TargetCandidateGenerator": ".target_generator",
+    "detect_wet_walls": ".target_generator",
+    "generate_targets_from_walls": ".target_generator",
+    "WetWallInfo": ".target_generator",
+    "TargetHeuristic": ".heuristics",
+    "SanitaryHeuristic": ".heuristics",
+    "VentHeuristic": ".heuristics",
+    "SupplyHeuristic": ".heuristics",
+    "PowerHeuristic": ".heuristics",
+    "DataHeuristic": ".heuristics",
+    "ConnectorInfo": ".heuristics.base",
+    "WallGraphBuilder": ".wall_graph",
+    "build_wall_graph_from_data": ".wall_graph",
+    "FloorGraphBuilder": ".floor_graph",
+    "build_floor_graph_from_bounds": ".floor_graph",
+    "UnifiedGraphBuilder": ".graph_builder",
+    "TransitionGenerator": ".graph_builder",
+    "build_routing_graph": ".graph_builder",
+    "RouteSegment": ".route_segment",
+    "SegmentDirection": ".route_segment",
+    "Route": ".route_segment",
+    "HananGrid": ".hanan_grid",
+    "HananMST": ".hanan_grid",
+    "SteinerTreeBuilder": ".hanan_grid",
+    "compute_hanan_mst": ".hanan_grid",
+    "AStarPathfinder": ".pathfinding",
+    "PathReconstructor": ".pathfinding",
+    "PathResult": ".pathfinding",
+    "find_shortest_path": ".pathfinding",
+    "find_path_as_route": ".pathfinding",
+    "MultiDomainPathfinder": ".multi_domain_pathfinder",
+    "RoutingResult": ".routing_result",
+    "RoutingStatistics": ".routing_result",
+    "FailedConnector": ".routing_result",
+    "RoutingRequest": ".routing_result",
+    "OAHSRouter": ".oahs_router",
+    "ConnectorSequencer": ".oahs_router",
+    "ConflictResolver": ".oahs_router",
+    "create_oahs_router": ".oahs_router",
+    "Trade": ".trade_config",
+    "TradeConfig": ".trade_config",
+    "RoutingZone": ".trade_config",
+    "create_default_trade_config": ".trade_config",
+    "create_plumbing_only_config": ".trade_config",
+    "create_electrical_only_config": ".trade_config",
+    "RoutingPlan": ".routing_plan",
+    "ZoneIndex": ".routing_plan",
+    "build_target_lookup": ".routing_plan",
+    "TargetSpatialIndex": ".target_index",
+    "SequentialOrchestrator": ".orchestrator",
+    "ZonePartitionStrategy": ".orchestrator",
+    "DefaultZoneStrategy": ".orchestrator",
+    "SingleZoneStrategy": ".orchestrator",
+    "OrchestrationResult": ".orchestrator",
+    "OrchestrationStatistics": ".orchestrator",
+    "create_orchestrator": ".orchestrator",
+    "create_single_zone_orchestrator": ".orchestrator",
+    "SlopeCalculator": ".postprocess",
+    "ElbowOptimizer": ".postprocess",
+    "FlowDirectionAssigner": ".postprocess",
+    "SanitaryPostProcessor": ".postprocess",
+    "PostProcessResult": ".postprocess",
+    "SlopeInfo": ".postprocess",
+    "apply_sanitary_postprocess": ".postprocess",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Occupancy
@@ -167,6 +170,11 @@ __all__ = [
     "create_default_trade_config",
     "create_plumbing_only_config",
     "create_electrical_only_config",
+    # Routing Plan
+    "RoutingPlan",
+    "ZoneIndex",
+    "build_target_lookup",
+    "TargetSpatialIndex",
     # Orchestrator
     "SequentialOrchestrator",
     "ZonePartitionStrategy",
@@ -12,12 +12,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any, Set, TYPE_CHECKING
 from enum import Enum
 
-try:
-    import networkx as nx
-    HAS_NETWORKX = True
-except ImportError:
-    HAS_NETWORKX = False
-    nx = None
+from ...utils.lazy_imports import optional_import
+
+# networkx is imported on first use, not at module import
+nx, HAS_NETWORKX = optional_import("networkx")
 
 if TYPE_CHECKING:
     import networkx as nx
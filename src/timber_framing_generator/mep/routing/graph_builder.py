@@ -13,12 +13,10 @@ import json
 import logging
 import math
 
-try:
-    import networkx as nx
-    HAS_NETWORKX = True
-except ImportError:
-    HAS_NETWORKX = False
-    nx = None
+from ...utils.lazy_imports import optional_import
+
+# networkx is imported on first use, not at module import
+nx, HAS_NETWORKX = optional_import("networkx")
 
 if TYPE_CHECKING:
     import networkx as nx
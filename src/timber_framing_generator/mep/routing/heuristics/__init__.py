@@ -6,9 +6,20 @@ Provides pluggable heuristics for finding and ranking routing targets
 based on MEP system type.
 """
 
-from .base import TargetHeuristic
-from .plumbing import SanitaryHeuristic, VentHeuristic, SupplyHeuristic
-from .electrical import PowerHeuristic, DataHeuristic, LightingHeuristic
+from ....utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "TargetHeuristic": ".base",
+    "SanitaryHeuristic": ".plumbing",
+    "VentHeuristic": ".plumbing",
+    "SupplyHeuristic": ".plumbing",
+    "PowerHeuristic": ".electrical",
+    "DataHeuristic": ".electrical",
+    "LightingHeuristic": ".electrical",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     "TargetHeuristic",
@@ -5,12 +5,14 @@ Base class for MEP routing target heuristics.
 Provides the abstract interface that all system-specific heuristics implement.
 """
 
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict, Any
 
 from ..targets import RoutingTarget, TargetCandidate, TargetType
 from ..domains import RoutingDomain
+from ..target_index import TargetSpatialIndex
 
 
 @dataclass
@@ -91,6 +93,7 @@ class TargetHeuristic(ABC):
     priority_weight: float = 0.1
     floor_change_penalty: float = 10.0
 
+
     @property
     @abstractmethod
     def system_types(self) -> List[str]:
@@ -109,7 +112,8 @@ class TargetHeuristic(ABC):
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """
         Find and rank candidate targets for a connector.
@@ -119,12 +123,148 @@ class TargetHeuristic(ABC):
             targets: All available routing targets
             domains: Available routing domains
             max_candidates: Maximum number of candidates to return
+            index: Optional spatial index built over ``targets``; when given,
+                only targets near the connector are scored
 
         Returns:
             List of TargetCandidates, sorted by score (best first)
         """
         pass
 
+    def is_valid_target(self, connector: ConnectorInfo, target: RoutingTarget) -> bool:
+        """
+        Check whether a target may be offered for a connector at all.
+
+        Default: available, of a preferred type and large enough for the
+        connector's pipe/conduit.
+        """
+        return (
+            target.is_available
+            and target.target_type in self.preferred_target_types
+            and target.can_fit_pipe(connector.diameter)
+        )
+
+    @property
+    def min_score_adjustment(self) -> float:
+        """
+        Most negative amount score_target() adds to the base score.
+
+        Subclasses that apply bonuses override this so best-k pruning
+        stays exact.
+        """
+        return 0.0
+
+    def score_lower_bound(
+        self,
+        connector: ConnectorInfo,
+        xy_distance: float,
+        priority_range: Tuple[int, int] = (0, 0)
+    ) -> float:
+        """
+        Lower bound on score_target() for targets at least a given XY
+        Manhattan distance from the connector.
+
+        Holds for any subclass whose extra terms are non-negative apart from
+        the bonuses covered by ``min_score_adjustment``.
+
+        Args:
+            connector: The connector seeking a target
+            xy_distance: Lower bound on XY Manhattan distance to the targets
+            priority_range: (min, max) priority of the targets
+
+        Returns:
+            Score lower bound
+        """
+        return (
+            self.distance_weight * xy_distance
+            + min(self.priority_weight * p for p in priority_range)
+            + self.min_score_adjustment
+        )
+
+    def rank_targets(
+        self,
+        connector: ConnectorInfo,
+        targets: List[RoutingTarget],
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
+    ) -> List[Tuple[float, RoutingTarget]]:
+        """
+        Select the best-scoring valid targets for a connector.
+
+        The result equals scoring every valid target and stable-sorting by
+        score (targets with infinite score are dropped). With an index,
+        targets are visited ring by ring around the connector and the
+        search stops once no unvisited target can beat the current k-th
+        best score; ``heapq.nsmallest`` picks the final ranking either way.
+
+        Args:
+            connector: The connector seeking a target
+            targets: Candidate targets (ignored when ``index`` is given)
+            max_candidates: Number of targets to return
+            index: Spatial index over the candidate targets
+
+        Returns:
+            List of (score, target), best first
+        """
+        if max_candidates <= 0:
+            return []
+
+        # (score, input position, target); position breaks ties like a stable sort
+        scored: List[Tuple[float, int, RoutingTarget]] = []
+
+        if index is None:
+            for i, target in enumerate(targets):
+                if self.is_valid_target(connector, target):
+                    score = self.score_target(connector, target)
+                    if score < float('inf'):
+                        scored.append((score, i, target))
+        else:
+            # Max-heap (negated) of the best k keys seen so far
+            best: List[Tuple[float, int]] = []
+            priority_range = (index.min_priority, index.max_priority)
+            for xy_bound, hits in index.rings(connector.location[0], connector.location[1]):
+                if len(best) == max_candidates:
+                    bound = self.score_lower_bound(connector, xy_bound, priority_range)
+                    if bound > -best[0][0]:
+                        break
+                for i, target in hits:
+                    if not self.is_valid_target(connector, target):
+                        continue
+                    score = self.score_target(connector, target)
+                    if score == float('inf'):
+                        continue
+                    scored.append((score, i, target))
+                    if len(best) < max_candidates:
+                        heapq.heappush(best, (-score, -i))
+                    elif (score, i) < (-best[0][0], -best[0][1]):
+                        heapq.heapreplace(best, (-score, -i))
+
+        top = heapq.nsmallest(max_candidates, scored, key=lambda s: (s[0], s[1]))
+        return [(score, target) for score, _, target in top]
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        """Notes recorded on a TargetCandidate for this heuristic."""
+        return ""
+
+    def _rank_candidates(
+        self,
+        connector: ConnectorInfo,
+        targets: List[RoutingTarget],
+        max_candidates: int,
+        index: Optional[TargetSpatialIndex] = None
+    ) -> List[TargetCandidate]:
+        """Build TargetCandidates for the best-ranked targets only."""
+        return [
+            self._create_candidate(
+                connector, target,
+                notes=self.candidate_notes(connector, target),
+                score=score
+            )
+            for score, target in self.rank_targets(
+                connector, targets, max_candidates, index
+            )
+        ]
+
     def score_target(
         self,
         connector: ConnectorInfo,
@@ -209,11 +349,13 @@ class TargetHeuristic(ABC):
         connector: ConnectorInfo,
         target: RoutingTarget,
         domain: Optional[RoutingDomain] = None,
-        notes: str = ""
+        notes: str = "",
+        score: Optional[float] = None
     ) -> TargetCandidate:
-        """Create a TargetCandidate with calculated score."""
+        """Create a TargetCandidate with calculated (or precomputed) score."""
         distance = self._manhattan_distance_3d(connector.location, target.location)
-        score = self.score_target(connector, target, domain)
+        if score is None:
+            score = self.score_target(connector, target, domain)
 
         return TargetCandidate(
             target=target,
@@ -243,28 +385,24 @@ class FallbackHeuristic(TargetHeuristic):
         # Accept any target type
         return list(TargetType)
 
+    def is_valid_target(self, connector: ConnectorInfo, target: RoutingTarget) -> bool:
+        """Any available target with capacity that serves the system."""
+        return (
+            target.is_available
+            and target.can_fit_pipe(connector.diameter)
+            and target.can_serve_system(connector.system_type)
+        )
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return "Fallback: distance-based ranking"
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find candidates using simple distance ranking."""
-        # Filter available targets with sufficient capacity
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Score all valid targets
-        candidates = []
-        for target in valid_targets:
-            if target.can_serve_system(connector.system_type):
-                candidate = self._create_candidate(
-                    connector, target,
-                    notes="Fallback: distance-based ranking"
-                )
-                candidates.append(candidate)
-
-        # Sort by score and return top candidates
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
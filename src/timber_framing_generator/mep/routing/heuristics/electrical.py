@@ -8,6 +8,7 @@ Provides heuristics for power, data, and low-voltage systems.
 from typing import List, Optional
 
 from .base import TargetHeuristic, ConnectorInfo
+from ..target_index import TargetSpatialIndex
 from ..targets import RoutingTarget, TargetCandidate, TargetType
 from ..domains import RoutingDomain
 
@@ -65,31 +66,23 @@ class PowerHeuristic(TargetHeuristic):
 
         return base_score
 
+    @property
+    def min_score_adjustment(self) -> float:
+        return min(self.panel_boundary_bonus, self.ceiling_bonus, 0.0)
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return f"Power: {target.target_type.value}"
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find power routing targets."""
-        # Filter to power-compatible targets
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_target_type(valid_targets, self.preferred_target_types)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Score and rank
-        candidates = []
-        for target in valid_targets:
-            score = self.score_target(connector, target)
-            candidate = self._create_candidate(
-                connector, target,
-                notes=f"Power: {target.target_type.value}"
-            )
-            candidates.append(candidate)
-
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
 
 
 class DataHeuristic(TargetHeuristic):
@@ -151,31 +144,23 @@ class DataHeuristic(TargetHeuristic):
 
         return base_score
 
+    @property
+    def min_score_adjustment(self) -> float:
+        return min(self.patch_panel_bonus, self.patch_panel_bonus * 0.5, self.ceiling_bonus, 0.0)
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return f"Data: {target.target_type.value}"
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find data routing targets."""
-        # Filter to data-compatible targets
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_target_type(valid_targets, self.preferred_target_types)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Score and rank
-        candidates = []
-        for target in valid_targets:
-            score = self.score_target(connector, target)
-            candidate = self._create_candidate(
-                connector, target,
-                notes=f"Data: {target.target_type.value}"
-            )
-            candidates.append(candidate)
-
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
 
 
 class LightingHeuristic(TargetHeuristic):
@@ -227,28 +212,20 @@ class LightingHeuristic(TargetHeuristic):
 
         return base_score
 
+    @property
+    def min_score_adjustment(self) -> float:
+        return min(self.ceiling_bonus, self.wall_switch_bonus, 0.0)
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return f"Lighting: {target.target_type.value}"
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find lighting routing targets."""
-        # Filter to lighting-compatible targets
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_target_type(valid_targets, self.preferred_target_types)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Score and rank
-        candidates = []
-        for target in valid_targets:
-            score = self.score_target(connector, target)
-            candidate = self._create_candidate(
-                connector, target,
-                notes=f"Lighting: {target.target_type.value}"
-            )
-            candidates.append(candidate)
-
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
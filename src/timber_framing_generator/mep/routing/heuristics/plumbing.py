@@ -8,6 +8,7 @@ Provides heuristics for sanitary (drain), vent, and supply systems.
 from typing import List, Optional
 
 from .base import TargetHeuristic, ConnectorInfo
+from ..target_index import TargetSpatialIndex
 from ..targets import RoutingTarget, TargetCandidate, TargetType
 from ..domains import RoutingDomain
 
@@ -85,40 +86,33 @@ class SanitaryHeuristic(TargetHeuristic):
 
         return base_score
 
+    @property
+    def min_score_adjustment(self) -> float:
+        return min(self.wet_wall_bonus, self.shaft_bonus, 0.0)
+
+    def is_valid_target(self, connector: ConnectorInfo, target: RoutingTarget) -> bool:
+        """Preferred, available targets at or below the connector (gravity drain)."""
+        return (
+            super().is_valid_target(connector, target)
+            and target.location[2] <= connector.location[2]
+        )
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return (
+            f"Sanitary: {target.target_type.value}, elevation drop: "
+            f"{connector.location[2] - target.location[2]:.2f} ft"
+        )
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find drain targets respecting gravity constraints."""
-        # Filter to sanitary-compatible targets
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_target_type(valid_targets, self.preferred_target_types)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Filter targets that are at or below connector elevation
-        # (can't route upward for gravity drain)
-        valid_targets = [
-            t for t in valid_targets
-            if t.location[2] <= connector.location[2]
-        ]
-
-        # Score and rank
-        candidates = []
-        for target in valid_targets:
-            score = self.score_target(connector, target)
-            if score < float('inf'):
-                candidate = self._create_candidate(
-                    connector, target,
-                    notes=f"Sanitary: {target.target_type.value}, elevation drop: "
-                          f"{connector.location[2] - target.location[2]:.2f} ft"
-                )
-                candidates.append(candidate)
-
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
 
 
 class VentHeuristic(TargetHeuristic):
@@ -173,31 +167,23 @@ class VentHeuristic(TargetHeuristic):
 
         return base_score
 
+    @property
+    def min_score_adjustment(self) -> float:
+        return min(self.wet_wall_bonus, 0.0)
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return f"Vent: {target.target_type.value}"
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find vent targets preferring wet walls."""
-        # Filter to vent-compatible targets
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_target_type(valid_targets, self.preferred_target_types)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Score and rank
-        candidates = []
-        for target in valid_targets:
-            score = self.score_target(connector, target)
-            candidate = self._create_candidate(
-                connector, target,
-                notes=f"Vent: {target.target_type.value}"
-            )
-            candidates.append(candidate)
-
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
 
 
 class SupplyHeuristic(TargetHeuristic):
@@ -253,28 +239,20 @@ class SupplyHeuristic(TargetHeuristic):
 
         return base_score
 
+    @property
+    def min_score_adjustment(self) -> float:
+        return min(self.wet_wall_bonus, 0.0)
+
+    def candidate_notes(self, connector: ConnectorInfo, target: RoutingTarget) -> str:
+        return f"Supply ({connector.system_type}): {target.target_type.value}"
+
     def find_candidates(
         self,
         connector: ConnectorInfo,
         targets: List[RoutingTarget],
         domains: List[RoutingDomain],
-        max_candidates: int = 5
+        max_candidates: int = 5,
+        index: Optional[TargetSpatialIndex] = None
     ) -> List[TargetCandidate]:
         """Find supply targets with flexible routing."""
-        # Filter to supply-compatible targets
-        valid_targets = self._filter_available(targets)
-        valid_targets = self._filter_by_target_type(valid_targets, self.preferred_target_types)
-        valid_targets = self._filter_by_capacity(valid_targets, connector.diameter)
-
-        # Score and rank
-        candidates = []
-        for target in valid_targets:
-            score = self.score_target(connector, target)
-            candidate = self._create_candidate(
-                connector, target,
-                notes=f"Supply ({connector.system_type}): {target.target_type.value}"
-            )
-            candidates.append(candidate)
-
-        candidates.sort(key=lambda c: c.score)
-        return candidates[:max_candidates]
+        return self._rank_candidates(connector, targets, max_candidates, index)
@@ -10,12 +10,10 @@ import logging
 import math
 from typing import List, Tuple, Optional, Dict, Set
 
-try:
-    import networkx as nx
-    HAS_NETWORKX = True
-except ImportError:
-    HAS_NETWORKX = False
-    nx = None
+from ...utils.lazy_imports import optional_import
+
+# networkx is imported on first use, not at module import
+nx, HAS_NETWORKX = optional_import("networkx")
 
 from .graph import MultiDomainGraph
 from .pathfinding import AStarPathfinder, PathReconstructor, PathResult
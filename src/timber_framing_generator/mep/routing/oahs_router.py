@@ -9,6 +9,7 @@ Implements the core routing algorithm that:
 4. Handles conflicts and failures
 """
 
+import heapq
 import logging
 import time
 from dataclasses import dataclass, field
@@ -21,6 +22,8 @@ from .route_segment import Route, RouteSegment
 from .routing_result import RoutingResult, RoutingStatistics, FailedConnector
 from .heuristics.base import ConnectorInfo, TargetHeuristic
 from .multi_domain_pathfinder import MultiDomainPathfinder
+from .routing_plan import build_target_lookup
+from .target_index import TargetSpatialIndex
 
 logger = logging.getLogger(__name__)
 
@@ -225,8 +228,13 @@ class OAHSRouter:
         mdg: Multi-domain graph for routing
         occupancy: Occupancy map for space tracking
         heuristics: Registry of target heuristics by system type
+        max_attempts: Number of best-ranked targets tried per connector
     """
 
+    max_attempts: int = 5
+    # Spatial indices kept per router before the cache is reset
+    _max_cached_indices: int = 64
+
     def __init__(
         self,
         mdg: MultiDomainGraph,
@@ -246,6 +254,14 @@ class OAHSRouter:
         self.heuristics = heuristic_registry or {}
         self._pathfinder: Optional[MultiDomainPathfinder] = None
         self._sequencer = ConnectorSequencer()
+        # (targets list, target count, lookup) of the last lookup built
+        self._target_lookup_cache: Optional[
+            Tuple[List[RoutingTarget], int, Dict[str, List[RoutingTarget]]]
+        ] = None
+        # id(target list) -> (target list, spatial index over it)
+        self._target_index_cache: Dict[
+            int, Tuple[List[RoutingTarget], TargetSpatialIndex]
+        ] = {}
         self._initialize_pathfinder()
 
     def _initialize_pathfinder(self) -> None:
@@ -263,7 +279,8 @@ class OAHSRouter:
     def route_all(
         self,
         connectors: List[ConnectorInfo],
-        targets: List[RoutingTarget]
+        targets: List[RoutingTarget],
+        target_lookup: Optional[Dict[str, List[RoutingTarget]]] = None
     ) -> RoutingResult:
         """
         Route all connectors to appropriate targets.
@@ -271,6 +288,8 @@ class OAHSRouter:
         Args:
             connectors: List of connectors to route
             targets: List of available routing targets
+            target_lookup: Precompiled system -> targets lookup for
+                ``targets`` (built here if omitted)
 
         Returns:
             RoutingResult with routes, failures, and statistics
@@ -294,7 +313,10 @@ class OAHSRouter:
         logger.info(f"Routing {len(sequenced)} connectors in priority order")
 
         # Build target lookup by system compatibility
-        target_by_system = self._build_target_lookup(targets)
+        target_by_system = (
+            target_lookup if target_lookup is not None
+            else self._get_target_lookup(targets)
+        )
 
         # Route each connector
         for i, connector in enumerate(sequenced):
@@ -343,7 +365,7 @@ class OAHSRouter:
         Returns:
             Route if successful, None otherwise
         """
-        target_lookup = self._build_target_lookup(targets)
+        target_lookup = self._get_target_lookup(targets)
         return self._route_connector(connector, targets, target_lookup)
 
     def _route_connector(
@@ -370,14 +392,19 @@ class OAHSRouter:
 
         # Try targets in priority order
         if heuristic:
-            candidates = heuristic.find_candidates(connector, compatible)
-            sorted_targets = [c.target for c in sorted(candidates, key=lambda c: c.score)]
+            ranked = heuristic.rank_targets(
+                connector, compatible, self.max_attempts,
+                index=self._get_target_index(compatible)
+            )
+            sorted_targets = [target for _, target in ranked]
         else:
             # Sort by distance as fallback
-            sorted_targets = self._sort_targets_by_distance(connector, compatible)
+            sorted_targets = self._sort_targets_by_distance(
+                connector, compatible, self.max_attempts
+            )
 
         # Attempt routing to each target
-        for target in sorted_targets[:5]:  # Limit attempts
+        for target in sorted_targets:
             route = self._attempt_route(connector, target)
             if route:
                 return route
@@ -477,30 +504,38 @@ class OAHSRouter:
         targets: List[RoutingTarget]
     ) -> Dict[str, List[RoutingTarget]]:
         """Build lookup of targets by compatible system."""
-        lookup: Dict[str, List[RoutingTarget]] = {}
-
-        for target in targets:
-            # Add to all compatible systems (systems_served attribute)
-            for system in (target.systems_served or []):
-                if system not in lookup:
-                    lookup[system] = []
-                lookup[system].append(target)
-
-            # Also add by target type if it maps to systems
-            if target.target_type:
-                type_str = target.target_type.value if hasattr(target.target_type, 'value') else str(target.target_type)
-                if type_str not in lookup:
-                    lookup[type_str] = []
-                lookup[type_str].append(target)
+        return build_target_lookup(targets)
 
+    def _get_target_lookup(
+        self,
+        targets: List[RoutingTarget]
+    ) -> Dict[str, List[RoutingTarget]]:
+        """Get the target lookup, reusing it for the same unchanged list."""
+        cached = self._target_lookup_cache
+        if cached is not None and cached[0] is targets and cached[1] == len(targets):
+            return cached[2]
+        lookup = self._build_target_lookup(targets)
+        self._target_lookup_cache = (targets, len(targets), lookup)
         return lookup
 
+    def _get_target_index(self, targets: List[RoutingTarget]) -> TargetSpatialIndex:
+        """Get the spatial index over a target list, building it on first use."""
+        cached = self._target_index_cache.get(id(targets))
+        if cached is not None and cached[0] is targets and len(cached[1]) == len(targets):
+            return cached[1]
+        if len(self._target_index_cache) >= self._max_cached_indices:
+            self._target_index_cache.clear()
+        index = TargetSpatialIndex(targets)
+        self._target_index_cache[id(targets)] = (targets, index)
+        return index
+
     def _sort_targets_by_distance(
         self,
         connector: ConnectorInfo,
-        targets: List[RoutingTarget]
+        targets: List[RoutingTarget],
+        limit: Optional[int] = None
     ) -> List[RoutingTarget]:
-        """Sort targets by distance from connector."""
+        """Sort targets by distance from connector, keeping at most ``limit``."""
         def distance(target: RoutingTarget) -> float:
             if not connector.location or not target.plane_location:
                 return float('inf')
@@ -511,6 +546,8 @@ class OAHSRouter:
             dy = ty - cy
             return (dx * dx + dy * dy) ** 0.5
 
+        if limit is not None:
+            return heapq.nsmallest(limit, targets, key=distance)
         return sorted(targets, key=distance)
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -12,7 +12,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Any
 
 from .trade_config import TradeConfig, Trade, RoutingZone, create_default_trade_config
 from .routing_result import RoutingResult, RoutingStatistics
@@ -20,10 +20,7 @@ from .route_segment import Route
 from .heuristics.base import ConnectorInfo
 from .targets import RoutingTarget
 from .occupancy import OccupancyMap
-
-if TYPE_CHECKING:
-    from .oahs_router import OAHSRouter
-    from .graph import MultiDomainGraph
+from .routing_plan import RoutingPlan
 
 logger = logging.getLogger(__name__)
 
@@ -383,46 +380,35 @@ class SequentialOrchestrator:
         result.statistics.total_zones = len(zones)
         logger.info(f"Partitioned building into {len(zones)} zones")
 
-        # 2. Get enabled trades
-        enabled_trades = self.trade_config.get_enabled_trades()
-        result.statistics.total_trades = len(enabled_trades)
-
-        # 3. Build connector lookup
-        connector_by_id = {c.id: c for c in connectors}
-        target_by_id = {t.id: t for t in targets}
+        # 2. Compile routing plan (trade/zone buckets, target partitions)
+        plan = RoutingPlan.compile(self.trade_config, connectors, targets, zones)
+        result.statistics.total_trades = len(plan.trades)
 
-        # 4. Route each trade in priority order
-        for trade in enabled_trades:
+        # 3. Route each trade in priority order
+        for trade in plan.trades:
             trade_start = time.time()
             trade_result = RoutingResult()
-            trade_systems = self.trade_config.get_systems_for_trade(trade)
-
-            # Filter connectors for this trade
-            trade_connectors = [
-                c for c in connectors
-                if c.system_type.lower() in [s.lower() for s in trade_systems]
-            ]
 
             logger.info(
-                f"Routing trade {trade.value}: {len(trade_connectors)} connectors"
+                f"Routing trade {trade.value}: "
+                f"{len(plan.trade_connectors[trade])} connectors"
             )
 
             # Route each zone
-            for zone in zones:
+            for zone_idx, zone in enumerate(zones):
                 zone_start = time.time()
 
                 # Get connectors in this zone
-                zone_connectors = [
-                    c for c in trade_connectors
-                    if c.id in zone.connector_ids or self._connector_in_zone(c, zone)
-                ]
+                zone_connectors = plan.connectors_for(zone_idx, trade)
 
                 if not zone_connectors:
                     continue
 
                 # Route zone
                 zone_result = self._route_zone_for_trade(
-                    zone, zone_connectors, targets, trade, mdg_factory
+                    zone, zone_connectors, targets, trade, mdg_factory,
+                    trade_targets=plan.trade_targets[trade],
+                    target_lookup=plan.trade_target_lookups[trade],
                 )
 
                 # Merge into zone results
@@ -443,7 +429,7 @@ class SequentialOrchestrator:
             trade_time = (time.time() - trade_start) * 1000
             result.statistics.trade_times_ms[trade.value] = trade_time
 
-        # 5. Aggregate statistics
+        # 4. Aggregate statistics
         self._aggregate_statistics(result)
         result.statistics.orchestration_time_ms = (time.time() - start_time) * 1000
 
@@ -469,17 +455,16 @@ class SequentialOrchestrator:
             RoutingResult for the zone
         """
         result = RoutingResult()
+        plan = RoutingPlan.compile(self.trade_config, connectors, targets)
 
-        for trade in self.trade_config.get_enabled_trades():
-            trade_systems = self.trade_config.get_systems_for_trade(trade)
-            trade_connectors = [
-                c for c in connectors
-                if c.system_type.lower() in [s.lower() for s in trade_systems]
-            ]
+        for trade in plan.trades:
+            trade_connectors = plan.trade_connectors[trade]
 
             if trade_connectors:
                 trade_result = self._route_zone_for_trade(
-                    zone, trade_connectors, targets, trade, mdg_factory
+                    zone, trade_connectors, targets, trade, mdg_factory,
+                    trade_targets=plan.trade_targets[trade],
+                    target_lookup=plan.trade_target_lookups[trade],
                 )
                 self._merge_results(result, trade_result)
 
@@ -491,17 +476,25 @@ class SequentialOrchestrator:
         connectors: List[ConnectorInfo],
         targets: List[RoutingTarget],
         trade: Trade,
-        mdg_factory: Optional[callable]
+        mdg_factory: Optional[callable],
+        trade_targets: Optional[List[RoutingTarget]] = None,
+        target_lookup: Optional[Dict[str, List[RoutingTarget]]] = None
     ) -> RoutingResult:
-        """Route connectors in a zone for a specific trade."""
+        """
+        Route connectors in a zone for a specific trade.
+
+        ``trade_targets`` and ``target_lookup`` come from a RoutingPlan;
+        when omitted, targets are filtered here.
+        """
         from .oahs_router import OAHSRouter
 
         # Filter targets for trade systems
-        trade_systems = self.trade_config.get_systems_for_trade(trade)
-        trade_targets = [
-            t for t in targets
-            if self._target_serves_trade(t, trade_systems)
-        ]
+        if trade_targets is None:
+            trade_systems = self.trade_config.get_systems_for_trade(trade)
+            trade_targets = [
+                t for t in targets
+                if self._target_serves_trade(t, trade_systems)
+            ]
 
         if not trade_targets:
             # No targets for this trade - mark all as failed
@@ -528,7 +521,7 @@ class SequentialOrchestrator:
         router = OAHSRouter(mdg, occupancy=self._occupancy)
 
         # Route connectors
-        result = router.route_all(connectors, trade_targets)
+        result = router.route_all(connectors, trade_targets, target_lookup)
 
         # Update shared occupancy from successful routes
         for route in result.routes:
@@ -547,15 +540,6 @@ class SequentialOrchestrator:
                 return True
         return False
 
-    def _connector_in_zone(
-        self,
-        connector: ConnectorInfo,
-        zone: RoutingZone
-    ) -> bool:
-        """Check if connector is within zone bounds."""
-        x, y = connector.location[0], connector.location[1]
-        return zone.contains_point(x, y)
-
     def _reserve_route_occupancy(self, route: Route, trade: Trade) -> None:
         """Reserve space in occupancy map for a route."""
         from .occupancy import OccupiedSegment
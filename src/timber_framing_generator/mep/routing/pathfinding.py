@@ -14,12 +14,10 @@ from typing import (
     List, Tuple, Optional, Dict, Set, Callable, Any
 )
 
-try:
-    import networkx as nx
-    HAS_NETWORKX = True
-except ImportError:
-    HAS_NETWORKX = False
-    nx = None
+from ...utils.lazy_imports import optional_import
+
+# networkx is imported on first use, not at module import
+nx, HAS_NETWORKX = optional_import("networkx")
 
 from .route_segment import RouteSegment, SegmentDirection, Route
 
@@ -6,15 +6,20 @@ Provides specialized processing for different MEP systems:
 - Sanitary: Slope application, elbow optimization, flow direction
 """
 
-from .sanitary import (
-    SlopeCalculator,
-    ElbowOptimizer,
-    FlowDirectionAssigner,
-    SanitaryPostProcessor,
-    PostProcessResult,
-    SlopeInfo,
-    apply_sanitary_postprocess,
-)
+from ....utils.lazy_imports import lazy_exports
+
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "SlopeCalculator": ".sanitary",
+    "ElbowOptimizer": ".sanitary",
+    "FlowDirectionAssigner": ".sanitary",
+    "SanitaryPostProcessor": ".sanitary",
+    "PostProcessResult": ".sanitary",
+    "SlopeInfo": ".sanitary",
+    "apply_sanitary_postprocess": ".sanitary",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     "SlopeCalculator",
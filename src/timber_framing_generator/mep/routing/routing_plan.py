@@ -0,0 +1,237 @@
+# File: src/timber_framing_generator/mep/routing/routing_plan.py
+"""
+Precompiled routing plan for orchestrated multi-zone, multi-trade routing.
+
+SequentialOrchestrator routes every (trade, zone) pair. Without a plan,
+each pair re-derives the trade's lowercase system names, re-tests every
+connector against the zone bounds and re-filters every target against the
+trade's systems. A RoutingPlan does all of that once, in time linear in
+the number of connectors, targets and zones:
+
+- system -> trade map (lowercase system names)
+- connectors bucketed by zone (via ZoneIndex) and by trade
+- targets partitioned by trade, plus a per-trade system -> targets lookup
+  for OAHSRouter
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .trade_config import TradeConfig, Trade, RoutingZone
+from .heuristics.base import ConnectorInfo
+from .targets import RoutingTarget
+
+
+def build_target_lookup(
+    targets: Sequence[RoutingTarget]
+) -> Dict[str, List[RoutingTarget]]:
+    """
+    Build lookup of targets by compatible system.
+
+    Targets are keyed by every entry of ``systems_served`` and by their
+    target type value, preserving input order within each key.
+
+    Args:
+        targets: Routing targets
+
+    Returns:
+        Dict of system/target-type name -> targets
+    """
+    lookup: Dict[str, List[RoutingTarget]] = {}
+
+    for target in targets:
+        for system in (target.systems_served or []):
+            lookup.setdefault(system, []).append(target)
+
+        if target.target_type:
+            type_str = (
+                target.target_type.value
+                if hasattr(target.target_type, 'value')
+                else str(target.target_type)
+            )
+            lookup.setdefault(type_str, []).append(target)
+
+    return lookup
+
+
+# Grid cells per axis are capped so one huge zone cannot blow up the index
+MAX_GRID_CELLS_PER_AXIS = 256
+
+
+class ZoneIndex:
+    """
+    Spatial lookup of routing zones by their XY bounds.
+
+    Zones are bucketed into a uniform XY grid whose cell size is the
+    median zone width/height. A query hashes the point to its cell and
+    checks only the zones overlapping that cell, so lookups stay O(1) per
+    connector however many zones a building has.
+
+    Args:
+        zones: Zones to index (list order is preserved in query results)
+    """
+
+    def __init__(self, zones: Sequence[RoutingZone]):
+        self._zones = list(zones)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        if not self._zones:
+            self._x0 = self._y0 = 0.0
+            self._cell_w = self._cell_h = 1.0
+            return
+
+        bounds = [zone.bounds for zone in self._zones]
+        self._x0 = min(b[0] for b in bounds)
+        self._y0 = min(b[2] for b in bounds)
+        span_x = max(b[1] for b in bounds) - self._x0
+        span_y = max(b[3] for b in bounds) - self._y0
+        self._cell_w = self._cell_size([b[1] - b[0] for b in bounds], span_x)
+        self._cell_h = self._cell_size([b[3] - b[2] for b in bounds], span_y)
+
+        # Zones are added in input order, so every bucket is ascending
+        for i, (min_x, max_x, min_y, max_y) in enumerate(bounds):
+            cx0, cy0 = self._cell(min_x, min_y)
+            cx1, cy1 = self._cell(max_x, max_y)
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    self._cells.setdefault((cx, cy), []).append(i)
+
+    @staticmethod
+    def _cell_size(sizes: List[float], span: float) -> float:
+        sizes = sorted(size for size in sizes if size > 0)
+        size = sizes[len(sizes) // 2] if sizes else 1.0
+        return max(size, span / MAX_GRID_CELLS_PER_AXIS, 1e-9)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (
+            int((x - self._x0) // self._cell_w),
+            int((y - self._y0) // self._cell_h),
+        )
+
+    def zones_containing(self, x: float, y: float) -> List[int]:
+        """
+        Get indices of zones whose bounds contain a point.
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            Zone indices in ascending (input) order
+        """
+        hits = []
+        for i in self._cells.get(self._cell(x, y), ()):
+            min_x, max_x, min_y, max_y = self._zones[i].bounds
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                hits.append(i)
+        return hits
+
+
+@dataclass
+class RoutingPlan:
+    """
+    Routing inputs partitioned once per orchestration call.
+
+    Attributes:
+        zones: Zones in routing order
+        trades: Enabled trades in priority order
+        system_trades: Lowercase system name -> trades owning it
+        trade_connectors: Trade -> connectors (input order)
+        zone_trade_connectors: (zone index, trade) -> connectors (input order)
+        trade_targets: Trade -> targets able to serve any of its systems
+        trade_target_lookups: Trade -> system/target-type -> targets
+    """
+    zones: List[RoutingZone] = field(default_factory=list)
+    trades: List[Trade] = field(default_factory=list)
+    system_trades: Dict[str, List[Trade]] = field(default_factory=dict)
+    trade_connectors: Dict[Trade, List[ConnectorInfo]] = field(default_factory=dict)
+    zone_trade_connectors: Dict[Tuple[int, Trade], List[ConnectorInfo]] = field(
+        default_factory=dict
+    )
+    trade_targets: Dict[Trade, List[RoutingTarget]] = field(default_factory=dict)
+    trade_target_lookups: Dict[Trade, Dict[str, List[RoutingTarget]]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def compile(
+        cls,
+        trade_config: TradeConfig,
+        connectors: Sequence[ConnectorInfo],
+        targets: Sequence[RoutingTarget],
+        zones: Optional[Sequence[RoutingZone]] = None,
+    ) -> "RoutingPlan":
+        """
+        Compile a routing plan.
+
+        A connector belongs to a zone if its id is listed in the zone's
+        connector_ids or its XY location lies within the zone bounds.
+        When ``zones`` is None, connectors are only bucketed by trade.
+
+        Args:
+            trade_config: Trade configuration
+            connectors: All connectors to route
+            targets: All routing targets
+            zones: Zones to bucket connectors into
+
+        Returns:
+            Compiled RoutingPlan
+        """
+        plan = cls(
+            zones=list(zones or []),
+            trades=list(trade_config.get_enabled_trades()),
+        )
+
+        # System -> trade map
+        trade_systems: Dict[Trade, List[str]] = {}
+        for trade in plan.trades:
+            systems = trade_config.get_systems_for_trade(trade)
+            trade_systems[trade] = systems
+            plan.trade_connectors[trade] = []
+            for system in systems:
+                owners = plan.system_trades.setdefault(system.lower(), [])
+                if trade not in owners:
+                    owners.append(trade)
+
+        # Connector id -> zones that list it explicitly
+        listed_zones: Dict[str, List[int]] = {}
+        for zone_idx, zone in enumerate(plan.zones):
+            for connector_id in zone.connector_ids:
+                listed_zones.setdefault(connector_id, []).append(zone_idx)
+        zone_index = ZoneIndex(plan.zones)
+
+        # Bucket connectors by trade and zone
+        for connector in connectors:
+            owners = plan.system_trades.get(connector.system_type.lower())
+            if not owners:
+                continue
+            zone_ids: List[int] = []
+            if plan.zones:
+                listed = listed_zones.get(connector.id, [])
+                spatial = zone_index.zones_containing(
+                    connector.location[0], connector.location[1]
+                )
+                zone_ids = sorted(set(listed).union(spatial))
+            for trade in owners:
+                plan.trade_connectors[trade].append(connector)
+                for zone_idx in zone_ids:
+                    plan.zone_trade_connectors.setdefault(
+                        (zone_idx, trade), []
+                    ).append(connector)
+
+        # Partition targets by trade
+        for trade in plan.trades:
+            systems = trade_systems[trade]
+            served = [
+                t for t in targets
+                if any(t.can_serve_system(system) for system in systems)
+            ]
+            plan.trade_targets[trade] = served
+            plan.trade_target_lookups[trade] = build_target_lookup(served)
+
+        return plan
+
+    def connectors_for(self, zone_idx: int, trade: Trade) -> List[ConnectorInfo]:
+        """Get connectors of a trade located in a zone."""
+        return self.zone_trade_connectors.get((zone_idx, trade), [])
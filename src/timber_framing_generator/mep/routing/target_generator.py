@@ -15,6 +15,7 @@ from .domains import RoutingDomain, RoutingDomainType
 from .heuristics.base import TargetHeuristic, ConnectorInfo, FallbackHeuristic
 from .heuristics.plumbing import SanitaryHeuristic, VentHeuristic, SupplyHeuristic
 from .heuristics.electrical import PowerHeuristic, DataHeuristic, LightingHeuristic
+from .target_index import TargetSpatialIndex
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,8 @@ class TargetCandidateGenerator:
         self._domains: List[RoutingDomain] = []
         self._domain_lookup: Dict[str, RoutingDomain] = {}
         self._fallback = FallbackHeuristic()
+        # Spatial index over _targets, rebuilt lazily after target changes
+        self._target_index: Optional[TargetSpatialIndex] = None
 
         # Register default heuristics
         self._register_default_heuristics()
@@ -105,14 +108,17 @@ class TargetCandidateGenerator:
     def add_target(self, target: RoutingTarget):
         """Add a routing target."""
         self._targets.append(target)
+        self._target_index = None
 
     def add_targets(self, targets: List[RoutingTarget]):
         """Add multiple routing targets."""
         self._targets.extend(targets)
+        self._target_index = None
 
     def clear_targets(self):
         """Remove all targets."""
         self._targets.clear()
+        self._target_index = None
 
     def add_domain(self, domain: RoutingDomain):
         """Add a routing domain."""
@@ -168,11 +174,15 @@ class TargetCandidateGenerator:
             f"using {type(heuristic).__name__}"
         )
 
+        if self._target_index is None:
+            self._target_index = TargetSpatialIndex(self._targets)
+
         candidates = heuristic.find_candidates(
             connector,
             self._targets,
             self._domains,
-            max_candidates
+            max_candidates,
+            index=self._target_index
         )
 
         logger.debug(f"Found {len(candidates)} candidates")
@@ -0,0 +1,118 @@
+# File: src/timber_framing_generator/mep/routing/target_index.py
+"""
+Spatial index over routing targets for best-k candidate selection.
+
+Heuristics only need the few best-scoring targets for a connector, but
+scoring every compatible target is linear in the target count. The index
+buckets targets into a uniform XY grid over ``RoutingTarget.location`` and
+hands them out ring by ring around a query point, together with a lower
+bound on the XY Manhattan distance of every target not yet handed out.
+Callers turn that into a lower bound on the score and stop as soon as the
+bound exceeds the k-th best exact score found so far.
+"""
+
+import math
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from .targets import RoutingTarget
+
+# (input position, target) - the position keeps tie-breaking identical to a
+# stable sort over the original target list
+IndexedTarget = Tuple[int, RoutingTarget]
+
+
+class TargetSpatialIndex:
+    """
+    Uniform grid over target XY locations.
+
+    Build once per target list and reuse it for every connector. The index
+    only stores locations; availability, capacity and type filters are
+    applied by the caller, so targets may change state between queries.
+
+    Args:
+        targets: Targets to index (list positions are reported with each hit)
+        cell_size: Grid cell size in feet. Defaults to a size giving roughly
+            one target per cell.
+    """
+
+    def __init__(self, targets: Sequence[RoutingTarget], cell_size: float = 0.0):
+        self.targets = list(targets)
+        self._cells: Dict[Tuple[int, int], List[IndexedTarget]] = {}
+
+        if self.targets:
+            xs = [t.location[0] for t in self.targets]
+            ys = [t.location[1] for t in self.targets]
+            priorities = [t.priority for t in self.targets]
+            self.min_priority = min(priorities)
+            self.max_priority = max(priorities)
+        else:
+            xs = ys = [0.0]
+            self.min_priority = self.max_priority = 0
+
+        if cell_size <= 0:
+            extent = max(max(xs) - min(xs), max(ys) - min(ys))
+            cell_size = extent / max(1.0, math.sqrt(len(self.targets)))
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+
+        for i, target in enumerate(self.targets):
+            key = self._cell_of(target.location[0], target.location[1])
+            self._cells.setdefault(key, []).append((i, target))
+
+        cells = list(self._cells) or [(0, 0)]
+        self._min_cx = min(c[0] for c in cells)
+        self._max_cx = max(c[0] for c in cells)
+        self._min_cy = min(c[1] for c in cells)
+        self._max_cy = max(c[1] for c in cells)
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def rings(self, x: float, y: float) -> Iterator[Tuple[float, List[IndexedTarget]]]:
+        """
+        Yield targets in rings of grid cells around a point.
+
+        Ring ``r`` holds the cells at Chebyshev cell distance ``r`` from the
+        query cell. Every target in ring ``r`` or beyond is at least
+        ``(r - 1) * cell_size`` away in XY Manhattan distance, which is the
+        bound yielded with the ring. Empty rings are skipped.
+
+        Args:
+            x: Query X coordinate
+            y: Query Y coordinate
+
+        Yields:
+            Tuples of (XY distance lower bound, targets in the ring)
+        """
+        cx, cy = self._cell_of(x, y)
+        max_ring = max(
+            abs(cx - self._min_cx), abs(cx - self._max_cx),
+            abs(cy - self._min_cy), abs(cy - self._max_cy),
+        )
+        remaining = len(self.targets)
+        for r in range(max_ring + 1):
+            if remaining == 0:
+                return
+            hits: List[IndexedTarget] = []
+            for key in self._ring_cells(cx, cy, r):
+                bucket = self._cells.get(key)
+                if bucket:
+                    hits.extend(bucket)
+            if hits:
+                remaining -= len(hits)
+                yield max(0, r - 1) * self.cell_size, hits
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, r: int) -> Iterator[Tuple[int, int]]:
+        """Cells at Chebyshev distance r from (cx, cy)."""
+        if r == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-r, r + 1):
+            yield (cx + dx, cy - r)
+            yield (cx + dx, cy + r)
+        for dy in range(-r + 1, r):
+            yield (cx - r, cy + dy)
+            yield (cx + r, cy + dy)
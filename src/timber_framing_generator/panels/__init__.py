@@ -17,34 +17,30 @@ Example:
     >>> print(f"Created {results['total_panel_count']} panels")
 """
 
-from .panel_config import (
-    PanelConfig,
-    CornerPriority,
-    ExclusionZone,
-)
+from ..utils.lazy_imports import lazy_exports
 
-from .corner_handler import (
-    WallEndpoint,
-    WallCornerInfo,
-    detect_wall_corners,
-    calculate_corner_adjustments,
-    apply_corner_adjustments,
-    get_adjusted_wall_length,
-)
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "PanelConfig": ".panel_config",
+    "CornerPriority": ".panel_config",
+    "ExclusionZone": ".panel_config",
+    "WallEndpoint": ".corner_handler",
+    "WallCornerInfo": ".corner_handler",
+    "detect_wall_corners": ".corner_handler",
+    "calculate_corner_adjustments": ".corner_handler",
+    "apply_corner_adjustments": ".corner_handler",
+    "get_adjusted_wall_length": ".corner_handler",
+    "find_exclusion_zones": ".joint_optimizer",
+    "find_optimal_joints": ".joint_optimizer",
+    "get_panel_boundaries": ".joint_optimizer",
+    "validate_joints": ".joint_optimizer",
+    "decompose_wall_to_panels": ".panel_decomposer",
+    "decompose_all_walls": ".panel_decomposer",
+    "serialize_panel_results": ".panel_decomposer",
+    "deserialize_panel_results": ".panel_decomposer",
+}
 
-from .joint_optimizer import (
-    find_exclusion_zones,
-    find_optimal_joints,
-    get_panel_boundaries,
-    validate_joints,
-)
-
-from .panel_decomposer import (
-    decompose_wall_to_panels,
-    decompose_all_walls,
-    serialize_panel_results,
-    deserialize_panel_results,
-)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Configuration
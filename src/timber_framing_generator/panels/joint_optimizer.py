@@ -145,6 +145,41 @@ def _in_exclusion_zone(u: float, zones: List[ExclusionZone]) -> bool:
     return False
 
 
+def _filter_excluded(
+    positions: List[float],
+    zones: List[ExclusionZone]
+) -> List[float]:
+    """Drop positions that fall in any exclusion zone.
+
+    Equivalent to filtering with _in_exclusion_zone, but sweeps the
+    sorted positions and zones together instead of testing every zone
+    for every position.
+
+    Args:
+        positions: U coordinates to filter (feet)
+        zones: List of exclusion zones (any order, may overlap)
+
+    Returns:
+        Positions outside all zones, in their original order
+    """
+    if not zones:
+        return list(positions)
+
+    sorted_zones = sorted(zones, key=lambda z: z.u_start)
+    excluded = [False] * len(positions)
+    zone_idx = 0
+    reach = float('-inf')  # Furthest u_end of zones starting at or before u
+
+    for i in sorted(range(len(positions)), key=positions.__getitem__):
+        u = positions[i]
+        while zone_idx < len(sorted_zones) and sorted_zones[zone_idx].u_start <= u:
+            reach = max(reach, sorted_zones[zone_idx].u_end)
+            zone_idx += 1
+        excluded[i] = u <= reach
+
+    return [u for u, skip in zip(positions, excluded) if not skip]
+
+
 def _generate_stud_aligned_candidates(
     wall_length: float,
     stud_spacing: float,
@@ -233,10 +268,7 @@ def find_optimal_joints(
         ]
 
     # Filter out candidates in exclusion zones
-    valid_candidates = [
-        c for c in candidates
-        if not _in_exclusion_zone(c, exclusion_zones)
-    ]
+    valid_candidates = _filter_excluded(candidates, exclusion_zones)
 
     # Add wall boundaries (required for DP)
     all_positions = [0.0] + valid_candidates + [wall_length]
@@ -19,6 +19,7 @@ Example:
     >>> print(f"Created {results['total_panel_count']} panels")
 """
 
+from bisect import bisect_left, bisect_right
 from typing import List, Dict, Any, Optional, Tuple
 import json
 
@@ -36,6 +37,68 @@ from .joint_optimizer import (
 )
 
 
+# Element types a panel joint can land on
+JOINT_STUD_TYPES = ("stud", "king_stud", "trimmer")
+
+
+class ElementIndex:
+    """Framing elements of one wall sorted by U coordinate.
+
+    Built once per wall so that panel membership and joint stud lookups
+    are bisect range queries instead of scans over every element.
+    Results are returned in the original element order, matching a
+    linear scan of the element list.
+
+    Args:
+        elements: List of FramingElementData dictionaries
+    """
+
+    def __init__(self, elements: List[Dict]):
+        self.elements = list(elements)
+        coords = [element.get("u_coord", 0) for element in self.elements]
+        # Stable sort keeps input order among elements at the same U
+        self._order = sorted(range(len(coords)), key=coords.__getitem__)
+        self._u_coords = [coords[i] for i in self._order]
+
+    @classmethod
+    def from_framing_data(cls, framing_data: Optional[Dict]) -> "ElementIndex":
+        """Build an index from a FramingResults dictionary (or None)."""
+        if not framing_data:
+            return cls([])
+        return cls(framing_data.get("elements", []))
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def positions_in_range(self, u_start: float, u_end: float) -> List[int]:
+        """Get list positions of elements with u_start <= u_coord <= u_end.
+
+        Args:
+            u_start: Start of range
+            u_end: End of range
+
+        Returns:
+            Positions into ``elements`` in ascending order
+        """
+        lo = bisect_left(self._u_coords, u_start)
+        hi = bisect_right(self._u_coords, u_end)
+        if lo >= hi:
+            return []
+        return sorted(self._order[lo:hi])
+
+    def elements_in_range(self, u_start: float, u_end: float) -> List[Dict]:
+        """Get elements whose centerline U is within [u_start, u_end]."""
+        elements = self.elements
+        return [elements[i] for i in self.positions_in_range(u_start, u_end)]
+
+    def ids_in_range(self, u_start: float, u_end: float) -> List[str]:
+        """Get IDs of elements whose centerline U is within [u_start, u_end]."""
+        return [
+            element.get("id", "")
+            for element in self.elements_in_range(u_start, u_end)
+        ]
+
+
 def decompose_wall_to_panels(
     wall_data: Dict,
     framing_data: Optional[Dict] = None,
@@ -87,6 +150,9 @@ def decompose_wall_to_panels(
     # Get panel boundaries
     boundaries = get_panel_boundaries(joint_u_coords, adjusted_length)
 
+    # Sort elements once; panels and joints share the index
+    element_index = ElementIndex.from_framing_data(framing_data)
+
     # Create panels
     panels = []
     joints = []
@@ -100,6 +166,7 @@ def decompose_wall_to_panels(
             wall_data=working_wall_data,
             framing_data=framing_data,
             config=config,
+            element_index=element_index,
         )
         panels.append(panel)
 
@@ -112,6 +179,7 @@ def decompose_wall_to_panels(
                 wall_data=working_wall_data,
                 framing_data=framing_data,
                 config=config,
+                element_index=element_index,
             )
             joints.append(joint)
 
@@ -199,6 +267,7 @@ def _create_panel(
     wall_data: Dict,
     framing_data: Optional[Dict],
     config: PanelConfig,
+    element_index: Optional["ElementIndex"] = None,
 ) -> Dict:
     """Create a panel dictionary.
 
@@ -210,6 +279,7 @@ def _create_panel(
         wall_data: WallData dictionary
         framing_data: FramingResults dictionary (optional)
         config: Panel configuration
+        element_index: Prebuilt index over framing_data elements (optional)
 
     Returns:
         Panel dictionary
@@ -231,7 +301,9 @@ def _create_panel(
     # Find elements within this panel
     element_ids = []
     cell_ids = []
-    if framing_data:
+    if element_index is not None:
+        element_ids = element_index.ids_in_range(u_start, u_end)
+    elif framing_data:
         element_ids = _find_elements_in_range(
             framing_data.get("elements", []),
             u_start,
@@ -266,6 +338,7 @@ def _create_joint(
     wall_data: Dict,
     framing_data: Optional[Dict],
     config: PanelConfig,
+    element_index: Optional["ElementIndex"] = None,
 ) -> Dict:
     """Create a joint dictionary.
 
@@ -276,6 +349,7 @@ def _create_joint(
         wall_data: WallData dictionary
         framing_data: FramingResults dictionary (optional)
         config: Panel configuration
+        element_index: Prebuilt index over framing_data elements (optional)
 
     Returns:
         Joint dictionary
@@ -303,11 +377,16 @@ def _create_joint(
     # Find studs at joint location
     stud_u_coords = []
     if framing_data and config.snap_to_studs:
+        if element_index is None:
+            element_index = ElementIndex.from_framing_data(framing_data)
         # Joint should be at a stud - find nearby studs
-        for element in framing_data.get("elements", []):
-            if element.get("element_type") in ["stud", "king_stud", "trimmer"]:
+        half_spacing = config.stud_spacing / 2
+        for element in element_index.elements_in_range(
+            u_coord - half_spacing, u_coord + half_spacing
+        ):
+            if element.get("element_type") in JOINT_STUD_TYPES:
                 elem_u = element.get("u_coord", 0)
-                if abs(elem_u - u_coord) < config.stud_spacing / 2:
+                if abs(elem_u - u_coord) < half_spacing:
                     stud_u_coords.append(elem_u)
 
     return {
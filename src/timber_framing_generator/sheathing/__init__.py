@@ -10,6 +10,7 @@ Key Components:
     - SheathingPanel: Data class representing a single sheathing panel
     - SheathingMaterial: Material specifications (thickness, type, properties)
     - PanelSize: Standard panel dimensions (4x8, 4x9, 4x10)
+    - nest_sheathing_panels: Packs pieces from many walls into stock sheets
 
 Configuration Options:
     All values are configurable with sensible defaults:
@@ -35,33 +36,38 @@ Example:
     >>> result = generate_wall_sheathing(wall_data, config)
 """
 
-from .sheathing_profiles import (
-    SheathingMaterial,
-    SheathingType,
-    PanelSize,
-    SHEATHING_MATERIALS,
-    PANEL_SIZES,
-    DEFAULT_MATERIALS,
-    DEFAULT_PANEL_SIZE,
-    get_sheathing_material,
-    get_panel_size,
-    list_materials_by_type,
-)
+from ..utils.lazy_imports import lazy_exports
 
-from .sheathing_generator import (
-    SheathingGenerator,
-    SheathingPanel,
-    Cutout,
-    generate_wall_sheathing,
-)
+# Public name -> defining submodule; submodules load on first access
+_EXPORTS = {
+    "SheathingMaterial": ".sheathing_profiles",
+    "SheathingType": ".sheathing_profiles",
+    "PanelSize": ".sheathing_profiles",
+    "SHEATHING_MATERIALS": ".sheathing_profiles",
+    "PANEL_SIZES": ".sheathing_profiles",
+    "DEFAULT_MATERIALS": ".sheathing_profiles",
+    "DEFAULT_PANEL_SIZE": ".sheathing_profiles",
+    "get_sheathing_material": ".sheathing_profiles",
+    "get_panel_size": ".sheathing_profiles",
+    "list_materials_by_type": ".sheathing_profiles",
+    "SheathingGenerator": ".sheathing_generator",
+    "SheathingPanel": ".sheathing_generator",
+    "Cutout": ".sheathing_generator",
+    "generate_wall_sheathing": ".sheathing_generator",
+    "IntervalSweep": ".sheathing_layout",
+    "NestedPiece": ".sheathing_nesting",
+    "StockSheet": ".sheathing_nesting",
+    "NestingResult": ".sheathing_nesting",
+    "nest_sheathing_panels": ".sheathing_nesting",
+    "get_nesting_summary": ".sheathing_nesting",
+    "SheathingPanelGeometry": ".sheathing_geometry",
+    "create_sheathing_breps": ".sheathing_geometry",
+    "create_sheathing_breps_batch": ".sheathing_geometry",
+    "uvw_to_world": ".sheathing_geometry",
+    "create_panel_brep": ".sheathing_geometry",
+}
 
-from .sheathing_geometry import (
-    SheathingPanelGeometry,
-    create_sheathing_breps,
-    create_sheathing_breps_batch,
-    uvw_to_world,
-    create_panel_brep,
-)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
 
 __all__ = [
     # Classes
@@ -72,6 +78,10 @@ __all__ = [
     "SheathingType",
     "PanelSize",
     "Cutout",
+    "IntervalSweep",
+    "NestedPiece",
+    "StockSheet",
+    "NestingResult",
     # Dictionaries
     "SHEATHING_MATERIALS",
     "PANEL_SIZES",
@@ -82,6 +92,8 @@ __all__ = [
     "get_panel_size",
     "list_materials_by_type",
     "generate_wall_sheathing",
+    "nest_sheathing_panels",
+    "get_nesting_summary",
     # Geometry functions
     "create_sheathing_breps",
     "create_sheathing_breps_batch",
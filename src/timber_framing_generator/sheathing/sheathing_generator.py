@@ -24,6 +24,7 @@ from .sheathing_profiles import (
     get_panel_size,
     PANEL_SIZES,
 )
+from .sheathing_layout import IntervalSweep
 
 
 @dataclass
@@ -262,14 +263,25 @@ class SheathingGenerator:
         # Calculate number of rows needed
         num_rows = self._calculate_num_rows(panel_height)
 
+        # Rows advance upward, so openings are swept by v once per face
+        row_sweep = IntervalSweep(
+            [(o["v_start"], o["v_end"]) for o in self.openings]
+        )
+
         # Generate panels row by row
         for row in range(num_rows):
+            v_start = row * panel_height
+            v_end = min((row + 1) * panel_height, self.wall_height)
+            row_openings = [
+                self.openings[i] for i in row_sweep.advance(v_start, v_end)
+            ]
             row_panels = self._generate_row(
                 row=row,
                 panel_width=panel_width,
                 panel_height=panel_height,
                 num_rows=num_rows,
-                face=face
+                face=face,
+                openings=row_openings,
             )
             panels.extend(row_panels)
 
@@ -287,7 +299,8 @@ class SheathingGenerator:
         panel_width: float,
         panel_height: float,
         num_rows: int,
-        face: str
+        face: str,
+        openings: Optional[List[Dict[str, float]]] = None
     ) -> List[SheathingPanel]:
         """
         Generate panels for a single row.
@@ -298,12 +311,19 @@ class SheathingGenerator:
             panel_height: Standard panel height
             num_rows: Total number of rows
             face: Wall face being sheathed
+            openings: Openings to consider for cutouts (default: all);
+                openings outside the row are ignored either way
 
         Returns:
             List of SheathingPanel for this row
         """
         panels = []
 
+        if openings is None:
+            openings = self.openings
+        # Panels advance left to right, so openings are swept by u
+        opening_sweep = IntervalSweep([(o["u_start"], o["u_end"]) for o in openings])
+
         # Calculate vertical bounds for this row
         v_start = row * panel_height
         v_end = min((row + 1) * panel_height, self.wall_height)
@@ -332,7 +352,13 @@ class SheathingGenerator:
             )
 
             # Find cutouts for openings that intersect this panel
-            cutouts = self._find_cutouts(u_start, u_end, v_start, v_end)
+            cutouts = []
+            for i in opening_sweep.advance(u_start, u_end):
+                opening = openings[i]
+                if opening["v_start"] < v_end and opening["v_end"] > v_start:
+                    cutouts.append(
+                        _clip_cutout(opening, u_start, u_end, v_start, v_end)
+                    )
 
             # Create panel
             panel = SheathingPanel(
@@ -368,6 +394,8 @@ class SheathingGenerator:
         """
         Find all opening cutouts that intersect the given panel bounds.
 
+        Scans every opening; layout uses IntervalSweep instead.
+
         Args:
             u_start, u_end: Panel horizontal bounds
             v_start, v_end: Panel vertical bounds
@@ -382,15 +410,9 @@ class SheathingGenerator:
             if (opening["u_start"] < u_end and opening["u_end"] > u_start and
                 opening["v_start"] < v_end and opening["v_end"] > v_start):
 
-                # Calculate the cutout bounds (clipped to panel)
-                cutout = Cutout(
-                    opening_type=opening["opening_type"],
-                    u_start=max(opening["u_start"], u_start),
-                    u_end=min(opening["u_end"], u_end),
-                    v_start=max(opening["v_start"], v_start),
-                    v_end=min(opening["v_end"], v_end),
+                cutouts.append(
+                    _clip_cutout(opening, u_start, u_end, v_start, v_end)
                 )
-                cutouts.append(cutout)
 
         return cutouts
 
@@ -441,6 +463,23 @@ class SheathingGenerator:
         }
 
 
+def _clip_cutout(
+    opening: Dict[str, Any],
+    u_start: float,
+    u_end: float,
+    v_start: float,
+    v_end: float
+) -> Cutout:
+    """Create the cutout of an opening clipped to panel bounds."""
+    return Cutout(
+        opening_type=opening["opening_type"],
+        u_start=max(opening["u_start"], u_start),
+        u_end=min(opening["u_end"], u_end),
+        v_start=max(opening["v_start"], v_start),
+        v_end=min(opening["v_end"], v_end),
+    )
+
+
 def generate_wall_sheathing(
     wall_data: Dict[str, Any],
     config: Dict[str, Any] = None,
@@ -17,11 +17,27 @@ Usage:
         wall_data=parsed_wall_json,
         factory=get_factory()
     )
+
+Batched mode:
+    Passing ``backend`` (see utils.geometry_batch) computes the box bounds
+    of every panel and cutout in pure Python, creates all boxes in one
+    backend call and runs Brep booleans only for panels with cutouts.
+    Without a factory the booleans are skipped and cutout solids are
+    returned on the geometry object instead.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Any
 
+from src.timber_framing_generator.utils.wall_frame import wall_frame
+
+Vector3 = Tuple[float, float, float]
+Bounds = Tuple[Vector3, Vector3]
+Frame = Tuple[Vector3, Vector3, Vector3, Vector3]
+
+# Cutouts extend this far past each panel surface for a clean boolean
+CUTOUT_TOLERANCE = 0.01  # ~1/8 inch
+
 
 @dataclass
 class SheathingPanelGeometry:
@@ -36,6 +52,8 @@ class SheathingPanelGeometry:
         area_gross: Gross panel area (sq ft)
         area_net: Net area after cutouts (sq ft)
         has_cutouts: Whether panel has opening cutouts
+        cutout_breps: Cutout solids not subtracted from brep (batched
+            mode without a factory)
     """
     panel_id: str
     wall_id: str
@@ -44,6 +62,7 @@ class SheathingPanelGeometry:
     area_gross: float
     area_net: float
     has_cutouts: bool
+    cutout_breps: List[Any] = field(default_factory=list)
 
 
 def uvw_to_world(
@@ -69,17 +88,8 @@ def uvw_to_world(
     Returns:
         (x, y, z) world coordinates
     """
-    origin = base_plane["origin"]
-    x_axis = base_plane["x_axis"]
-    y_axis = base_plane["y_axis"]
-    z_axis = base_plane["z_axis"]
-
-    # Transform: world = origin + u*X + v*Y + w*Z
-    x = origin["x"] + x_axis["x"] * u + y_axis["x"] * v + z_axis["x"] * w
-    y = origin["y"] + x_axis["y"] * u + y_axis["y"] * v + z_axis["y"] * w
-    z = origin["z"] + x_axis["z"] * u + y_axis["z"] * v + z_axis["z"] * w
-
-    return (x, y, z)
+    # world = origin + u*X + v*Y + w*Z, via the wall's shared frame
+    return wall_frame(base_plane).to_world_point(u, v, w)
 
 
 def get_extrusion_vector(
@@ -173,12 +183,12 @@ def create_panel_brep(
 
     # Create panel corners in world coordinates
     # Order: bottom-left, bottom-right, top-right, top-left (counter-clockwise)
-    corners = [
-        uvw_to_world(u_start, v_start, w_offset, base_plane),  # BL
-        uvw_to_world(u_end, v_start, w_offset, base_plane),    # BR
-        uvw_to_world(u_end, v_end, w_offset, base_plane),      # TR
-        uvw_to_world(u_start, v_end, w_offset, base_plane),    # TL
-    ]
+    corners = wall_frame(base_plane).to_world([
+        (u_start, v_start, w_offset),  # BL
+        (u_end, v_start, w_offset),    # BR
+        (u_end, v_end, w_offset),      # TR
+        (u_start, v_end, w_offset),    # TL
+    ])
 
     # Get extrusion vector (panel thickness direction)
     extrusion_vector = get_extrusion_vector(face, base_plane, thickness_ft)
@@ -276,20 +286,15 @@ def create_cutout_brep(
         return None
 
     # Extend cutout slightly beyond panel surface for clean boolean
-    tolerance = 0.01  # ~1/8 inch
-    w_start = w_offset - tolerance
-    w_end = w_offset + panel_thickness + tolerance
-    if face == "interior":
-        w_start = w_offset - panel_thickness - tolerance
-        w_end = w_offset + tolerance
+    w_start, w_end = _cutout_w_range(face, w_offset, panel_thickness)
 
     # Create cutout corners
-    corners = [
-        uvw_to_world(u_start, v_start, w_start, base_plane),
-        uvw_to_world(u_end, v_start, w_start, base_plane),
-        uvw_to_world(u_end, v_end, w_start, base_plane),
-        uvw_to_world(u_start, v_end, w_start, base_plane),
-    ]
+    corners = wall_frame(base_plane).to_world([
+        (u_start, v_start, w_start),
+        (u_end, v_start, w_start),
+        (u_end, v_end, w_start),
+        (u_start, v_end, w_start),
+    ])
 
     # Extrusion vector through panel
     extrusion_depth = abs(w_end - w_start)
@@ -304,10 +309,202 @@ def create_cutout_brep(
     return factory.create_box_from_corners_and_thickness(corners, extrusion_vector)
 
 
+def _cutout_w_range(
+    face: str,
+    w_offset: float,
+    panel_thickness: float
+) -> Tuple[float, float]:
+    """
+    Get the (start, end) W of a cutout solid, in extrusion order.
+
+    The cutout spans the panel's W range plus CUTOUT_TOLERANCE on both
+    sides. Interior panels extrude toward -W from w_offset.
+    """
+    if face == "interior":
+        return (w_offset + CUTOUT_TOLERANCE,
+                w_offset - panel_thickness - CUTOUT_TOLERANCE)
+    return (w_offset - CUTOUT_TOLERANCE,
+            w_offset + panel_thickness + CUTOUT_TOLERANCE)
+
+
+def _wall_thickness_feet(wall_data: Dict[str, Any]) -> float:
+    """Get wall thickness in feet from wall JSON."""
+    wall_thickness = wall_data.get("thickness", wall_data.get("wall_thickness", 0.5))
+
+    # Handle different thickness keys (may be in inches or feet)
+    if wall_thickness > 2.0:  # Likely in inches
+        wall_thickness = wall_thickness / 12.0
+    return wall_thickness
+
+
+def plane_frame(base_plane: Dict[str, Any]) -> Frame:
+    """
+    Convert a base plane dictionary to (origin, x_axis, y_axis, z_axis) tuples.
+
+    Args:
+        base_plane: Wall base plane dictionary
+
+    Returns:
+        Tuple of four (x, y, z) tuples
+    """
+    frame = wall_frame(base_plane)
+    return (frame.origin, frame.x_axis, frame.y_axis, frame.z_axis)
+
+
+def uvw_box_bounds(
+    frame: Frame,
+    u_range: Tuple[float, float],
+    v_range: Tuple[float, float],
+    w_range: Tuple[float, float]
+) -> Bounds:
+    """
+    World axis-aligned bounds of a UVW box.
+
+    Equals the bounding box of the box's 8 transformed corners, which is
+    what create_box_from_corners_and_thickness builds, without creating
+    the corners.
+
+    Args:
+        frame: (origin, x_axis, y_axis, z_axis) from plane_frame
+        u_range: (u0, u1) along the wall
+        v_range: (v0, v1) vertical
+        w_range: (w0, w1) through the wall (either order)
+
+    Returns:
+        ((min_x, min_y, min_z), (max_x, max_y, max_z))
+    """
+    origin, x_axis, y_axis, z_axis = frame
+    lo = list(origin)
+    hi = list(origin)
+    for axis, (p0, p1) in ((x_axis, u_range), (y_axis, v_range), (z_axis, w_range)):
+        for k in range(3):
+            c0 = axis[k] * p0
+            c1 = axis[k] * p1
+            if c0 <= c1:
+                lo[k] += c0
+                hi[k] += c1
+            else:
+                lo[k] += c1
+                hi[k] += c0
+    return (tuple(lo), tuple(hi))
+
+
+def compute_panel_bounds(
+    panel_data: Dict[str, Any],
+    frame: Frame,
+    wall_thickness: float
+) -> Tuple[Bounds, List[Bounds]]:
+    """
+    Compute box bounds of a sheathing panel and its cutouts.
+
+    Matches the boxes built by create_panel_brep and create_cutout_brep.
+
+    Args:
+        panel_data: Sheathing panel dictionary from sheathing_json
+        frame: Wall plane frame from plane_frame
+        wall_thickness: Wall thickness in feet
+
+    Returns:
+        Tuple of (panel bounds, bounds of each non-degenerate cutout)
+    """
+    thickness_ft = panel_data["thickness_inches"] / 12.0
+    face = panel_data.get("face", "exterior")
+    w_offset = calculate_w_offset(face, wall_thickness, thickness_ft)
+    direction = 1.0 if face == "exterior" else -1.0
+
+    panel_bounds = uvw_box_bounds(
+        frame,
+        (panel_data["u_start"], panel_data["u_end"]),
+        (panel_data["v_start"], panel_data["v_end"]),
+        (w_offset, w_offset + direction * thickness_ft),
+    )
+
+    cutout_bounds = []
+    cutout_w = _cutout_w_range(face, w_offset, thickness_ft)
+    for cutout in panel_data.get("cutouts", []):
+        if cutout["u_end"] <= cutout["u_start"] or cutout["v_end"] <= cutout["v_start"]:
+            continue
+        cutout_bounds.append(uvw_box_bounds(
+            frame,
+            (cutout["u_start"], cutout["u_end"]),
+            (cutout["v_start"], cutout["v_end"]),
+            cutout_w,
+        ))
+
+    return panel_bounds, cutout_bounds
+
+
+def _create_breps_batched(
+    walls: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    factory: Any,
+    backend: Any
+) -> List[List[SheathingPanelGeometry]]:
+    """
+    Create sheathing geometry for several walls with one backend call.
+
+    Args:
+        walls: (sheathing_data, wall_data) pairs
+        factory: RhinoCommonFactory for booleans, or None to skip them
+        backend: Geometry backend name or GeometryBackend instance
+
+    Returns:
+        One list of SheathingPanelGeometry per input pair
+    """
+    from ..utils.geometry_batch import get_backend
+
+    if isinstance(backend, str):
+        backend = get_backend(backend)
+
+    # Pass 1: bounds for every panel and cutout, flattened
+    all_bounds: List[Bounds] = []
+    records = []  # (wall index, panel_data, panel slot, cutout slots)
+    for wall_idx, (sheathing_data, wall_data) in enumerate(walls):
+        frame = plane_frame(wall_data.get("base_plane") or _create_default_base_plane())
+        wall_thickness = _wall_thickness_feet(wall_data)
+        for panel_data in sheathing_data.get("sheathing_panels", []):
+            panel_bounds, cutout_bounds = compute_panel_bounds(
+                panel_data, frame, wall_thickness
+            )
+            panel_slot = len(all_bounds)
+            all_bounds.append(panel_bounds)
+            all_bounds.extend(cutout_bounds)
+            records.append((
+                wall_idx, panel_data, panel_slot,
+                range(panel_slot + 1, len(all_bounds)),
+            ))
+
+    # Pass 2: all boxes at once
+    boxes = backend.create_box_breps(all_bounds)
+
+    # Pass 3: booleans only where there is something to cut
+    results: List[List[SheathingPanelGeometry]] = [[] for _ in walls]
+    for wall_idx, panel_data, panel_slot, cutout_slots in records:
+        brep = boxes[panel_slot]
+        if brep is None:
+            continue
+        cutout_breps = [boxes[i] for i in cutout_slots if boxes[i] is not None]
+        if cutout_breps and factory is not None:
+            brep = factory.boolean_difference_multiple(brep, cutout_breps)
+            cutout_breps = []
+        results[wall_idx].append(SheathingPanelGeometry(
+            panel_id=panel_data.get("id", "unknown"),
+            wall_id=panel_data.get("wall_id", "unknown"),
+            face=panel_data.get("face", "exterior"),
+            brep=brep,
+            area_gross=panel_data.get("area_gross_sqft", 0),
+            area_net=panel_data.get("area_net_sqft", 0),
+            has_cutouts=len(panel_data.get("cutouts", [])) > 0,
+            cutout_breps=cutout_breps,
+        ))
+
+    return results
+
+
 def create_sheathing_breps(
     sheathing_data: Dict[str, Any],
     wall_data: Dict[str, Any],
-    factory: Any
+    factory: Any,
+    backend: Any = None
 ) -> List[SheathingPanelGeometry]:
     """
     Create Brep geometry for all sheathing panels.
@@ -315,20 +512,21 @@ def create_sheathing_breps(
     Args:
         sheathing_data: Parsed sheathing JSON for a single wall
         wall_data: Parsed wall JSON with base_plane and thickness
-        factory: RhinoCommonFactory instance
+        factory: RhinoCommonFactory instance (may be None in batched mode)
+        backend: Optional geometry backend name or instance; enables
+            batched mode (see module docstring)
 
     Returns:
         List of SheathingPanelGeometry objects
     """
+    if backend is not None:
+        return _create_breps_batched([(sheathing_data, wall_data)], factory, backend)[0]
+
     results = []
 
     # Get wall properties
     base_plane = wall_data.get("base_plane", {})
-    wall_thickness = wall_data.get("thickness", wall_data.get("wall_thickness", 0.5))
-
-    # Handle different thickness keys (may be in inches or feet)
-    if wall_thickness > 2.0:  # Likely in inches
-        wall_thickness = wall_thickness / 12.0
+    wall_thickness = _wall_thickness_feet(wall_data)
 
     panels = sheathing_data.get("sheathing_panels", [])
 
@@ -353,7 +551,8 @@ def create_sheathing_breps(
 def create_sheathing_breps_batch(
     sheathing_results: List[Dict[str, Any]],
     walls_data: List[Dict[str, Any]],
-    factory: Any
+    factory: Any,
+    backend: Any = None
 ) -> Dict[str, List[SheathingPanelGeometry]]:
     """
     Create Brep geometry for sheathing panels across multiple walls.
@@ -361,7 +560,9 @@ def create_sheathing_breps_batch(
     Args:
         sheathing_results: List of sheathing JSON results (one per wall)
         walls_data: List of wall JSON data (one per wall)
-        factory: RhinoCommonFactory instance
+        factory: RhinoCommonFactory instance (may be None in batched mode)
+        backend: Optional geometry backend name or instance; enables
+            batched mode, creating the boxes of all walls in one call
 
     Returns:
         Dictionary mapping wall_id to list of SheathingPanelGeometry
@@ -373,6 +574,7 @@ def create_sheathing_breps_batch(
         walls_by_id[wall_id] = wall
 
     results = {}
+    pairs = []
 
     for sheathing_data in sheathing_results:
         wall_id = str(sheathing_data.get("wall_id", "unknown"))
@@ -382,6 +584,18 @@ def create_sheathing_breps_batch(
         if "base_plane" not in wall_data:
             wall_data["base_plane"] = _create_default_base_plane()
 
+        pairs.append((wall_id, sheathing_data, wall_data))
+
+    if backend is not None:
+        batched = _create_breps_batched(
+            [(sheathing_data, wall_data) for _, sheathing_data, wall_data in pairs],
+            factory, backend,
+        )
+        for (wall_id, _, _), geometries in zip(pairs, batched):
+            results.setdefault(wall_id, []).extend(geometries)
+        return results
+
+    for wall_id, sheathing_data, wall_data in pairs:
         geometries = create_sheathing_breps(sheathing_data, wall_data, factory)
 
         if wall_id not in results:
@@ -0,0 +1,90 @@
+# File: src/timber_framing_generator/sheathing/sheathing_layout.py
+"""
+Opening sweep for sheathing layout.
+
+Sheathing is laid out row by row, bottom to top, and each row left to
+right, so the panel windows queried against the wall's openings only
+ever move forward. Instead of testing every opening for every panel,
+openings are sorted once and swept alongside the panels:
+
+1. Openings sorted by ``v_start`` are swept across rows, giving each row
+   the openings that overlap it vertically.
+2. A row's openings sorted by ``u_start`` are swept across its panels,
+   giving each panel the openings that overlap it horizontally.
+
+Each opening enters and leaves a sweep's active set once, so assigning
+cutouts costs O(panels + openings + cutouts) after sorting.
+
+Usage:
+    from src.timber_framing_generator.sheathing.sheathing_layout import (
+        IntervalSweep,
+    )
+
+    sweep = IntervalSweep([(o["u_start"], o["u_end"]) for o in openings])
+    for u_start, u_end in panel_windows:   # non-decreasing
+        hits = sweep.advance(u_start, u_end)
+"""
+
+from typing import List, Sequence, Tuple
+
+Interval = Tuple[float, float]
+
+
+class IntervalSweep:
+    """
+    Forward-only overlap queries over a fixed set of intervals.
+
+    ``advance(lo, hi)`` returns the intervals that overlap the open window
+    ``(lo, hi)``, i.e. ``start < hi and end > lo`` - the same test the
+    generator uses for panel/opening intersection. Successive windows must
+    have non-decreasing ``lo`` and ``hi``.
+
+    Args:
+        intervals: (start, end) pairs; positions in this sequence are what
+            ``advance`` reports
+    """
+
+    def __init__(self, intervals: Sequence[Interval]):
+        self._starts = [float(s) for s, _ in intervals]
+        self._ends = [float(e) for _, e in intervals]
+        self._order = sorted(range(len(self._starts)), key=self._starts.__getitem__)
+        self._next = 0
+        self._active: List[int] = []
+        self._lo = float('-inf')
+        self._hi = float('-inf')
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def advance(self, lo: float, hi: float) -> List[int]:
+        """
+        Get the intervals overlapping the window (lo, hi).
+
+        Args:
+            lo: Window start (must not decrease between calls)
+            hi: Window end (must not decrease between calls)
+
+        Returns:
+            Positions of overlapping intervals, ascending
+
+        Raises:
+            ValueError: If the window moves backwards
+        """
+        if lo < self._lo or hi < self._hi:
+            raise ValueError(
+                f"IntervalSweep windows must advance: ({lo}, {hi}) after "
+                f"({self._lo}, {self._hi})"
+            )
+        self._lo, self._hi = lo, hi
+
+        starts, ends, order = self._starts, self._ends, self._order
+        active = self._active
+        while self._next < len(order) and starts[order[self._next]] < hi:
+            active.append(order[self._next])
+            self._next += 1
+
+        # Intervals ending at or before lo can never overlap a later window
+        if active:
+            active[:] = [i for i in active if ends[i] > lo]
+
+        return sorted(active)
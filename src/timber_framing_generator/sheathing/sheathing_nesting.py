@@ -0,0 +1,352 @@
+# File: src/timber_framing_generator/sheathing/sheathing_nesting.py
+"""
+Sheet nesting for sheathing panels.
+
+SheathingGenerator lays out sheets wall by wall, and every partial piece
+(ripped end panel, short top row, panel around an opening) is counted as
+a whole stock sheet. This module packs the pieces of many walls into
+stock sheets so off-cuts are reused, and produces a cut list and waste
+statistics.
+
+Packing uses a guillotine shelf heuristic (first-fit decreasing height):
+
+1. Pieces of the same material are oriented (optionally rotated so the
+   shelf height is smallest) and sorted by decreasing height.
+2. Each piece goes on the most recently opened shelf with room for it;
+   shelves are strips across the full sheet width, so because of the sort
+   the newest shelves are the shortest that still fit.
+3. Otherwise a new shelf is opened in the first sheet with enough height
+   left, or on a new sheet.
+
+Every cut runs edge to edge (rip shelves off the sheet, crosscut pieces
+off the shelf, trim to height), so the layouts are cuttable on a panel
+saw. Shelf and sheet lookups are max-segment-tree searches, giving
+O(n log n) for n pieces.
+
+Usage:
+    from src.timber_framing_generator.sheathing.sheathing_nesting import (
+        nest_sheathing_panels,
+    )
+
+    results = nest_sheathing_panels(all_panels, stock="4x8")
+    for material, result in results.items():
+        print(material, result.sheet_count, result.waste_percentage)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from ..utils.segment_tree import MaxSegmentTree
+from .sheathing_profiles import PanelSize, get_panel_size
+from .sheathing_generator import SheathingPanel
+
+# Default saw kerf: 1/8 inch
+DEFAULT_KERF = 0.125 / 12.0
+
+# Dimension tolerance (feet)
+_EPS = 1e-6
+
+
+@dataclass
+class NestedPiece:
+    """
+    A sheathing piece placed on a stock sheet.
+
+    Attributes:
+        panel_id: ID of the SheathingPanel this piece becomes
+        wall_id: Parent wall ID
+        x: Offset from the sheet's left edge (feet)
+        y: Offset from the sheet's bottom edge (feet)
+        width: Width on the sheet (feet)
+        height: Height on the sheet (feet)
+        rotated: Whether the piece is turned 90 degrees on the sheet
+    """
+    panel_id: str
+    wall_id: str
+    x: float
+    y: float
+    width: float
+    height: float
+    rotated: bool = False
+
+    @property
+    def area(self) -> float:
+        return self.width * self.height
+
+
+@dataclass
+class StockSheet:
+    """
+    One stock sheet and the pieces cut from it.
+
+    Attributes:
+        index: Sheet number within its material
+        width: Sheet width (feet)
+        height: Sheet height (feet)
+        pieces: Pieces placed on the sheet
+    """
+    index: int
+    width: float
+    height: float
+    pieces: List[NestedPiece] = field(default_factory=list)
+
+    @property
+    def area(self) -> float:
+        return self.width * self.height
+
+    @property
+    def used_area(self) -> float:
+        return sum(p.area for p in self.pieces)
+
+    @property
+    def waste_area(self) -> float:
+        return self.area - self.used_area
+
+
+@dataclass
+class NestingResult:
+    """
+    Nesting result for one sheathing material.
+
+    Attributes:
+        material: Material name
+        stock: Stock sheet size
+        sheets: Stock sheets with their cut lists
+        piece_count: Number of pieces nested
+        cutout_area: Opening cutout area inside the pieces (sq ft)
+        unplaced: Panels larger than the stock sheet
+    """
+    material: str
+    stock: PanelSize
+    sheets: List[StockSheet] = field(default_factory=list)
+    piece_count: int = 0
+    cutout_area: float = 0.0
+    unplaced: List[SheathingPanel] = field(default_factory=list)
+
+    @property
+    def sheet_count(self) -> int:
+        return len(self.sheets)
+
+    @property
+    def stock_area(self) -> float:
+        return self.sheet_count * self.stock.width_feet * self.stock.height_feet
+
+    @property
+    def used_area(self) -> float:
+        return sum(s.used_area for s in self.sheets)
+
+    @property
+    def waste_area(self) -> float:
+        """Off-cut area: stock bought minus piece rectangles (sq ft)."""
+        return self.stock_area - self.used_area
+
+    @property
+    def waste_percentage(self) -> float:
+        return self.waste_area / self.stock_area * 100 if self.stock_area > 0 else 0.0
+
+    def cut_list(self) -> List[Dict[str, Any]]:
+        """
+        Flat cut list, one row per piece, ordered by sheet.
+
+        Returns:
+            List of dicts with sheet index, panel ID and placement
+        """
+        return [
+            {
+                "sheet": sheet.index,
+                "panel_id": piece.panel_id,
+                "wall_id": piece.wall_id,
+                "x": round(piece.x, 4),
+                "y": round(piece.y, 4),
+                "width": round(piece.width, 4),
+                "height": round(piece.height, 4),
+                "rotated": piece.rotated,
+            }
+            for sheet in self.sheets
+            for piece in sheet.pieces
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "material": self.material,
+            "panel_size": self.stock.name,
+            "sheets": self.sheet_count,
+            "pieces": self.piece_count,
+            "stock_area_sqft": round(self.stock_area, 2),
+            "used_area_sqft": round(self.used_area, 2),
+            "waste_area_sqft": round(self.waste_area, 2),
+            "waste_percentage": round(self.waste_percentage, 1),
+            "cutout_area_sqft": round(self.cutout_area, 2),
+            "unplaced": [p.id for p in self.unplaced],
+            "cut_list": self.cut_list(),
+        }
+
+
+def _orient(
+    width: float,
+    height: float,
+    stock_width: float,
+    stock_height: float,
+    allow_rotation: bool
+) -> Optional[tuple]:
+    """Pick (width, height, rotated) for a piece, or None if it cannot fit."""
+    options = []
+    if width <= stock_width + _EPS and height <= stock_height + _EPS:
+        options.append((width, height, False))
+    if allow_rotation and height <= stock_width + _EPS and width <= stock_height + _EPS:
+        options.append((height, width, True))
+    if not options:
+        return None
+    # Thinner shelves leave less unused height above shorter pieces
+    return min(options, key=lambda o: (o[1], o[2]))
+
+
+def nest_pieces(
+    panels: List[SheathingPanel],
+    stock: PanelSize,
+    kerf: float = DEFAULT_KERF,
+    allow_rotation: bool = True,
+    material: str = ""
+) -> NestingResult:
+    """
+    Pack sheathing pieces of one material into stock sheets.
+
+    Args:
+        panels: Pieces to nest (their width x height rectangles)
+        stock: Stock sheet size
+        kerf: Saw kerf between adjacent pieces (feet)
+        allow_rotation: Allow turning pieces 90 degrees on the sheet
+        material: Material name recorded on the result
+
+    Returns:
+        NestingResult with sheets, cut list and waste statistics
+    """
+    stock_w = stock.width_feet
+    stock_h = stock.height_feet
+    result = NestingResult(material=material, stock=stock)
+
+    items = []
+    for i, panel in enumerate(panels):
+        oriented = _orient(panel.width, panel.height, stock_w, stock_h, allow_rotation)
+        if oriented is None or panel.width <= 0 or panel.height <= 0:
+            result.unplaced.append(panel)
+            continue
+        result.cutout_area += panel.area_cutouts
+        items.append((oriented, i))
+    result.piece_count = len(items)
+
+    # Decreasing height, then width; index keeps the order deterministic
+    items.sort(key=lambda item: (-item[0][1], -item[0][0], item[1]))
+
+    n = len(items)
+    shelf_room = MaxSegmentTree(n)  # remaining width per shelf
+    sheet_room = MaxSegmentTree(n)  # remaining height per sheet
+    shelf_sheet: List[int] = []  # shelf -> sheet index
+    shelf_y: List[float] = []
+    shelf_used: List[float] = []
+    sheet_used: List[float] = []
+
+    for (width, height, rotated), i in items:
+        panel = panels[i]
+
+        # Newest shelf with room: shelves only get shorter, so it is the
+        # shortest shelf that still takes this piece
+        shelf = shelf_room.last_at_least(width - _EPS)
+        if shelf < 0:
+            sheet = sheet_room.first_at_least(height - _EPS)
+            if sheet < 0:
+                sheet = len(result.sheets)
+                result.sheets.append(StockSheet(index=sheet, width=stock_w, height=stock_h))
+                sheet_used.append(0.0)
+            y = sheet_used[sheet] + (kerf if sheet_used[sheet] > 0 else 0.0)
+            sheet_used[sheet] = y + height
+            sheet_room.set(sheet, stock_h - sheet_used[sheet] - kerf)
+
+            shelf = len(shelf_sheet)
+            shelf_sheet.append(sheet)
+            shelf_y.append(y)
+            shelf_used.append(0.0)
+
+        x = shelf_used[shelf] + (kerf if shelf_used[shelf] > 0 else 0.0)
+        shelf_used[shelf] = x + width
+        shelf_room.set(shelf, stock_w - shelf_used[shelf] - kerf)
+
+        result.sheets[shelf_sheet[shelf]].pieces.append(NestedPiece(
+            panel_id=panel.id,
+            wall_id=panel.wall_id,
+            x=x,
+            y=shelf_y[shelf],
+            width=width,
+            height=height,
+            rotated=rotated,
+        ))
+
+    return result
+
+
+def nest_sheathing_panels(
+    panels: Iterable[SheathingPanel],
+    stock: Union[str, PanelSize] = "4x8",
+    kerf: float = DEFAULT_KERF,
+    allow_rotation: bool = True
+) -> Dict[str, NestingResult]:
+    """
+    Nest sheathing panels from any number of walls into stock sheets.
+
+    Panels are grouped by material; each material is nested separately.
+
+    Args:
+        panels: SheathingPanel objects (e.g. from several generators)
+        stock: Stock sheet size name or PanelSize
+        kerf: Saw kerf between adjacent pieces (feet)
+        allow_rotation: Allow turning pieces 90 degrees. Disable for
+            structural panels whose strength axis must stay vertical.
+
+    Returns:
+        Dictionary mapping material name to NestingResult
+    """
+    if isinstance(stock, str):
+        stock = get_panel_size(stock)
+
+    by_material: Dict[str, List[SheathingPanel]] = {}
+    for panel in panels:
+        by_material.setdefault(panel.material.name, []).append(panel)
+
+    return {
+        material: nest_pieces(group, stock, kerf, allow_rotation, material)
+        for material, group in by_material.items()
+    }
+
+
+def get_nesting_summary(results: Dict[str, NestingResult]) -> Dict[str, Any]:
+    """
+    Summarize nesting results against one-sheet-per-piece ordering.
+
+    Args:
+        results: Output of nest_sheathing_panels
+
+    Returns:
+        Dictionary with sheet counts, savings and waste per material
+    """
+    materials = {}
+    for material, result in results.items():
+        pieces = result.piece_count + len(result.unplaced)
+        materials[material] = {
+            "sheets_without_nesting": pieces,
+            "sheets_with_nesting": result.sheet_count + len(result.unplaced),
+            "sheets_saved": pieces - result.sheet_count - len(result.unplaced),
+            "waste_area_sqft": round(result.waste_area, 2),
+            "waste_percentage": round(result.waste_percentage, 1),
+            "unplaced": len(result.unplaced),
+        }
+
+    return {
+        "total_sheets_without_nesting": sum(
+            m["sheets_without_nesting"] for m in materials.values()
+        ),
+        "total_sheets_with_nesting": sum(
+            m["sheets_with_nesting"] for m in materials.values()
+        ),
+        "materials": materials,
+    }
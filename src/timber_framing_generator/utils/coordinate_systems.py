@@ -1,9 +1,11 @@
 # File: timber_framing_generator/utils/coordinate_systems.py
 
 import Rhino.Geometry as rg
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
 
+from src.timber_framing_generator.utils.wall_frame import WallFrame, to_point3d, wall_frame
+
 
 class WallCoordinateSystem:
     """
@@ -15,7 +17,9 @@ class WallCoordinateSystem:
     - W-axis: Through wall thickness (normal to wall face)
 
     This class handles conversions in both directions and maintains debugging
-    geometry for visualization of the coordinate system.
+    geometry for visualization of the coordinate system. The math runs on the
+    wall's cached WallFrame (utils.wall_frame); RhinoCommon points are only
+    created for the results.
     """
 
     def __init__(self, wall_data: Dict[str, Any]):
@@ -35,6 +39,7 @@ class WallCoordinateSystem:
         self.top_elevation = 0.0
         self._to_world_transform = None
         self._to_wall_transform = None
+        self.frame: Optional[WallFrame] = None
         self.debug_geometry = {"axes": [], "grid": [], "origin": None}
 
         # Add this to track initialization status
@@ -59,6 +64,13 @@ class WallCoordinateSystem:
 
             print(f"Initializing WallCoordinateSystem with valid base plane and curve")
 
+            try:
+                self.frame = wall_frame(self.base_plane)
+            except ValueError as e:
+                print(f"Warning: {str(e)}")
+                self.initialization_failed = True
+                return
+
             # Create transformations
             try:
                 self._to_world_transform = self._compute_to_world_transform()
@@ -189,7 +201,9 @@ class WallCoordinateSystem:
 
     def wall_to_world(self, u: float, v: float, w: float = 0.0) -> Optional[rg.Point3d]:
         """
-        Convert wall coordinates (u,v,w) to world coordinates with improved robustness.
+        Convert wall coordinates (u,v,w) to world coordinates on the cached wall frame.
+
+        Falls back to point_at when the frame could not be built.
 
         Args:
             u: Position along wall length
@@ -199,57 +213,23 @@ class WallCoordinateSystem:
         Returns:
             Point in world coordinates, or None if transformation fails
         """
-        try:
-            # Check for invalid transforms or numerically problematic geometry
-            transform_valid = (
-                self._to_world_transform is not None
-                and self._to_world_transform.IsValid
-            )
+        if self.frame is None:
+            return self.point_at(u, v, w)
+        return rg.Point3d(*self.frame.to_world_point(u, v, w))
 
-            # Check for numerically problematic base plane (new condition)
-            potentially_unstable = False
-            if self.base_plane is not None:
-                potentially_unstable = (
-                    abs(self.base_plane.XAxis.X) < 1e-10
-                    or abs(self.base_plane.YAxis.Y) < 1e-10
-                )
-
-            # Use direct point_at approach if transform is invalid or potentially unstable
-            if not transform_valid or potentially_unstable:
-                if not transform_valid:
-                    print(
-                        f"Transform invalid for u={u}, v={v}, w={w} - using point_at method"
-                    )
-                elif potentially_unstable:
-                    print(
-                        f"Potentially unstable geometry for u={u}, v={v}, w={w} - using point_at method"
-                    )
-
-                direct_point = self.point_at(u, v, w)
-                if direct_point is None:
-                    print(
-                        f"  point_at also failed - base_plane is {self.base_plane is not None}"
-                    )
-                return direct_point
-
-            # Standard transformation path when transform is valid and geometry is stable
-            wall_point = rg.Point3d(u, v, w)
-            world_point = rg.Point3d(wall_point)
-
-            # Attempt the transformation
-            if not world_point.Transform(self._to_world_transform):
-                print(
-                    f"Point transformation failed for u={u}, v={v}, w={w} - falling back to point_at"
-                )
-                return self.point_at(
-                    u, v, w
-                )  # Fall back to direct method if transform fails
+    def wall_to_world_many(self, points: Sequence[Sequence[float]]) -> List[rg.Point3d]:
+        """
+        Convert many wall points to world points in one pass.
 
-            return world_point
+        Args:
+            points: (u, v, w) triples, or (u, v) pairs at w = 0
 
-        except Exception as e:
-            print(f"Error in wall_to_world for u={u}, v={v}, w={w}: {str(e)}")
-            return self.point_at(u, v, w)  # Final fallback using direct method
+        Returns:
+            World points in input order (empty if the system is not initialized)
+        """
+        if self.frame is None:
+            return []
+        return to_point3d(self.frame.to_world(points))
 
     def world_to_wall(self, point: rg.Point3d) -> Optional[Tuple[float, float, float]]:
         """
@@ -261,30 +241,27 @@ class WallCoordinateSystem:
         Returns:
             Tuple of (u, v, w) coordinates in wall space
         """
-        try:
-            # Validate transform and point
-            if self._to_wall_transform is None or not self._to_wall_transform.IsValid:
-                print(f"Cannot transform point: invalid world-to-wall transform")
-                return None
-
-            if point is None:
-                print(f"Cannot transform None point")
-                return None
-
-            # Make a copy to transform
-            wall_point = rg.Point3d(point)
+        if self.frame is None:
+            print(f"Cannot transform point: coordinate system not initialized")
+            return None
+        if point is None:
+            print(f"Cannot transform None point")
+            return None
+        return self.frame.to_wall_point(point.X, point.Y, point.Z)
 
-            # Transform the point
-            if not wall_point.Transform(self._to_wall_transform):
-                print(f"World-to-wall transformation failed for point {point}")
-                return None
+    def world_to_wall_many(self, points: Sequence[rg.Point3d]) -> List[Tuple[float, float, float]]:
+        """
+        Convert many world points to wall coordinates in one pass.
 
-            # Return as tuple
-            return wall_point.X, wall_point.Y, wall_point.Z
+        Args:
+            points: Points in world coordinates
 
-        except Exception as e:
-            print(f"Error in world_to_wall: {str(e)}")
-            return None
+        Returns:
+            (u, v, w) tuples in input order (empty if the system is not initialized)
+        """
+        if self.frame is None:
+            return []
+        return self.frame.to_wall([(p.X, p.Y, p.Z) for p in points])
 
     def create_wall_plane(
         self, u: float, v: float, normal_dir: str = "w"
@@ -491,21 +468,13 @@ class FramingElementCoordinates:
                 print("Warning: coordinate_system is None in FramingElementCoordinates")
                 return [None, None, None, None]
 
-            # Get the four corners in world coordinates
-            corners = [
-                self.coordinate_system.wall_to_world(
-                    self.u_start, self.v_start, self.w_center
-                ),
-                self.coordinate_system.wall_to_world(
-                    self.u_end, self.v_start, self.w_center
-                ),
-                self.coordinate_system.wall_to_world(
-                    self.u_end, self.v_end, self.w_center
-                ),
-                self.coordinate_system.wall_to_world(
-                    self.u_start, self.v_end, self.w_center
-                ),
-            ]
+            # Get the four corners in world coordinates in one pass
+            corners = self.coordinate_system.wall_to_world_many([
+                (self.u_start, self.v_start, self.w_center),
+                (self.u_end, self.v_start, self.w_center),
+                (self.u_end, self.v_end, self.w_center),
+                (self.u_start, self.v_end, self.w_center),
+            ])
 
             # Filter out None values
             corners = [corner for corner in corners if corner is not None]
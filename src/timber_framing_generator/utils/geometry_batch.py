@@ -0,0 +1,417 @@
+# File: src/timber_framing_generator/utils/geometry_batch.py
+"""
+Batched box-Brep creation from framing centerlines.
+
+Converting framing elements to geometry is dominated by per-element
+overhead: every Point3d, BoundingBox and Box built through
+RhinoCommonFactory goes through ``Activator.CreateInstance`` with an
+object array. This module splits the work in two:
+
+1. Pure-Python math over columnar element data (:class:`CenterlineArrays`)
+   that computes each member's axis-aligned box bounds in one pass.
+2. A pluggable :class:`GeometryBackend` that turns the bounds into Breps:
+   - ``RhinoCommonBackend``: RhinoCommon via cached ConstructorInfo
+     (Grasshopper / Rhino.Inside)
+   - ``Rhino3dmBackend``: the ``rhino3dm`` package (headless Linux,
+     benchmarking; geometry is NOT usable in Grasshopper)
+   - ``BoundsBackend``: returns the raw (min, max) tuples (no CAD library)
+
+Usage:
+    from src.timber_framing_generator.utils.geometry_batch import (
+        CenterlineArrays, create_box_breps_from_centerlines,
+    )
+
+    arrays = CenterlineArrays.from_elements(results.elements)
+    breps = create_box_breps_from_centerlines(arrays, backend="rhino3dm")
+
+See Also:
+    - docs/ai/ai-geometry-assembly-solution.md
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Vector3 = Tuple[float, float, float]
+Bounds = Tuple[Vector3, Vector3]
+
+# Centerlines shorter than this produce no geometry
+MIN_CENTERLINE_LENGTH = 0.001
+
+
+# =============================================================================
+# Columnar Input
+# =============================================================================
+
+@dataclass
+class CenterlineArrays:
+    """
+    Columnar centerline data for a batch of framing members.
+
+    All lists are index-aligned; entry i describes one member.
+
+    Attributes:
+        starts: Centerline start points (x, y, z)
+        ends: Centerline end points (x, y, z)
+        widths: Profile widths (along wall face for vertical members)
+        depths: Profile depths (through wall for vertical members)
+        wall_x_axes: Optional wall X-axis per member (None = World axes)
+        wall_z_axes: Optional wall Z-axis (normal) per member
+    """
+    starts: List[Vector3] = field(default_factory=list)
+    ends: List[Vector3] = field(default_factory=list)
+    widths: List[float] = field(default_factory=list)
+    depths: List[float] = field(default_factory=list)
+    wall_x_axes: List[Optional[Sequence[float]]] = field(default_factory=list)
+    wall_z_axes: List[Optional[Sequence[float]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def append(
+        self,
+        start: Vector3,
+        end: Vector3,
+        width: float,
+        depth: float,
+        wall_x_axis: Optional[Sequence[float]] = None,
+        wall_z_axis: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Append one member to the batch."""
+        self.starts.append(start)
+        self.ends.append(end)
+        self.widths.append(width)
+        self.depths.append(depth)
+        self.wall_x_axes.append(wall_x_axis)
+        self.wall_z_axes.append(wall_z_axis)
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[Any]) -> "CenterlineArrays":
+        """
+        Build columnar arrays from FramingElementData objects.
+
+        Wall axes are read from ``metadata['wall_x_axis']`` and
+        ``metadata['wall_z_axis']`` when present.
+        """
+        arrays = cls()
+        for element in elements:
+            start = element.centerline_start
+            end = element.centerline_end
+            metadata = element.metadata or {}
+            arrays.append(
+                (start.x, start.y, start.z),
+                (end.x, end.y, end.z),
+                element.profile.width,
+                element.profile.depth,
+                metadata.get('wall_x_axis'),
+                metadata.get('wall_z_axis'),
+            )
+        return arrays
+
+
+# =============================================================================
+# Box Math
+# =============================================================================
+
+def compute_box_bounds(
+    start_point: Vector3,
+    direction: Vector3,
+    length: float,
+    width: float,
+    depth: float,
+    wall_x_axis: Optional[Sequence[float]] = None,
+    wall_z_axis: Optional[Sequence[float]] = None,
+) -> Bounds:
+    """
+    Compute the axis-aligned bounds of a member box along a centerline.
+
+    This is the geometry-free core of
+    ``RhinoCommonFactory.create_box_brep_from_centerline``.
+
+    Args:
+        start_point: Start point of centerline
+        direction: Direction vector (will be normalized)
+        length: Length along direction
+        width: Width perpendicular to direction (W direction in UVW)
+        depth: Depth perpendicular to direction and width (U direction)
+        wall_x_axis: Optional wall X-axis direction (along wall length)
+        wall_z_axis: Optional wall Z-axis direction (wall normal, into wall)
+
+    Returns:
+        Tuple of (min_point, max_point)
+
+    Note:
+        For horizontal elements (plates, headers, sills), width and depth
+        are swapped because profile dimensions are defined for vertical
+        orientation but horizontal members are "laid flat".
+    """
+    sx, sy, sz = start_point
+    dx, dy, dz = direction
+
+    # Normalize direction
+    mag = (dx*dx + dy*dy + dz*dz) ** 0.5
+    if mag > 0:
+        dx, dy, dz = dx/mag, dy/mag, dz/mag
+
+    ex = sx + dx * length
+    ey = sy + dy * length
+    ez = sz + dz * length
+
+    is_vertical = abs(dz) > 0.9
+
+    if is_vertical:
+        if wall_x_axis and wall_z_axis:
+            # Profile width along wall face (U), depth through wall (W)
+            perp1 = wall_x_axis
+            perp2 = wall_z_axis
+        else:
+            # Legacy World axes
+            perp1 = (1.0, 0.0, 0.0)
+            perp2 = (0.0, 1.0, 0.0)
+        half_w = width / 2.0
+        half_d = depth / 2.0
+    else:
+        # Horizontal members: perp1 = wall normal (in XY plane), perp2 = vertical
+        p1x, p1y, p1z = -dy, dx, 0.0
+        p1_mag = (p1x*p1x + p1y*p1y) ** 0.5
+        if p1_mag > 0:
+            p1x, p1y = p1x/p1_mag, p1y/p1_mag
+        perp1 = (p1x, p1y, p1z)
+        perp2 = (
+            dy * p1z - dz * p1y,
+            dz * p1x - dx * p1z,
+            dx * p1y - dy * p1x,
+        )
+        # Depth goes into wall, width goes vertical
+        half_w = depth / 2.0
+        half_d = width / 2.0
+
+    # The box is symmetric about the centerline, so per-axis extents are
+    # |perp1| * half_w + |perp2| * half_d around both endpoints.
+    bounds_min = []
+    bounds_max = []
+    for s, e, a, b in (
+        (sx, ex, perp1[0], perp2[0]),
+        (sy, ey, perp1[1], perp2[1]),
+        (sz, ez, perp1[2], perp2[2]),
+    ):
+        extent = abs(a) * half_w + abs(b) * half_d
+        bounds_min.append(min(s, e) - extent)
+        bounds_max.append(max(s, e) + extent)
+
+    return (
+        (bounds_min[0], bounds_min[1], bounds_min[2]),
+        (bounds_max[0], bounds_max[1], bounds_max[2]),
+    )
+
+
+def compute_box_bounds_batch(arrays: CenterlineArrays) -> List[Optional[Bounds]]:
+    """
+    Compute box bounds for every member in a batch.
+
+    Args:
+        arrays: Columnar centerline data
+
+    Returns:
+        List aligned with the input; None for degenerate centerlines
+    """
+    results: List[Optional[Bounds]] = []
+    for start, end, width, depth, x_axis, z_axis in zip(
+        arrays.starts, arrays.ends, arrays.widths, arrays.depths,
+        arrays.wall_x_axes, arrays.wall_z_axes,
+    ):
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        dz = end[2] - start[2]
+        length = (dx*dx + dy*dy + dz*dz) ** 0.5
+        if length < MIN_CENTERLINE_LENGTH:
+            results.append(None)
+            continue
+        results.append(compute_box_bounds(
+            start, (dx/length, dy/length, dz/length), length,
+            width, depth, x_axis, z_axis,
+        ))
+    return results
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+class GeometryBackend(ABC):
+    """Turns precomputed bounds and segments into CAD geometry."""
+
+    name = "base"
+
+    @abstractmethod
+    def create_box_breps(self, bounds: Sequence[Optional[Bounds]]) -> List[Any]:
+        """Create one box Brep per bounds entry (None passes through)."""
+        pass
+
+    @abstractmethod
+    def create_line_curves(
+        self, starts: Sequence[Vector3], ends: Sequence[Vector3]
+    ) -> List[Any]:
+        """Create one line curve per (start, end) pair."""
+        pass
+
+
+class BoundsBackend(GeometryBackend):
+    """Geometry-free backend returning bounds and segments as tuples."""
+
+    name = "bounds"
+
+    def create_box_breps(self, bounds: Sequence[Optional[Bounds]]) -> List[Any]:
+        return list(bounds)
+
+    def create_line_curves(
+        self, starts: Sequence[Vector3], ends: Sequence[Vector3]
+    ) -> List[Any]:
+        return list(zip(starts, ends))
+
+
+class Rhino3dmBackend(GeometryBackend):
+    """
+    Backend using the ``rhino3dm`` package.
+
+    Intended for headless use and benchmarking. rhino3dm geometry comes
+    from the Rhino3dmIO assembly and cannot be passed to Grasshopper.
+    """
+
+    name = "rhino3dm"
+
+    def __init__(self) -> None:
+        import rhino3dm
+        self._r3 = rhino3dm
+
+    def create_box_breps(self, bounds: Sequence[Optional[Bounds]]) -> List[Any]:
+        r3 = self._r3
+        breps = []
+        for item in bounds:
+            if item is None:
+                breps.append(None)
+                continue
+            (x0, y0, z0), (x1, y1, z1) = item
+            breps.append(r3.Brep.CreateFromBox(
+                r3.Box(r3.BoundingBox(x0, y0, z0, x1, y1, z1))
+            ))
+        return breps
+
+    def create_line_curves(
+        self, starts: Sequence[Vector3], ends: Sequence[Vector3]
+    ) -> List[Any]:
+        r3 = self._r3
+        return [
+            r3.LineCurve(r3.Point3d(*start), r3.Point3d(*end))
+            for start, end in zip(starts, ends)
+        ]
+
+
+class RhinoCommonBackend(GeometryBackend):
+    """
+    Backend creating RhinoCommon geometry through cached constructors.
+
+    Constructor lookup is done once per backend; each element then costs
+    a direct ``ConstructorInfo.Invoke`` instead of an
+    ``Activator.CreateInstance`` overload resolution.
+
+    Args:
+        factory: RhinoCommonFactory providing the RhinoCommon types
+    """
+
+    name = "rhinocommon"
+
+    def __init__(self, factory: Any) -> None:
+        from System import Array, Double, Type
+
+        self._array_object = Array[object]
+        point_type = factory._get_type("Point3d")
+        bbox_type = factory._get_type("BoundingBox")
+        box_type = factory._get_type("Box")
+        line_curve_type = factory._get_type("LineCurve")
+
+        self._point_ctor = point_type.GetConstructor(Array[Type]([Double] * 3))
+        self._bbox_ctor = bbox_type.GetConstructor(Array[Type]([Double] * 6))
+        self._box_ctor = box_type.GetConstructor(Array[Type]([bbox_type]))
+        self._line_curve_ctor = line_curve_type.GetConstructor(
+            Array[Type]([point_type, point_type])
+        )
+
+    def create_box_breps(self, bounds: Sequence[Optional[Bounds]]) -> List[Any]:
+        to_args = self._array_object
+        bbox_ctor = self._bbox_ctor
+        box_ctor = self._box_ctor
+        breps = []
+        for item in bounds:
+            if item is None:
+                breps.append(None)
+                continue
+            (x0, y0, z0), (x1, y1, z1) = item
+            bbox = bbox_ctor.Invoke(to_args([
+                float(x0), float(y0), float(z0), float(x1), float(y1), float(z1)
+            ]))
+            breps.append(box_ctor.Invoke(to_args([bbox])).ToBrep())
+        return breps
+
+    def create_line_curves(
+        self, starts: Sequence[Vector3], ends: Sequence[Vector3]
+    ) -> List[Any]:
+        to_args = self._array_object
+        point_ctor = self._point_ctor
+        line_curve_ctor = self._line_curve_ctor
+        curves = []
+        for start, end in zip(starts, ends):
+            p0 = point_ctor.Invoke(to_args([float(c) for c in start]))
+            p1 = point_ctor.Invoke(to_args([float(c) for c in end]))
+            curves.append(line_curve_ctor.Invoke(to_args([p0, p1])))
+        return curves
+
+
+_backend_cache: Dict[str, GeometryBackend] = {}
+
+
+def get_backend(name: str = "rhinocommon") -> GeometryBackend:
+    """
+    Get a (cached) geometry backend by name.
+
+    Args:
+        name: 'rhinocommon', 'rhino3dm' or 'bounds'
+
+    Returns:
+        GeometryBackend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError / RuntimeError: If the backend's library is unavailable
+    """
+    key = name.lower()
+    if key not in _backend_cache:
+        if key == "rhinocommon":
+            from .geometry_factory import get_factory
+            _backend_cache[key] = RhinoCommonBackend(get_factory())
+        elif key == "rhino3dm":
+            _backend_cache[key] = Rhino3dmBackend()
+        elif key == "bounds":
+            _backend_cache[key] = BoundsBackend()
+        else:
+            raise ValueError(f"Unknown geometry backend: {name}")
+    return _backend_cache[key]
+
+
+def create_box_breps_from_centerlines(
+    arrays: CenterlineArrays,
+    backend: Any = "rhinocommon",
+) -> List[Any]:
+    """
+    Create box Breps for a whole batch of framing members in one call.
+
+    Args:
+        arrays: Columnar centerline data
+        backend: Backend name or GeometryBackend instance
+
+    Returns:
+        List aligned with the input; None for degenerate centerlines
+    """
+    if isinstance(backend, str):
+        backend = get_backend(backend)
+    return backend.create_box_breps(compute_box_bounds_batch(arrays))
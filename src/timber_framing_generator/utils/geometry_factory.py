@@ -24,6 +24,12 @@ Usage in GHPython:
     point = factory.create_point3d(1.0, 2.0, 3.0)
     brep = factory.create_box_brep_from_centerline(start, direction, length, width, depth)
 
+    # Batch creation (columnar input, one call for all members)
+    from src.timber_framing_generator.utils.geometry_batch import CenterlineArrays
+    breps = factory.create_box_breps_from_centerlines(
+        CenterlineArrays.from_elements(elements)
+    )
+
 See Also:
     - docs/ai/ai-geometry-assembly-solution.md
     - docs/ai/ai-grasshopper-rhino-patterns.md
@@ -31,6 +37,13 @@ See Also:
 
 from typing import Tuple, List, Optional, Any, Union
 
+from .geometry_batch import (
+    CenterlineArrays,
+    RhinoCommonBackend,
+    compute_box_bounds,
+    compute_box_bounds_batch,
+)
+
 # Type aliases for clarity
 Point3DLike = Union[Tuple[float, float, float], Any]
 Vector3DLike = Union[Tuple[float, float, float], Any]
@@ -768,88 +781,63 @@ class RhinoCommonFactory:
         else:
             dx, dy, dz = float(direction.X), float(direction.Y), float(direction.Z)
 
-        # Normalize direction
-        mag = (dx*dx + dy*dy + dz*dz) ** 0.5
-        if mag > 0:
-            dx, dy, dz = dx/mag, dy/mag, dz/mag
-
-        # Calculate end point
-        ex = sx + dx * length
-        ey = sy + dy * length
-        ez = sz + dz * length
-
-        # Calculate perpendicular vectors for width and depth
-        # For vertical elements (studs): perp1=along wall (X-axis), perp2=into wall (Z-axis/normal)
-        # For horizontal elements (plates): perp1=into wall (normal), perp2=vertical
-        is_vertical = abs(dz) > 0.9
-
-        if is_vertical:
-            # Vertical members: use wall direction if available, else fall back to World axes
-            if wall_x_axis and wall_z_axis:
-                # Use wall-relative axes:
-                # Profile width (1.5") = along wall face = wall X-axis
-                # Profile depth (3.5") = through-wall thickness = wall Z-axis (normal)
-                perp1 = wall_x_axis  # width direction = along wall (U)
-                perp2 = wall_z_axis  # depth direction = wall normal (W)
-            else:
-                # Fall back to hardcoded World axes (legacy behavior)
-                perp1 = (1.0, 0.0, 0.0)  # Width perpendicular in X
-                perp2 = (0.0, 1.0, 0.0)  # Depth perpendicular in Y
-        else:
-            # Horizontal members: perp1 = wall normal (in XY plane), perp2 = vertical
-            p1x = -dy
-            p1y = dx
-            p1z = 0.0
-            p1_mag = (p1x*p1x + p1y*p1y) ** 0.5
-            if p1_mag > 0:
-                p1x, p1y = p1x/p1_mag, p1y/p1_mag
-            perp1 = (p1x, p1y, p1z)
-
-            # For horizontal elements, perp2 should be vertical (Z direction)
-            # Cross direction with perp1 to get perp2
-            p2x = dy * p1z - dz * p1y
-            p2y = dz * p1x - dx * p1z
-            p2z = dx * p1y - dy * p1x
-            perp2 = (p2x, p2y, p2z)
-
-        # Profile dimensions for vertical elements (studs, king studs, trimmers, cripples):
-        #   - width = 1.5" = visible edge along wall face (what you see from exterior)
-        #   - depth = 3.5" = through wall thickness (wall depth)
-        #
-        # This matches standard framing: stud narrow edge faces out, wide face = wall thickness
-        # perp1 = wall_x_axis (along wall face), perp2 = wall_z_axis (wall normal/through wall)
-        if is_vertical:
-            half_w = width / 2.0  # 1.5"/2 along wall face (visible edge)
-            half_d = depth / 2.0  # 3.5"/2 through wall (wall thickness)
-        else:
-            # Horizontal elements: depth into wall, width vertical
-            half_w = depth / 2.0  # depth (3.5") goes into wall
-            half_d = width / 2.0  # width (1.5") goes vertical
-
-        corners = []
-        for start_end in [(sx, sy, sz), (ex, ey, ez)]:
-            px, py, pz = start_end
-            for w_sign in [-1, 1]:
-                for d_sign in [-1, 1]:
-                    cx = px + perp1[0] * half_w * w_sign + perp2[0] * half_d * d_sign
-                    cy = py + perp1[1] * half_w * w_sign + perp2[1] * half_d * d_sign
-                    cz = pz + perp1[2] * half_w * w_sign + perp2[2] * half_d * d_sign
-                    corners.append((cx, cy, cz))
-
-        # Find min/max from corners
-        min_x = min(c[0] for c in corners)
-        min_y = min(c[1] for c in corners)
-        min_z = min(c[2] for c in corners)
-        max_x = max(c[0] for c in corners)
-        max_y = max(c[1] for c in corners)
-        max_z = max(c[2] for c in corners)
+        # Profile orientation rules live in compute_box_bounds:
+        #   - vertical: width along wall face, depth through wall thickness
+        #   - horizontal: depth into wall, width vertical
+        min_pt, max_pt = compute_box_bounds(
+            (sx, sy, sz), (dx, dy, dz), length, width, depth,
+            wall_x_axis, wall_z_axis,
+        )
 
         # Create bounding box and box
-        bbox = self.create_bounding_box((min_x, min_y, min_z), (max_x, max_y, max_z))
+        bbox = self.create_bounding_box(min_pt, max_pt)
         box = self.create_box(bbox)
 
         return box.ToBrep()
 
+    def create_box_breps_from_centerlines(self, arrays: CenterlineArrays) -> List[Any]:
+        """
+        Create box Breps for a whole batch of members in one call.
+
+        Box bounds are computed in pure Python for all members first, then
+        Breps are built through cached RhinoCommon constructors, avoiding
+        per-element Activator.CreateInstance overload resolution.
+
+        Args:
+            arrays: Columnar centerline data (see CenterlineArrays)
+
+        Returns:
+            List of Breps aligned with the input; None for degenerate centerlines
+        """
+        return self._get_batch_backend().create_box_breps(
+            compute_box_bounds_batch(arrays)
+        )
+
+    def create_line_curves_batch(
+        self,
+        starts: List[Tuple[float, float, float]],
+        ends: List[Tuple[float, float, float]],
+    ) -> List[Any]:
+        """
+        Create LineCurves for a batch of (start, end) coordinate tuples.
+
+        Args:
+            starts: Start points as (x, y, z) tuples
+            ends: End points as (x, y, z) tuples
+
+        Returns:
+            List of LineCurves aligned with the input
+        """
+        return self._get_batch_backend().create_line_curves(starts, ends)
+
+    def _get_batch_backend(self) -> RhinoCommonBackend:
+        """Get the constructor-caching backend used by batch methods."""
+        backend = getattr(self, "_batch_backend", None)
+        if backend is None:
+            backend = RhinoCommonBackend(self)
+            self._batch_backend = backend
+        return backend
+
     def create_brep_from_element_data(self, element_data) -> Optional[Any]:
         """
         Create a Brep from FramingElementData.
@@ -0,0 +1,111 @@
+# File: src/timber_framing_generator/utils/lazy_imports.py
+"""
+Lazy import helpers for package ``__init__`` modules and optional dependencies.
+
+Grasshopper components re-run their scripts on every solve, so import cost
+is paid repeatedly. Package ``__init__`` files therefore declare their
+public names in an export table instead of importing every submodule up
+front; a submodule is only imported the first time one of its names is
+accessed (PEP 562 module ``__getattr__``).
+
+Usage in a package ``__init__``:
+    from src.timber_framing_generator.utils.lazy_imports import lazy_exports
+
+    _EXPORTS = {
+        "OccupancyMap": ".occupancy",
+        "RoutingDomain": ".domains",
+    }
+
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
+
+Usage for optional heavy dependencies:
+    nx, HAS_NETWORKX = optional_import("networkx")
+
+    graph = nx.Graph()  # networkx is imported here, on first attribute access
+"""
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Dict[str, str],
+    package_globals: Dict[str, Any],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Args:
+        package_name: The package's ``__name__``
+        exports: Mapping of public name -> relative submodule (e.g. ".occupancy")
+        package_globals: The package's ``globals()``; resolved names are
+            cached here so later lookups bypass ``__getattr__``
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module = importlib.import_module(submodule, package_name)
+        value = getattr(module, name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+
+def optional_import(name: str) -> Tuple[Optional[ModuleType], bool]:
+    """
+    Declare an optional dependency without importing it yet.
+
+    Availability is checked with ``importlib.util.find_spec``, which does not
+    execute the package. If the package is already imported, the real module
+    is returned directly.
+
+    Args:
+        name: Top-level module name (e.g. "networkx")
+
+    Returns:
+        Tuple of (module proxy or None, is_available)
+    """
+    import sys
+
+    if name in sys.modules:
+        return sys.modules[name], True
+    try:
+        available = importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        available = False
+    if not available:
+        return None, False
+    return LazyModule(name), True
@@ -0,0 +1,69 @@
+# File: src/timber_framing_generator/utils/segment_tree.py
+"""
+Max segment tree for first-fit / best-fit packing heuristics.
+
+Bin-packing style heuristics (sheet nesting, stock-length cutting) keep
+one "remaining capacity" value per open bin and repeatedly ask for the
+first or last bin with room for an item. A max segment tree answers both
+in O(log n) instead of scanning every open bin.
+
+Usage:
+    from src.timber_framing_generator.utils.segment_tree import MaxSegmentTree
+
+    room = MaxSegmentTree(capacity=len(items))
+    room.set(0, 8.0)
+    bin_index = room.first_at_least(2.5)   # -1 if no bin has room
+"""
+
+from typing import List
+
+
+class MaxSegmentTree:
+    """
+    Fixed-capacity max segment tree over float slots.
+
+    Unset slots hold -inf, so they never satisfy a search.
+
+    Args:
+        capacity: Number of slots (indices 0..capacity-1)
+    """
+
+    def __init__(self, capacity: int):
+        size = 1
+        while size < max(1, capacity):
+            size *= 2
+        self._size = size
+        self._tree: List[float] = [float('-inf')] * (2 * size)
+
+    def __getitem__(self, index: int) -> float:
+        return self._tree[index + self._size]
+
+    def set(self, index: int, value: float) -> None:
+        """Set the value of a slot."""
+        i = index + self._size
+        tree = self._tree
+        tree[i] = value
+        i //= 2
+        while i:
+            left = tree[2 * i]
+            right = tree[2 * i + 1]
+            tree[i] = left if left >= right else right
+            i //= 2
+
+    def first_at_least(self, value: float) -> int:
+        """Lowest index holding >= value, or -1."""
+        return self._descend(value, prefer_right=False)
+
+    def last_at_least(self, value: float) -> int:
+        """Highest index holding >= value, or -1."""
+        return self._descend(value, prefer_right=True)
+
+    def _descend(self, value: float, prefer_right: bool) -> int:
+        tree = self._tree
+        if tree[1] < value:
+            return -1
+        i = 1
+        while i < self._size:
+            first, second = (2 * i + 1, 2 * i) if prefer_right else (2 * i, 2 * i + 1)
+            i = first if tree[first] >= value else second
+        return i - self._size
@@ -0,0 +1,237 @@
+# File: src/timber_framing_generator/utils/wall_frame.py
+"""
+Pure-Python wall frames for bulk wall (u, v, w) <-> world conversion.
+
+A wall's base plane defines its coordinate system:
+
+- U: along the wall (plane X axis)
+- V: up the wall (plane Y axis)
+- W: through the wall (plane Z axis, the wall normal)
+
+so ``world = origin + u * X + v * Y + w * Z``, which is what RhinoCommon's
+``Plane.PointAt(u, v, w)`` computes. :class:`WallFrame` holds the axes
+and both 4x4 matrices as plain floats, converts whole point lists in one
+call, and accepts any plane representation the pipeline uses (RhinoCommon
+``Plane``, ``PlaneData``, or the base_plane JSON dict).
+
+``wall_frame(plane)`` returns a cached frame, keyed by the plane's
+coefficients, so every module handling a wall shares one frame and its
+inverse is computed once. Rhino points are created only at the end, by
+``to_point3d`` in the modules that need them.
+
+Usage:
+    from src.timber_framing_generator.utils.wall_frame import wall_frame
+
+    frame = wall_frame(wall_data["base_plane"])
+    corners = frame.to_world([(0, 0, 0), (4, 0, 0), (4, 8, 0), (0, 8, 0)])
+    uvw = frame.to_wall(corners)
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+Vector3 = Tuple[float, float, float]
+Matrix4 = Tuple[Tuple[float, float, float, float], ...]
+
+# Distinct planes kept by wall_frame(); a few per wall in a large building
+FRAME_CACHE_SIZE = 4096
+
+# Axes spanning less volume than this cannot be inverted
+SINGULAR_TOLERANCE = 1e-12
+
+
+def _cross(a: Sequence[float], b: Sequence[float]) -> Vector3:
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+class WallFrame:
+    """
+    A wall's coordinate system with cached forward and inverse matrices.
+
+    Args:
+        origin: Plane origin in world coordinates
+        x_axis: U direction
+        y_axis: V direction
+        z_axis: W direction (default: x_axis x y_axis)
+
+    Raises:
+        ValueError: If the axes are degenerate (no inverse)
+    """
+
+    __slots__ = ("origin", "x_axis", "y_axis", "z_axis", "to_world_matrix", "to_wall_matrix")
+
+    def __init__(
+        self,
+        origin: Sequence[float],
+        x_axis: Sequence[float],
+        y_axis: Sequence[float],
+        z_axis: Optional[Sequence[float]] = None,
+    ) -> None:
+        self.origin: Vector3 = (float(origin[0]), float(origin[1]), float(origin[2]))
+        self.x_axis: Vector3 = (float(x_axis[0]), float(x_axis[1]), float(x_axis[2]))
+        self.y_axis: Vector3 = (float(y_axis[0]), float(y_axis[1]), float(y_axis[2]))
+        if z_axis is None:
+            z_axis = _cross(self.x_axis, self.y_axis)
+        self.z_axis: Vector3 = (float(z_axis[0]), float(z_axis[1]), float(z_axis[2]))
+
+        o, x, y, z = self.origin, self.x_axis, self.y_axis, self.z_axis
+        # Columns are the axes; translation is the origin
+        self.to_world_matrix: Matrix4 = (
+            (x[0], y[0], z[0], o[0]),
+            (x[1], y[1], z[1], o[1]),
+            (x[2], y[2], z[2], o[2]),
+            (0.0, 0.0, 0.0, 1.0),
+        )
+        self.to_wall_matrix: Matrix4 = self._invert()
+
+    def _invert(self) -> Matrix4:
+        x, y, z, o = self.x_axis, self.y_axis, self.z_axis, self.origin
+        # Rows of the inverse of [x y z] are the reciprocal axes
+        yz, zx, xy = _cross(y, z), _cross(z, x), _cross(x, y)
+        det = x[0] * yz[0] + x[1] * yz[1] + x[2] * yz[2]
+        if abs(det) < SINGULAR_TOLERANCE:
+            raise ValueError("Wall frame axes are degenerate")
+        rows = [tuple(c / det for c in r) for r in (yz, zx, xy)]
+        return tuple(
+            (r[0], r[1], r[2], -(r[0] * o[0] + r[1] * o[1] + r[2] * o[2]))
+            for r in rows
+        ) + ((0.0, 0.0, 0.0, 1.0),)
+
+    @classmethod
+    def from_plane(cls, plane: Any) -> "WallFrame":
+        """
+        Frame of a RhinoCommon Plane, PlaneData or base_plane dict.
+
+        Args:
+            plane: Plane in any pipeline representation
+
+        Returns:
+            New (uncached) WallFrame; see wall_frame() for the cached one
+        """
+        return cls(*_plane_key(plane))
+
+    def to_world_point(self, u: float, v: float, w: float = 0.0) -> Vector3:
+        """World (x, y, z) of one wall point."""
+        o, x, y, z = self.origin, self.x_axis, self.y_axis, self.z_axis
+        return (
+            o[0] + x[0] * u + y[0] * v + z[0] * w,
+            o[1] + x[1] * u + y[1] * v + z[1] * w,
+            o[2] + x[2] * u + y[2] * v + z[2] * w,
+        )
+
+    def to_world(self, points: Iterable[Sequence[float]]) -> List[Vector3]:
+        """
+        World points of many wall points.
+
+        Args:
+            points: (u, v, w) triples; (u, v) pairs take w = 0
+
+        Returns:
+            (x, y, z) tuples in input order
+        """
+        (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), _ = self.to_world_matrix
+        out = []
+        append = out.append
+        for p in points:
+            u, v = p[0], p[1]
+            w = p[2] if len(p) > 2 else 0.0
+            append((
+                m00 * u + m01 * v + m02 * w + m03,
+                m10 * u + m11 * v + m12 * w + m13,
+                m20 * u + m21 * v + m22 * w + m23,
+            ))
+        return out
+
+    def to_wall_point(self, x: float, y: float, z: float) -> Vector3:
+        """Wall (u, v, w) of one world point."""
+        return self.to_wall([(x, y, z)])[0]
+
+    def to_wall(self, points: Iterable[Sequence[float]]) -> List[Vector3]:
+        """
+        Wall coordinates of many world points.
+
+        Args:
+            points: (x, y, z) triples
+
+        Returns:
+            (u, v, w) tuples in input order
+        """
+        (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), _ = self.to_wall_matrix
+        out = []
+        append = out.append
+        for x, y, z in points:
+            append((
+                m00 * x + m01 * y + m02 * z + m03,
+                m10 * x + m11 * y + m12 * z + m13,
+                m20 * x + m21 * y + m22 * z + m23,
+            ))
+        return out
+
+
+def _xyz(value: Any) -> Vector3:
+    """Coordinates of a Rhino point/vector, a Point3D/Vector3D or a dict."""
+    if isinstance(value, dict):
+        return (value.get("x", 0.0), value.get("y", 0.0), value.get("z", 0.0))
+    if hasattr(value, "X"):
+        return (value.X, value.Y, value.Z)
+    if hasattr(value, "x"):
+        return (value.x, value.y, value.z)
+    return (value[0], value[1], value[2])
+
+
+def _plane_key(plane: Any) -> Tuple[Vector3, Vector3, Vector3, Vector3]:
+    """(origin, x_axis, y_axis, z_axis) of any plane representation."""
+    if isinstance(plane, dict):
+        z_axis = plane.get("z_axis")
+        x_axis, y_axis = _xyz(plane["x_axis"]), _xyz(plane["y_axis"])
+        return (
+            _xyz(plane["origin"]), x_axis, y_axis,
+            _xyz(z_axis) if z_axis else _cross(x_axis, y_axis),
+        )
+    if hasattr(plane, "Origin"):
+        return (_xyz(plane.Origin), _xyz(plane.XAxis), _xyz(plane.YAxis), _xyz(plane.ZAxis))
+    return (_xyz(plane.origin), _xyz(plane.x_axis), _xyz(plane.y_axis), _xyz(plane.z_axis))
+
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def _cached_frame(key: Tuple[Vector3, Vector3, Vector3, Vector3]) -> WallFrame:
+    return WallFrame(*key)
+
+
+def wall_frame(plane: Any) -> WallFrame:
+    """
+    Shared, cached frame of a wall's base plane.
+
+    Frames are cached by plane coefficients, so a RhinoCommon Plane and
+    the JSON dict of the same plane share one frame.
+
+    Args:
+        plane: RhinoCommon Plane, PlaneData, or base_plane dict
+
+    Returns:
+        WallFrame (treat as read-only; it is shared)
+    """
+    key = _plane_key(plane)
+    return _cached_frame(tuple(tuple(float(c) for c in axis) for axis in key))
+
+
+def clear_frame_cache() -> None:
+    """Forget all cached frames."""
+    _cached_frame.cache_clear()
+
+
+def to_point3d(points: Iterable[Sequence[float]]) -> List[Any]:
+    """
+    RhinoCommon Point3d objects for (x, y, z) tuples.
+
+    Call this last, after all math is done on tuples.
+
+    Raises:
+        ImportError: If RhinoCommon is not available
+    """
+    import Rhino.Geometry as rg
+    return [rg.Point3d(p[0], p[1], p[2]) for p in points]
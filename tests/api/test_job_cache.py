@@ -0,0 +1,204 @@
+# File: tests/api/test_job_cache.py
+"""Tests for job record caching, ETags and response compression."""
+
+import asyncio
+import gzip
+import time
+import uuid
+from datetime import datetime
+
+from api.utils.http_cache import (
+    EncodedBody,
+    ResponseCache,
+    choose_encoding,
+    negotiate,
+)
+from api.utils.job_cache import JobCache
+from api.utils.job_store import AsyncJobStore, InMemoryJobStore
+
+
+def make_job(status="pending"):
+    now = datetime.now()
+    return {
+        "job_id": str(uuid.uuid4()),
+        "status": status,
+        "created_at": now,
+        "updated_at": now,
+        "wall_data": {},
+    }
+
+
+class CountingStore(InMemoryJobStore):
+    """In-memory store that counts reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get_job(self, job_id):
+        self.reads += 1
+        return super().get_job(job_id)
+
+    def list_jobs(self, limit=10, offset=0, status=None):
+        self.reads += 1
+        return super().list_jobs(limit, offset, status)
+
+
+class TestJobCache:
+    """Tests for JobCache expiry and eviction."""
+
+    def test_terminal_jobs_never_expire(self):
+        cache = JobCache(ttl=0.0)
+        done = make_job("completed")
+        running = make_job("processing")
+        cache.put(done)
+        cache.put(running)
+        assert cache.get(done["job_id"]) is done
+        assert cache.get(running["job_id"]) is None
+
+    def test_unfinished_jobs_expire(self):
+        cache = JobCache(ttl=0.05)
+        job = make_job()
+        cache.put(job)
+        assert cache.get(job["job_id"]) is job
+        time.sleep(0.06)
+        assert cache.get(job["job_id"]) is None
+
+    def test_lru_eviction(self):
+        cache = JobCache(max_entries=2)
+        a, b, c = (make_job("completed") for _ in range(3))
+        cache.put(a)
+        cache.put(b)
+        cache.get(a["job_id"])
+        cache.put(c)
+        assert cache.get(b["job_id"]) is None
+        assert cache.get(a["job_id"]) is a
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_drops_lists(self):
+        cache = JobCache()
+        cache.put_list((10, 0, None), [])
+        cache.invalidate("unknown")
+        assert cache.get_list((10, 0, None)) is None
+
+
+class TestCachedJobStore:
+    """Tests for AsyncJobStore with a cache."""
+
+    def test_polling_a_finished_job_reads_once(self):
+        async def scenario():
+            backend = CountingStore()
+            store = AsyncJobStore(backend, cache=JobCache())
+            job = make_job()
+            await store.create_job(job)
+            await store.update_job(job["job_id"], {"status": "completed", "result": {"x": 1}})
+            backend.reads = 0
+            results = [await store.get_job(job["job_id"]) for _ in range(100)]
+            store.close()
+            return backend.reads, results, store.metrics()["cache"]
+
+        reads, results, stats = asyncio.run(scenario())
+        # Writes through the store fill the cache, so no read reaches the backend
+        assert reads == 0
+        assert all(r["result"] == {"x": 1} for r in results)
+        assert stats["hits"] == 100
+
+    def test_unfinished_job_reread_after_ttl(self):
+        async def scenario():
+            backend = CountingStore()
+            store = AsyncJobStore(backend, cache=JobCache(ttl=0.05))
+            job = make_job()
+            backend.create_job(job)
+            for _ in range(10):
+                await store.get_job(job["job_id"])
+            first = backend.reads
+            # Another process finishes the job
+            backend.update_job(job["job_id"], {"status": "completed"})
+            await asyncio.sleep(0.06)
+            record = await store.get_job(job["job_id"])
+            store.close()
+            return first, backend.reads, record
+
+        first, total, record = asyncio.run(scenario())
+        assert first == 1
+        assert total == 2
+        assert record["status"] == "completed"
+
+    def test_list_cached_until_write(self):
+        async def scenario():
+            backend = CountingStore()
+            store = AsyncJobStore(backend, cache=JobCache(ttl=60.0))
+            await store.create_job(make_job())
+            pages = [await store.list_jobs(limit=5) for _ in range(5)]
+            reads = backend.reads
+            await store.create_job(make_job())
+            fresh = await store.list_jobs(limit=5)
+            store.close()
+            return pages, reads, fresh
+
+        pages, reads, fresh = asyncio.run(scenario())
+        assert reads == 1
+        assert len(pages[-1]) == 1
+        assert len(fresh) == 2
+
+    def test_batch_submit_keeps_finished_jobs_cached(self):
+        async def scenario():
+            backend = CountingStore()
+            store = AsyncJobStore(backend, cache=JobCache())
+            done = make_job()
+            await store.create_job(done)
+            await store.update_job(done["job_id"], {"status": "completed"})
+            backend.reads = 0
+            await store.create_jobs([make_job(), make_job()])
+            record = await store.get_job(done["job_id"])
+            store.close()
+            return backend.reads, record
+
+        reads, record = asyncio.run(scenario())
+        assert reads == 0
+        assert record["status"] == "completed"
+
+
+class TestNegotiation:
+    """Tests for ETags, 304s and compression."""
+
+    def test_not_modified(self):
+        encoded = EncodedBody(b'{"status":"completed"}')
+        status, headers, body = negotiate(encoded, None, None)
+        assert status == 200 and body == encoded.body
+        assert headers["ETag"] == encoded.etag()
+
+        status, headers, body = negotiate(encoded, headers["ETag"], None)
+        assert status == 304 and body == b""
+        assert negotiate(encoded, f'"other", W/{encoded.etag()}', None)[0] == 304
+        assert negotiate(encoded, '"other"', None)[0] == 200
+
+    def test_gzip_for_large_bodies(self):
+        encoded = EncodedBody(b'{"members":[' + b'{"type":"stud"},' * 500 + b'{}]}')
+        status, headers, body = negotiate(encoded, None, "gzip, deflate", min_bytes=1024)
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(body) == encoded.body
+        assert len(body) * 10 < len(encoded.body)
+        # The compressed variant has its own ETag, and either one revalidates
+        assert headers["ETag"] != encoded.etag()
+        assert negotiate(encoded, headers["ETag"], None)[0] == 304
+        assert negotiate(encoded, encoded.etag(), "gzip")[0] == 304
+
+    def test_small_bodies_sent_plain(self):
+        encoded = EncodedBody(b"{}")
+        status, headers, body = negotiate(encoded, None, "gzip", min_bytes=1024)
+        assert "Content-Encoding" not in headers and body == b"{}"
+
+    def test_choose_encoding(self):
+        assert choose_encoding(None) == "identity"
+        assert choose_encoding("gzip;q=0") == "identity"
+        assert choose_encoding("*") in ("br", "gzip")
+        assert choose_encoding("identity") == "identity"
+
+    def test_response_cache_lru(self):
+        cache = ResponseCache(max_entries=1)
+        cache.put("a", EncodedBody(b"a"))
+        cache.put("b", EncodedBody(b"b"))
+        assert cache.get("a") is None
+        assert cache.get("b").body == b"b"
@@ -0,0 +1,308 @@
+# File: tests/api/test_job_pipeline.py
+"""Tests for the job store backends, async job store and job runner."""
+
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.utils.analysis import run_wall_analysis, to_internal_wall_data
+from api.utils.job_runner import JobRunner, QueueFullError
+from api.utils.job_store import (
+    AsyncJobStore,
+    InMemoryJobStore,
+    JobStoreTimeout,
+    SQLiteJobStore,
+    create_job_store,
+)
+
+WALL = {
+    "wall_type": "2x6 EXT",
+    "wall_base_elevation": 0.0,
+    "wall_top_elevation": 8.0,
+    "wall_length": 20.0,
+    "wall_height": 8.0,
+    "is_exterior_wall": True,
+    "openings": [{
+        "opening_type": "window",
+        "start_u_coordinate": 4.0,
+        "rough_width": 3.0,
+        "rough_height": 4.0,
+        "base_elevation_relative_to_wall_base": 3.0,
+    }],
+}
+
+
+def make_job(created_at=None, status="pending"):
+    now = created_at or datetime.now()
+    return {
+        "job_id": str(uuid.uuid4()),
+        "status": status,
+        "created_at": now,
+        "updated_at": now,
+        "wall_data": WALL,
+        "result": None,
+        "error": None,
+    }
+
+
+def echo_kernel(wall_data):
+    return {"length": wall_data["wall_length"]}
+
+
+def slow_kernel(wall_data):
+    time.sleep(wall_data.get("sleep", 0.2))
+    return {"slept": True}
+
+
+def failing_kernel(wall_data):
+    raise ValueError("bad wall")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    backend = create_job_store(request.param)
+    yield backend
+    backend.close()
+
+
+class TestJobStores:
+    """Backend parity tests for InMemoryJobStore and SQLiteJobStore."""
+
+    def test_create_and_get(self, store):
+        job = make_job()
+        created = store.create_job(job)
+        assert created["job_id"] == job["job_id"]
+        assert created["created_at"] == job["created_at"].isoformat()
+        assert store.get_job(job["job_id"])["wall_data"] == WALL
+        assert store.get_job(str(uuid.uuid4())) is None
+
+    def test_duplicate_create_fails(self, store):
+        job = make_job()
+        assert store.create_job(job)
+        assert store.create_job(job) is None
+
+    def test_update(self, store):
+        job = make_job()
+        store.create_job(job)
+        updated = store.update_job(job["job_id"], {"status": "completed", "result": {"a": [1, 2]}})
+        assert updated["status"] == "completed"
+        assert store.get_job(job["job_id"])["result"] == {"a": [1, 2]}
+        assert updated["updated_at"] != job["updated_at"].isoformat()
+        assert store.update_job(str(uuid.uuid4()), {"status": "failed"}) is None
+
+    def test_list_newest_first_with_filter(self, store):
+        base = datetime(2024, 1, 1)
+        jobs = [make_job(base + timedelta(minutes=i), "completed" if i % 2 else "pending")
+                for i in range(6)]
+        for job in jobs:
+            store.create_job(job)
+
+        listed = store.list_jobs(limit=3)
+        assert [j["job_id"] for j in listed] == [j["job_id"] for j in jobs[::-1][:3]]
+        assert [j["job_id"] for j in store.list_jobs(limit=2, offset=1, status="completed")] == [
+            jobs[3]["job_id"], jobs[1]["job_id"]
+        ]
+
+    def test_delete(self, store):
+        job = make_job()
+        store.create_job(job)
+        assert store.delete_job(job["job_id"])
+        assert not store.delete_job(job["job_id"])
+        assert store.check_connection()
+
+    def test_sqlite_file_persists(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+        job = make_job()
+        first = SQLiteJobStore(path)
+        first.create_job(job)
+        first.close()
+
+        second = SQLiteJobStore(path)
+        assert second.get_job(job["job_id"])["wall_data"] == WALL
+        second.close()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_job_store("redis")
+
+
+class _SlowStore(InMemoryJobStore):
+    def get_job(self, job_id):
+        time.sleep(0.3)
+        return super().get_job(job_id)
+
+
+class TestAsyncJobStore:
+    """Tests for the thread-offloaded job store."""
+
+    def test_calls_run_off_the_event_loop(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore(), threads=2)
+            job = make_job()
+            await store.create_job(job)
+            loop_thread = threading.get_ident()
+            seen = []
+            store.store.get_job = lambda job_id: seen.append(threading.get_ident())
+            await store.get_job(job["job_id"])
+            store.close()
+            return loop_thread, seen
+
+        loop_thread, seen = asyncio.run(scenario())
+        assert seen and seen[0] != loop_thread
+
+    def test_timeout_raises_and_is_counted(self):
+        async def scenario():
+            store = AsyncJobStore(_SlowStore(), threads=2, timeout=0.05)
+            with pytest.raises(JobStoreTimeout):
+                await store.get_job("x")
+            await store.create_job(make_job())
+            metrics = store.metrics()
+            store.close()
+            return metrics
+
+        metrics = asyncio.run(scenario())
+        assert metrics["operations"]["get_job"]["timeouts"] == 1
+        assert metrics["operations"]["create_job"]["calls"] == 1
+        assert metrics["backend"] == "_SlowStore"
+
+
+class TestJobRunner:
+    """Tests for the bounded job runner."""
+
+    @staticmethod
+    async def wait_for_status(store, job_id, statuses, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = await store.get_job(job_id)
+            if job and job["status"] in statuses:
+                return job
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"job {job_id} never reached {statuses}")
+
+    def run_jobs(self, kernel, jobs, **runner_kwargs):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=kernel, executor="thread", **runner_kwargs)
+            await runner.start()
+            for job in jobs:
+                await runner.submit(job)
+            finished = [
+                await self.wait_for_status(store, job["job_id"], ("completed", "failed"))
+                for job in jobs
+            ]
+            metrics = runner.metrics()
+            await runner.stop()
+            store.close()
+            return finished, metrics
+
+        return asyncio.run(scenario())
+
+    def test_completes_jobs(self):
+        finished, metrics = self.run_jobs(echo_kernel, [make_job() for _ in range(5)], workers=2)
+        assert all(j["status"] == "completed" for j in finished)
+        assert finished[0]["result"] == {"length": 20.0}
+        assert metrics["completed"] == 5
+        assert metrics["submitted"] == 5
+        assert metrics["job_duration"]["count"] == 5
+        assert metrics["job_store"]["operations"]["update_job"]["calls"] == 10
+
+    def test_kernel_error_fails_job(self):
+        finished, metrics = self.run_jobs(failing_kernel, [make_job()])
+        assert finished[0]["status"] == "failed"
+        assert finished[0]["error"] == "bad wall"
+        assert metrics["failed"] == 1
+
+    def test_timeout_fails_job(self):
+        job = make_job()
+        job["wall_data"] = dict(WALL, sleep=0.5)
+        finished, metrics = self.run_jobs(slow_kernel, [job], job_timeout=0.05)
+        assert finished[0]["status"] == "failed"
+        assert "timed out" in finished[0]["error"]
+        assert metrics["timed_out"] == 1
+
+    def test_event_loop_stays_responsive(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=slow_kernel, workers=1, executor="thread")
+            await runner.start()
+            job = make_job()
+            job["wall_data"] = dict(WALL, sleep=0.3)
+            await runner.submit(job)
+
+            # Loop ticks keep arriving while the kernel blocks its worker
+            ticks = 0
+            start = time.monotonic()
+            while time.monotonic() - start < 0.25:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            await self.wait_for_status(store, job["job_id"], ("completed",))
+            await runner.stop()
+            store.close()
+            return ticks
+
+        assert asyncio.run(scenario()) >= 10
+
+    def test_queue_full_rejects(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=slow_kernel, workers=1, queue_depth=2,
+                               executor="thread")
+            await runner.start()
+            accepted = 0
+            with pytest.raises(QueueFullError):
+                for _ in range(10):
+                    await runner.submit(make_job())
+                    accepted += 1
+            metrics = runner.metrics()
+            await runner.stop()
+            store.close()
+            return accepted, metrics
+
+        accepted, metrics = asyncio.run(scenario())
+        # One job may already be on the worker, the rest wait in the queue
+        assert 2 <= accepted <= 3
+        assert metrics["rejected"] == 1
+        assert metrics["queue_capacity"] == 2
+
+    def test_submit_requires_start(self):
+        runner = JobRunner(AsyncJobStore(InMemoryJobStore()), executor="thread")
+        with pytest.raises(RuntimeError):
+            asyncio.run(runner.submit(make_job()))
+
+    def test_process_pool_runs_analysis_kernel(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, workers=1, executor="process")
+            await runner.start()
+            job = make_job()
+            await runner.submit(job)
+            finished = await self.wait_for_status(store, job["job_id"], ("completed", "failed"),
+                                                  timeout=60.0)
+            await runner.stop()
+            store.close()
+            return finished
+
+        finished = asyncio.run(scenario())
+        assert finished["status"] == "completed", finished["error"]
+        assert finished["result"]["panels"]["total_panel_count"] >= 1
+
+
+class TestAnalysisKernel:
+    """Tests for the headless wall analysis kernel."""
+
+    def test_converts_api_payload(self):
+        wall = to_internal_wall_data(WALL, "w1")
+        assert wall["wall_thickness"] == pytest.approx(5.5 / 12.0)
+        opening = wall["openings"][0]
+        assert (opening["u_start"], opening["u_end"]) == (4.0, 7.0)
+        assert (opening["v_start"], opening["v_end"]) == (3.0, 7.0)
+
+    def test_runs_headless(self):
+        result = run_wall_analysis(WALL)
+        assert result["panels"]["total_panel_count"] >= 1
+        faces = {p["face"] for p in result["sheathing"]["sheathing_panels"]}
+        assert faces == {"exterior", "interior"}
@@ -0,0 +1,221 @@
+# File: tests/api/test_streaming.py
+"""Tests for batch submission and the NDJSON / SSE job event streams."""
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+from api.utils.job_runner import JobRunner, QueueFullError
+from api.utils.job_store import AsyncJobStore, InMemoryJobStore, create_job_store
+from api.utils.streaming import (
+    NDJSON_MEDIA_TYPE,
+    SSE_MEDIA_TYPE,
+    encode_event,
+    iter_batch_events,
+    iter_job_progress,
+    stream_media_type,
+)
+
+
+def make_job(wall_data):
+    now = datetime.now()
+    return {
+        "job_id": str(uuid.uuid4()),
+        "status": "pending",
+        "created_at": now,
+        "updated_at": now,
+        "wall_data": wall_data,
+    }
+
+
+def sleepy_kernel(wall_data):
+    time.sleep(wall_data["sleep"])
+    if wall_data.get("fail"):
+        raise ValueError("bad wall")
+    return {"sleep": wall_data["sleep"]}
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+class TestEncoding:
+    """Tests for stream format selection and encoding."""
+
+    def test_media_type(self):
+        assert stream_media_type(None, None) == NDJSON_MEDIA_TYPE
+        assert stream_media_type(None, "text/event-stream") == SSE_MEDIA_TYPE
+        assert stream_media_type("ndjson", "text/event-stream") == NDJSON_MEDIA_TYPE
+        with pytest.raises(ValueError):
+            stream_media_type("xml", None)
+
+    def test_encode(self):
+        event = {"event": "job", "job_id": "a", "status": "completed"}
+        line = encode_event(event, NDJSON_MEDIA_TYPE)
+        assert line.endswith("\n") and json.loads(line) == event
+
+        message = encode_event(event, SSE_MEDIA_TYPE)
+        assert message.startswith("event: job\ndata: ")
+        assert message.endswith("\n\n")
+        assert json.loads(message.split("data: ", 1)[1]) == event
+
+
+class TestBatchEvents:
+    """Tests for iter_batch_events over a running JobRunner."""
+
+    def test_results_stream_in_completion_order(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=sleepy_kernel, workers=3, executor="thread")
+            await runner.start()
+            jobs = [make_job({"sleep": s}) for s in (0.3, 0.0, 0.15)]
+            jobs.append(make_job({"sleep": 0.0, "fail": True}))
+            job_ids = [j["job_id"] for j in jobs]
+
+            subscription = runner.subscribe(job_ids)
+            await runner.submit_many(jobs)
+            events = await collect(iter_batch_events(runner, subscription, "b1", job_ids))
+            subscribed = runner.metrics()["subscribed_jobs"]
+            await runner.stop()
+            store.close()
+            return events, subscribed
+
+        events, subscribed = asyncio.run(scenario())
+        assert events[0]["event"] == "batch"
+        assert len(events[0]["job_ids"]) == 4
+
+        job_events = [e for e in events if e["event"] == "job"]
+        assert len(job_events) == 4
+        # The slowest wall finishes last
+        assert job_events[-1]["index"] == 0
+        assert [e["finished"] for e in job_events] == [1, 2, 3, 4]
+        failed = [e for e in job_events if e["status"] == "failed"]
+        assert failed[0]["index"] == 3 and failed[0]["error"] == "bad wall"
+        assert job_events[-1]["result"] == {"sleep": 0.3}
+
+        assert events[-1] == {"event": "done", "batch_id": "b1", "total": 4,
+                              "completed": 3, "failed": 1}
+        assert subscribed == 0
+
+    def test_heartbeat_while_waiting(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=sleepy_kernel, workers=1, executor="thread")
+            await runner.start()
+            job = make_job({"sleep": 0.2})
+            subscription = runner.subscribe([job["job_id"]])
+            await runner.submit_many([job])
+            events = await collect(iter_batch_events(
+                runner, subscription, "b", [job["job_id"]], heartbeat=0.05
+            ))
+            await runner.stop()
+            store.close()
+            return events
+
+        names = [e["event"] for e in asyncio.run(scenario())]
+        assert "heartbeat" in names
+        assert names[0] == "batch" and names[-2:] == ["job", "done"]
+
+    def test_batch_rejected_as_a_whole(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=sleepy_kernel, workers=1, queue_depth=3,
+                               executor="thread")
+            await runner.start()
+            with pytest.raises(QueueFullError):
+                await runner.submit_many([make_job({"sleep": 0.0}) for _ in range(4)])
+            stored = await store.list_jobs(limit=10)
+            await runner.stop()
+            store.close()
+            return stored, runner.rejected
+
+        stored, rejected = asyncio.run(scenario())
+        assert stored == []
+        assert rejected == 4
+
+
+class TestJobProgress:
+    """Tests for iter_job_progress."""
+
+    def test_follows_job_to_completion(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, kernel=sleepy_kernel, workers=1, executor="thread")
+            await runner.start()
+            job = make_job({"sleep": 0.1})
+            await runner.submit(job)
+            events = await collect(iter_job_progress(runner, store, job["job_id"]))
+            await runner.stop()
+            store.close()
+            return events
+
+        events = asyncio.run(scenario())
+        names = [e["event"] for e in events]
+        assert names[0] == "status"
+        assert names[-2:] == ["job", "done"]
+        assert events[-2]["result"] == {"sleep": 0.1}
+        statuses = [e["status"] for e in events if e["event"] == "status"]
+        assert statuses[-1] == "processing"
+
+    def test_finished_job_and_missing_job(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, executor="thread")
+            job = make_job({})
+            await store.create_job(job)
+            await store.update_job(job["job_id"], {"status": "failed", "error": "boom"})
+            finished = await collect(iter_job_progress(runner, store, job["job_id"]))
+            missing = await collect(iter_job_progress(runner, store, str(uuid.uuid4())))
+            store.close()
+            return finished, missing
+
+        finished, missing = asyncio.run(scenario())
+        assert [e["event"] for e in finished] == ["status", "job", "done"]
+        assert finished[1]["error"] == "boom"
+        assert [e["event"] for e in missing] == ["error"]
+
+    def test_refreshes_from_store_for_other_processes(self):
+        async def scenario():
+            store = AsyncJobStore(InMemoryJobStore())
+            runner = JobRunner(store, executor="thread")
+            job = make_job({})
+            await store.create_job(job)
+
+            async def finish_elsewhere():
+                await asyncio.sleep(0.05)
+                await store.update_job(job["job_id"], {"status": "completed", "result": {"x": 1}})
+
+            task = asyncio.create_task(finish_elsewhere())
+            events = await collect(iter_job_progress(
+                runner, store, job["job_id"], heartbeat=1.0, refresh=0.02
+            ))
+            await task
+            store.close()
+            return events
+
+        events = asyncio.run(scenario())
+        assert events[-2] == {"event": "job", "job_id": events[0]["job_id"],
+                              "status": "completed", "result": {"x": 1}}
+
+
+class TestBatchCreate:
+    """Tests for all-or-nothing create_jobs."""
+
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_duplicate_rolls_back(self, backend):
+        store = create_job_store(backend)
+        existing = make_job({})
+        store.create_job(existing)
+        batch = [make_job({}), existing]
+        assert store.create_jobs(batch) is None
+        assert store.get_job(batch[0]["job_id"]) is None
+
+        fresh = [make_job({"n": i}) for i in range(3)]
+        records = store.create_jobs(fresh)
+        assert [r["job_id"] for r in records] == [j["job_id"] for j in fresh]
+        assert store.get_job(fresh[2]["job_id"])["wall_data"] == {"n": 2}
+        store.close()
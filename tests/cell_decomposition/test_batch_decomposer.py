@@ -0,0 +1,261 @@
+# File: tests/cell_decomposition/test_batch_decomposer.py
+"""
+Unit tests for headless batch cell decomposition.
+
+Tests cover:
+- Cell corner points on the wall's base plane
+- Opening sorting and clipping once per wall
+- Whole-wall decomposition: cell types, order, IDs and coverage
+- Panel-aware slicing with clipped openings and panel cell IDs
+- Batch decomposition of a generated building
+- WallComponent and BuildingComponent.decompose_many
+"""
+
+import json
+
+import pytest
+
+from src.timber_framing_generator.cell_decomposition.batch_decomposer import (
+    decompose_wall,
+    decompose_walls,
+    panels_by_wall,
+    prepare_openings,
+)
+from src.timber_framing_generator.components.walls import WallComponent
+from src.timber_framing_generator.core.component_types import ComponentType
+from src.timber_framing_generator.core.json_schemas import deserialize_cell_data
+
+
+def make_wall(openings=(), length=20.0, height=8.0, wall_id="wall_1"):
+    """Wall along world X at elevation 10, in the Wall Analyzer layout."""
+    return {
+        "wall_id": wall_id,
+        "wall_length": length,
+        "wall_height": height,
+        "base_elevation": 10.0,
+        "base_plane": {
+            "origin": {"x": 1.0, "y": 2.0, "z": 10.0},
+            "x_axis": {"x": 1.0, "y": 0.0, "z": 0.0},
+            "y_axis": {"x": 0.0, "y": 0.0, "z": 1.0},
+            "z_axis": {"x": 0.0, "y": -1.0, "z": 0.0},
+        },
+        "openings": list(openings),
+    }
+
+
+def window(u_start, u_end, v_start=3.0, v_end=7.0, opening_id="w1"):
+    return {"id": opening_id, "opening_type": "window",
+            "u_start": u_start, "u_end": u_end, "v_start": v_start, "v_end": v_end}
+
+
+def door(u_start, u_end, v_end=6.75, opening_id="d1"):
+    return {"id": opening_id, "opening_type": "door",
+            "u_start": u_start, "u_end": u_end, "v_start": 0.0, "v_end": v_end}
+
+
+def cell_types(entry):
+    return [cell["cell_type"] for cell in entry["cells"]]
+
+
+# =============================================================================
+# Test: corner points
+# =============================================================================
+
+class TestCorners:
+    """Test cell corners in world coordinates."""
+
+    def test_corners_follow_base_plane(self):
+        """Corners run bottom-left, bottom-right, top-right, top-left."""
+        wall = make_wall([door(2.0, 4.0, v_end=8.0)])
+        corners = decompose_wall(wall)[0]["cells"][1]["corners"]
+        assert corners["bottom_left"] == {"x": 3.0, "y": 2.0, "z": 10.0}
+        assert corners["bottom_right"] == {"x": 5.0, "y": 2.0, "z": 10.0}
+        assert corners["top_right"] == {"x": 5.0, "y": 2.0, "z": 18.0}
+        assert corners["top_left"] == {"x": 3.0, "y": 2.0, "z": 18.0}
+
+    def test_rotated_wall(self):
+        """Corners follow a wall that is not along world X."""
+        wall = make_wall()
+        wall["base_plane"]["x_axis"] = {"x": 0.6, "y": 0.8, "z": 0.0}
+        wall["base_plane"]["z_axis"] = {"x": 0.8, "y": -0.6, "z": 0.0}
+        corners = decompose_wall(wall)[0]["cells"][0]["corners"]
+        assert corners["top_right"] == pytest.approx({"x": 13.0, "y": 18.0, "z": 18.0})
+
+    def test_missing_plane_uses_base_elevation(self):
+        """Without a base plane the wall runs along world X at its elevation."""
+        wall = make_wall()
+        del wall["base_plane"]
+        corners = decompose_wall(wall)[0]["cells"][0]["corners"]
+        assert corners["top_right"] == {"x": 20.0, "y": 0.0, "z": 18.0}
+
+
+# =============================================================================
+# Test: prepare_openings
+# =============================================================================
+
+class TestPrepareOpenings:
+    """Test per-wall opening preparation."""
+
+    def test_sorted_and_clipped(self):
+        """Openings come back sorted by U and clipped to the wall."""
+        openings = [window(12.0, 25.0, opening_id="b"), window(-2.0, 3.0, opening_id="a")]
+        prepared = prepare_openings(openings, 20.0)
+        assert [o["id"] for o in prepared] == ["a", "b"]
+        assert prepared[0]["u_start"] == 0.0
+        assert prepared[1]["u_end"] == 20.0
+
+    def test_outside_dropped_and_input_untouched(self):
+        """Openings off the wall are dropped; inputs are not modified."""
+        original = window(15.0, 25.0)
+        assert prepare_openings([window(21.0, 23.0), original], 20.0)[0]["u_end"] == 20.0
+        assert original["u_end"] == 25.0
+
+
+# =============================================================================
+# Test: decompose_wall
+# =============================================================================
+
+class TestDecomposeWall:
+    """Test whole-wall and panel-aware decomposition."""
+
+    def test_plain_wall_single_stud_cell(self):
+        """A wall without openings is one stud cell."""
+        entries = decompose_wall(make_wall())
+        assert len(entries) == 1
+        cell = entries[0]["cells"][0]
+        assert cell["id"] == "wall_1_SC_0"
+        assert (cell["u_start"], cell["u_end"], cell["v_start"], cell["v_end"]) == (0, 20.0, 0, 8.0)
+        assert entries[0]["metadata"] == {"wall_length": 20.0, "wall_height": 8.0}
+
+    def test_window_cells(self):
+        """A window gives SC, HCC, OC, SCC then the closing SC."""
+        entry = decompose_wall(make_wall([window(5.0, 8.0)]))[0]
+        assert cell_types(entry) == ["SC", "HCC", "OC", "SCC", "SC"]
+        assert [c["id"] for c in entry["cells"]] == [
+            "wall_1_SC_0", "wall_1_HCC_1", "wall_1_OC_2", "wall_1_SCC_3", "wall_1_SC_4",
+        ]
+        opening_cell = entry["cells"][2]
+        assert opening_cell["opening_id"] == "w1"
+        assert opening_cell["opening_type"] == "window"
+        assert entry["cells"][3]["v_end"] == 3.0
+
+    def test_door_has_no_sill_cripple(self):
+        """Doors start at the floor: no SCC cell."""
+        entry = decompose_wall(make_wall([door(5.0, 8.0)]))[0]
+        assert cell_types(entry) == ["SC", "HCC", "OC", "SC"]
+
+    def test_stud_cells_cover_gaps(self):
+        """Stud cells fill exactly the U ranges between openings."""
+        wall = make_wall([window(12.0, 15.0, opening_id="b"), door(3.0, 6.0, opening_id="a")])
+        cells = decompose_wall(wall)[0]["cells"]
+        studs = [(c["u_start"], c["u_end"]) for c in cells if c["cell_type"] == "SC"]
+        assert studs == [(0, 3.0), (6.0, 12.0), (15.0, 20.0)]
+        openings = [c["opening_id"] for c in cells if c["cell_type"] == "OC"]
+        assert openings == ["a", "b"]
+
+    def test_panels_slice_and_clip(self):
+        """Openings crossing a panel edge are clipped into each panel."""
+        panels = [
+            {"id": "wall_1_panel_0", "u_start": 0.0, "u_end": 10.0},
+            {"id": "wall_1_panel_1", "u_start": 10.0, "u_end": 20.0},
+        ]
+        entries = decompose_wall(make_wall([window(8.0, 12.0)]), panels)
+        assert len(entries) == 2
+
+        first, second = entries
+        assert first["metadata"]["panel_id"] == "wall_1_panel_0"
+        assert cell_types(first) == ["SC", "HCC", "OC", "SCC"]
+        assert first["cells"][2]["u_end"] == 10.0
+        assert first["cells"][0]["id"] == "wall_1_panel_0_SC_0"
+        assert cell_types(second) == ["HCC", "OC", "SCC", "SC"]
+        assert second["cells"][1]["u_start"] == 10.0
+        assert second["cells"][3]["id"] == "wall_1_panel_1_SC_3"
+        assert {c["panel_id"] for c in second["cells"]} == {"wall_1_panel_1"}
+
+    def test_output_matches_cell_data_schema(self):
+        """Entries deserialize as CellData."""
+        entry = decompose_wall(make_wall([window(5.0, 8.0)]))[0]
+        cell_data = deserialize_cell_data(json.dumps(entry))
+        assert cell_data.wall_id == "wall_1"
+        assert cell_data.cells[1].corners.bottom_left.z == 17.0
+        assert cell_data.cells[2].width == 3.0
+
+
+# =============================================================================
+# Test: decompose_walls
+# =============================================================================
+
+class TestDecomposeWalls:
+    """Test batch decomposition."""
+
+    def test_panels_by_wall_first_result_wins(self):
+        """Panel results are indexed by string wall ID."""
+        index = panels_by_wall([
+            {"wall_id": 7, "panels": [{"id": "a"}]},
+            {"wall_id": "7", "panels": [{"id": "b"}]},
+        ])
+        assert index == {"7": [{"id": "a"}]}
+
+    def test_mixed_panel_and_whole_walls(self):
+        """Walls with panels are sliced; others are decomposed whole."""
+        walls = [make_wall(wall_id="a"), make_wall([window(5.0, 8.0)], wall_id="b")]
+        panels = [{"wall_id": "a", "panels": [
+            {"id": "a_panel_0", "u_start": 0.0, "u_end": 12.0},
+            {"id": "a_panel_1", "u_start": 12.0, "u_end": 20.0},
+        ]}]
+        entries = decompose_walls(walls, panels)
+        assert [e["wall_id"] for e in entries] == ["a", "a", "b"]
+        assert entries[1]["cells"][0]["id"] == "a_panel_1_SC_0"
+        assert entries[2]["cells"][0]["id"] == "b_SC_0"
+
+    def test_generated_building(self):
+        """Every panel of a generated building is covered by its cells."""
+        from benchmarks.generators import generate_building
+        from src.timber_framing_generator.panels.panel_config import PanelConfig
+        from src.timber_framing_generator.panels.panel_decomposer import decompose_all_walls
+
+        walls = generate_building(60, opening_density=0.6, seed="cells").walls
+        panel_results = decompose_all_walls(walls, config=PanelConfig())
+        entries = decompose_walls(walls, panel_results)
+
+        assert len(entries) == sum(r["total_panel_count"] for r in panel_results)
+        for entry in entries:
+            meta = entry["metadata"]
+            covered = sum(c["u_end"] - c["u_start"] for c in entry["cells"]
+                          if c["cell_type"] in ("SC", "OC"))
+            assert covered == pytest.approx(meta["panel_u_end"] - meta["panel_u_start"])
+
+
+# =============================================================================
+# Test: WallComponent
+# =============================================================================
+
+class TestWallComponent:
+    """Test the wall BuildingComponent."""
+
+    def test_component_type(self):
+        assert WallComponent().component_type == ComponentType.WALL
+
+    def test_decompose_to_cells(self):
+        """One wall decomposes to a flat cell list."""
+        cells = WallComponent().decompose_to_cells(make_wall([window(5.0, 8.0)]), {})
+        assert [c["cell_type"] for c in cells] == ["SC", "HCC", "OC", "SCC", "SC"]
+
+    def test_decompose_many_matches_per_wall(self):
+        """The batch override returns what per-wall calls return."""
+        component = WallComponent()
+        walls = [make_wall([window(5.0, 8.0)], wall_id=f"w{i}") for i in range(5)]
+        config = {"panels_data": [{"wall_id": "w2", "panels": [
+            {"id": "w2_panel_0", "u_start": 0.0, "u_end": 6.0},
+            {"id": "w2_panel_1", "u_start": 6.0, "u_end": 20.0},
+        ]}]}
+        per_wall = [c for w in walls for c in component.decompose_to_cells(w, config)]
+        assert component.decompose_many(walls, config) == per_wall
+
+    def test_extract_data_needs_wall_json(self):
+        with pytest.raises(TypeError):
+            WallComponent().extract_data(object())
+
+    def test_validate_component_data(self):
+        assert WallComponent().validate_component_data(make_wall())
+        assert not WallComponent().validate_component_data({"wall_id": "x"})
@@ -0,0 +1,76 @@
+# File: tests/clash/test_bvh.py
+"""Unit tests for the bounding-volume hierarchy."""
+
+import random
+
+from src.timber_framing_generator.clash.bvh import BVH
+
+
+def random_boxes(count, seed="bvh", extent=50.0, size=2.0):
+    rng = random.Random(seed)
+    boxes = []
+    for _ in range(count):
+        lo = tuple(rng.uniform(0.0, extent) for _ in range(3))
+        hi = tuple(c + rng.uniform(0.0, size) for c in lo)
+        boxes.append((lo, hi))
+    return boxes
+
+
+def overlaps(a, b):
+    return all(a[0][k] <= b[1][k] and b[0][k] <= a[1][k] for k in range(3))
+
+
+def brute_pairs(boxes):
+    return [
+        (i, j)
+        for i in range(len(boxes))
+        for j in range(i + 1, len(boxes))
+        if overlaps(boxes[i], boxes[j])
+    ]
+
+
+class TestBVH:
+    """Test tree construction and queries."""
+
+    def test_empty(self):
+        tree = BVH([])
+        assert len(tree) == 0
+        assert tree.query((0, 0, 0), (1, 1, 1)) == []
+        assert tree.overlapping_pairs() == []
+
+    def test_pairs_match_brute_force(self):
+        """Self-traversal finds exactly the overlapping pairs."""
+        boxes = random_boxes(600)
+        assert BVH(boxes).overlapping_pairs() == brute_pairs(boxes)
+
+    def test_pairs_with_any_leaf_size(self):
+        boxes = random_boxes(200, seed="leaf", extent=10.0)
+        expected = brute_pairs(boxes)
+        for leaf_size in (1, 2, 8, 500):
+            assert BVH(boxes, leaf_size=leaf_size).overlapping_pairs() == expected
+
+    def test_touching_boxes_overlap(self):
+        """Shared faces count; filtering contacts is the caller's job."""
+        boxes = [((0, 0, 0), (1, 1, 1)), ((1, 0, 0), (2, 1, 1)), ((3, 0, 0), (4, 1, 1))]
+        assert BVH(boxes).overlapping_pairs() == [(0, 1)]
+
+    def test_coincident_centers(self):
+        """Items that cannot be split still pair up."""
+        boxes = [((0, 0, 0), (1, 1, 1))] * 10
+        tree = BVH(boxes, leaf_size=2)
+        assert len(tree.overlapping_pairs()) == 45
+
+    def test_query_matches_brute_force(self):
+        boxes = random_boxes(500, seed="query")
+        tree = BVH(boxes)
+        rng = random.Random("probe")
+        for _ in range(50):
+            lo = tuple(rng.uniform(0.0, 50.0) for _ in range(3))
+            hi = tuple(c + rng.uniform(0.0, 8.0) for c in lo)
+            expected = [i for i, box in enumerate(boxes) if overlaps(box, (lo, hi))]
+            assert sorted(tree.query(lo, hi)) == expected
+
+    def test_tree_is_balanced(self):
+        """Median splits keep the node count linear."""
+        tree = BVH(random_boxes(1024), leaf_size=4)
+        assert tree.node_count < 2 * 1024 / 4 * 2
@@ -0,0 +1,374 @@
+# File: tests/clash/test_clash_detection.py
+"""
+Unit tests for framing and MEP clash detection.
+
+Tests cover:
+- Member boxes follow the geometry_batch orientation convention
+- Member/member clashes, contacts within tolerance, rotated walls
+- Route/member clashes and stud penetrations
+- Route/route clashes and same-system tie-ins
+- Placing 2D route segments with domain frames
+- Agreement with an all-pairs brute force on random input
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from src.timber_framing_generator.clash import (
+    ClashDetector,
+    ClashType,
+    DomainFrame,
+    detect_clashes,
+    member_box,
+    wall_domain_frames,
+)
+from src.timber_framing_generator.clash.clash_detection import (
+    box_box_overlap,
+    segment_box_distance,
+    segment_segment_closest,
+)
+from src.timber_framing_generator.core.json_schemas import (
+    FramingElementData,
+    FramingResults,
+    Point3D,
+    ProfileData,
+    Vector3D,
+)
+from src.timber_framing_generator.mep.routing.route_segment import Route, RouteSegment
+from src.timber_framing_generator.utils.geometry_batch import compute_box_bounds
+
+W = 1.5 / 12.0   # 2x4 width
+D = 3.5 / 12.0   # 2x4 depth
+
+
+def member(eid, element_type, start, end, width=W, depth=D, **metadata):
+    """Framing element dictionary in world coordinates."""
+    return {
+        "id": eid,
+        "element_type": element_type,
+        "profile": {"name": "2x4", "width": width, "depth": depth},
+        "centerline_start": {"x": start[0], "y": start[1], "z": start[2]},
+        "centerline_end": {"x": end[0], "y": end[1], "z": end[2]},
+        "metadata": metadata,
+    }
+
+
+def route(route_id, system_type, points, diameter=None):
+    """Route dictionary with 3D segments between consecutive points."""
+    data = {
+        "id": route_id,
+        "system_type": system_type,
+        "segments": [
+            {"start": list(p), "end": list(q)} for p, q in zip(points, points[1:])
+        ],
+        "metadata": {},
+    }
+    if diameter is not None:
+        data["metadata"]["diameter"] = diameter
+    return data
+
+
+# Bottom plate along X, a stud bearing on it, top plate at 8 ft
+def small_wall():
+    return [
+        member("bp", "bottom_plate", (0, 0, W / 2), (4, 0, W / 2)),
+        member("tp", "top_plate", (0, 0, 8 - W / 2), (4, 0, 8 - W / 2)),
+        member("s0", "stud", (W / 2, 0, W), (W / 2, 0, 8 - W)),
+        member("s1", "stud", (16 / 12, 0, W), (16 / 12, 0, 8 - W)),
+        member("hdr", "header", (2, 0, 6), (3.5, 0, 6), depth=D, width=9.25 / 12),
+    ]
+
+
+# =============================================================================
+# Test: volumes
+# =============================================================================
+
+class TestMemberBox:
+    """Test oriented boxes of framing members."""
+
+    @pytest.mark.parametrize("start,end,x_axis,z_axis", [
+        ((1, 2, 0), (1, 2, 8), None, None),
+        ((0, 0, 1), (5, 0, 1), None, None),
+        ((0, 0, 1), (3, 4, 1), None, None),
+        ((1, 1, 0), (1, 1, 8), (0.6, 0.8, 0), (0.8, -0.6, 0)),
+    ])
+    def test_bounds_match_geometry_batch(self, start, end, x_axis, z_axis):
+        """Boxes cover the same space as the Brep geometry."""
+        box = member_box(start, end, W, D, x_axis, z_axis)
+        length = math.dist(start, end)
+        direction = tuple((e - s) / length for s, e in zip(start, end))
+        expected = compute_box_bounds(start, direction, length, W, D, x_axis, z_axis)
+        for got, want in zip(box.bounds(), expected):
+            assert got == pytest.approx(want, abs=1e-9)
+
+    def test_degenerate_centerline(self):
+        assert member_box((0, 0, 0), (0, 0, 0), W, D) is None
+
+    def test_overlap_depth(self):
+        a = member_box((0, 0, 0), (0, 0, 8), W, D)
+        b = member_box((W - 0.01, 0, 0), (W - 0.01, 0, 8), W, D)
+        assert box_box_overlap(a, b) == pytest.approx(0.01)
+
+    def test_rotated_boxes_separated(self):
+        """Boxes whose axis-aligned bounds overlap can still be apart."""
+        axis = (math.sqrt(0.5), math.sqrt(0.5), 0.0)
+        normal = (axis[1], -axis[0], 0.0)
+        a = member_box((0, 0, 0), (0, 0, 8), W, D, axis, normal)
+        gap = W + 0.02
+        b = member_box((axis[0] * gap, axis[1] * gap, 0), (axis[0] * gap, axis[1] * gap, 8),
+                       W, D, axis, normal)
+        assert box_box_overlap(a, b) < 0
+
+
+class TestSegmentDistances:
+    """Test the exact capsule tests."""
+
+    def test_segment_through_box(self):
+        box = member_box((0, 0, 0), (0, 0, 8), W, D)
+        distance, t = segment_box_distance((-1, 0, 4), (1, 0, 4), box)
+        assert distance == pytest.approx(0.0, abs=1e-6)
+        assert 0.4 < t < 0.6
+
+    def test_segment_beside_box(self):
+        box = member_box((0, 0, 0), (0, 0, 8), W, D)
+        distance, _ = segment_box_distance((-1, 1, 4), (1, 1, 4), box)
+        assert distance == pytest.approx(1 - D / 2, abs=1e-6)
+
+    def test_segment_segment(self):
+        distance, s, t = segment_segment_closest((0, 0, 0), (2, 0, 0), (1, -1, 1), (1, 1, 1))
+        assert distance == pytest.approx(1.0)
+        assert (s, t) == (pytest.approx(0.5), pytest.approx(0.5))
+
+    def test_parallel_segments(self):
+        distance, _, _ = segment_segment_closest((0, 0, 0), (2, 0, 0), (1, 0.5, 0), (3, 0.5, 0))
+        assert distance == pytest.approx(0.5)
+
+
+# =============================================================================
+# Test: member clashes
+# =============================================================================
+
+class TestMemberClashes:
+    """Test member/member clashes."""
+
+    def test_bearing_members_do_not_clash(self):
+        """Studs sitting on plates are contacts, not clashes."""
+        report = detect_clashes(small_wall())
+        assert report.member_count == 5
+        assert report.clashes == []
+        assert report.candidate_pairs > 0
+
+    def test_overlapping_members_clash(self):
+        members = small_wall() + [member("s2", "stud", (16 / 12 + 0.05, 0, W), (16 / 12 + 0.05, 0, 8 - W))]
+        report = detect_clashes(members)
+        assert len(report.clashes) == 1
+        clash = report.clashes[0]
+        assert clash.clash_type == ClashType.MEMBER_MEMBER
+        assert {clash.first.id, clash.second.id} == {"s1", "s2"}
+        assert clash.depth == pytest.approx(W - 0.05)
+        assert clash.location[2] == pytest.approx(4.0)
+
+    def test_tolerance(self):
+        members = [
+            member("a", "stud", (0, 0, 0), (0, 0, 8)),
+            member("b", "stud", (W - 0.001, 0, 0), (W - 0.001, 0, 8)),
+        ]
+        assert detect_clashes(members).clashes == []
+        assert len(detect_clashes(members, tolerance=0.0).clashes) == 1
+
+    def test_framing_results_objects(self):
+        """FramingElementData with wall axes from FramingResults."""
+        def element(eid, u):
+            return FramingElementData(
+                id=eid, element_type="stud",
+                profile=ProfileData("2x4", W, D, "timber"),
+                centerline_start=Point3D(u * 0.6, u * 0.8, 0.0),
+                centerline_end=Point3D(u * 0.6, u * 0.8, 8.0),
+                u_coord=u, v_start=0.0, v_end=8.0,
+            )
+
+        results = FramingResults(
+            wall_id="w1", material_system="timber",
+            elements=[element("a", 0.0), element("b", W + 0.01), element("c", W + 0.05)],
+            wall_x_axis=Vector3D(0.6, 0.8, 0.0), wall_z_axis=Vector3D(0.8, -0.6, 0.0),
+        )
+        detector = ClashDetector()
+        assert detector.add_framing_results(results) == 3
+        report = detector.detect()
+        assert [(c.first.id, c.second.id) for c in report.clashes] == [("b", "c")]
+        assert report.clashes[0].first.wall_id == "w1"
+
+
+# =============================================================================
+# Test: route clashes
+# =============================================================================
+
+class TestRouteClashes:
+    """Test route/member and route/route clashes."""
+
+    def test_stud_crossing_is_penetration(self):
+        report = detect_clashes(small_wall(), [route("r1", "supply", [(-1, 0, 4), (3, 0, 4)])])
+        types = {(c.clash_type, c.first.id) for c in report.clashes}
+        assert types == {(ClashType.PENETRATION, "s0"), (ClashType.PENETRATION, "s1")}
+        assert report.hard_clashes == []
+        assert report.clashes[0].second.kind == "route"
+        assert report.clashes[0].second.segment_index == 0
+
+    def test_plate_and_header_are_hard_clashes(self):
+        routes = [
+            route("r1", "supply", [(3, 0, 7), (3, 0, 9)]),
+            route("r2", "power", [(2.5, -1, 6), (2.5, 1, 6)]),
+        ]
+        report = detect_clashes(small_wall(), routes)
+        hard = {(c.clash_type, c.first.id, c.second.id) for c in report.hard_clashes}
+        assert hard == {
+            (ClashType.ROUTE_MEMBER, "tp", "r1"),
+            (ClashType.ROUTE_MEMBER, "hdr", "r2"),
+        }
+
+    def test_route_along_stud_is_clash(self):
+        report = detect_clashes(small_wall(), [route("r1", "supply", [(W / 2, 0, 2), (W / 2, 0, 5)])])
+        assert [c.clash_type for c in report.clashes] == [ClashType.ROUTE_MEMBER]
+
+    def test_clear_route(self):
+        report = detect_clashes(small_wall(), [route("r1", "supply", [(-1, 1, 4), (3, 1, 4)])])
+        assert report.clashes == []
+
+    def test_diameter_sources(self):
+        """Route metadata beats the per-system table, which beats the default."""
+        near = [(-1, D / 2 + 0.03, 4), (1, D / 2 + 0.03, 4)]
+        members = [member("s", "stud", (0, 0, 0), (0, 0, 8))]
+        assert detect_clashes(members, [route("r", "drain", near)]).clashes != []
+        assert detect_clashes(members, [route("r", "drain", near)],
+                              route_diameters={"drain": 0.05}).clashes == []
+        assert detect_clashes(members, [route("r", "drain", near, diameter=0.05)],
+                              route_diameters={"drain": 0.3}).clashes == []
+
+    def test_route_route(self):
+        routes = [
+            route("a", "supply", [(0, 0, 4), (4, 0, 4)]),
+            route("b", "power", [(2, -1, 4), (2, 1, 4)]),
+        ]
+        report = detect_clashes([], routes)
+        assert [(c.clash_type, c.first.id, c.second.id) for c in report.clashes] == [
+            (ClashType.ROUTE_ROUTE, "a", "b")
+        ]
+        assert report.clashes[0].location == pytest.approx((2, 0, 4))
+
+    def test_same_route_segments_do_not_clash(self):
+        report = detect_clashes([], [route("a", "supply", [(0, 0, 4), (4, 0, 4), (4, 4, 4)])])
+        assert report.clashes == []
+        assert report.segment_count == 2
+
+    def test_same_system_tie_in(self):
+        """A branch ending on a main of its system is a connection."""
+        routes = [
+            route("main", "sanitary", [(0, 0, 1), (10, 0, 1)]),
+            route("branch", "sanitary", [(5, 3, 1), (5, 0, 1)]),
+            route("other", "supply", [(5, 3, 1), (5, 0, 1)]),
+        ]
+        report = detect_clashes([], routes)
+        pairs = {(c.first.id, c.second.id) for c in report.clashes}
+        assert ("main", "branch") not in pairs
+        assert ("main", "other") in pairs
+
+    def test_types_filter(self):
+        routes = [route("r1", "supply", [(-1, 0, 4), (3, 0, 4)])]
+        report = detect_clashes(small_wall(), routes, types=[ClashType.ROUTE_MEMBER])
+        assert report.clashes == []
+
+
+# =============================================================================
+# Test: domain placement
+# =============================================================================
+
+class TestDomainFrames:
+    """Test placing 2D route segments."""
+
+    WALL = {
+        "wall_id": "w1",
+        "base_plane": {
+            "origin": {"x": 10.0, "y": 5.0, "z": 9.0},
+            "x_axis": {"x": 0.0, "y": 1.0, "z": 0.0},
+            "y_axis": {"x": 0.0, "y": 0.0, "z": 1.0},
+            "z_axis": {"x": 1.0, "y": 0.0, "z": 0.0},
+        },
+    }
+
+    def test_wall_frame(self):
+        frame = wall_domain_frames([self.WALL])["w1"]
+        assert frame.to_world((2.0, 3.0)) == (10.0, 7.0, 12.0)
+
+    def test_route_objects_placed_by_domain(self):
+        """RouteSegments in wall (u, v) land on the wall in world space."""
+        stud = member("s", "stud", (10, 6, 9), (10, 6, 17))
+        segment = RouteSegment(start=(0.0, 4.0), end=(3.0, 4.0), domain_id="w1")
+        lost = RouteSegment(start=(0.0, 1.0), end=(0.0, 2.0), domain_id="unknown")
+        routes = [Route(id="r", system_type="supply", segments=[segment, lost])]
+
+        report = detect_clashes([stud], routes, frames=wall_domain_frames([self.WALL]))
+        assert report.segment_count == 1
+        assert report.unplaced_segments == 1
+        assert [c.clash_type for c in report.clashes] == [ClashType.PENETRATION]
+        x, y, z = report.clashes[0].location
+        assert (x, z) == (pytest.approx(10), pytest.approx(13))
+        assert abs(y - 6) <= D / 2 + 1e-6
+
+    def test_floor_frame_default_axes(self):
+        assert DomainFrame(origin=(0, 0, 9)).to_world((1, 2)) == (1, 2, 9)
+
+
+# =============================================================================
+# Test: scale and correctness against brute force
+# =============================================================================
+
+def random_model(count, seed):
+    rng = random.Random(seed)
+    members = []
+    for i in range(count):
+        x, y = rng.uniform(0, 30), rng.uniform(0, 30)
+        if rng.random() < 0.6:
+            members.append(member(f"m{i}", "stud", (x, y, 0), (x, y, 8)))
+        else:
+            angle = rng.uniform(0, math.pi)
+            length = rng.uniform(1, 6)
+            z = rng.uniform(0, 8)
+            members.append(member(f"m{i}", "top_plate", (x, y, z),
+                                  (x + math.cos(angle) * length, y + math.sin(angle) * length, z)))
+    routes = []
+    for i in range(count // 10):
+        points = [(rng.uniform(0, 30), rng.uniform(0, 30), rng.uniform(0, 8))]
+        for _ in range(3):
+            p = list(points[-1])
+            p[rng.randrange(3)] += rng.uniform(-4, 4)
+            points.append(tuple(p))
+        routes.append(route(f"r{i}", rng.choice(["supply", "power"]), points))
+    return members, routes
+
+
+def test_matches_brute_force():
+    """The hierarchy misses no clash an all-pairs test would find."""
+    members, routes = random_model(400, "brute")
+    detector = ClashDetector()
+    detector.add_members(members)
+    detector.add_routes(routes)
+    report = detector.detect()
+
+    expected = []
+    for i in range(len(detector._volumes)):
+        for j in range(i + 1, len(detector._volumes)):
+            clash = detector._test(i, j, set(ClashType))
+            if clash is not None:
+                expected.append(clash)
+    assert report.clashes == expected
+    assert report.candidate_pairs < len(detector._volumes) ** 2 / 20
+
+
+def test_report_serializes():
+    members, routes = random_model(100, "json")
+    report = detect_clashes(members, routes)
+    data = json.loads(json.dumps(report.to_dict()))
+    assert sum(data["counts"].values()) == len(data["clashes"])
@@ -0,0 +1,204 @@
+# File: tests/clients/test_timber_api_client.py
+"""
+Tests for the Python API clients against a local FastAPI server.
+
+The async client runs against the app in-process (httpx.ASGITransport);
+the sync client against the same app served by uvicorn on a free port.
+Both use an in-memory job store and thread workers.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+
+requests = pytest.importorskip("requests")
+httpx = pytest.importorskip("httpx")
+fastapi = pytest.importorskip("fastapi")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "clients", "python"))
+
+from timber_api_client import (  # noqa: E402
+    AsyncTimberFramingClient,
+    TimberFramingClient,
+    _parse_event_line,
+    backoff_delays,
+)
+from api.endpoints.walls import router as walls_router  # noqa: E402
+from api.utils.job_runner import JobRunner  # noqa: E402
+from api.utils.job_store import AsyncJobStore, InMemoryJobStore  # noqa: E402
+
+API_KEY = "dev_key"
+
+
+def make_wall(length=10.0):
+    return {
+        "wall_type": "2x4 EXT",
+        "wall_base_elevation": 0.0,
+        "wall_top_elevation": 8.0,
+        "wall_length": length,
+        "wall_height": 8.0,
+        "is_exterior_wall": True,
+        "openings": [{
+            "opening_type": "window",
+            "start_u_coordinate": 3.0,
+            "rough_width": 2.0,
+            "rough_height": 3.0,
+            "base_elevation_relative_to_wall_base": 3.0,
+        }],
+    }
+
+
+def make_runner():
+    return JobRunner(AsyncJobStore(InMemoryJobStore()), workers=2, executor="thread")
+
+
+def make_app():
+    @asynccontextmanager
+    async def lifespan(app):
+        runner = make_runner()
+        app.state.job_runner = runner
+        await runner.start()
+        yield
+        await runner.stop()
+
+    app = fastapi.FastAPI(lifespan=lifespan)
+    app.include_router(walls_router, prefix="/walls")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+class TestHelpers:
+    """Tests for backoff and stream decoding."""
+
+    def test_backoff_grows_to_cap(self):
+        delays = backoff_delays(0.1, 1.0, jitter=0.0)
+        assert [next(delays) for _ in range(6)] == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+    def test_parse_event_lines(self):
+        assert _parse_event_line('{"event":"done"}', False) == {"event": "done"}
+        assert _parse_event_line("event: done", True) is None
+        assert _parse_event_line('data: {"event":"done"}', True) == {"event": "done"}
+        assert _parse_event_line("", False) is None
+
+
+class TestAsyncClient:
+    """AsyncTimberFramingClient against the in-process app."""
+
+    def run(self, scenario):
+        async def main():
+            app = make_app()
+            runner = make_runner()
+            app.state.job_runner = runner
+            await runner.start()
+            client = AsyncTimberFramingClient(
+                "http://testserver", API_KEY, transport=httpx.ASGITransport(app=app)
+            )
+            try:
+                return await scenario(client)
+            finally:
+                await client.aclose()
+                await runner.stop()
+
+        return asyncio.run(main())
+
+    def test_analyze_walls_concurrently(self):
+        finished = []
+
+        async def scenario(client):
+            return await client.analyze_walls(
+                [make_wall(10.0 + i) for i in range(6)], max_in_flight=3,
+                on_result=lambda i, job: finished.append(i), timeout=30
+            )
+
+        results = self.run(scenario)
+        assert [r["status"] for r in results] == ["completed"] * 6
+        assert [r["wall_data"]["wall_length"] for r in results] == [10.0 + i for i in range(6)]
+        assert sorted(finished) == list(range(6))
+
+    def test_batch_stream(self):
+        async def scenario(client):
+            return await client.analyze_walls_batch([make_wall(12.0), make_wall(14.0)])
+
+        results = self.run(scenario)
+        assert [r["index"] for r in results] == [0, 1]
+        assert all(r["status"] == "completed" for r in results)
+        assert results[1]["result"]["wall"]["wall_length"] == 14.0
+
+    def test_invalid_key_rejected(self):
+        async def scenario(client):
+            client.client.headers["X-API-Key"] = "wrong"
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_analysis_result("00000000-0000-0000-0000-000000000000")
+
+        self.run(scenario)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def live_server():
+    uvicorn = pytest.importorskip("uvicorn")
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(make_app(), host="127.0.0.1", port=port,
+                                           log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(timeout=10)
+
+
+class TestSyncClient:
+    """TimberFramingClient against the app served by uvicorn."""
+
+    def test_analyze_wall_uses_one_pooled_session(self, live_server):
+        with TimberFramingClient(live_server, API_KEY) as client:
+            assert client.check_connection() == (True, "Connection successful")
+            first = client.analyze_wall(make_wall())
+            second = client.analyze_wall(make_wall(11.0))
+            # Checked before close() empties the pool manager
+            assert len(client.session.get_adapter(live_server).poolmanager.pools) == 1
+        assert first["status"] == "completed"
+        assert second["result"]["wall"]["wall_length"] == 11.0
+
+    def test_batch_and_list(self, live_server):
+        with TimberFramingClient(live_server, API_KEY) as client:
+            results = client.analyze_walls_batch([make_wall(9.0), make_wall(10.0), make_wall(11.0)])
+            jobs = client.list_jobs(limit=50)
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert {r["job_id"] for r in results} <= {j["job_id"] for j in jobs}
+
+    def test_progress_stream_ends_with_result(self, live_server):
+        with TimberFramingClient(live_server, API_KEY) as client:
+            job = client.analyze_wall(make_wall(), polling=False)
+            events = list(client.stream_job_events(job["job_id"]))
+        assert events[0]["event"] == "status"
+        assert [e["event"] for e in events[-2:]] == ["job", "done"]
+
+    def test_job_etag_and_gzip(self, live_server):
+        with TimberFramingClient(live_server, API_KEY) as client:
+            job = client.analyze_wall(make_wall())
+            url = f"{live_server}/walls/job/{job['job_id']}"
+            first = client.session.get(url, headers={"Accept-Encoding": "gzip"})
+            again = client.session.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert first.headers["Cache-Control"].startswith("private")
+        assert first.json() == job
+        assert again.status_code == 304 and again.content == b""
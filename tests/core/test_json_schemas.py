@@ -0,0 +1,136 @@
+# File: tests/core/test_json_schemas.py
+"""Tests for WallData/CellData validation."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+from src.timber_framing_generator.core.json_schemas import (
+    CellCorners,
+    CellData,
+    CellInfo,
+    PlaneData,
+    Point3D,
+    Vector3D,
+    WallData,
+    compile_validator,
+    validate_cell_data,
+    validate_cell_data_batch,
+    validate_wall_data,
+    validate_wall_data_batch,
+)
+
+
+def make_wall(wall_id="w1", length=10.0, height=8.0):
+    return WallData(
+        wall_id=wall_id,
+        wall_length=length,
+        wall_height=height,
+        wall_thickness=0.5,
+        base_elevation=0.0,
+        top_elevation=height,
+        base_plane=PlaneData(
+            origin=Point3D(0, 0, 0),
+            x_axis=Vector3D(1, 0, 0),
+            y_axis=Vector3D(0, 0, 1),
+            z_axis=Vector3D(0, -1, 0),
+        ),
+        base_curve_start=Point3D(0, 0, 0),
+        base_curve_end=Point3D(length, 0, 0),
+    )
+
+
+def make_cells(count=3):
+    corner = Point3D(0, 0, 0)
+    cells = [
+        CellInfo(id=f"c{i}", cell_type="SC", u_start=i, u_end=i + 1, v_start=0, v_end=8,
+                 corners=CellCorners(corner, corner, corner, corner))
+        for i in range(count)
+    ]
+    return CellData(wall_id="w1", cells=cells)
+
+
+class TestValidateWallData:
+    """Test cases for validate_wall_data."""
+
+    def test_all_representations_valid(self):
+        """Dataclass, dict and JSON string agree."""
+        wall = make_wall()
+        assert validate_wall_data(wall) == (True, [])
+        assert validate_wall_data(asdict(wall)) == (True, [])
+        assert validate_wall_data(json.dumps(asdict(wall))) == (True, [])
+
+    def test_missing_and_non_positive_fields(self):
+        data = asdict(make_wall(length=0))
+        del data["wall_id"]
+        del data["base_plane"]["origin"]
+        valid, errors = validate_wall_data(data)
+        assert not valid
+        assert errors == [
+            "Missing required field: wall_id",
+            "wall_length must be positive",
+            "base_plane missing origin",
+        ]
+
+    def test_invalid_json(self):
+        valid, errors = validate_wall_data("{not json")
+        assert not valid
+        assert errors[0].startswith("Invalid JSON")
+
+    def test_trusted_skips_checks(self):
+        assert validate_wall_data("{not json", trusted=True) == (True, [])
+
+
+class TestValidateCellData:
+    """Test cases for validate_cell_data."""
+
+    def test_all_representations_valid(self):
+        cell_data = make_cells()
+        assert validate_cell_data(cell_data) == (True, [])
+        assert validate_cell_data(json.dumps(asdict(cell_data))) == (True, [])
+
+    def test_incomplete_cells(self):
+        data = asdict(make_cells(2))
+        del data["cells"][1]["cell_type"]
+        del data["cells"][1]["v_end"]
+        assert validate_cell_data(data) == (
+            False, ["Cell 1 missing cell_type", "Cell 1 missing V coordinates"],
+        )
+
+
+class TestBatchValidation:
+    """Test cases for bulk validation."""
+
+    def test_reports_failures_by_index(self):
+        walls = [make_wall("a"), asdict(make_wall("b", height=-1)), make_wall("c")]
+        valid, failures = validate_wall_data_batch(walls)
+        assert not valid
+        assert failures == {1: ["wall_height must be positive"]}
+
+    def test_json_array(self):
+        text = json.dumps([asdict(make_wall("a")), asdict(make_wall("b"))])
+        assert validate_wall_data_batch(text) == (True, {})
+
+    def test_json_must_be_array(self):
+        valid, failures = validate_wall_data_batch(json.dumps(asdict(make_wall())))
+        assert not valid
+        assert failures == {-1: ["Expected a JSON array"]}
+
+    def test_cell_batch_and_trusted(self):
+        bad = {"wall_id": "w2"}
+        assert validate_cell_data_batch([make_cells(), bad]) == (
+            False, {1: ["Missing required field: cells"]},
+        )
+        assert validate_cell_data_batch([bad], trusted=True) == (True, {})
+
+
+class TestCompileValidator:
+    """Test cases for compile_validator."""
+
+    def test_compiled_once_per_schema(self):
+        assert compile_validator(WallData) is compile_validator(WallData)
+        assert compile_validator(WallData) is not compile_validator(CellData)
+
+    def test_unknown_schema(self):
+        with pytest.raises(KeyError):
+            compile_validator(Point3D)
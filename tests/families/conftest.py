@@ -0,0 +1,103 @@
+# File: tests/families/conftest.py
+"""Shared fixtures for family resolver tests."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FamilyServer:
+    """Local HTTP server standing in for GitHub raw file hosting.
+
+    Serves ``files`` (URL path -> bytes) with keep-alive HTTP/1.1 and
+    records requests, connections and peak concurrent requests. Paths
+    with an ETag or Last-Modified value answer matching conditional
+    requests with 304.
+
+    Attributes:
+        files: URL path (e.g. "/families/a.rfa") -> body
+        etags: URL path -> ETag header value
+        last_modified: URL path -> Last-Modified header value
+        statuses: Response status codes in order
+        delay: Seconds each response is held, to force overlap
+        requests: Requested paths in arrival order
+        connections: TCP connections accepted
+        max_in_flight: Most requests being served at once
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.etags = {}
+        self.last_modified = {}
+        self.statuses = []
+        self.delay = 0.0
+        self.requests = []
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append(self.path)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    if server.delay:
+                        time.sleep(server.delay)
+                    body = server.files.get(self.path)
+                    etag = server.etags.get(self.path)
+                    modified = server.last_modified.get(self.path)
+                    if body is None:
+                        status, body = 404, b"not found"
+                    elif (etag and self.headers.get("If-None-Match") == etag) or (
+                            modified and self.headers.get("If-Modified-Since") == modified):
+                        status, body = 304, b""
+                    else:
+                        status = 200
+                    with server._lock:
+                        server.statuses.append(status)
+                    self.send_response(status)
+                    if etag:
+                        self.send_header("ETag", etag)
+                    if modified:
+                        self.send_header("Last-Modified", modified)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}/families"
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def family_server():
+    """A running FamilyServer, shut down after the test."""
+    server = FamilyServer()
+    yield server
+    server.close()
@@ -225,3 +225,150 @@ class TestCachePersistence:
         os.remove(cached_path)
 
         assert not cache.is_cached("TFG_Stud_2x4")
+
+
+# =============================================================================
+# Test: Manifest Writes
+# =============================================================================
+
+def make_rfa(tmp_path, name: str, size: int) -> str:
+    """Write an .rfa of ``size`` bytes and return its path."""
+    path = tmp_path / f"{name}.rfa"
+    path.write_bytes(name.encode("utf-8").ljust(size, b"x"))
+    return str(path)
+
+
+class TestCacheTransactions:
+    """Test batched, atomic cache manifest writes."""
+
+    def test_store_outside_transaction_writes_immediately(self, cache, sample_rfa):
+        """A lone store is persisted at once."""
+        cache.store("F1", sample_rfa, "f1.rfa")
+        assert cache.manifest_writes == 1
+        assert "F1" in FamilyCache(cache_dir=cache.cache_dir).list_cached()
+
+    def test_transaction_writes_once(self, cache, tmp_path):
+        """Many changes in a transaction cost one manifest write."""
+        with cache.transaction():
+            for i in range(20):
+                cache.store(f"F{i}", make_rfa(tmp_path, f"F{i}", 10), f"F{i}.rfa")
+            cache.remove("F0")
+            assert cache.manifest_writes == 0
+            # Not visible on disk until the transaction ends
+            assert FamilyCache(cache_dir=cache.cache_dir).list_cached() == []
+
+        assert cache.manifest_writes == 1
+        assert len(FamilyCache(cache_dir=cache.cache_dir).list_cached()) == 19
+
+    def test_nested_transactions_write_at_outermost_exit(self, cache, sample_rfa):
+        """Inner blocks do not write."""
+        with cache.transaction():
+            with cache.transaction():
+                cache.store("F1", sample_rfa, "f1.rfa")
+            assert cache.manifest_writes == 0
+        assert cache.manifest_writes == 1
+
+    def test_transaction_writes_on_exception(self, cache, sample_rfa):
+        """Files already stored are recorded even if the block raises."""
+        with pytest.raises(RuntimeError):
+            with cache.transaction():
+                cache.store("F1", sample_rfa, "f1.rfa")
+                raise RuntimeError("boom")
+        assert "F1" in FamilyCache(cache_dir=cache.cache_dir).list_cached()
+
+    def test_lookups_do_not_write(self, cache, sample_rfa):
+        """Cache hits only update use times in memory."""
+        cache.store("F1", sample_rfa, "f1.rfa")
+        for _ in range(5):
+            assert cache.is_cached("F1")
+            assert cache.get_cached_path("F1")
+        assert cache.manifest_writes == 1
+
+    def test_write_is_atomic(self, cache, sample_rfa, monkeypatch):
+        """A failed write leaves the previous manifest and no temp file."""
+        cache.store("F1", sample_rfa, "f1.rfa")
+
+        def failing_dump(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(json, "dump", failing_dump)
+        cache.store("F2", sample_rfa, "f2.rfa")
+        monkeypatch.undo()
+
+        assert FamilyCache(cache_dir=cache.cache_dir).list_cached() == ["F1"]
+        assert [n for n in os.listdir(cache.cache_dir) if n.endswith(".tmp")] == []
+        # The change is still pending and written by the next flush
+        cache.flush()
+        assert FamilyCache(cache_dir=cache.cache_dir).list_cached() == ["F1", "F2"]
+
+
+# =============================================================================
+# Test: LRU Eviction
+# =============================================================================
+
+class TestCacheEviction:
+    """Test size-capped least recently used eviction."""
+
+    def test_unbounded_by_default(self, cache, tmp_path):
+        """Without a cap nothing is evicted."""
+        for i in range(5):
+            cache.store(f"F{i}", make_rfa(tmp_path, f"F{i}", 100), f"F{i}.rfa")
+        assert len(cache.list_cached()) == 5
+        assert cache.total_size() == 500
+
+    def test_store_evicts_least_recently_used(self, cache_dir, tmp_path):
+        """Stores past the cap evict the oldest unused families."""
+        cache = FamilyCache(cache_dir=cache_dir, max_size_bytes=300)
+        for i in range(3):
+            cache.store(f"F{i}", make_rfa(tmp_path, f"F{i}", 100), f"F{i}.rfa")
+        cache.get_cached_path("F0")  # F0 is now more recent than F1
+
+        cache.store("F3", make_rfa(tmp_path, "F3", 100), "F3.rfa")
+
+        assert cache.list_cached() == ["F0", "F2", "F3"]
+        assert not os.path.exists(os.path.join(cache_dir, "F1.rfa"))
+        assert cache.total_size() <= 300
+
+    def test_transaction_keeps_families_it_uses(self, cache_dir, tmp_path):
+        """Families used in a transaction are not evicted by it."""
+        cache = FamilyCache(cache_dir=cache_dir, max_size_bytes=200)
+        cache.store("Old", make_rfa(tmp_path, "Old", 100), "Old.rfa")
+        with cache.transaction():
+            for i in range(3):
+                cache.store(f"F{i}", make_rfa(tmp_path, f"F{i}", 100), f"F{i}.rfa")
+            assert sorted(cache.list_cached()) == ["F0", "F1", "F2"]
+
+        # Over the cap until the next store or evict()
+        assert cache.evict() == ["F0"]
+        assert cache.total_size() == 200
+
+    def test_evict_with_explicit_cap(self, cache, tmp_path):
+        """evict(max_bytes) works without a configured cap."""
+        for i in range(4):
+            cache.store(f"F{i}", make_rfa(tmp_path, f"F{i}", 100), f"F{i}.rfa")
+        assert cache.evict(150) == ["F0", "F1", "F2"]
+        assert cache.list_cached() == ["F3"]
+        assert FamilyCache(cache_dir=cache.cache_dir).list_cached() == ["F3"]
+
+    def test_use_times_persist(self, cache_dir, tmp_path):
+        """LRU order survives re-initialization."""
+        cache = FamilyCache(cache_dir=cache_dir)
+        for i in range(3):
+            cache.store(f"F{i}", make_rfa(tmp_path, f"F{i}", 100), f"F{i}.rfa")
+        with cache.transaction():
+            cache.get_cached_path("F0")
+
+        reopened = FamilyCache(cache_dir=cache_dir)
+        assert reopened.evict(200) == ["F1"]
+
+    def test_legacy_entries_without_size(self, cache_dir, sample_rfa):
+        """Entries from older cache manifests are measured on demand."""
+        os.makedirs(cache_dir)
+        shutil_dest = os.path.join(cache_dir, "old.rfa")
+        with open(sample_rfa, "rb") as src, open(shutil_dest, "wb") as dst:
+            dst.write(src.read())
+        with open(os.path.join(cache_dir, "cache_manifest.json"), "w") as f:
+            json.dump({"Old": {"relative_path": "old.rfa", "sha256": "abc"}}, f, indent=2)
+
+        cache = FamilyCache(cache_dir=cache_dir)
+        assert cache.total_size() == os.path.getsize(sample_rfa)
@@ -0,0 +1,283 @@
+# File: tests/families/test_manifest_cache.py
+"""
+Unit tests for stored manifest copies and conditional manifest fetching.
+
+Tests cover:
+- ManifestCache storage, lookup and freshness
+- GitHubProvider.fetch_manifest: TTL hits, 304 revalidation, offline fallback
+- FamilyResolver reusing the manifest across resolves
+"""
+
+import json
+import os
+import socket
+
+import pytest
+
+from src.timber_framing_generator.families import manifest_cache as manifest_cache_module
+from src.timber_framing_generator.families.cache import FamilyCache
+from src.timber_framing_generator.families.manifest import parse_manifest
+from src.timber_framing_generator.families.manifest_cache import (
+    MANIFESTS_SUBDIR,
+    ManifestCache,
+)
+from src.timber_framing_generator.families.providers import GitHubProvider
+from src.timber_framing_generator.families.resolver import FamilyResolver
+
+
+MANIFEST_PATH = "/families/manifest.json"
+
+
+def manifest_json(family_count: int = 1) -> bytes:
+    """Manifest with ``family_count`` families and placeholder hashes."""
+    return json.dumps({
+        "schema_version": "1.0",
+        "revit_version": "2025",
+        "base_url": "",
+        "families": {
+            f"TFG_F{i}": {
+                "file": f"timber/TFG_F{i}.rfa",
+                "category": "OST_StructuralFraming",
+                "types": {f"P{i}": {"width_in": 1.5, "depth_in": 3.5}},
+                "sha256": "placeholder",
+            }
+            for i in range(family_count)
+        },
+    }).encode("utf-8")
+
+
+def forget_memory():
+    """Drop in-memory copies, as a Grasshopper module purge does."""
+    manifest_cache_module._memory.clear()
+
+
+def manifest_requests(server) -> int:
+    return server.requests.count(MANIFEST_PATH)
+
+
+@pytest.fixture
+def served(family_server):
+    """Server with a manifest carrying an ETag."""
+    family_server.files[MANIFEST_PATH] = manifest_json()
+    family_server.etags[MANIFEST_PATH] = '"v1"'
+    return family_server
+
+
+# =============================================================================
+# Test: ManifestCache
+# =============================================================================
+
+class TestManifestCache:
+    """Test stored manifest copies."""
+
+    def test_store_and_lookup_from_disk(self, tmp_path):
+        """A stored copy survives losing the in-memory copy."""
+        cache = ManifestCache(str(tmp_path))
+        content = manifest_json().decode("utf-8")
+        cache.store("http://x/manifest.json", content, parse_manifest(content),
+                    etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        forget_memory()
+
+        cached = ManifestCache(str(tmp_path)).lookup("http://x/manifest.json")
+        assert cached.content == content
+        assert cached.etag == '"v1"'
+        assert "TFG_F0" in cache.parsed(cached).families
+        assert os.listdir(tmp_path / MANIFESTS_SUBDIR) == [
+            os.path.basename(cache._path("http://x/manifest.json"))
+        ]
+
+    def test_lookup_missing(self, tmp_path):
+        """Unknown URLs have no copy."""
+        assert ManifestCache(str(tmp_path)).lookup("http://x/other.json") is None
+
+    def test_unreadable_copy_ignored(self, tmp_path):
+        """A corrupt copy on disk is treated as missing."""
+        cache = ManifestCache(str(tmp_path))
+        path = cache._path("http://x/manifest.json")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write("{truncated")
+        assert cache.lookup("http://x/manifest.json") is None
+
+    def test_freshness_follows_ttl(self, tmp_path):
+        """Copies are fresh for ttl seconds after being checked."""
+        content = manifest_json().decode("utf-8")
+        cached = ManifestCache(str(tmp_path)).store(
+            "http://x/m.json", content, parse_manifest(content))
+        assert ManifestCache(str(tmp_path), ttl=60).is_fresh(cached)
+        assert not ManifestCache(str(tmp_path), ttl=0).is_fresh(cached)
+
+    def test_conditional_headers(self, tmp_path):
+        """Validators become If-None-Match / If-Modified-Since."""
+        content = manifest_json().decode("utf-8")
+        cached = ManifestCache(str(tmp_path)).store(
+            "http://x/m.json", content, parse_manifest(content),
+            etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        assert ManifestCache.conditional_headers(cached) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert ManifestCache.conditional_headers(None) == {}
+
+    def test_clear(self, tmp_path):
+        """clear() forgets memory and disk copies."""
+        cache = ManifestCache(str(tmp_path))
+        content = manifest_json().decode("utf-8")
+        cache.store("http://x/m.json", content, parse_manifest(content))
+        cache.clear()
+        assert cache.lookup("http://x/m.json") is None
+
+
+# =============================================================================
+# Test: GitHubProvider.fetch_manifest
+# =============================================================================
+
+class TestConditionalFetch:
+    """Test manifest fetching against a stored copy."""
+
+    def test_fresh_copy_needs_no_request(self, served, tmp_path):
+        """Within the TTL the stored copy is used without a request."""
+        cache = ManifestCache(str(tmp_path), ttl=60)
+        provider = GitHubProvider(base_url=served.base_url)
+
+        first = provider.fetch_manifest(cache)
+        assert provider.manifest_status == "fetched"
+        forget_memory()
+        second = provider.fetch_manifest(cache)
+
+        assert provider.manifest_status == "fresh"
+        assert manifest_requests(served) == 1
+        assert list(second.families) == list(first.families)
+        assert second.base_url == served.base_url
+
+    def test_stale_copy_revalidated_with_etag(self, served, tmp_path):
+        """After the TTL, an unchanged manifest costs one 304."""
+        cache = ManifestCache(str(tmp_path), ttl=0)
+        provider = GitHubProvider(base_url=served.base_url)
+
+        first = provider.fetch_manifest(cache)
+        second = provider.fetch_manifest(cache)
+
+        assert provider.manifest_status == "revalidated"
+        assert served.statuses == [200, 304]
+        assert second is first
+
+    def test_revalidated_with_last_modified(self, family_server, tmp_path):
+        """Last-Modified alone is enough to revalidate."""
+        family_server.files[MANIFEST_PATH] = manifest_json()
+        family_server.last_modified[MANIFEST_PATH] = "Mon, 01 Jan 2024 00:00:00 GMT"
+        cache = ManifestCache(str(tmp_path), ttl=0)
+        provider = GitHubProvider(base_url=family_server.base_url)
+
+        provider.fetch_manifest(cache)
+        provider.fetch_manifest(cache)
+        assert family_server.statuses == [200, 304]
+
+    def test_changed_manifest_refetched(self, served, tmp_path):
+        """A new ETag on the server replaces the stored copy."""
+        cache = ManifestCache(str(tmp_path), ttl=0)
+        provider = GitHubProvider(base_url=served.base_url)
+        provider.fetch_manifest(cache)
+
+        served.files[MANIFEST_PATH] = manifest_json(3)
+        served.etags[MANIFEST_PATH] = '"v2"'
+        manifest = provider.fetch_manifest(cache)
+
+        assert provider.manifest_status == "fetched"
+        assert len(manifest.families) == 3
+        assert cache.lookup(provider._get_manifest_url()).etag == '"v2"'
+
+    def test_offline_uses_stored_copy(self, served, tmp_path):
+        """An unreachable server falls back to the stored copy, however old."""
+        cache = ManifestCache(str(tmp_path), ttl=0)
+        GitHubProvider(base_url=served.base_url).fetch_manifest(cache)
+        served.close()
+        forget_memory()
+
+        provider = GitHubProvider(base_url=served.base_url, timeout=2)
+        manifest = provider.fetch_manifest(cache)
+        assert provider.manifest_status == "offline"
+        assert "TFG_F0" in manifest.families
+
+    def test_http_error_uses_stored_copy(self, served, tmp_path):
+        """An error status also falls back to the stored copy."""
+        cache = ManifestCache(str(tmp_path), ttl=0)
+        provider = GitHubProvider(base_url=served.base_url)
+        provider.fetch_manifest(cache)
+
+        del served.files[MANIFEST_PATH]
+        manifest = provider.fetch_manifest(cache)
+        assert provider.manifest_status == "offline"
+        assert "TFG_F0" in manifest.families
+
+    def test_offline_without_copy_raises(self, tmp_path):
+        """With no stored copy an unreachable server is an error."""
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        provider = GitHubProvider(base_url=f"http://127.0.0.1:{port}/families", timeout=2)
+        with pytest.raises(ConnectionError):
+            provider.fetch_manifest(ManifestCache(str(tmp_path)))
+
+    def test_invalid_manifest_not_stored(self, family_server, tmp_path):
+        """Invalid manifests raise and are never stored."""
+        family_server.files[MANIFEST_PATH] = b"not valid json"
+        cache = ManifestCache(str(tmp_path))
+        provider = GitHubProvider(base_url=family_server.base_url)
+        with pytest.raises(ValueError):
+            provider.fetch_manifest(cache)
+        assert cache.lookup(provider._get_manifest_url()) is None
+
+    def test_provider_level_manifest_cache(self, served, tmp_path):
+        """get_manifest() uses a manifest_cache given to the provider."""
+        provider = GitHubProvider(
+            base_url=served.base_url,
+            manifest_cache=ManifestCache(str(tmp_path), ttl=60),
+        )
+        provider.get_manifest()
+        provider.get_manifest()
+        assert manifest_requests(served) == 1
+
+
+# =============================================================================
+# Test: FamilyResolver
+# =============================================================================
+
+class TestResolverManifestReuse:
+    """Test that repeated resolves reuse the stored manifest."""
+
+    def test_warm_resolve_skips_manifest_request(self, served, tmp_path):
+        """A second solve within the TTL makes no manifest request."""
+        for _ in range(2):
+            forget_memory()
+            resolver = FamilyResolver(
+                provider=GitHubProvider(base_url=served.base_url),
+                cache=FamilyCache(cache_dir=str(tmp_path / "cache")),
+            )
+            result = resolver.resolve(doc=None)
+
+        assert manifest_requests(served) == 1
+        assert any("(fresh)" in line for line in result.log)
+
+    def test_offline_resolve_uses_stored_manifest(self, served, tmp_path):
+        """Offline, families resolve from the stored manifest and cache."""
+        served.files["/families/timber/TFG_F0.rfa"] = b"rfa"
+        cache_dir = str(tmp_path / "cache")
+        resolver = FamilyResolver(
+            provider=GitHubProvider(base_url=served.base_url),
+            cache=FamilyCache(cache_dir=cache_dir),
+            manifest_cache=ManifestCache(cache_dir, ttl=0),
+        )
+        assert resolver.resolve(doc=None).status == "all_resolved"
+        served.close()
+
+        resolver = FamilyResolver(
+            provider=GitHubProvider(base_url=served.base_url, timeout=2),
+            cache=FamilyCache(cache_dir=cache_dir),
+            manifest_cache=ManifestCache(cache_dir, ttl=0),
+        )
+        result = resolver.resolve(doc=None)
+        assert result.status == "all_resolved"
+        assert result.cached == ["TFG_F0"]
+        assert result.resolved == {"P0": "P0"}
+        assert any("(offline)" in line for line in result.log)
@@ -4,15 +4,16 @@ Unit tests for family providers.
 
 Tests cover:
 - GitHubProvider URL construction
-- GitHubProvider manifest fetching (mocked)
-- GitHubProvider file download (mocked)
+- GitHubProvider manifest fetching and revalidation (local HTTP server)
+- GitHubProvider file download (local HTTP server)
 - LocalFileProvider operations
 - Provider ABC enforcement
 """
 
+import hashlib
 import json
 import os
-from unittest.mock import patch, MagicMock
+import socket
 
 import pytest
 
@@ -50,6 +51,14 @@ SAMPLE_MANIFEST_RESPONSE = json.dumps({
 }).encode("utf-8")
 
 
+def closed_port_url() -> str:
+    """Base URL on a local port nothing listens on."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/families"
+
+
 def make_family_entry() -> FamilyEntry:
     """Create a sample FamilyEntry for testing."""
     return FamilyEntry(
@@ -87,76 +96,110 @@ class TestGitHubProvider:
         provider = GitHubProvider()
         assert provider.provider_name == "GitHub"
 
-    @patch("src.timber_framing_generator.families.providers.urllib.request.urlopen")
-    def test_get_manifest_success(self, mock_urlopen):
+    def test_get_manifest_success(self, family_server):
         """get_manifest parses response into FamilyManifest."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = SAMPLE_MANIFEST_RESPONSE
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
-
-        provider = GitHubProvider()
+        family_server.files["/families/manifest.json"] = SAMPLE_MANIFEST_RESPONSE
+        provider = GitHubProvider(base_url=family_server.base_url)
         manifest = provider.get_manifest()
 
         assert isinstance(manifest, FamilyManifest)
         assert len(manifest.families) == 1
         assert "TFG_Stud_2x4" in manifest.families
+        assert provider.manifest_status == "fetched"
 
-    @patch("src.timber_framing_generator.families.providers.urllib.request.urlopen")
-    def test_get_manifest_network_error(self, mock_urlopen):
+    def test_get_manifest_network_error(self):
         """get_manifest raises ConnectionError on network failure."""
-        import urllib.error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+        provider = GitHubProvider(base_url=closed_port_url(), timeout=2)
+        with pytest.raises(ConnectionError):
+            provider.get_manifest()
 
-        provider = GitHubProvider()
+    def test_get_manifest_http_error(self, family_server):
+        """get_manifest raises ConnectionError on an HTTP error status."""
+        provider = GitHubProvider(base_url=family_server.base_url)
         with pytest.raises(ConnectionError):
             provider.get_manifest()
 
-    @patch("src.timber_framing_generator.families.providers.urllib.request.urlopen")
-    def test_get_manifest_invalid_json(self, mock_urlopen):
+    def test_get_manifest_invalid_json(self, family_server):
         """get_manifest raises ValueError on invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"not valid json"
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
-
-        provider = GitHubProvider()
+        family_server.files["/families/manifest.json"] = b"not valid json"
+        provider = GitHubProvider(base_url=family_server.base_url)
         with pytest.raises(ValueError):
             provider.get_manifest()
 
-    @patch("src.timber_framing_generator.families.providers.urllib.request.urlopen")
-    def test_download_family_success(self, mock_urlopen, tmp_path):
+    def test_download_family_success(self, family_server, tmp_path):
         """download_family writes file to disk."""
-        mock_response = MagicMock()
-        mock_response.read.side_effect = [b"fake rfa content", b""]
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        family_server.files["/families/timber/structural_framing/TFG_Stud_2x4.rfa"] = \
+            b"fake rfa content"
 
         dest = str(tmp_path / "test.rfa")
-        provider = GitHubProvider()
+        provider = GitHubProvider(base_url=family_server.base_url)
         entry = make_family_entry()
+        entry.sha256 = hashlib.sha256(b"fake rfa content").hexdigest()
 
         success = provider.download_family(entry, dest)
+        provider.close()
         assert success
         assert os.path.exists(dest)
         with open(dest, "rb") as f:
             assert f.read() == b"fake rfa content"
 
-    @patch("src.timber_framing_generator.families.providers.urllib.request.urlopen")
-    def test_download_family_network_error(self, mock_urlopen, tmp_path):
+    def test_download_family_network_error(self, tmp_path):
         """download_family returns False on network error."""
-        import urllib.error
-        mock_urlopen.side_effect = urllib.error.URLError("Timeout")
-
         dest = str(tmp_path / "test.rfa")
-        provider = GitHubProvider()
+        provider = GitHubProvider(base_url=closed_port_url(), timeout=2)
         entry = make_family_entry()
 
         success = provider.download_family(entry, dest)
         assert not success
+        assert not os.path.exists(dest)
+
+    def test_download_checksum_mismatch_removes_file(self, family_server, tmp_path):
+        """A file whose SHA256 doesn't match the manifest is rejected."""
+        family_server.files["/families/timber/structural_framing/TFG_Stud_2x4.rfa"] = \
+            b"tampered"
+
+        dest = str(tmp_path / "test.rfa")
+        provider = GitHubProvider(base_url=family_server.base_url)
+        assert provider.download_verified(make_family_entry(), dest) is None
+        assert not os.path.exists(dest)
+
+    def test_download_http_error(self, family_server, tmp_path):
+        """A 404 is a failed download."""
+        provider = GitHubProvider(base_url=family_server.base_url)
+        assert not provider.download_family(make_family_entry(), str(tmp_path / "x.rfa"))
+
+    def test_downloads_reuse_connection(self, family_server, tmp_path):
+        """Sequential downloads from one thread share a keep-alive connection."""
+        content = b"rfa"
+        entries = []
+        for i in range(5):
+            family_server.files[f"/families/f{i}.rfa"] = content
+            entries.append(FamilyEntry(file=f"f{i}.rfa", category="OST_StructuralFraming",
+                                       types={}, sha256=hashlib.sha256(content).hexdigest()))
+
+        provider = GitHubProvider(base_url=family_server.base_url)
+        for i, entry in enumerate(entries):
+            assert provider.download_verified(entry, str(tmp_path / f"{i}.rfa"))
+        provider.close()
+        assert len(family_server.requests) == 5
+        assert family_server.connections == 1
+
+    def test_context_manager_closes_connections(self, family_server, tmp_path):
+        """Leaving the with block closes kept-alive connections."""
+        family_server.files["/families/f.rfa"] = b"rfa"
+        entry = FamilyEntry(file="f.rfa", category="OST_StructuralFraming",
+                            types={}, sha256=hashlib.sha256(b"rfa").hexdigest())
+        with GitHubProvider(base_url=family_server.base_url) as provider:
+            assert provider.download_verified(entry, str(tmp_path / "f.rfa"))
+            assert len(provider._pool._all) == 1
+        assert provider._pool._all == []
+
+    def test_failed_connections_not_kept(self, tmp_path):
+        """Connections that failed are closed and forgotten by the pool."""
+        provider = GitHubProvider(base_url=closed_port_url(), timeout=2)
+        assert not provider.download_family(make_family_entry(), str(tmp_path / "x.rfa"))
+        assert provider._pool._all == []
+        assert provider._pool.connections_opened == 1
 
     def test_manifest_url_construction(self):
         """Manifest URL is correctly constructed from base_url."""
@@ -10,6 +10,7 @@ Tests cover:
 - ResolutionResult status computation
 """
 
+import hashlib
 import json
 import os
 from unittest.mock import MagicMock, patch
@@ -34,6 +35,10 @@ from src.timber_framing_generator.families.providers import FamilyProvider
 # Fixtures
 # =============================================================================
 
+FAKE_RFA = b"fake rfa content"
+FAKE_RFA_SHA256 = hashlib.sha256(FAKE_RFA).hexdigest()
+
+
 def make_manifest() -> FamilyManifest:
     """Create a test manifest."""
     return FamilyManifest(
@@ -45,13 +50,13 @@ def make_manifest() -> FamilyManifest:
                 file="timber/structural_framing/TFG_Stud_2x4.rfa",
                 category="OST_StructuralFraming",
                 types={"2x4": FamilyTypeInfo(width_in=1.5, depth_in=3.5)},
-                sha256="abc123",
+                sha256=FAKE_RFA_SHA256,
             ),
             "TFG_Plate_2x4": FamilyEntry(
                 file="timber/plates/TFG_Plate_2x4.rfa",
                 category="OST_StructuralFraming",
                 types={"2x4_Plate": FamilyTypeInfo(width_in=1.5, depth_in=3.5)},
-                sha256="def456",
+                sha256=FAKE_RFA_SHA256,
             ),
         },
     )
@@ -111,7 +116,7 @@ class MockProvider(FamilyProvider):
         # Create a fake .rfa file
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
         with open(dest_path, "wb") as f:
-            f.write(b"fake rfa content")
+            f.write(FAKE_RFA)
         return True
 
 
@@ -398,6 +403,19 @@ class TestResolverConfig:
         resolver = FamilyResolver(provider=provider)
         assert resolver.provider is provider
 
+    def test_closes_only_its_own_provider(self):
+        """A default provider is closed with the resolver; a passed one is not."""
+        closed = []
+        provider = MockProvider()
+        provider.close = lambda: closed.append("passed")
+        with FamilyResolver(provider=provider):
+            pass
+        assert closed == []
+
+        with FamilyResolver() as resolver:
+            resolver.provider.close = lambda: closed.append("default")
+        assert closed == ["default"]
+
     def test_custom_cache(self, tmp_path):
         """Custom cache is used when provided."""
         cache = FamilyCache(cache_dir=str(tmp_path / "cache"))
@@ -412,3 +430,107 @@ class TestResolverConfig:
         )
         result = resolver.resolve(doc=None)
         assert len(result.log) > 0
+
+
+# =============================================================================
+# Test: Concurrent Downloads
+# =============================================================================
+
+def make_served_manifest(server, count: int) -> FamilyManifest:
+    """Manifest of ``count`` families, each served by the test server."""
+    families = {}
+    for i in range(count):
+        content = f"rfa {i}".encode("utf-8") * 1000
+        server.files[f"/families/timber/TFG_F{i}.rfa"] = content
+        families[f"TFG_F{i}"] = FamilyEntry(
+            file=f"timber/TFG_F{i}.rfa",
+            category="OST_StructuralFraming",
+            types={f"P{i}": FamilyTypeInfo(width_in=1.5, depth_in=3.5)},
+            sha256=hashlib.sha256(content).hexdigest(),
+        )
+    return FamilyManifest(
+        schema_version="1.0", revit_version="2025",
+        base_url=server.base_url, families=families,
+    )
+
+
+class TestConcurrentDownloads:
+    """Test the concurrent download phase against a local HTTP server."""
+
+    def test_downloads_overlap_and_merge_in_order(self, family_server, tmp_path):
+        """Downloads run in parallel; results follow manifest order."""
+        from src.timber_framing_generator.families.providers import GitHubProvider
+
+        manifest = make_served_manifest(family_server, 8)
+        family_server.delay = 0.05
+        provider = GitHubProvider(base_url=family_server.base_url, max_connections=4)
+        cache = FamilyCache(cache_dir=str(tmp_path / "cache"))
+        resolver = FamilyResolver(provider=provider, cache=cache, manifest=manifest)
+
+        result = resolver.resolve(doc=None)
+        provider.close()
+
+        assert result.status == "all_resolved"
+        assert result.cached == list(manifest.families)
+        assert 1 < family_server.max_in_flight <= 4
+        assert family_server.connections <= 4
+        for key, entry in manifest.families.items():
+            assert cache.is_cached(key, entry.sha256)
+            assert cache.compute_sha256(cache.get_cached_path(key)) == entry.sha256
+
+    def test_resolve_writes_cache_manifest_once(self, family_server, tmp_path):
+        """All downloads of one resolve share a single cache manifest write."""
+        from src.timber_framing_generator.families.providers import GitHubProvider
+
+        manifest = make_served_manifest(family_server, 6)
+        cache = FamilyCache(cache_dir=str(tmp_path / "cache"))
+        resolver = FamilyResolver(
+            provider=GitHubProvider(base_url=family_server.base_url),
+            cache=cache, manifest=manifest,
+        )
+        assert resolver.resolve(doc=None).status == "all_resolved"
+        assert cache.manifest_writes == 1
+        assert len(FamilyCache(cache_dir=cache.cache_dir).list_cached()) == 6
+
+    def test_failures_reported_in_order(self, family_server, tmp_path):
+        """Bad checksums and missing files end up in missing, others cached."""
+        from src.timber_framing_generator.families.providers import GitHubProvider
+
+        manifest = make_served_manifest(family_server, 5)
+        family_server.files["/families/timber/TFG_F1.rfa"] = b"tampered"
+        del family_server.files["/families/timber/TFG_F3.rfa"]
+        provider = GitHubProvider(base_url=family_server.base_url)
+        cache = FamilyCache(cache_dir=str(tmp_path / "cache"))
+        resolver = FamilyResolver(provider=provider, cache=cache, manifest=manifest)
+
+        result = resolver.resolve(doc=None)
+
+        assert result.status == "partial"
+        assert result.missing == ["TFG_F1", "TFG_F3"]
+        assert result.cached == ["TFG_F0", "TFG_F2", "TFG_F4"]
+        assert "TFG_F1" not in cache.list_cached()
+
+    def test_single_worker_is_serial(self, family_server, tmp_path):
+        """max_workers=1 downloads one family at a time."""
+        from src.timber_framing_generator.families.providers import GitHubProvider
+
+        manifest = make_served_manifest(family_server, 3)
+        provider = GitHubProvider(base_url=family_server.base_url)
+        resolver = FamilyResolver(
+            provider=provider, cache=FamilyCache(cache_dir=str(tmp_path / "cache")),
+            manifest=manifest, max_workers=1,
+        )
+        result = resolver.resolve(doc=None)
+        assert result.status == "all_resolved"
+        assert family_server.max_in_flight == 1
+        assert family_server.connections == 1
+
+    def test_provider_concurrency_caps_workers(self, tmp_path):
+        """Providers default to one download at a time."""
+        provider = MockProvider()
+        resolver = FamilyResolver(
+            provider=provider, cache=FamilyCache(cache_dir=str(tmp_path / "cache")),
+            manifest=make_manifest(), max_workers=8,
+        )
+        result = resolver.resolve(doc=None)
+        assert "Downloading 2 families with 1 worker(s)" in result.log
@@ -0,0 +1,118 @@
+# File: tests/families/test_type_matcher.py
+"""
+Unit tests for profile -> Revit type matching.
+
+Plain strings stand in for Revit ElementType objects.
+
+Tests cover:
+- Resolution order (user mapping, exact, contains, CFS, fallback)
+- Substring index agreement with a linear scan
+- Memoization of repeated profiles
+- Objects exposing a Name attribute
+"""
+
+from src.timber_framing_generator.families.type_matcher import (
+    TypeMatcher,
+    find_matching_revit_type,
+    parse_cfs_profile_name,
+)
+
+
+class FakeRevitType:
+    """Minimal stand-in for a Revit ElementType."""
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+
+# =============================================================================
+# Resolution Order
+# =============================================================================
+
+class TestResolutionOrder:
+    """Tests for the staged matching strategy."""
+
+    def test_empty_types(self):
+        assert TypeMatcher([]).match("2x4") == (None, None)
+
+    def test_user_mapping_wins(self):
+        matcher = TypeMatcher(["2x4", "Custom Stud"], {"2x4": "custom stud"})
+        assert matcher.match("2x4") == ("Custom Stud", "user_mapping")
+
+    def test_user_mapping_missing_target_falls_through(self):
+        matcher = TypeMatcher(["2x4"], {"2x4": "Missing"})
+        assert matcher.match("2x4") == ("2x4", "exact")
+
+    def test_exact_is_case_insensitive(self):
+        assert TypeMatcher(["Foo", "2X6"]).match(" 2x6 ") == ("2X6", "exact")
+
+    def test_contains_returns_first_in_order(self):
+        types = ["Plate - 2x4", "Stud - 2x4", "2x6"]
+        assert TypeMatcher(types).match("2x4") == ("Plate - 2x4", "contains")
+
+    def test_cfs_similar_prefers_same_flange_then_closest_series(self):
+        types = ["600S162-54(50)", "400S125-54(50)", "800S125-54(50)"]
+        assert TypeMatcher(types).match("362S125-54") == (
+            "400S125-54(50)", "cfs_similar"
+        )
+
+    def test_cfs_type_match(self):
+        types = ["2x4", "600S162-43(50)", "600T125-43(50)"]
+        assert TypeMatcher(types).match("362S125-54") == (
+            "600S162-43(50)", "cfs_type_match"
+        )
+
+    def test_cfs_fallback(self):
+        types = ["2x4", "600T125-43(50)"]
+        assert TypeMatcher(types).match("362S125-54") == (
+            "600T125-43(50)", "cfs_fallback"
+        )
+
+    def test_fallback_to_first_type(self):
+        assert TypeMatcher(["A", "B"]).match("2x4") == ("A", "fallback")
+
+    def test_short_profile_uses_linear_scan(self):
+        assert TypeMatcher(["Alpha", "xb2"]).match("b2") == ("xb2", "contains")
+
+
+# =============================================================================
+# Indexing and Memoization
+# =============================================================================
+
+class TestIndexing:
+    """Tests for the substring index and memo."""
+
+    def test_contains_index_matches_linear_scan(self):
+        types = [f"Series {i} - 2x{i % 13}" for i in range(300)]
+        matcher = TypeMatcher(types)
+        for profile in ["2x4", "2x12", "ries 1", "- 2x1", "zzz", "s 29"]:
+            lowered = [t.lower() for t in types]
+            expected = next((t for t, low in zip(types, lowered) if profile in low), None)
+            result, quality = matcher.match(profile)
+            if expected is None:
+                assert quality != "contains"
+            else:
+                assert (result, quality) == (expected, "contains")
+
+    def test_match_is_memoized(self):
+        matcher = TypeMatcher(["Stud - 2x4"])
+        first = matcher.match("2x4")
+        assert matcher.cache_size == 1
+        assert matcher.match("2x4") is first
+        assert matcher.cache_size == 1
+
+    def test_name_attribute_objects(self):
+        types = [FakeRevitType("2x4"), FakeRevitType("2x6")]
+        matched, quality = TypeMatcher(types).match("2x6")
+        assert matched is types[1]
+        assert quality == "exact"
+
+    def test_find_matching_revit_type_wrapper(self):
+        assert find_matching_revit_type("2x4", ["2x4"]) == ("2x4", "exact")
+
+
+def test_parse_cfs_profile_name():
+    assert parse_cfs_profile_name("600t125-54(50)") == {
+        "series": "600", "type": "T", "flange": "125", "gauge": "54",
+    }
+    assert parse_cfs_profile_name("2x4") is None
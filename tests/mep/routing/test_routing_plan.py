@@ -0,0 +1,143 @@
+# File: tests/mep/routing/test_routing_plan.py
+"""
+Unit tests for the precompiled routing plan.
+
+Tests cover:
+- ZoneIndex point queries
+- Connector bucketing by trade and zone (matches per-pair filtering)
+- Target partitioning by trade
+- Target lookup construction
+"""
+
+import random
+
+from src.timber_framing_generator.mep.routing import (
+    ConnectorInfo,
+    RoutingPlan,
+    RoutingTarget,
+    RoutingZone,
+    TargetType,
+    Trade,
+    TradeConfig,
+    ZoneIndex,
+    build_target_lookup,
+)
+
+
+def make_connector(cid, system, x, y):
+    return ConnectorInfo(
+        id=cid, system_type=system, location=(x, y, 0.0),
+        direction="outward", diameter=0.1,
+    )
+
+
+def make_target(tid, target_type, systems=None):
+    return RoutingTarget(
+        id=tid, target_type=target_type, location=(0.0, 0.0, 0.0),
+        domain_id="w1", plane_location=(0.0, 0.0),
+        systems_served=systems or [],
+    )
+
+
+class TestZoneIndex:
+    """Tests for ZoneIndex."""
+
+    def test_point_queries(self):
+        zones = [
+            RoutingZone(id="a", bounds=(0, 10, 0, 10)),
+            RoutingZone(id="b", bounds=(5, 20, 0, 5)),
+            RoutingZone(id="c", bounds=(30, 40, 0, 10)),
+        ]
+        index = ZoneIndex(zones)
+        assert index.zones_containing(6, 2) == [0, 1]
+        assert index.zones_containing(6, 8) == [0]
+        assert index.zones_containing(25, 2) == []
+        assert index.zones_containing(40, 10) == [2]
+
+    def test_matches_contains_point(self):
+        rng = random.Random(3)
+        zones = []
+        for i in range(30):
+            x0, y0 = rng.uniform(0, 100), rng.uniform(0, 100)
+            zones.append(RoutingZone(
+                id=str(i), bounds=(x0, x0 + rng.uniform(1, 30), y0, y0 + rng.uniform(1, 30))
+            ))
+        index = ZoneIndex(zones)
+        for _ in range(200):
+            x, y = rng.uniform(0, 130), rng.uniform(0, 130)
+            expected = [i for i, z in enumerate(zones) if z.contains_point(x, y)]
+            assert index.zones_containing(x, y) == expected
+
+    def test_wide_building_with_site_zone(self):
+        """A long row of zones plus one zone over everything, edges included."""
+        zones = [RoutingZone(id=f"z{i}", bounds=(10 * i, 10 * i + 10, 0, 8)) for i in range(500)]
+        zones.append(RoutingZone(id="site", bounds=(-5, 5005, -5, 20)))
+        index = ZoneIndex(zones)
+        for x, y in [(0, 0), (10, 4), (2505, 8), (4999.5, 3), (5000, 8), (5002, 10), (6000, 0)]:
+            expected = [i for i, z in enumerate(zones) if z.contains_point(x, y)]
+            assert index.zones_containing(x, y) == expected
+
+    def test_empty(self):
+        assert ZoneIndex([]).zones_containing(0, 0) == []
+
+
+class TestRoutingPlan:
+    """Tests for RoutingPlan.compile."""
+
+    def test_buckets_match_per_pair_filtering(self):
+        config = TradeConfig()
+        zones = [
+            RoutingZone(id="z0", bounds=(0, 50, 0, 50), connector_ids=["c_listed"]),
+            RoutingZone(id="z1", bounds=(40, 100, 0, 50)),
+        ]
+        rng = random.Random(11)
+        systems = ["sanitary_drain", "DHW", "power", "data", "unknown_system"]
+        connectors = [
+            make_connector(f"c{i}", rng.choice(systems), rng.uniform(0, 120), rng.uniform(0, 60))
+            for i in range(100)
+        ]
+        connectors.append(make_connector("c_listed", "power", 200.0, 200.0))
+
+        plan = RoutingPlan.compile(config, connectors, [], zones)
+
+        for trade in config.get_enabled_trades():
+            trade_systems = [s.lower() for s in config.get_systems_for_trade(trade)]
+            trade_connectors = [
+                c for c in connectors if c.system_type.lower() in trade_systems
+            ]
+            assert plan.trade_connectors[trade] == trade_connectors
+            for zone_idx, zone in enumerate(zones):
+                expected = [
+                    c for c in trade_connectors
+                    if c.id in zone.connector_ids
+                    or zone.contains_point(c.location[0], c.location[1])
+                ]
+                assert plan.connectors_for(zone_idx, trade) == expected
+
+    def test_respects_enabled_trades(self):
+        config = TradeConfig(enabled_trades={Trade.ELECTRICAL})
+        connectors = [
+            make_connector("c1", "sanitary_drain", 0, 0),
+            make_connector("c2", "power", 0, 0),
+        ]
+        plan = RoutingPlan.compile(config, connectors, [])
+        assert plan.trades == [Trade.ELECTRICAL]
+        assert [c.id for c in plan.trade_connectors[Trade.ELECTRICAL]] == ["c2"]
+
+    def test_partitions_targets_by_trade(self):
+        config = TradeConfig()
+        wet_wall = make_target("t1", TargetType.WET_WALL, ["sanitary_drain"])
+        panel = make_target("t2", TargetType.PANEL_BOUNDARY, ["power"])
+        plan = RoutingPlan.compile(config, [], [wet_wall, panel])
+        assert plan.trade_targets[Trade.PLUMBING] == [wet_wall]
+        assert plan.trade_targets[Trade.ELECTRICAL] == [panel]
+        assert plan.trade_target_lookups[Trade.PLUMBING]["sanitary_drain"] == [wet_wall]
+
+
+def test_build_target_lookup():
+    t1 = make_target("t1", TargetType.WET_WALL, ["sanitary_drain", "vent"])
+    t2 = make_target("t2", TargetType.WET_WALL, ["vent"])
+    lookup = build_target_lookup([t1, t2])
+    assert lookup["vent"] == [t1, t2]
+    assert lookup["sanitary_drain"] == [t1]
+    assert lookup[TargetType.WET_WALL.value] == [t1, t2]
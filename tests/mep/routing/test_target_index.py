@@ -0,0 +1,159 @@
+# File: tests/mep/routing/test_target_index.py
+"""
+Tests for best-k target selection with the target spatial index.
+
+The indexed ranking must match scoring every target and stable-sorting.
+"""
+
+import random
+
+import pytest
+
+from src.timber_framing_generator.mep.routing.heuristics.base import (
+    ConnectorInfo,
+    FallbackHeuristic,
+)
+from src.timber_framing_generator.mep.routing.heuristics.plumbing import (
+    SanitaryHeuristic,
+    VentHeuristic,
+    SupplyHeuristic,
+)
+from src.timber_framing_generator.mep.routing.heuristics.electrical import (
+    PowerHeuristic,
+    DataHeuristic,
+    LightingHeuristic,
+)
+from src.timber_framing_generator.mep.routing.target_index import TargetSpatialIndex
+from src.timber_framing_generator.mep.routing.target_generator import (
+    TargetCandidateGenerator,
+)
+from src.timber_framing_generator.mep.routing.targets import (
+    RoutingTarget,
+    TargetType,
+)
+
+HEURISTICS = [
+    (SanitaryHeuristic(), "Sanitary"),
+    (VentHeuristic(), "Vent"),
+    (SupplyHeuristic(), "DHW"),
+    (PowerHeuristic(), "Power"),
+    (DataHeuristic(), "Data"),
+    (LightingHeuristic(), "Lighting"),
+    (FallbackHeuristic(), "Sanitary"),
+]
+
+
+def random_targets(rng, count, grid=False):
+    """Random targets; grid=True snaps to a coarse lattice to force ties."""
+    targets = []
+    for i in range(count):
+        if grid:
+            x, y, z = rng.randint(0, 10) * 5.0, rng.randint(0, 10) * 5.0, 0.0
+        else:
+            x, y, z = rng.uniform(0, 400), rng.uniform(0, 400), rng.choice([-1.0, 0.0, 10.0])
+        targets.append(RoutingTarget(
+            id=f"t{i}",
+            target_type=rng.choice(list(TargetType)),
+            location=(x, y, z),
+            domain_id="w",
+            plane_location=(x, y),
+            capacity=rng.choice([0.1, 0.25, 0.333]),
+            priority=rng.randint(0, 5),
+            is_available=rng.random() > 0.1,
+        ))
+    return targets
+
+
+def exhaustive(heuristic, connector, targets, k):
+    """Reference ranking: score everything, stable sort."""
+    scored = []
+    for target in targets:
+        if heuristic.is_valid_target(connector, target):
+            score = heuristic.score_target(connector, target)
+            if score < float('inf'):
+                scored.append((score, target))
+    scored.sort(key=lambda s: s[0])
+    return [(s, t.id) for s, t in scored[:k]]
+
+
+class TestTargetSpatialIndex:
+    """Tests for TargetSpatialIndex.rings."""
+
+    def test_rings_cover_all_targets_once(self):
+        targets = random_targets(random.Random(1), 300)
+        index = TargetSpatialIndex(targets)
+        seen = [i for _, hits in index.rings(-50.0, 120.0) for i, _ in hits]
+        assert sorted(seen) == list(range(len(targets)))
+
+    def test_ring_bounds_are_lower_bounds(self):
+        targets = random_targets(random.Random(2), 300)
+        index = TargetSpatialIndex(targets)
+        qx, qy = 210.0, 37.0
+        last_bound = 0.0
+        for bound, hits in index.rings(qx, qy):
+            assert bound >= last_bound
+            last_bound = bound
+            for _, t in hits:
+                assert abs(t.location[0] - qx) + abs(t.location[1] - qy) >= bound
+
+    def test_empty_index(self):
+        assert list(TargetSpatialIndex([]).rings(0.0, 0.0)) == []
+
+
+class TestBestKMatchesExhaustive:
+    """Indexed best-k ranking equals exhaustive ranking."""
+
+    @pytest.mark.parametrize("heuristic,system", HEURISTICS)
+    @pytest.mark.parametrize("grid", [False, True])
+    def test_rank_targets(self, heuristic, system, grid):
+        rng = random.Random(f"{type(heuristic).__name__}-{system}-{grid}")
+        targets = random_targets(rng, 500, grid=grid)
+        index = TargetSpatialIndex(targets)
+        for _ in range(20):
+            connector = ConnectorInfo(
+                id="c", system_type=system,
+                location=(rng.uniform(-20, 420), rng.uniform(-20, 420), 3.0),
+                direction="outward", diameter=0.1, elevation=3.0,
+                fixture_type=rng.choice([None, "Toilet"]),
+            )
+            for k in (1, 5, 12):
+                expected = exhaustive(heuristic, connector, targets, k)
+                indexed = heuristic.rank_targets(connector, targets, k, index=index)
+                unindexed = heuristic.rank_targets(connector, targets, k)
+                assert [(s, t.id) for s, t in indexed] == expected
+                assert [(s, t.id) for s, t in unindexed] == expected
+
+    def test_find_candidates_with_index(self):
+        targets = random_targets(random.Random(5), 200)
+        heuristic = PowerHeuristic()
+        connector = ConnectorInfo(
+            id="c", system_type="Power", location=(100.0, 100.0, 1.5),
+            direction="outward", diameter=0.05,
+        )
+        plain = heuristic.find_candidates(connector, targets, [], max_candidates=5)
+        indexed = heuristic.find_candidates(
+            connector, targets, [], max_candidates=5, index=TargetSpatialIndex(targets)
+        )
+        assert [c.target.id for c in indexed] == [c.target.id for c in plain]
+        assert [c.score for c in indexed] == sorted(c.score for c in plain)
+        assert all(c.notes.startswith("Power:") for c in indexed)
+
+
+def test_generator_rebuilds_index_after_target_changes():
+    generator = TargetCandidateGenerator()
+    connector = ConnectorInfo(
+        id="c", system_type="Power", location=(0.0, 0.0, 1.5),
+        direction="outward", diameter=0.05,
+    )
+    far = RoutingTarget(
+        id="far", target_type=TargetType.PANEL_BOUNDARY, location=(100.0, 0.0, 0.0),
+        domain_id="w", plane_location=(100.0, 0.0),
+    )
+    near = RoutingTarget(
+        id="near", target_type=TargetType.PANEL_BOUNDARY, location=(1.0, 0.0, 0.0),
+        domain_id="w", plane_location=(1.0, 0.0),
+    )
+    generator.add_target(far)
+    assert generator.find_candidates(connector)[0].target.id == "far"
+    generator.add_target(near)
+    assert generator.find_candidates(connector)[0].target.id == "near"
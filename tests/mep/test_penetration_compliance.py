@@ -0,0 +1,199 @@
+# File: tests/mep/test_penetration_compliance.py
+"""Tests for batch penetration code-compliance checking."""
+
+import random
+
+from src.timber_framing_generator.core import MEPDomain, MEPRoute
+from src.timber_framing_generator.mep.core.base import check_penetration_allowed
+from src.timber_framing_generator.mep.core.penetration_compliance import (
+    ComplianceReason,
+    MemberRule,
+    PenetrationBatch,
+    PenetrationKind,
+    check_penetrations,
+    describe_failure,
+)
+from src.timber_framing_generator.mep.plumbing.penetration_rules import (
+    generate_plumbing_penetrations,
+)
+
+STUD_DEPTH = 3.5 / 12   # 2x4
+INCH = 1.0 / 12
+
+
+def check_one(hole, depth=STUD_DEPTH, **kwargs):
+    batch = PenetrationBatch()
+    batch.append(hole, depth, **kwargs)
+    result = check_penetrations(batch)
+    return result.allowed[0], result.reasons[0]
+
+
+class TestRules:
+    """Test each code rule on single penetrations."""
+
+    def test_small_bored_hole_allowed(self):
+        assert check_one(1.0 * INCH) == (True, ())
+
+    def test_bored_ratio_bearing_vs_non_bearing(self):
+        """A 50% hole fails the 40% bearing limit but meets the 60% one."""
+        hole = 0.5 * STUD_DEPTH
+        assert check_one(hole, load_bearing=True) == (False, ("bored_ratio",))
+        assert check_one(hole, load_bearing=False) == (True, ())
+
+    def test_notch_limits(self):
+        """Notches are limited to 25% (bearing) and 40% (non-bearing)."""
+        notch = 0.3 * STUD_DEPTH
+        assert check_one(notch, kind="notched") == (False, ("notch_ratio",))
+        assert check_one(notch, kind="notched", load_bearing=False) == (True, ())
+
+    def test_edge_distance(self):
+        """Off-center holes need 5/8 inch to the member face."""
+        assert check_one(1.0 * INCH, edge_distance=0.5 * INCH) == (False, ("edge_distance",))
+        assert check_one(1.0 * INCH, edge_distance=0.75 * INCH) == (True, ())
+
+    def test_centered_hole_reports_every_rule(self):
+        """A hole breaking the ratio and edge rules reports both."""
+        hole = 2.4 * INCH   # 69% of depth, 0.55 in edges
+        assert check_one(hole, load_bearing=False) == (False, ("bored_ratio", "edge_distance"))
+
+    def test_joist_rule(self):
+        depth = 9.25 * INCH
+        allowed, reasons = check_one(3.5 * INCH, depth, member_type="joist")
+        assert (allowed, reasons) == (False, ("bored_ratio",))
+        assert check_one(3.5 * INCH, depth, member_type="stud")[0] is True
+
+    def test_invalid_size(self):
+        assert check_one(0.0) == (False, ("invalid_size",))
+        assert check_one(1.0 * INCH, 0.0) == (False, ("invalid_size",))
+
+    def test_matches_scalar_check(self):
+        """The batch agrees with check_penetration_allowed on the ratio rule."""
+        rng = random.Random("scalar")
+        batch = PenetrationBatch()
+        holes = [rng.uniform(0.2, 1.6) * INCH for _ in range(200)]
+        for hole in holes:
+            batch.append(hole, STUD_DEPTH)
+        result = check_penetrations(batch)
+        for hole, allowed in zip(holes, result.allowed):
+            assert allowed == check_penetration_allowed(hole, STUD_DEPTH)[0]
+
+
+class TestStacking:
+    """Test spacing between holes in the same member."""
+
+    def batch(self, positions, member_ids=None):
+        batch = PenetrationBatch()
+        for i, z in enumerate(positions):
+            member_id = member_ids[i] if member_ids else "stud_1"
+            batch.append(1.0 * INCH, STUD_DEPTH, member_id=member_id, position=z)
+        return batch
+
+    def test_close_holes_fail(self):
+        """Clear distance under twice the larger diameter fails both holes."""
+        result = check_penetrations(self.batch([3.0, 3.0 + 2.5 * INCH, 6.0]))
+        assert result.allowed == [False, False, True]
+        assert result.reasons[0] == ("hole_spacing",)
+
+    def test_spaced_holes_pass(self):
+        result = check_penetrations(self.batch([6.0, 3.0, 3.0 + 3.0 * INCH]))
+        assert result.allowed == [True, True, True]
+
+    def test_other_members_ignored(self):
+        result = check_penetrations(self.batch([3.0, 3.0], ["stud_1", "stud_2"]))
+        assert result.allowed == [True, True]
+
+    def test_unknown_member_not_stacked(self):
+        batch = PenetrationBatch()
+        batch.append(1.0 * INCH, STUD_DEPTH, position=3.0)
+        batch.append(1.0 * INCH, STUD_DEPTH, position=3.0)
+        assert check_penetrations(batch).allowed == [True, True]
+
+
+class TestResult:
+    """Test result summaries."""
+
+    def test_reinforcement_only_for_allowed_bored_holes(self):
+        batch = PenetrationBatch()
+        batch.append(0.35 * STUD_DEPTH, STUD_DEPTH)                      # allowed, > 33%
+        batch.append(0.2 * STUD_DEPTH, STUD_DEPTH)                       # allowed
+        batch.append(0.45 * STUD_DEPTH, STUD_DEPTH)                      # too large
+        batch.append(0.2 * STUD_DEPTH, STUD_DEPTH,
+                     kind=PenetrationKind.NOTCHED.value)                 # notch
+        result = check_penetrations(batch)
+        assert result.reinforcement_required == [True, False, False, False]
+        assert result.failures() == [2]
+        assert result.limits == [0.4, 0.4, 0.4, 0.25]
+
+    def test_reason_counts(self):
+        batch = PenetrationBatch()
+        batch.append(0.5 * STUD_DEPTH, STUD_DEPTH)
+        batch.append(0.5 * STUD_DEPTH, STUD_DEPTH, kind="notched")
+        counts = check_penetrations(batch).reason_counts()
+        assert counts["bored_ratio"] == 1
+        assert counts["notch_ratio"] == 1
+        assert set(counts) == {reason.value for reason in ComplianceReason}
+
+    def test_custom_rules(self):
+        batch = PenetrationBatch()
+        batch.append(0.5 * STUD_DEPTH, STUD_DEPTH, member_type="stud")
+        result = check_penetrations(batch, member_rules={"stud": MemberRule(bored_ratio=0.6)})
+        assert result.allowed == [True]
+
+    def test_describe_failure(self):
+        text = describe_failure("bored_ratio", 1.5 * INCH, STUD_DEPTH, 0.4)
+        assert text == "Hole diameter (1.50in) exceeds 40% of member depth (3.50in)"
+        assert "edge distance" in describe_failure("edge_distance", 2.4 * INCH, STUD_DEPTH)
+
+    def test_building_scale(self):
+        """Tens of thousands of penetrations check in one pass."""
+        rng = random.Random("building")
+        batch = PenetrationBatch()
+        for i in range(20000):
+            batch.append(rng.uniform(0.5, 2.0) * INCH, STUD_DEPTH,
+                         member_id=f"stud_{i // 4}", position=rng.uniform(0.0, 8.0))
+        result = check_penetrations(batch)
+        assert len(result) == 20000
+        assert 0 < len(result.failures()) < 20000
+
+
+class TestGeneratedPenetrations:
+    """Test compliance results on generated penetrations."""
+
+    def route(self, route_id, z, pipe_size=0.0625):
+        return MEPRoute(
+            id=route_id,
+            domain=MEPDomain.PLUMBING,
+            system_type="Supply",
+            path_points=[(0.0, 0.0, z), (5.0, 0.0, z)],
+            start_connector_id=f"conn_{route_id}",
+            end_point_type="wall_entry",
+            pipe_size=pipe_size,
+        )
+
+    def stud(self, **metadata):
+        return {
+            "id": "stud_1",
+            "element_type": "stud",
+            "centerline_start": {"x": 2.5, "y": 0.0, "z": 0.0},
+            "centerline_end": {"x": 2.5, "y": 0.0, "z": 9.0},
+            "profile": {"width": 0.125, "depth": STUD_DEPTH},
+            "metadata": metadata,
+        }
+
+    def test_stacked_routes_flagged(self):
+        """Two runs through one stud an inch apart fail the spacing rule."""
+        routes = [self.route("a", 3.0), self.route("b", 3.0 + INCH), self.route("c", 5.0)]
+        result = generate_plumbing_penetrations(routes, [self.stud()])
+        by_route = {pen["route_id"]: pen for pen in result}
+        assert by_route["a"]["reason_codes"] == ["hole_spacing"]
+        assert by_route["b"]["is_allowed"] is False
+        assert by_route["c"]["is_allowed"] is True
+        assert by_route["c"]["warning"] is None
+
+    def test_non_bearing_wall_allows_larger_hole(self):
+        route = self.route("a", 3.0, pipe_size=1.3 * INCH)   # ~1.8in hole, ~51%
+        bearing = generate_plumbing_penetrations([route], [self.stud()])[0]
+        partition = generate_plumbing_penetrations([route], [self.stud(load_bearing=False)])[0]
+        assert bearing["is_allowed"] is False
+        assert "exceeds 40%" in bearing["warning"]
+        assert partition["is_allowed"] is True
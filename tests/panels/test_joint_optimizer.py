@@ -2,7 +2,10 @@
 """Unit tests for joint optimizer."""
 
 import pytest
+import random
 from src.timber_framing_generator.panels.joint_optimizer import (
+    _filter_excluded,
+    _in_exclusion_zone,
     find_exclusion_zones,
     find_optimal_joints,
     get_panel_boundaries,
@@ -149,6 +152,20 @@ class TestFindOptimalJoints:
             assert remainder < 0.01 or abs(remainder - config.stud_spacing) < 0.01
 
 
+def test_filter_excluded_matches_zone_checks():
+    """Sweep filtering equals testing every position against every zone."""
+    rng = random.Random(3)
+    zones = []
+    for _ in range(15):
+        start = round(rng.uniform(0, 50), 1)
+        zones.append(ExclusionZone(start, start + round(rng.uniform(0, 6), 1), "opening"))
+    positions = [round(rng.uniform(-2, 60), 1) for _ in range(300)]
+
+    expected = [u for u in positions if not _in_exclusion_zone(u, zones)]
+    assert _filter_excluded(positions, zones) == expected
+    assert _filter_excluded(positions, []) == positions
+
+
 class TestGetPanelBoundaries:
     """Tests for get_panel_boundaries function."""
 
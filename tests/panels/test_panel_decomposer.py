@@ -3,7 +3,11 @@
 
 import pytest
 import json
+import random
 from src.timber_framing_generator.panels.panel_decomposer import (
+    ElementIndex,
+    _create_joint,
+    _find_elements_in_range,
     decompose_wall_to_panels,
     decompose_all_walls,
     serialize_panel_results,
@@ -208,6 +212,66 @@ class TestDecomposeAllWalls:
         assert len(results) == 2
 
 
+class TestElementIndex:
+    """Tests for the sorted per-wall element index."""
+
+    def test_matches_linear_scan(self):
+        """Bisect range queries return the same IDs in the same order."""
+        rng = random.Random(7)
+        elements = [
+            {"id": f"e{i}", "u_coord": round(rng.uniform(0, 60), 1)}
+            for i in range(400)
+        ]
+        elements.append({"id": "no_u"})
+        index = ElementIndex(elements)
+
+        for _ in range(100):
+            u_start = round(rng.uniform(-5, 60), 1)
+            u_end = u_start + round(rng.uniform(0, 10), 1)
+            assert index.ids_in_range(u_start, u_end) == _find_elements_in_range(
+                elements, u_start, u_end
+            )
+
+    def test_panels_match_linear_scan(self):
+        """Panel element IDs equal per-panel scans of the element list."""
+        elements = [
+            {"id": f"stud_{i}", "element_type": "stud", "u_coord": i * 1.333}
+            for i in range(46)
+        ]
+        framing = {"wall_id": "test_wall", "elements": list(reversed(elements))}
+        wall = create_mock_wall(length=60.0)
+
+        result = decompose_wall_to_panels(wall, framing, PanelConfig())
+
+        assert result["total_panel_count"] > 1
+        for panel in result["panels"]:
+            assert panel["element_ids"] == _find_elements_in_range(
+                framing["elements"], panel["u_start"], panel["u_end"]
+            )
+
+    def test_joint_studs_with_and_without_index(self):
+        """Joint stud lookup is the same with a shared or implicit index."""
+        framing = {
+            "elements": [
+                {"id": "s1", "element_type": "stud", "u_coord": 16.0},
+                {"id": "k1", "element_type": "king_stud", "u_coord": 15.5},
+                {"id": "p1", "element_type": "bottom_plate", "u_coord": 16.0},
+                {"id": "s2", "element_type": "stud", "u_coord": 17.0},
+            ]
+        }
+        wall = create_mock_wall(length=30.0)
+        config = PanelConfig()
+
+        shared = _create_joint(
+            16.0, "a", "b", wall, framing, config,
+            element_index=ElementIndex(framing["elements"]),
+        )
+        implicit = _create_joint(16.0, "a", "b", wall, framing, config)
+
+        assert shared["stud_u_coords"] == [16.0, 15.5]
+        assert implicit == shared
+
+
 class TestSerialization:
     """Tests for serialization functions."""
 
@@ -7,6 +7,9 @@ from src.timber_framing_generator.sheathing.sheathing_geometry import (
     calculate_w_offset,
     get_extrusion_vector,
     SheathingPanelGeometry,
+    create_panel_brep,
+    create_sheathing_breps,
+    create_sheathing_breps_batch,
 )
 
 
@@ -387,3 +390,93 @@ class TestIntegration:
         for panel in sample_sheathing_data["sheathing_panels"]:
             for field in required_fields:
                 assert field in panel, f"Missing field: {field}"
+
+
+class BoundsFactory:
+    """Stand-in factory: boxes are AABB tuples, booleans are recorded."""
+
+    def __init__(self):
+        self.booleans = []
+
+    def create_box_from_corners_and_thickness(self, corners, extrusion_vector):
+        dx, dy, dz = extrusion_vector
+        points = list(corners) + [(x + dx, y + dy, z + dz) for x, y, z in corners]
+        return (
+            tuple(min(p[k] for p in points) for k in range(3)),
+            tuple(max(p[k] for p in points) for k in range(3)),
+        )
+
+    def boolean_difference_multiple(self, brep, cutouts):
+        self.booleans.append((brep, list(cutouts)))
+        return ("cut", brep)
+
+
+def _approx_bounds(bounds):
+    return [pytest.approx(list(corner)) for corner in bounds]
+
+
+class TestBatchedGeometry:
+    """Batched mode builds the same boxes and only cuts panels with cutouts."""
+
+    @pytest.fixture
+    def wall(self):
+        return {
+            "wall_id": "w1",
+            "wall_thickness": 0.5,
+            "base_plane": {
+                "origin": {"x": 3.0, "y": -2.0, "z": 1.0},
+                "x_axis": {"x": 0.6, "y": 0.8, "z": 0.0},
+                "y_axis": {"x": 0.0, "y": 0.0, "z": 1.0},
+                "z_axis": {"x": 0.8, "y": -0.6, "z": 0.0},
+            },
+        }
+
+    @pytest.fixture
+    def sheathing(self):
+        def panel(pid, face, u0, cutouts):
+            return {
+                "id": pid, "wall_id": "w1", "face": face,
+                "u_start": u0, "u_end": u0 + 4.0, "v_start": 0.0, "v_end": 8.0,
+                "thickness_inches": 0.5, "cutouts": cutouts,
+            }
+        window = {"u_start": 5.0, "u_end": 7.0, "v_start": 3.0, "v_end": 6.0}
+        degenerate = {"u_start": 6.0, "u_end": 6.0, "v_start": 3.0, "v_end": 6.0}
+        return {
+            "wall_id": "w1",
+            "sheathing_panels": [
+                panel("p0", "exterior", 0.0, []),
+                panel("p1", "exterior", 4.0, [window, degenerate]),
+                panel("p2", "interior", 4.0, [window]),
+            ],
+        }
+
+    def test_bounds_match_per_panel_boxes(self, wall, sheathing):
+        factory = BoundsFactory()
+        batched = create_sheathing_breps(sheathing, wall, None, backend="bounds")
+
+        assert [g.panel_id for g in batched] == ["p0", "p1", "p2"]
+        for geom, panel_data in zip(batched, sheathing["sheathing_panels"]):
+            legacy = create_panel_brep(
+                dict(panel_data, cutouts=[]), wall["base_plane"], 0.5, factory
+            )
+            assert list(geom.brep) == _approx_bounds(legacy)
+        assert batched[0].cutout_breps == []
+        assert len(batched[1].cutout_breps) == 1  # degenerate cutout dropped
+
+    def test_cutouts_overlap_panel_on_both_faces(self, wall, sheathing):
+        for geom in create_sheathing_breps(sheathing, wall, None, backend="bounds"):
+            (plo, phi) = geom.brep
+            for clo, chi in geom.cutout_breps:
+                assert all(clo[k] < phi[k] and chi[k] > plo[k] for k in range(3))
+
+    def test_booleans_only_for_panels_with_cutouts(self, wall, sheathing):
+        factory = BoundsFactory()
+        results = create_sheathing_breps_batch(
+            [sheathing], [wall], factory, backend="bounds"
+        )
+
+        geoms = results["w1"]
+        assert len(factory.booleans) == 2
+        assert geoms[0].brep[0] != "cut"
+        assert geoms[1].brep[0] == "cut" and geoms[2].brep[0] == "cut"
+        assert all(g.cutout_breps == [] for g in geoms)
@@ -0,0 +1,77 @@
+# File: tests/sheathing/test_sheathing_layout.py
+"""Tests for the sorted opening sweep used by sheathing layout."""
+
+import random
+
+import pytest
+
+from src.timber_framing_generator.sheathing import SheathingGenerator
+from src.timber_framing_generator.sheathing.sheathing_layout import IntervalSweep
+
+
+def random_openings(rng, wall_length, wall_height, count):
+    """Random openings, some overlapping, some outside the wall."""
+    openings = []
+    for i in range(count):
+        openings.append({
+            "opening_type": rng.choice(["window", "door"]),
+            "u_start": round(rng.uniform(-2, wall_length), 2),
+            "width": round(rng.choice([0.0, rng.uniform(0.5, 6)]), 2),
+            "v_start": round(rng.uniform(0, wall_height), 2),
+            "height": round(rng.uniform(0, 5), 2),
+        })
+    return openings
+
+
+class TestIntervalSweep:
+    """Tests for IntervalSweep."""
+
+    def test_matches_pairwise_overlap(self):
+        rng = random.Random(5)
+        intervals = []
+        for _ in range(200):
+            start = rng.uniform(0, 100)
+            intervals.append((start, start + rng.choice([0.0, rng.uniform(0, 10)])))
+        sweep = IntervalSweep(intervals)
+
+        lo = hi = -1.0
+        while lo < 110:
+            lo += rng.uniform(0, 3)
+            hi = max(hi, lo + rng.uniform(0, 5))
+            expected = [i for i, (s, e) in enumerate(intervals) if s < hi and e > lo]
+            assert sweep.advance(lo, hi) == expected
+
+    def test_rejects_backward_window(self):
+        sweep = IntervalSweep([(0.0, 1.0)])
+        sweep.advance(2.0, 4.0)
+        with pytest.raises(ValueError):
+            sweep.advance(1.0, 4.0)
+
+
+@pytest.mark.parametrize("stagger", [0.0, 2.0])
+@pytest.mark.parametrize("panel_size", ["4x8", "4x10"])
+def test_layout_cutouts_match_scan(stagger, panel_size):
+    """Swept cutouts equal scanning every opening for every panel."""
+    rng = random.Random(f"{stagger}-{panel_size}")
+    wall = {
+        "wall_id": "w",
+        "wall_length": 97.3,
+        "wall_height": 19.5,
+        "openings": random_openings(rng, 97.3, 19.5, 60),
+    }
+    generator = SheathingGenerator(
+        wall, {"panel_size": panel_size, "stagger_offset": stagger}
+    )
+    panels = generator.generate_sheathing()
+
+    assert any(p.cutouts for p in panels)
+    for panel in panels:
+        expected = generator._find_cutouts(
+            panel.u_start, panel.u_end, panel.v_start, panel.v_end
+        )
+        assert panel.cutouts == expected
+        assert panel.is_full_sheet == (
+            not expected
+            and panel.width >= generator.panel_size.width_feet - 0.01
+            and panel.height >= generator.panel_size.height_feet - 0.01
+        )
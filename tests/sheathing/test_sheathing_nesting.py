@@ -0,0 +1,117 @@
+# File: tests/sheathing/test_sheathing_nesting.py
+"""Tests for guillotine sheet nesting of sheathing panels."""
+
+import random
+
+import pytest
+
+from src.timber_framing_generator.sheathing import (
+    SheathingGenerator,
+    SheathingPanel,
+    get_panel_size,
+    get_sheathing_material,
+)
+from src.timber_framing_generator.sheathing.sheathing_nesting import (
+    get_nesting_summary,
+    nest_pieces,
+    nest_sheathing_panels,
+)
+
+PLYWOOD = get_sheathing_material("structural_plywood_7_16")
+STOCK = get_panel_size("4x8")
+
+
+def piece(pid, width, height, material=PLYWOOD):
+    return SheathingPanel(
+        id=pid, wall_id="w", panel_id=None, face="exterior", material=material,
+        u_start=0.0, u_end=width, v_start=0.0, v_end=height, row=0, column=0,
+    )
+
+
+def assert_valid_layout(result, kerf):
+    """Pieces stay on their sheet and are at least a kerf apart."""
+    for sheet in result.sheets:
+        for p in sheet.pieces:
+            assert p.x >= 0 and p.y >= 0
+            assert p.x + p.width <= sheet.width + 1e-6
+            assert p.y + p.height <= sheet.height + 1e-6
+        for i, a in enumerate(sheet.pieces):
+            for b in sheet.pieces[i + 1:]:
+                apart_x = a.x + a.width + kerf <= b.x + 1e-6 or b.x + b.width + kerf <= a.x + 1e-6
+                apart_y = a.y + a.height + kerf <= b.y + 1e-6 or b.y + b.height + kerf <= a.y + 1e-6
+                assert apart_x or apart_y
+
+
+class TestNestPieces:
+    """Tests for nest_pieces."""
+
+    def test_rips_share_a_sheet_without_kerf(self):
+        result = nest_pieces([piece("a", 2.0, 8.0), piece("b", 2.0, 8.0)], STOCK, kerf=0.0)
+        assert result.sheet_count == 1
+        assert result.waste_area == pytest.approx(0.0)
+
+    def test_kerf_is_respected(self):
+        result = nest_pieces([piece("a", 2.0, 8.0), piece("b", 2.0, 8.0)], STOCK)
+        assert result.sheet_count == 2
+
+    def test_top_strips_stack_on_one_sheet(self):
+        strips = [piece(f"s{i}", 4.0, 1.5) for i in range(5)]
+        result = nest_pieces(strips, STOCK)
+        assert result.sheet_count == 1
+        assert [p.y for p in result.sheets[0].pieces] == pytest.approx(
+            [i * (1.5 + 0.125 / 12) for i in range(5)]
+        )
+
+    def test_rotation(self):
+        wide = [piece("wide", 6.0, 3.0)]
+        rotated = nest_pieces(wide, STOCK)
+        assert rotated.sheets[0].pieces[0].rotated
+        assert rotated.sheets[0].pieces[0].width == 3.0
+
+        fixed = nest_pieces(wide, STOCK, allow_rotation=False)
+        assert fixed.sheet_count == 0
+        assert [p.id for p in fixed.unplaced] == ["wide"]
+
+    def test_random_pieces_are_placed_once_without_overlap(self):
+        rng = random.Random(21)
+        pieces = [
+            piece(f"p{i}", round(rng.uniform(0.3, 4.0), 3), round(rng.uniform(0.3, 8.0), 3))
+            for i in range(400)
+        ]
+        kerf = 0.125 / 12
+        result = nest_pieces(pieces, STOCK, kerf=kerf)
+
+        placed = sorted(p.panel_id for s in result.sheets for p in s.pieces)
+        assert placed == sorted(p.id for p in pieces)
+        assert_valid_layout(result, kerf)
+        assert result.sheet_count < len(pieces)
+        total = sum(p.area_gross for p in pieces)
+        assert result.used_area == pytest.approx(total)
+        assert result.stock_area >= total
+
+
+def test_nest_walls_by_material():
+    walls = [
+        {"wall_id": f"w{i}", "wall_length": 13.5 + i, "wall_height": 9.0,
+         "openings": [{"u_start": 3.0, "width": 3.0, "v_start": 3.0, "height": 4.0}]}
+        for i in range(6)
+    ]
+    panels = []
+    for wall in walls:
+        panels.extend(SheathingGenerator(wall).generate_sheathing())
+        panels.extend(
+            SheathingGenerator(wall, {"material": "gypsum_1_2"})
+            .generate_sheathing(face="interior")
+        )
+
+    results = nest_sheathing_panels(panels, stock="4x8")
+
+    assert set(results) == {"structural_plywood_7_16", "gypsum_1_2"}
+    summary = get_nesting_summary(results)
+    assert summary["total_sheets_without_nesting"] == len(panels)
+    assert summary["total_sheets_with_nesting"] < len(panels)
+    for result in results.values():
+        assert result.cutout_area > 0
+        rows = result.cut_list()
+        assert len(rows) == result.piece_count
+        assert result.to_dict()["sheets"] == result.sheet_count
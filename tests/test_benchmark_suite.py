@@ -0,0 +1,119 @@
+# File: tests/test_benchmark_suite.py
+"""Tests for the pipeline benchmark generators and runner."""
+
+import json
+
+from benchmarks.generators import generate_building, layout_framing_members, routing_walls
+from benchmarks.runner import (
+    StageResult,
+    compare_to_baseline,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+from src.timber_framing_generator.core.json_schemas import (
+    deserialize_wall_data,
+    validate_wall_data,
+)
+
+
+class TestGenerators:
+    """Tests for the synthetic building generator."""
+
+    def test_seeded_and_sized(self):
+        a = generate_building(num_walls=50, walls_per_floor=13, seed="s")
+        b = generate_building(num_walls=50, walls_per_floor=13, seed="s")
+        c = generate_building(num_walls=50, walls_per_floor=13, seed="t")
+        assert json.dumps(a.walls) == json.dumps(b.walls)
+        assert a.connectors == b.connectors
+        assert json.dumps(a.walls) != json.dumps(c.walls)
+        assert len(a.walls) == 50
+        assert len(a.floor_bounds) == 4
+
+    def test_walls_are_valid_wall_data(self):
+        building = generate_building(num_walls=20, opening_density=1.0, seed="valid")
+        for wall in building.walls:
+            data = deserialize_wall_data(json.dumps(wall))
+            assert validate_wall_data(data) == (True, [])
+            for opening in wall["openings"]:
+                assert 0 < opening["u_start"] < opening["u_end"] < wall["wall_length"]
+                assert opening["v_end"] <= wall["wall_height"]
+
+    def test_opening_density_and_fixtures(self):
+        none = generate_building(num_walls=40, opening_density=0.0, fixtures_per_floor=0)
+        full = generate_building(num_walls=40, opening_density=1.0, fixtures_per_floor=5)
+        assert none.summary()["openings"] == 0
+        assert full.summary()["openings"] > 40
+        assert none.connectors == []
+        assert {c["wall_id"] for c in full.connectors} <= {w["wall_id"] for w in full.walls}
+        assert len(full.targets) == 2 * len(full.floor_bounds)
+
+    def test_routing_walls_and_members(self):
+        building = generate_building(num_walls=4, seed="members")
+        walls = routing_walls(building.walls)
+        assert walls[0]["id"] == building.walls[0]["wall_id"]
+        assert walls[0]["start_point"] == walls[0]["start"]
+
+        members = layout_framing_members(building.walls)
+        studs = [m for m in members if m["element_type"] == "stud"]
+        assert studs and all(m["profile"]["name"] in ("2x4", "2x6") for m in studs)
+        assert len({m["id"] for m in members}) == len(members)
+
+
+class TestRunner:
+    """Tests for stage measurement and baseline comparison."""
+
+    def test_headless_stages_run(self):
+        run = run_suite(num_walls=12, fixtures_per_floor=2, repeat=1,
+                        stages=["serialize_walls", "panels", "cells", "joints", "sheathing",
+                                "framing_cut_list", "clash_detection", "serialize_panels"])
+        results = {r.name: r for r in run["stages"]}
+        assert all(r.status == "ok" for r in results.values()), results
+        assert results["panels"].summary["walls"] == 12
+        assert results["panels"].peak_kib > 0
+        assert results["clash_detection"].summary["members"] > 0
+        assert results["cells"].summary["cells"] >= results["panels"].summary["panels"]
+
+    def test_summary_independent_of_earlier_stages(self):
+        def clash_summary(stages):
+            run = run_suite(num_walls=12, fixtures_per_floor=2, repeat=1, memory=False,
+                            stages=stages)
+            return {r.name: r for r in run["stages"]}["clash_detection"].summary
+
+        # Panel corner handling modifies nested wall data in place
+        alone = clash_summary(["clash_detection"])
+        assert clash_summary(["panels", "cells", "clash_detection"]) == alone
+
+    def test_stage_needing_missing_output_skips(self):
+        run = run_suite(num_walls=4, stages=["serialize_panels"], repeat=1, memory=False)
+        assert run["stages"][0].status == "skipped"
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            "panels": {"seconds": 0.100, "peak_kib": 1000.0, "summary": {"panels": 10}},
+            "joints": {"seconds": 0.001, "peak_kib": 10.0, "summary": {}},
+        }
+        results = [
+            StageResult("panels", "ok", seconds=0.200, peak_kib=1100.0, summary={"panels": 11}),
+            # 3x slower but below min_seconds
+            StageResult("joints", "ok", seconds=0.003, peak_kib=10.0),
+        ]
+        comparison = compare_to_baseline(results, baseline)
+        assert len(comparison["regressions"]) == 1
+        assert comparison["regressions"][0].startswith("panels")
+        assert len(comparison["changed_outputs"]) == 1
+
+        results[0] = StageResult("panels", "ok", seconds=0.120, peak_kib=2000.0,
+                                 summary={"panels": 10})
+        comparison = compare_to_baseline(results, baseline)
+        assert comparison["regressions"] == ["panels: peak 2000 KiB vs baseline 1000 KiB"]
+
+    def test_save_keeps_other_scenarios(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        first = {"scenario": "a", "stages": [StageResult("panels", "ok", seconds=0.1)]}
+        second = {"scenario": "b", "stages": [StageResult("panels", "skipped")]}
+        save_baseline(first, path)
+        save_baseline(second, path)
+        scenarios = load_baseline(path)["scenarios"]
+        assert set(scenarios) == {"a", "b"}
+        assert scenarios["b"]["stages"] == {}
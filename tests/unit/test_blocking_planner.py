@@ -0,0 +1,196 @@
+# File: tests/unit/test_blocking_planner.py
+
+"""
+Unit tests for the data-first row blocking planner.
+
+The planner works on member u-coordinates only, so these tests run
+without Rhino.
+"""
+
+import math
+
+import pytest
+
+from src.timber_framing_generator.config.framing import BlockingPattern
+from src.timber_framing_generator.core.material_system import (
+    ElementProfile,
+    ElementType,
+    FramingElement,
+    MaterialSystem,
+)
+from src.timber_framing_generator.framing_elements.blocking_planner import (
+    BlockingPlan,
+    assign_vertical_positions,
+    calculate_block_heights,
+    plan_blocking_from_members,
+    plan_row_blocking,
+)
+
+BLOCK_WIDTH = 1.5 / 12
+PROFILE = ElementProfile("2x4", 1.5 / 12, 3.5 / 12, MaterialSystem.TIMBER)
+
+
+@pytest.fixture
+def cells():
+    """Two stud cells around a window with header and sill cripple cells."""
+    return [
+        {"id": "SC_0", "cell_type": "SC", "u_start": 0.0, "u_end": 4.0, "v_start": 0.0, "v_end": 8.0},
+        {"id": "SCC_0", "cell_type": "SCC", "u_start": 4.0, "u_end": 7.0, "v_start": 0.0, "v_end": 3.0},
+        {"id": "HCC_0", "cell_type": "HCC", "u_start": 4.0, "u_end": 7.0, "v_start": 6.5, "v_end": 8.0},
+        {"id": "SC_1", "cell_type": "SC", "u_start": 7.0, "u_end": 12.0, "v_start": 0.0, "v_end": 8.0},
+    ]
+
+
+class TestBlockHeights:
+    """Tests for calculate_block_heights."""
+
+    def test_first_height_and_spacing(self):
+        assert calculate_block_heights(8.0, 2.0, 4.0) == [2.0, 6.0]
+        assert calculate_block_heights(10.0, 1.0, 2.0) == [1.0, 3.0, 5.0, 7.0, 9.0]
+
+    def test_thirds_without_first_height(self):
+        assert calculate_block_heights(9.0, None, 4.0) == [3.0, 6.0]
+
+
+class TestAssignVerticalPositions:
+    """Tests for assign_vertical_positions."""
+
+    def test_members_go_to_their_cells(self, cells):
+        positions = assign_vertical_positions(
+            cells, 8.0,
+            stud_positions=[1.333, 2.667, 8.333, 9.667, 11.0],
+            king_stud_positions=[3.9, 7.1],
+            header_cripple_positions=[5.5],
+            sill_cripple_positions=[5.0, 6.0],
+        )
+        assert positions["SC_0"]["positions"] == [1.333, 2.667, 3.9]
+        assert positions["SC_1"]["positions"] == [8.333, 9.667, 11.0, 7.1]
+        assert positions["HCC_0"]["positions"] == [5.5]
+        assert positions["SCC_0"]["positions"] == [5.0, 6.0]
+        assert positions["HCC_0"]["v_start"] == 6.5
+
+    def test_stud_on_shared_edge_goes_to_first_cell_only(self, cells):
+        positions = assign_vertical_positions(cells, 8.0, stud_positions=[4.0])
+        assert positions["SC_0"]["positions"] == [4.0]
+        assert "SC_1" not in positions
+
+    def test_king_studs_deduplicated(self, cells):
+        positions = assign_vertical_positions(
+            cells, 8.0, stud_positions=[3.95], king_stud_positions=[3.9]
+        )
+        assert positions["SC_0"]["positions"] == [3.95]
+
+
+class TestPlanRowBlocking:
+    """Tests for plan_row_blocking."""
+
+    def test_inline_blocks_between_studs(self):
+        cell_positions = {"SC_0": {"positions": [2.0, 0.0, 1.0], "v_start": 0.0, "v_end": 8.0}}
+        plan = plan_row_blocking(cell_positions, [2.0, 6.0], BLOCK_WIDTH)
+
+        assert len(plan) == 4
+        assert plan.heights == [2.0, 6.0, 2.0, 6.0]
+        half_stud = 0.125 / 2
+        assert plan.u_starts[0] == pytest.approx(0.0 + half_stud)
+        assert plan.u_ends[0] == pytest.approx(1.0 - half_stud)
+        assert all(length == pytest.approx(1.0 - 0.125) for length in plan.lengths)
+
+    def test_skips_narrow_bays_and_rows_outside_cell(self):
+        cell_positions = {
+            "SCC_0": {"positions": [4.0, 4.3, 5.5], "v_start": 0.0, "v_end": 3.0},
+        }
+        plan = plan_row_blocking(cell_positions, [2.0, 6.0], BLOCK_WIDTH)
+        # Bay 4.0-4.3 is under 6"; row 6.0 is above the cell
+        assert plan.u_centers == [pytest.approx(4.9)]
+        assert plan.heights == [2.0]
+
+    def test_list_format_and_string_positions(self):
+        plan = plan_row_blocking({"c": ["0.0", "1.3333", "bad"]}, [2.0], BLOCK_WIDTH, wall_height=8.0)
+        assert len(plan) == 1
+
+    def test_staggered_alternates_bays(self):
+        cell_positions = {"SC_0": {"positions": [0.0, 1.0, 2.0, 3.0], "v_start": 0.0, "v_end": 8.0}}
+        plan = plan_row_blocking(
+            cell_positions, [2.0], BLOCK_WIDTH, pattern=BlockingPattern.STAGGERED
+        )
+        assert plan.heights == [2.0, 2.0 + BLOCK_WIDTH, 2.0]
+
+    def test_staggered_flips_offset_at_cell_top(self):
+        cell_positions = {"SCC_0": {"positions": [0.0, 1.0, 2.0], "v_start": 0.0, "v_end": 2.15}}
+        plan = plan_row_blocking(
+            cell_positions, [2.0], BLOCK_WIDTH, pattern=BlockingPattern.STAGGERED
+        )
+        assert plan.heights == [2.0, 2.0 - BLOCK_WIDTH]
+
+
+class TestPlanOutput:
+    """Tests for world-space output of a BlockingPlan."""
+
+    def test_centerlines_follow_wall_plane(self):
+        plan = BlockingPlan(cell_ids=["c"], u_starts=[1.0], u_ends=[2.0], heights=[2.0])
+        s = math.sqrt(0.5)
+        plane = {
+            "origin": {"x": 10.0, "y": 0.0, "z": 100.0},
+            "x_axis": {"x": s, "y": s, "z": 0.0},
+            "y_axis": {"x": 0.0, "y": 0.0, "z": 1.0},
+        }
+        starts, ends = plan.centerlines(plane)
+        assert starts[0] == pytest.approx((10.0 + s, s, 102.0))
+        assert ends[0] == pytest.approx((10.0 + 2 * s, 2 * s, 102.0))
+
+    def test_to_framing_elements(self):
+        plan = BlockingPlan(cell_ids=["c"], u_starts=[1.0], u_ends=[2.0], heights=[2.0])
+        plane = {"origin": {"x": 0, "y": 0, "z": 0}, "x_axis": {"x": 1}, "y_axis": {"z": 1, "y": 0}}
+        (element,) = plan.to_framing_elements(plane, PROFILE, wall_id="w1")
+        assert element.id == "blocking_0"
+        assert element.element_type == ElementType.ROW_BLOCKING
+        assert element.length == pytest.approx(1.0)
+        assert element.u_coord == pytest.approx(1.5)
+        assert element.v_start == pytest.approx(2.0 - PROFILE.width / 2)
+        assert element.metadata["wall_id"] == "w1"
+
+
+def test_plan_blocking_from_members(cells):
+    def vertical(element_type, u):
+        return FramingElement(
+            id=f"{element_type.value}_{u}", element_type=element_type, profile=PROFILE,
+            centerline_start=(u, 0.0, 0.0), centerline_end=(u, 0.0, 8.0),
+            u_coord=u, v_start=0.0, v_end=8.0,
+        )
+
+    members = [
+        vertical(ElementType.STUD, 0.0625),
+        vertical(ElementType.STUD, 1.333),
+        vertical(ElementType.STUD, 2.667),
+        vertical(ElementType.KING_STUD, 3.9),
+        vertical(ElementType.TRIMMER, 4.0),
+        vertical(ElementType.HEADER_CRIPPLE, 5.5),
+    ]
+    plan = plan_blocking_from_members(
+        cells, members, 8.0, BLOCK_WIDTH, calculate_block_heights(8.0, 2.0, 4.0)
+    )
+    # 3 bays in SC_0 x 2 rows; trimmers are ignored, HCC has a single cripple
+    assert len(plan) == 6
+    assert set(plan.cell_ids) == {"SC_0"}
+
+
+def test_plan_blocking_trimmers_bound_sill_cripple_cells():
+    """With include_trimmers, trimmers close the bays of an SCC cell."""
+    def vertical(element_type, u):
+        return FramingElement(
+            id=f"{element_type.value}_{u}", element_type=element_type, profile=PROFILE,
+            centerline_start=(u, 0.0, 0.0), centerline_end=(u, 0.0, 8.0),
+            u_coord=u, v_start=0.0, v_end=8.0,
+        )
+
+    cells = [{"id": "SCC_0", "cell_type": "SCC", "u_start": 4.0, "u_end": 7.0, "v_start": 0.0, "v_end": 3.0}]
+    members = [
+        vertical(ElementType.TRIMMER, 4.0),
+        vertical(ElementType.SILL_CRIPPLE, 5.5),
+        vertical(ElementType.TRIMMER, 7.0),
+    ]
+    without = plan_blocking_from_members(cells, members, 8.0, BLOCK_WIDTH, [2.0])
+    plan = plan_blocking_from_members(cells, members, 8.0, BLOCK_WIDTH, [2.0], include_trimmers=True)
+    assert len(without) == 0
+    assert plan.cell_ids == ["SCC_0", "SCC_0"]
+    assert plan.u_starts == pytest.approx([4.0625, 5.5625])
@@ -29,6 +29,8 @@ from src.timber_framing_generator.materials.cfs import (
     list_available_profiles,
 )
 from src.timber_framing_generator.materials.cfs.cfs_profiles import (
+    CFS_PROFILE_TABLE,
+    DEFAULT_CFS_PROFILES_LOAD_BEARING,
     get_stud_profiles,
     get_track_profiles,
 )
@@ -196,6 +198,35 @@ class TestGetCFSProfile:
         profile = get_cfs_profile(ElementType.STUD)
         assert profile is not None
 
+    def test_wall_thickness_selects_series(self):
+        """6" walls move the default to the 600 series."""
+        profile = get_cfs_profile(ElementType.STUD, wall_thickness_inches=6.0)
+        assert profile.name.startswith("600S")
+        assert profile.name.endswith("-54")
+
+    def test_load_bearing_uses_structural_defaults(self):
+        profile = get_cfs_profile(ElementType.STUD, is_load_bearing=True)
+        assert profile.name == DEFAULT_CFS_PROFILES_LOAD_BEARING[ElementType.STUD]
+
+    def test_missing_flange_falls_back_within_series(self):
+        """A series without the default flange uses another flange, same gauge."""
+        profile = get_cfs_profile(ElementType.TOP_PLATE, wall_thickness_inches=8.0)
+        assert profile.name.startswith("800T")
+        assert profile.name.endswith("-54")
+
+    def test_table_covers_every_element_type(self):
+        """Default resolution is a table hit for every element type."""
+        for element_type in ElementType:
+            for is_load_bearing in (False, True):
+                assert (element_type, None, is_load_bearing) in CFS_PROFILE_TABLE
+                assert (element_type, "600", is_load_bearing) in CFS_PROFILE_TABLE
+
+    def test_lookup_returns_table_entry(self):
+        """Near-series thicknesses hit the same precomputed profile."""
+        expected = CFS_PROFILE_TABLE[(ElementType.KING_STUD, "550", True)]
+        profile = get_cfs_profile(ElementType.KING_STUD, wall_thickness_inches=5.4, is_load_bearing=True)
+        assert profile is expected
+
 
 # =============================================================================
 # list_available_profiles() Tests
@@ -0,0 +1,162 @@
+# File: tests/unit/test_geometry_batch.py
+"""
+Unit tests for batched box geometry creation.
+
+The box math is checked against the original corner-enumeration
+algorithm from RhinoCommonFactory.create_box_brep_from_centerline.
+"""
+
+import random
+
+import pytest
+
+from src.timber_framing_generator.core.json_schemas import (
+    FramingElementData, Point3D, ProfileData,
+)
+from src.timber_framing_generator.utils.geometry_batch import (
+    BoundsBackend,
+    CenterlineArrays,
+    GeometryBackend,
+    compute_box_bounds,
+    compute_box_bounds_batch,
+    create_box_breps_from_centerlines,
+    get_backend,
+)
+
+try:
+    import rhino3dm  # noqa: F401
+    RHINO3DM_AVAILABLE = True
+except ImportError:
+    RHINO3DM_AVAILABLE = False
+
+
+def corner_bounds(start, direction, length, width, depth, x_axis=None, z_axis=None):
+    """Reference implementation: enumerate the 8 box corners."""
+    sx, sy, sz = start
+    dx, dy, dz = direction
+    mag = (dx*dx + dy*dy + dz*dz) ** 0.5
+    dx, dy, dz = dx/mag, dy/mag, dz/mag
+    ex, ey, ez = sx + dx*length, sy + dy*length, sz + dz*length
+    if abs(dz) > 0.9:
+        perp1, perp2 = (x_axis, z_axis) if x_axis and z_axis else ((1, 0, 0), (0, 1, 0))
+        half_w, half_d = width / 2, depth / 2
+    else:
+        p1x, p1y = -dy, dx
+        m = (p1x*p1x + p1y*p1y) ** 0.5
+        perp1 = (p1x/m, p1y/m, 0.0)
+        perp2 = (-dz*perp1[1], dz*perp1[0], dx*perp1[1] - dy*perp1[0])
+        half_w, half_d = depth / 2, width / 2
+    corners = []
+    for px, py, pz in [(sx, sy, sz), (ex, ey, ez)]:
+        for ws in (-1, 1):
+            for ds in (-1, 1):
+                corners.append(tuple(
+                    p + perp1[i]*half_w*ws + perp2[i]*half_d*ds
+                    for i, p in enumerate((px, py, pz))
+                ))
+    return (
+        tuple(min(c[i] for c in corners) for i in range(3)),
+        tuple(max(c[i] for c in corners) for i in range(3)),
+    )
+
+
+def make_element(start, end, metadata=None):
+    return FramingElementData(
+        id="e",
+        element_type="stud",
+        profile=ProfileData(name="2x4", width=0.125, depth=0.292, material_system="timber"),
+        centerline_start=Point3D(*start),
+        centerline_end=Point3D(*end),
+        u_coord=0.0,
+        v_start=0.0,
+        v_end=8.0,
+        metadata=metadata or {},
+    )
+
+
+class TestComputeBoxBounds:
+    """Tests for compute_box_bounds."""
+
+    def test_vertical_stud_world_axes(self):
+        bounds = compute_box_bounds((0, 0, 0), (0, 0, 1), 8.0, 0.125, 0.292)
+        assert bounds[0] == pytest.approx((-0.0625, -0.146, 0.0))
+        assert bounds[1] == pytest.approx((0.0625, 0.146, 8.0))
+
+    def test_horizontal_plate_swaps_width_and_depth(self):
+        bounds = compute_box_bounds((0, 0, 0), (1, 0, 0), 10.0, 0.125, 0.292)
+        assert bounds[0] == pytest.approx((0.0, -0.146, -0.0625))
+        assert bounds[1] == pytest.approx((10.0, 0.146, 0.0625))
+
+    def test_matches_corner_enumeration(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            start = tuple(rng.uniform(-50, 50) for _ in range(3))
+            if rng.random() < 0.5:
+                direction = (rng.uniform(-0.1, 0.1), rng.uniform(-0.1, 0.1), 1.0)
+                x_axis = (0.6, 0.8, 0.0)
+                z_axis = (-0.8, 0.6, 0.0)
+            else:
+                direction = (rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-0.3, 0.3))
+                x_axis = z_axis = None
+            args = (start, direction, rng.uniform(0.5, 20), 0.125, 0.292, x_axis, z_axis)
+            expected = corner_bounds(*args)
+            actual = compute_box_bounds(*args)
+            for got, want in zip(actual, expected):
+                assert got == pytest.approx(want, abs=1e-9)
+
+
+class TestBatch:
+    """Tests for columnar batch creation."""
+
+    def test_from_elements_reads_wall_axes(self):
+        arrays = CenterlineArrays.from_elements([
+            make_element((0, 0, 0), (0, 0, 8), {"wall_x_axis": [0, 1, 0], "wall_z_axis": [1, 0, 0]}),
+            make_element((1, 0, 0), (1, 0, 8)),
+        ])
+        assert len(arrays) == 2
+        assert arrays.wall_x_axes == [[0, 1, 0], None]
+        assert arrays.widths == [0.125, 0.125]
+
+    def test_batch_matches_single_and_skips_degenerate(self):
+        arrays = CenterlineArrays()
+        arrays.append((0, 0, 0), (0, 0, 8), 0.125, 0.292)
+        arrays.append((0, 0, 0), (0, 0, 0.0001), 0.125, 0.292)
+        arrays.append((0, 0, 1), (10, 0, 1), 0.125, 0.292)
+
+        bounds = compute_box_bounds_batch(arrays)
+
+        assert bounds[0] == compute_box_bounds((0, 0, 0), (0, 0, 1), 8.0, 0.125, 0.292)
+        assert bounds[1] is None
+        assert bounds[2] == compute_box_bounds((0, 0, 1), (1, 0, 0), 10.0, 0.125, 0.292)
+
+    def test_bounds_backend(self):
+        arrays = CenterlineArrays()
+        arrays.append((0, 0, 0), (0, 0, 8), 0.125, 0.292)
+        result = create_box_breps_from_centerlines(arrays, backend="bounds")
+        assert result == compute_box_bounds_batch(arrays)
+        assert BoundsBackend().create_line_curves([(0, 0, 0)], [(1, 1, 1)]) == [
+            ((0, 0, 0), (1, 1, 1))
+        ]
+
+    def test_incomplete_backend_rejected(self):
+        """Backends must implement every method to be created."""
+        class BoxesOnly(GeometryBackend):
+            def create_box_breps(self, bounds):
+                return list(bounds)
+
+        with pytest.raises(TypeError):
+            BoxesOnly()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_backend("nope")
+
+    @pytest.mark.skipif(not RHINO3DM_AVAILABLE, reason="rhino3dm not available")
+    def test_rhino3dm_backend(self):
+        arrays = CenterlineArrays()
+        arrays.append((0, 0, 0), (0, 0, 8), 0.125, 0.292)
+        arrays.append((0, 0, 0), (0, 0, 0), 0.125, 0.292)
+        breps = create_box_breps_from_centerlines(arrays, backend="rhino3dm")
+        assert breps[1] is None
+        bbox = breps[0].GetBoundingBox()
+        assert bbox.Max.Z == pytest.approx(8.0)
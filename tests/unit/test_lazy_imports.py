@@ -0,0 +1,165 @@
+# File: tests/unit/test_lazy_imports.py
+"""
+Unit tests for the lazy import surface and the changed-module reload helper.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.timber_framing_generator.utils.lazy_imports import (
+    LazyModule,
+    lazy_exports,
+    optional_import,
+)
+from src.timber_framing_generator.dev_utils.reload_modules import (
+    reload_changed_modules,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_isolated(code: str) -> str:
+    """Run code in a fresh interpreter from the project root."""
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, check=True,
+    )
+    return proc.stdout.strip()
+
+
+class TestLazyPackages:
+    """Package __init__ files only import submodules on first access."""
+
+    def test_routing_package_import_is_light(self):
+        out = run_isolated(
+            "import sys\n"
+            "import src.timber_framing_generator.mep.routing as r\n"
+            "print('oahs_router' in str(sorted(sys.modules)))\n"
+            "r.OccupancyMap\n"
+            "print('mep.routing.occupancy' in str(sorted(sys.modules)))\n"
+            "print('mep.routing.orchestrator' in str(sorted(sys.modules)))\n"
+        )
+        assert out.split() == ["False", "True", "False"]
+
+    def test_from_import_and_star_import(self):
+        from src.timber_framing_generator.core import WallData
+        from src.timber_framing_generator.core.json_schemas import WallData as Direct
+        assert WallData is Direct
+
+        namespace = {}
+        exec("from src.timber_framing_generator.panels import *", namespace)
+        assert "decompose_all_walls" in namespace
+
+    def test_unknown_attribute_raises(self):
+        import src.timber_framing_generator.families as families
+        with pytest.raises(AttributeError):
+            families.DoesNotExist
+
+    def test_lazy_exports_caches_in_globals(self):
+        package_globals = {}
+        getattr_fn, dir_fn = lazy_exports("json", {"dumps": ".decoder"}, package_globals)
+        # ".decoder" resolved relative to "json"; dumps is not there
+        with pytest.raises(AttributeError):
+            getattr_fn("dumps")
+        getattr_fn, dir_fn = lazy_exports("json", {"JSONDecoder": ".decoder"}, package_globals)
+        value = getattr_fn("JSONDecoder")
+        assert package_globals["JSONDecoder"] is value
+        assert "JSONDecoder" in dir_fn()
+
+
+class TestOptionalImport:
+    """Tests for optional_import."""
+
+    def test_missing_module(self):
+        module, available = optional_import("definitely_not_a_module_xyz")
+        assert module is None
+        assert available is False
+
+    def test_deferred_import(self):
+        out = run_isolated(
+            "import sys\n"
+            "from src.timber_framing_generator.utils.lazy_imports import optional_import\n"
+            "mod, ok = optional_import('xml.dom.minidom')\n"
+            "print(ok, 'xml.dom.minidom' in sys.modules)\n"
+            "mod.parseString('<a/>')\n"
+            "print('xml.dom.minidom' in sys.modules)\n"
+        )
+        assert out.split() == ["True", "False", "True"]
+
+    def test_already_imported_returns_real_module(self):
+        module, available = optional_import("json")
+        assert available is True
+        assert not isinstance(module, LazyModule)
+
+
+class TestReloadChangedModules:
+    """Tests for reload_changed_modules."""
+
+    def test_evicts_changed_module_and_dependents(self, tmp_path, monkeypatch):
+        pkg = tmp_path / "tfg_reload_pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "base.py").write_text("VALUE = 1\nclass Thing:\n    pass\n")
+        (pkg / "user.py").write_text("from .base import Thing\n")
+        (pkg / "other.py").write_text("X = 2\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        import tfg_reload_pkg.base
+        import tfg_reload_pkg.user
+        import tfg_reload_pkg.other  # noqa: F401
+        try:
+            # First call only records mtimes
+            assert reload_changed_modules(["tfg_reload_pkg"]) == []
+
+            base_file = pkg / "base.py"
+            stat = base_file.stat()
+            os.utime(base_file, (stat.st_atime, stat.st_mtime + 10))
+
+            evicted = reload_changed_modules(["tfg_reload_pkg"])
+            assert evicted == ["tfg_reload_pkg.base", "tfg_reload_pkg.user"]
+            assert "tfg_reload_pkg.other" in sys.modules
+        finally:
+            for name in [k for k in sys.modules if k.startswith("tfg_reload_pkg")]:
+                del sys.modules[name]
+
+    @pytest.mark.parametrize("write_bytecode", [True, False])
+    def test_edit_between_import_and_next_call(self, tmp_path, monkeypatch, write_bytecode):
+        """Mirror a Grasshopper script: check, import, edit, check again."""
+        monkeypatch.setattr(sys, "dont_write_bytecode", not write_bytecode)
+        pkg = tmp_path / "tfg_reload_gap"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        mod_file = pkg / "mod.py"
+        mod_file.write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        def edit(value):
+            # Distinct whole seconds so the import system rejects the old pyc
+            mod_file.write_text(f"VALUE = {value}\n")
+            future = time.time() + 10 * value
+            os.utime(mod_file, (future, future))
+
+        try:
+            # Solve 1: nothing imported yet, then the script imports
+            assert reload_changed_modules(["tfg_reload_gap"]) == []
+            import tfg_reload_gap.mod
+            assert tfg_reload_gap.mod.VALUE == 1
+
+            # Solve 2 after an edit: the module is seen for the first time
+            edit(2)
+            assert reload_changed_modules(["tfg_reload_gap"]) == ["tfg_reload_gap.mod"]
+            import tfg_reload_gap.mod
+            assert tfg_reload_gap.mod.VALUE == 2
+
+            # Solve 3 after another edit to the re-imported module
+            edit(3)
+            assert reload_changed_modules(["tfg_reload_gap"]) == ["tfg_reload_gap.mod"]
+            import tfg_reload_gap.mod
+            assert tfg_reload_gap.mod.VALUE == 3
+        finally:
+            for name in [k for k in sys.modules if k.startswith("tfg_reload_gap")]:
+                del sys.modules[name]
@@ -0,0 +1,314 @@
+# File: tests/unit/test_strategy_concurrency.py
+"""
+Thread-safety tests for framing strategies.
+
+Tests cover:
+- generate_framing threads one GenerationContext through every step
+- Contexts are per call: direct create_* calls share nothing
+- A registered-style shared strategy instance framing 1,000 walls from
+  many threads produces exactly the serial output
+- The same stress test for the real timber and CFS strategies (Rhino only)
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.timber_framing_generator.core.material_system import (
+    ElementProfile,
+    ElementType,
+    FramingElement,
+    FramingStrategy,
+    GenerationContext,
+    MaterialSystem,
+)
+
+try:
+    import Rhino.Geometry  # noqa: F401
+    RHINO_AVAILABLE = True
+except ImportError:
+    RHINO_AVAILABLE = False
+
+WALL_COUNT = 1000
+WORKERS = 32
+
+PROFILE = ElementProfile("2x4", 1.5 / 12, 3.5 / 12, MaterialSystem.TIMBER)
+
+
+def _yield_thread() -> None:
+    """Give other threads a chance to interleave between steps."""
+    time.sleep(random.random() * 0.0002)
+
+
+def _element(
+    element_id: str,
+    element_type: ElementType,
+    u: float,
+    v_start: float,
+    v_end: float,
+    wall_id: str
+) -> FramingElement:
+    return FramingElement(
+        id=element_id,
+        element_type=element_type,
+        profile=PROFILE,
+        centerline_start=(u, 0.0, v_start),
+        centerline_end=(u, 0.0, v_end),
+        u_coord=u,
+        v_start=v_start,
+        v_end=v_end,
+        metadata={"wall_id": wall_id},
+    )
+
+
+class ContextStrategy(FramingStrategy):
+    """
+    Minimal strategy whose later steps depend on earlier steps' state.
+
+    Plates record the wall's stud zone in the context; studs, headers
+    and blocking read it back. Any state leaking between walls shows up
+    as elements with another wall's dimensions.
+    """
+
+    @property
+    def material_system(self) -> MaterialSystem:
+        return MaterialSystem.TIMBER
+
+    @property
+    def default_profiles(self) -> Dict[ElementType, ElementProfile]:
+        return {ElementType.STUD: PROFILE}
+
+    def get_generation_sequence(self) -> List[ElementType]:
+        return [ElementType.BOTTOM_PLATE, ElementType.STUD]
+
+    def get_element_types(self) -> List[ElementType]:
+        return [ElementType.BOTTOM_PLATE, ElementType.TOP_PLATE, ElementType.STUD]
+
+    def create_horizontal_members(
+        self,
+        wall_data: Dict[str, Any],
+        cell_data: Dict[str, Any],
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
+    ) -> List[FramingElement]:
+        context = context or GenerationContext()
+        plate = PROFILE.width
+        length = wall_data["wall_length"]
+        height = wall_data["wall_height"]
+        context.state["stud_zone"] = (plate, height - 2 * plate, length)
+        _yield_thread()
+        return [
+            _element("bottom_plate_0", ElementType.BOTTOM_PLATE, length / 2, 0.0, plate, context.wall_id),
+            _element("top_plate_0", ElementType.TOP_PLATE, length / 2, height - plate, height, context.wall_id),
+        ]
+
+    def create_vertical_members(
+        self,
+        wall_data: Dict[str, Any],
+        cell_data: Dict[str, Any],
+        horizontal_members: List[FramingElement],
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
+    ) -> List[FramingElement]:
+        context = context or GenerationContext()
+        if "stud_zone" not in context.state:
+            return []
+        bottom, top, length = context.state["stud_zone"]
+        _yield_thread()
+        spacing = config.get("stud_spacing", 16 / 12)
+        count = int(length // spacing) + 1
+        context.state["stud_us"] = [min(i * spacing, length) for i in range(count)]
+        return [
+            _element(f"stud_{i}", ElementType.STUD, u, bottom, top, context.wall_id)
+            for i, u in enumerate(context.state["stud_us"])
+        ]
+
+    def create_opening_members(
+        self,
+        wall_data: Dict[str, Any],
+        cell_data: Dict[str, Any],
+        existing_members: List[FramingElement],
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
+    ) -> List[FramingElement]:
+        context = context or GenerationContext()
+        _, top, _ = context.state["stud_zone"]
+        _yield_thread()
+        return [
+            _element(f"header_{i}", ElementType.HEADER, opening["u_start"], top - 1.0, top, context.wall_id)
+            for i, opening in enumerate(wall_data.get("openings", []))
+        ]
+
+    def create_bracing_members(
+        self,
+        wall_data: Dict[str, Any],
+        cell_data: Dict[str, Any],
+        existing_members: List[FramingElement],
+        config: Dict[str, Any],
+        context: Optional[GenerationContext] = None
+    ) -> List[FramingElement]:
+        context = context or GenerationContext()
+        bottom, top, _ = context.state["stud_zone"]
+        mid = (bottom + top) / 2
+        _yield_thread()
+        return [
+            _element(f"blocking_{i}", ElementType.ROW_BLOCKING, u, mid, mid + PROFILE.depth, context.wall_id)
+            for i, u in enumerate(context.state["stud_us"][:-1])
+        ]
+
+
+def make_walls(count: int) -> List[Dict[str, Any]]:
+    """Walls of varied size, each with a unique ID."""
+    rng = random.Random("strategy-concurrency")
+    walls = []
+    for i in range(count):
+        length = rng.uniform(4.0, 40.0)
+        walls.append({
+            "wall_id": f"wall_{i}",
+            "wall_length": length,
+            "wall_height": rng.choice([8.0, 9.0, 10.0, 12.0]),
+            "openings": [
+                {"u_start": rng.uniform(0.0, length - 3.0)}
+                for _ in range(rng.randint(0, 3))
+            ],
+        })
+    return walls
+
+
+def signature(elements: List[FramingElement]) -> List[tuple]:
+    """Comparable summary of a wall's elements."""
+    return [
+        (e.id, e.element_type, e.metadata.get("wall_id"), round(e.u_coord, 9),
+         round(e.v_start, 9), round(e.v_end, 9))
+        for e in elements
+    ]
+
+
+def run_walls(strategy: FramingStrategy, walls, cells, config, workers: int) -> List[List[tuple]]:
+    """Frame every wall with one shared strategy, serially or on a thread pool."""
+    def frame(i):
+        return signature(strategy.generate_framing(walls[i], cells[i], config))
+
+    if workers == 1:
+        return [frame(i) for i in range(len(walls))]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(frame, range(len(walls))))
+
+
+class TestGenerationContext:
+    """Test per-call generation contexts."""
+
+    def test_context_defaults(self):
+        """A new context is empty."""
+        context = GenerationContext()
+        assert context.wall_id == "unknown"
+        assert context.state == {}
+
+    def test_contexts_do_not_share_state(self):
+        """Each context has its own state dict."""
+        a, b = GenerationContext(), GenerationContext()
+        a.state["plates"] = [1]
+        assert b.state == {}
+
+    def test_generate_framing_threads_one_context(self):
+        """Later steps see state recorded by earlier steps of the same call."""
+        strategy = ContextStrategy()
+        wall = make_walls(1)[0]
+        elements = strategy.generate_framing(wall, {"wall_id": wall["wall_id"]})
+        types = {e.element_type for e in elements}
+        assert ElementType.STUD in types
+        assert ElementType.ROW_BLOCKING in types
+        assert {e.metadata["wall_id"] for e in elements} == {wall["wall_id"]}
+
+    def test_direct_calls_share_nothing(self):
+        """Without a context, a step cannot see another call's state."""
+        strategy = ContextStrategy()
+        wall = make_walls(1)[0]
+        strategy.create_horizontal_members(wall, {}, {})
+        assert strategy.create_vertical_members(wall, {}, [], {}) == []
+
+    def test_direct_calls_with_shared_context(self):
+        """Callers driving the steps themselves pass one context through."""
+        strategy = ContextStrategy()
+        wall = make_walls(1)[0]
+        context = GenerationContext(wall_id=wall["wall_id"])
+        strategy.create_horizontal_members(wall, {}, {}, context)
+        studs = strategy.create_vertical_members(wall, {}, [], {}, context)
+        assert studs
+        assert "stud_us" in context.state
+
+
+class TestConcurrentFraming:
+    """Stress one shared strategy instance from many threads."""
+
+    def test_thousand_walls_match_serial(self):
+        """Concurrent output equals serial output, wall for wall."""
+        strategy = ContextStrategy()
+        walls = make_walls(WALL_COUNT)
+        cells = [{"wall_id": w["wall_id"]} for w in walls]
+        config = {"stud_spacing": 16 / 12}
+
+        serial = run_walls(strategy, walls, cells, config, workers=1)
+        concurrent = run_walls(strategy, walls, cells, config, workers=WORKERS)
+
+        assert len(concurrent) == WALL_COUNT
+        assert concurrent == serial
+        for wall, elements in zip(walls, concurrent):
+            assert {e[2] for e in elements} == {wall["wall_id"]}
+
+
+def _rhino_walls(count: int):
+    """JSON walls with a single stud cell each, as the cell decomposer emits."""
+    from benchmarks.generators import generate_building
+
+    walls = generate_building(count, opening_density=0.5, fixtures_per_floor=0, seed="strategy").walls
+    cells = []
+    for wall in walls:
+        length, height = wall["wall_length"], wall["wall_height"]
+        origin = wall["base_plane"]["origin"]
+        x_axis = wall["base_plane"]["x_axis"]
+
+        def point(u, v):
+            return {
+                "x": origin["x"] + x_axis["x"] * u,
+                "y": origin["y"] + x_axis["y"] * u,
+                "z": origin["z"] + v,
+            }
+
+        cells.append({
+            "wall_id": wall["wall_id"],
+            "cells": [{
+                "id": f"{wall['wall_id']}_SC_0",
+                "cell_type": "SC",
+                "u_start": 0.0, "u_end": length,
+                "v_start": 0.0, "v_end": height,
+                "corners": {
+                    "bottom_left": point(0.0, 0.0),
+                    "bottom_right": point(length, 0.0),
+                    "top_right": point(length, height),
+                    "top_left": point(0.0, height),
+                },
+            }],
+        })
+    return walls, cells
+
+
+@pytest.mark.skipif(not RHINO_AVAILABLE, reason="Rhino not available")
+@pytest.mark.parametrize("material", [MaterialSystem.TIMBER, MaterialSystem.CFS])
+def test_registered_strategies_thousand_walls(material):
+    """The registered timber and CFS strategies are safe to share across threads."""
+    import src.timber_framing_generator.materials  # noqa: F401  (registers strategies)
+    from src.timber_framing_generator.core.material_system import get_framing_strategy
+
+    strategy = get_framing_strategy(material)
+    walls, cells = _rhino_walls(WALL_COUNT)
+    config = {"include_blocking": True}
+
+    serial = run_walls(strategy, walls, cells, config, workers=1)
+    concurrent = run_walls(strategy, walls, cells, config, workers=WORKERS)
+
+    assert concurrent == serial
+    assert any(serial)
@@ -0,0 +1,163 @@
+# File: tests/unit/test_wall_frame.py
+"""
+Unit tests for shared wall frames.
+
+Tests cover:
+- Forward conversion matches Plane.PointAt math, single and bulk
+- Inverse conversion round-trips, including non-orthogonal axes
+- Plane representations: JSON dict, PlaneData, Rhino-style objects
+- wall_frame() caching by plane coefficients
+- Modules sharing the frame (sheathing, holddowns)
+- Parity with RhinoCommon Plane.PointAt (Rhino only)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.timber_framing_generator.core.json_schemas import PlaneData, Point3D, Vector3D
+from src.timber_framing_generator.framing_elements.holddowns import _calculate_point
+from src.timber_framing_generator.sheathing.sheathing_geometry import uvw_to_world
+from src.timber_framing_generator.utils.wall_frame import (
+    WallFrame,
+    clear_frame_cache,
+    wall_frame,
+)
+
+try:
+    import Rhino.Geometry as rg
+    RHINO_AVAILABLE = True
+except ImportError:
+    RHINO_AVAILABLE = False
+
+
+def plane_dict(origin=(1.0, 2.0, 3.0), x_axis=(0.6, 0.8, 0.0), y_axis=(0.0, 0.0, 1.0),
+               z_axis=(0.8, -0.6, 0.0)):
+    def vec(v):
+        return {"x": v[0], "y": v[1], "z": v[2]}
+    return {"origin": vec(origin), "x_axis": vec(x_axis), "y_axis": vec(y_axis), "z_axis": vec(z_axis)}
+
+
+def rhino_like(plane):
+    """Object with RhinoCommon's Origin/XAxis/YAxis/ZAxis attributes."""
+    def vec(d):
+        return SimpleNamespace(X=d["x"], Y=d["y"], Z=d["z"])
+    return SimpleNamespace(Origin=vec(plane["origin"]), XAxis=vec(plane["x_axis"]),
+                           YAxis=vec(plane["y_axis"]), ZAxis=vec(plane["z_axis"]))
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_frame_cache()
+    yield
+    clear_frame_cache()
+
+
+# =============================================================================
+# Test: conversion
+# =============================================================================
+
+class TestConversion:
+    """Test wall <-> world conversion."""
+
+    def test_to_world_point(self):
+        """world = origin + u*X + v*Y + w*Z."""
+        frame = WallFrame.from_plane(plane_dict())
+        assert frame.to_world_point(5.0, 2.0, 1.0) == pytest.approx((4.8, 5.4, 5.0))
+
+    def test_bulk_matches_single(self):
+        """to_world gives the same points as to_world_point."""
+        frame = WallFrame.from_plane(plane_dict())
+        uvw = [(0.0, 0.0, 0.0), (3.0, 1.5, -0.25), (12.0, 8.0, 0.5)]
+        assert frame.to_world(uvw) == [pytest.approx(frame.to_world_point(*p)) for p in uvw]
+
+    def test_pairs_are_on_the_plane(self):
+        """(u, v) pairs take w = 0."""
+        frame = WallFrame.from_plane(plane_dict())
+        assert frame.to_world([(5.0, 2.0)]) == [pytest.approx(frame.to_world_point(5.0, 2.0, 0.0))]
+
+    def test_round_trip(self):
+        """to_wall inverts to_world."""
+        frame = WallFrame.from_plane(plane_dict())
+        uvw = [(5.0, 2.0, 1.0), (-1.0, 9.0, 0.0)]
+        for got, want in zip(frame.to_wall(frame.to_world(uvw)), uvw):
+            assert got == pytest.approx(want)
+
+    def test_round_trip_non_orthogonal(self):
+        """The inverse is exact for sheared axes too."""
+        frame = WallFrame((0.0, 0.0, 0.0), (1.0, 0.2, 0.0), (0.0, 0.3, 1.0), (0.1, 1.0, 0.0))
+        assert frame.to_wall_point(*frame.to_world_point(2.0, 3.0, 4.0)) == pytest.approx((2.0, 3.0, 4.0))
+
+    def test_matrices(self):
+        """The 4x4 matrices are inverses of each other."""
+        frame = WallFrame.from_plane(plane_dict())
+        a, b = frame.to_world_matrix, frame.to_wall_matrix
+        product = [[sum(a[i][k] * b[k][j] for k in range(4)) for j in range(4)] for i in range(4)]
+        identity = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+        for row, expected in zip(product, identity):
+            assert row == pytest.approx(expected)
+
+    def test_default_z_axis(self):
+        """A missing Z axis is X cross Y."""
+        frame = WallFrame((0, 0, 0), (1, 0, 0), (0, 0, 1))
+        assert frame.z_axis == (0.0, -1.0, 0.0)
+
+    def test_degenerate_axes_rejected(self):
+        with pytest.raises(ValueError):
+            WallFrame((0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 0, 1))
+
+
+# =============================================================================
+# Test: plane representations and caching
+# =============================================================================
+
+class TestWallFrameCache:
+    """Test shared frames."""
+
+    def test_representations_agree(self):
+        """Dict, PlaneData and Rhino-style planes give the same frame."""
+        plane = plane_dict()
+        plane_data = PlaneData(
+            origin=Point3D(1.0, 2.0, 3.0),
+            x_axis=Vector3D(0.6, 0.8, 0.0),
+            y_axis=Vector3D(0.0, 0.0, 1.0),
+            z_axis=Vector3D(0.8, -0.6, 0.0),
+        )
+        frames = [wall_frame(plane), wall_frame(plane_data), wall_frame(rhino_like(plane))]
+        assert frames[0] is frames[1] is frames[2]
+
+    def test_cached_per_plane(self):
+        """Equal planes share a frame; different planes do not."""
+        assert wall_frame(plane_dict()) is wall_frame(plane_dict())
+        assert wall_frame(plane_dict()) is not wall_frame(plane_dict(origin=(0.0, 0.0, 0.0)))
+
+    def test_dict_without_z_axis(self):
+        plane = plane_dict()
+        del plane["z_axis"]
+        assert wall_frame(plane).z_axis == pytest.approx((0.8, -0.6, 0.0))
+
+
+# =============================================================================
+# Test: shared by pipeline modules
+# =============================================================================
+
+class TestSharedFrame:
+    """Test modules that convert through the shared frame."""
+
+    def test_sheathing_uvw_to_world(self):
+        plane = plane_dict()
+        assert uvw_to_world(5.0, 2.0, 1.0, plane) == pytest.approx((4.8, 5.4, 5.0))
+
+    def test_holddown_point_on_dict_plane(self):
+        """Holddown points use absolute elevation on JSON planes."""
+        point = _calculate_point(plane_dict(), 5.0, 3.5)
+        assert point == pytest.approx((4.0, 6.0, 3.5))
+
+
+@pytest.mark.skipif(not RHINO_AVAILABLE, reason="Rhino not available")
+def test_matches_rhino_point_at():
+    """Frame math equals RhinoCommon Plane.PointAt."""
+    plane = rg.Plane(rg.Point3d(1, 2, 3), rg.Vector3d(0.6, 0.8, 0), rg.Vector3d(0, 0, 1))
+    expected = plane.PointAt(5.0, 2.0, 1.0)
+    got = wall_frame(plane).to_world_point(5.0, 2.0, 1.0)
+    assert got == pytest.approx((expected.X, expected.Y, expected.Z))
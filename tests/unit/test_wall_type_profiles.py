@@ -0,0 +1,63 @@
+# File: tests/unit/test_wall_type_profiles.py
+"""
+Unit tests for wall-type -> profile resolution.
+
+Tests cover:
+- Each fallback strategy (exact, normalized, 2xN pattern, thickness)
+- Unresolvable wall types raising KeyError
+- Caching of resolved names and clear_wall_type_cache()
+"""
+
+import pytest
+
+from src.timber_framing_generator.config.framing import (
+    PROFILES,
+    WALL_TYPE_PROFILES,
+    _resolve_wall_type_profile,
+    clear_wall_type_cache,
+    get_profile_for_wall_type,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_wall_type_cache()
+    yield
+    clear_wall_type_cache()
+
+
+class TestResolution:
+    """Test the fallback strategies."""
+
+    @pytest.mark.parametrize("wall_type, profile", [
+        ("2x4 EXT", "2x4"),
+        ("2x6 ext", "2x6"),
+        ("Exterior 2x12 Stud Wall", "2x12"),
+        ("Basic Wall - W1 - 6", "2x6"),
+        ('Generic 4"', "2x4"),
+        ("Interior 8 inch", "2x8"),
+        ("Partition 3", "2x3"),
+    ])
+    def test_resolves(self, wall_type, profile):
+        assert get_profile_for_wall_type(wall_type) is PROFILES[profile]
+
+    def test_unresolvable_raises(self):
+        with pytest.raises(KeyError):
+            get_profile_for_wall_type("Curtain Wall")
+
+
+class TestCache:
+    """Test memoized resolution."""
+
+    def test_repeated_lookups_hit_cache(self):
+        get_profile_for_wall_type("Basic Wall - W1 - 6")
+        get_profile_for_wall_type("Basic Wall - W1 - 6")
+        assert _resolve_wall_type_profile.cache_info().hits == 1
+
+    def test_clear_picks_up_new_wall_types(self, monkeypatch):
+        """New WALL_TYPE_PROFILES entries apply after clearing the cache."""
+        with pytest.raises(KeyError):
+            get_profile_for_wall_type("Curtain Wall")
+        monkeypatch.setitem(WALL_TYPE_PROFILES, "Curtain Wall", "2x6")
+        clear_wall_type_cache()
+        assert get_profile_for_wall_type("Curtain Wall") is PROFILES["2x6"]